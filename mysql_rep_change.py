@@ -16,11 +16,22 @@
         files.  This must be done manually outside the scope of this program.
 
     Usage:
-        mysql_rep_change.py -c mysql_cfg -d path -s [path/]file
-            {-M -m new_master_name -n slave_name |
-             -R -m new_master_name -n slave_name |
-             -S -m new_master -n slave_name}
-            [-y flavor_id]
+        mysql_rep_change.py -c mysql_cfg -d path {-s [path/]file | -D}
+            {-M -m new_master_name {-n slave_name [slave_name ...] |
+                -f [path/]file} |
+             -R -m new_master_name {-n slave_name [slave_name ...] |
+                -f [path/]file} |
+             -S -m new_master {-n slave_name [slave_name ...] |
+                -f [path/]file} |
+             -T [path/]file |
+             -L socket |
+             -F [-B budget] |
+             -U -J [path/]file}
+            [-g] [-W wait_timeout] [-I interval] [-l lag] [-x deadline]
+            [-w workers] [-t timeout]
+            [-P [path/]file] [-p] [-e - | fd | [path/]file]
+            [-C cache_dir] [-H [schema.]table]
+            [-G lease] [-J [path/]file [-r]] [-A] [-y flavor_id]
             [-v | -h]
 
     Arguments:
@@ -28,19 +39,33 @@
             not include the .py extension with the name.  Required arg.
         -s [path/]file => Slave config file.  Will be a text file.  Include the
             file extension with the name.  Can include the path or use the -d
-            option path.  Required arg.
+            option path.  Required arg unless -D is used.
         -d dir path => Directory path to the config files. Required arg.
+        -D => Discover the slaves by walking the replication tree down from
+            the master.  Without a move option the discovered tree is
+            printed.
 
         -M -> Move slave in a slave array to under another slave in the same
                 slave array.
-            -m new_master_name => Name of the new master from slave cfg file.
-            -n slave_name => Name of a slave to be moved to the new master.
+            -m new_master_name => Name of the new master from slave cfg file
+                or auto to select the slave which will sync fastest and is
+                able to be a master.  For auto every slave is checked and
+                the ranking is printed.
+            -n slave_name => Name of one or more slaves to be moved to the
+                new master.
+            -f [path/]file => File of slave names, one per line, to be moved
+                to the new master.  Can include the path or use the -d
+                option path.
 
         -R -> Move slave in a slave array to under another slave in the same
                 slave array and remove the replication connection between the
                 current master and new master.
-            -m new_master_name => Name of the new master from slave cfg file.
-            -n slave_name => Name of a slave to be moved to the new master.
+            -m new_master_name => Name of the new master from slave cfg file
+                or auto, see the -M option.
+            -n slave_name => Name of one or more slaves to be moved to the
+                new master.
+            -f [path/]file => File of slave names, one per line, to be moved
+                to the new master.
 
         -S -> Take a slave that is under a slave/master and move it to under
                 the master that is hosting the slave/master
@@ -48,18 +73,186 @@
                 (New Topology:  New_Master -> Slave1
                                 New_Master -> Slave2)
             -m new_master => Name of the New_Master config file.
-            -n slave_name => Name of a slave to be moved to the New_Master.
-
-        -y value => A flavor id for the program lock.  To create unique lock.
+            -n slave_name => Name of one or more slaves to be moved to the
+                New_Master.
+            -f [path/]file => File of slave names, one per line, to be moved
+                to the New_Master.
+
+        -T [path/]file => Change the replication tree to the target topology
+            in the file.  Each line in the file is the name of a slave
+            followed by the name of the server it will replicate from or
+            none to remove the slave's replication.  Can include the path
+            or use the -d option path.  The moves are worked out from the
+            current topology and independent moves are run at the same
+            time.
+
+        -L socket => Run as a daemon which takes requests on the Unix socket
+            and keeps its connections to the master and slaves between
+            requests.  Each request is a line with a JSON object and is
+            answered with a JSON line with status, msg, output and seconds.
+                {"argv": ["-M", "-m", "new_master", "-n", "slave_name"]}
+                    => Run an operation.  The argv can have the -M, -R, -S,
+                    -T, -m, -n, -f, -g, -W, -I, -l, -x and -r options, the
+                    other options are the daemon's options.
+                {"cmd": "ping"} => Check the daemon and get the number of
+                    queued requests.
+                {"cmd": "shutdown"} => Stop the daemon after the requests
+                    queued before it.  Later requests are refused.
+            Requests are run one at a time in the order received.  With
+            the -H option the heartbeat runs while each request runs.
+
+        -F -> Fail over from a master which is down to the most advanced of
+                its slaves.  The slaves apply their relay logs, the slave
+                with the most executed transactions becomes the new master
+                and the other slaves are moved to it with auto positioning.
+            -B budget => Number of seconds the failover has to complete in.
+                Default is 60.
+
+        -U -> Roll back the last move in the -J journal which was not rolled
+                back.  The moved slaves are pointed back to the master they
+                were moved from at the same time, at the position or GTID
+                state recorded before the move.  See NOTE 15.
+
+        -g => Use GTID based replication to sync the servers and to move the
+            slave.  The servers are synced using a server side wait on the
+            executed GTID set and the slave is moved using auto positioning.
+            Requires GTID mode to be enabled on all servers.
+        -W wait_timeout => Sync the servers by waiting on the server side
+            with SOURCE_POS_WAIT (or WAIT_FOR_EXECUTED_GTID_SET with -g)
+            instead of checking the slaves from the client.  The value is
+            the number of seconds to wait for each slave to catch up before
+            the sync fails.  With or without -W, a sync fails when
+            replication on a slave stops or has an error.
+        -I interval => Print the progress of each slave during a sync every
+            interval seconds:  the bytes of the master's binary logs it has
+            left to apply, its apply rate over the last 30 seconds and an
+            ETA.  A single slave is then synced the same way as more than
+            one slave.
+        -l lag => Number of seconds of lag a slave can have to be converged
+            after a move.  Default is 1.
+        -x deadline => Number of seconds to wait after a move for the moved
+            slaves and the new master to converge.  A slave is converged
+            when it is running with a lag under the -l lag.  The state of
+            each slave is printed as it changes.  Default is 60.
+        -w workers => Number of threads used to connect to the master and
+            slaves concurrently.  Default is 10.
+        -t timeout => Number of seconds to wait for a server connection to
+            complete before the server is treated as down.  Default is 30.
+        -P [path/]file => Write a JSON timing report of the run to the file.
+            The report has the wall time of each phase for each server.  A
+            file which can not be written is reported as a warning.
+        -p => Print the JSON timing report to standard out.
+        -e - | fd | [path/]file => Write the events of the run as lines of
+            JSON, as they happen, to standard out for -, to an open file
+            descriptor for a number or appended to a file.  See NOTE 16.
+        -C cache_dir => Directory to cache the parsed master and slave
+            configuration in.  A cached configuration is used until its
+            file changes, which is found from the file's modification time,
+            size and SHA-256 hash.  The directory must be owned by the user
+            and not writable by the group or others.  The passwords are not
+            cached, they are read from the configuration files.
+        -H [schema.]table => Write a heartbeat to the table on the master,
+            or on the -m new master for -S, every 0.1 seconds while the
+            operation runs and measure the lag of the slaves in
+            milliseconds from the heartbeats they have applied.  The lag is
+            used to rank the candidates for -m auto and to check the slaves
+            have converged after a move.  The table is created if it does
+            not exist.  See NOTE 11.
+        -G lease => Take a coordination lock with GET_LOCK on the master,
+            and on the new master for -S, before the operation is run, so
+            runs on other hosts can not change the same servers.  The lock
+            is a lease of the number of seconds:  it is renewed while the
+            run is alive and is freed by the server when the run stops
+            renewing it.  A run waits up to the lease for the lock.  See
+            NOTE 13.
+        -J [path/]file => Record each step of a -M, -R or -S move in the
+            journal file with the positions captured.  Lines are only
+            appended to the file.
+            -r => Resume the last move in the journal with the same options
+                which did not finish, from its last completed step.  See
+                NOTE 14.
+        -A => Roll back a -M, -R or -S move if the moved slaves do not
+            converge after they are started, see the -U option.
+        -y value => A flavor id for the program lock.  Only one run with the
+            flavor id can run at a time.  Without -y, a run only locks the
+            servers it changes, see NOTE 12.
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1:  -v or -h overrides the other options.
-        NOTE 2:  -M, -R, and -S are XOR arguments.
+        NOTE 2:  -M, -R, -S, -T, -L, -F and -U are XOR arguments.
         NOTE 3:  -M and -R options:  The name for -m option is the server_name
             entry from the slave configuration file.
         NOTE 4:  -S option:  The -m is a master configuration file name (minus
             .py extension).
+        NOTE 5:  -n and -f options:  When more than one slave is moved, the
+            new master is synced once and the slaves are synced and moved at
+            the same time.
+        NOTE 6:  -g option:  The new master must have binary logging and
+            log_replica_updates enabled so the moved slave can auto position
+            against it.
+        NOTE 7:  -T option:  All servers in the replication tree must be in
+            the slave config file.  Servers not in the topology file keep
+            their current master.
+        NOTE 8:  -D option:  Slaves must set report_host to be discovered.  A
+            discovered slave found in the -s slave config file uses that
+            configuration, otherwise it uses the master's configuration and
+            is named host:port.
+        NOTE 9:  -m auto:  A candidate is rejected if it does not replicate
+            from the master, found from the master's server UUID, its
+            replication is not running, it is read-only, or binary logging
+            or log_replica_updates is off.  The
+            others are ranked by the master's transactions they are missing
+            (with -g), their lag, relay log backlog and Threads_running.
+        NOTE 10:  -F option:  Requires GTID mode on the slaves and the -s
+            slave config file.  Use a short -t timeout so the connection to
+            the failed master does not use up the budget.  The new master
+            must have binary logging and log_replica_updates enabled when
+            there are other slaves to move.  The failover is refused if the
+            -c master can be connected to.
+        NOTE 11:  -H option:  The heartbeat is written by the user in the
+            master config file, which needs the CREATE, INSERT and DELETE
+            privileges on the table.  The table is not dropped at the end.
+            The lag of slaves moved to a new master which does not receive
+            the heartbeats, such as the new master of -R after its reset, is
+            Seconds_Behind_Source.
+        NOTE 12:  Each run locks the servers its operation changes, found
+            from their host and port:  the master, the new master and the
+            slaves to be moved, or every slave for -T, -F, -U and -m auto.
+            Runs changing different servers run at the same time and a run
+            changing a server locked by another run is refused.  The daemon
+            locks the servers of each request while it runs.
+        NOTE 13:  -G option:  The lock is held on a connection of its own by
+            the user in the master config file.  It is not taken on a master
+            which is down for -F.  A lease lost during the operation is
+            reported at the end, the operation is not stopped.
+        NOTE 14:  -r option:  A sync which completed is only skipped if the
+            synced servers are still stopped at the position in the journal,
+            otherwise they are synced again.  In GTID mode the servers are
+            synced again, which only waits for the transactions since the
+            last sync.  A move which stopped while pointing the slaves to
+            the new master uses the position in the journal only if the
+            synced servers are still stopped, otherwise they are synced
+            again and the new position is used.  The state recorded for -U
+            before the first attempt is kept.  For -m auto the new master
+            in the journal is used.
+        NOTE 15:  -U and -A options:  Before the slaves are pointed to the new
+            master, the master, position and GTID state of each slave is
+            recorded, and of the new master before its reset for -R.  A
+            slave moved with auto positioning is pointed back with auto
+            positioning.  A slave moved to a binary log position is only
+            rolled back if it has not applied any transactions since the
+            move, otherwise it must be rolled back by hand.  The -c master
+            must be the master the slaves were moved from.
+        NOTE 16:  -e option:  Each event has the time, the seconds since the
+            start of the run and the event name:  run_start, phase_start and
+            phase_end of each timed phase with its server, slave_state with
+            the running state, lag and error of a slave, sync_progress with
+            the position and bytes left of a slave, move_step with the
+            positions of each step of a move, new_master_selected,
+            failover_completed, connection_error, error and run_end.  The
+            other output is still printed, so use a file descriptor or a file
+            to keep the events apart from it.
 
     Notes:
         Database configuration file format (config/mysql_cfg.py.TEMPLATE):
@@ -153,32 +346,145 @@
         mysql_rep_change.py -c master -d config -s slaves.txt -M
             -m new_master -n slave_name
 
+        mysql_rep_change.py -c master -d config -s slaves.txt -M
+            -m new_master -n slave_name1 slave_name2 slave_name3
+
+        mysql_rep_change.py -c master -d config -s slaves.txt
+            -T topology.txt
+
+        mysql_rep_change.py -c master -d config -D -T topology.txt
+
+        mysql_rep_change.py -c master -d config -s slaves.txt
+            -L /var/run/mysql_rep_change.sock
+
+        mysql_rep_change.py -c master -d config -s slaves.txt -S
+            -m new_master -n slave_name -J move.journal -r
+
+        mysql_rep_change.py -c master -d config -s slaves.txt -M
+            -m new_master -n slave_name -e 3 3>events.ndjson
+
 """
 
 # Libraries and Global Variables
 
 # Standard
+import os
 import sys
+import time
+import threading
+import ast
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import fcntl
+import hashlib
+import importlib
+import io
+import json
+import queue
+import re
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import types
 
 # Local
 try:
     from .lib import gen_libs
     from .lib import gen_class
     from .lib import machine
-    from .mysql_lib import mysql_libs
-    from .mysql_lib import mysql_class
     from . import version
 
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
     import lib.machine as machine                       # pylint:disable=R0402
-    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
-    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
     import version
 
 __version__ = version.__version__
 
+# Timing of the phases of the run, see timed and timing_report.
+TIMING = {"start": time.monotonic(), "phases": []}
+TIMING_LOCK = threading.Lock()
+
+# Seconds between the heartbeat writes on the master, see Heartbeat.
+HEARTBEAT_INTERVAL = 0.1
+
+# Seconds of samples used for the apply rate, see SyncProgress.
+PROGRESS_WINDOW = 30
+
+# Name of the coordination lock taken with GET_LOCK, see LeaseLock.
+LEASE_NAME = "mysql_rep_change"
+
+# Stream the JSON events of the run are written to, see emit.
+EVENTS = {"sink": None}
+EVENTS_LOCK = threading.Lock()
+
+# Configuration entries which are not written to the cache, see cached_load.
+CFG_SECRETS = ["japd", "rep_japd"]
+
+
+class LazyModule():                                     # pylint:disable=R0903
+
+    """Class:  LazyModule
+
+    Description:  Stands in for a module and imports it on first use of one
+        of its attributes.  Used for the mysql_lib modules, which pull in the
+        database connector, so -h, -v and argument errors do not load them.
+
+    Methods:
+        __init__
+        __getattr__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Module name relative to the program directory
+
+        """
+
+        self.name = name
+        self.module = None
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Imports the module if not imported yet and returns the
+            attribute from it.
+
+        Arguments:
+            (input) attr -> Attribute name
+            (output) Attribute of the module
+
+        """
+
+        if attr in ["name", "module"]:
+            raise AttributeError(attr)
+
+        if self.module is None:
+            try:
+                self.module = importlib.import_module(
+                    "." + self.name, __package__)
+
+            except (TypeError, ValueError, ImportError):
+                self.module = importlib.import_module(self.name)
+
+        return getattr(self.module, attr)
+
+
+mysql_libs = LazyModule("mysql_lib.mysql_libs")
+mysql_class = LazyModule("mysql_lib.mysql_class")
+
 
 def help_message():
 
@@ -194,328 +500,4386 @@ def help_message():
     print(__doc__)
 
 
-def is_slv_up(slv):
+def reset_timing():
 
-    """Function:  is_slv_up
+    """Function:  reset_timing
 
-    Description:  Checks to see if the slave is running and whether there are
-        any errors to report.
+    Description:  Clears the timing of the phases and restarts the run
+        clock.
 
     Arguments:
-        (input) slv -> Class instance of slave
 
     """
 
-    if not slv.is_slv_running():
-        print(f"Error:  Slave on {slv.name} is not running.")
+    with TIMING_LOCK:
+        TIMING["start"] = time.monotonic()
+        TIMING["phases"] = []
 
-        if slv.is_slv_error():
-            print(f"IO Error:  {slv.io_err}:  {slv.io_msg}")
-            print(f"SQL Error:  {slv.sql_err}:  {slv.sql_msg}")
 
+def open_events(args):
 
-def crt_slv_mst(slaves, **kwargs):
-
-    """Function:  crt_slv_mst
+    """Function:  open_events
 
-    Description:  Creates the new master from an existing slave within the
-        slave array.  Does ensure the slave is not in read-only mode.
+    Description:  Opens the stream of the -e option the events of the run
+        are written to:  - for standard out, a number for a file descriptor
+        already open or a file name to append to.  If the stream can not be
+        opened the run goes on without it.
 
     Arguments:
-        (input) slaves -> Slave instance array
-        (input) **kwargs:
-            new_mst -> Name of slave to be the new master
-        (output) new_master -> Class instance of new master
-        (output) err_flag -> True|False - if an error has occurred
-        (output) err_msg -> Error message
+        (input) args -> ArgParser class instance
 
     """
 
-    slaves = list(slaves)
-    err_flag = False
-    err_msg = None
-    new_master = None
-    slv = mysql_libs.find_name(slaves, kwargs.get("new_mst"))
+    close_events()
+    target = args.get_val("-e")
 
-    if slv:
+    try:
+        if target == "-":
+            sink = sys.stdout
 
-        if gen_libs.is_true(slv.read_only):
-            err_flag = True
-            err_msg = \
-                f'Error:  New master {kwargs.get("new_mst")} is set to' \
-                f' read-only mode.'
+        elif target and target.isdigit():
+            sink = os.fdopen(
+                int(target), mode="w", encoding="UTF-8", closefd=False)
+
+        elif target:
+            sink = open(                        # pylint:disable=R1732
+                target, mode="a", encoding="UTF-8")
 
-        # Assume slave is ready to be new master.
         else:
-            new_master = mysql_class.MasterRep(
-                slv.name, slv.server_id, slv.sql_user, slv.sql_pass,
-                os_type=slv.machine, host=slv.host, port=slv.port,
-                defaults_file=slv.defaults_file,
-                extra_def_file=slv.extra_def_file, rep_user=slv.rep_user,
-                rep_japd=slv.rep_japd)
-            new_master.connect(silent=True)
+            sink = None
 
-            if new_master.conn_msg:
-                err_flag = True
-                err_msg = "Detected problem in new master connection"
-                print("Error:  Connection problem for new master.")
-                print(f"\tNew Master:  {new_master.conn_msg}")
+    except OSError as err:
+        print(f"Warning:  Running without the event stream.  {err}")
+        sink = None
 
-    else:
-        err_flag = True
-        err_msg = \
-            f'Error: Slave(new master) {kwargs.get("new_mst")} was not found' \
-            f' in slave array.'
+    with EVENTS_LOCK:
+        EVENTS["sink"] = sink
 
-    return new_master, err_flag, err_msg
 
+def close_events():
 
-def mv_slv_to_new_mst(master, slaves, new_master, slave_move, **kwargs):
+    """Function:  close_events
 
-    """Function:  mv_slv_to_new_mst
+    Description:  Stops the events of the run and closes their stream.
+
+    Arguments:
+
+    """
+
+    with EVENTS_LOCK:
+        sink = EVENTS["sink"]
+        EVENTS["sink"] = None
+
+    if sink and sink is not sys.stdout:
+        sink.close()
 
-    Description:  Moves the slave to the new master, but first syncs up current
-        master with the slave and the new master before running a
-        Change Master To command.
+
+def emit(event, **data):
+
+    """Function:  emit
+
+    Description:  Writes an event of the run as a line of JSON to the -e
+        option stream and flushes it.  Does nothing when there is no stream.
+        If the stream is closed by the reader, the events are stopped.  Safe
+        to use from threads.
 
     Arguments:
-        (input) master -> Master class instance
-        (input) slaves -> Slave instance array
-        (input) new_master -> Class instance of new master
-        (input) slave_move -> Class instance of slave to be moved
-        (input) **kwargs:
-            new_mst -> Name of slave to be the new master
-        (output) err_flag -> True|False - if an error has occurred
-        (output) err_msg -> Error message
+        (input) event -> Name of the event
+        (input) **data -> Data of the event
 
     """
 
-    slaves = list(slaves)
+    if EVENTS["sink"] is None:
+        return
 
-    for svr in [mysql_libs.find_name(slaves, kwargs.get("new_mst")),
-                slave_move]:
+    line = json.dumps(
+        dict({"time": round(time.time(), 6),
+              "elapsed": round(time.monotonic() - TIMING["start"], 6),
+              "event": event}, **data), default=str)
 
-        err_flag, err_msg = mysql_libs.sync_rep_slv(master, svr)
+    with EVENTS_LOCK:
+        if EVENTS["sink"] is not None:
+            try:
+                EVENTS["sink"].write(line + "\n")
+                EVENTS["sink"].flush()
 
-        if err_flag:
-            break
+            except (OSError, ValueError):
+                EVENTS["sink"] = None
 
-    # Only run if loop completes without error.
-    else:
-        # Get latest log position.
-        new_master.upd_mst_status()
-        mysql_libs.change_master_to(new_master, slave_move)
 
-        mysql_libs.chg_slv_state(
-            [mysql_libs.find_name(slaves, kwargs.get("new_mst")), slave_move],
-            "start")
+@contextlib.contextmanager
+def timed(phase, srv=None):
 
-    return err_flag, err_msg
+    """Function:  timed
 
+    Description:  Context manager which records the wall time of a phase of
+        the run for the timing report, with phase_start and phase_end events.
+        Safe to use from threads.
 
-def move_slave(master, slaves, **kwargs):
+    Arguments:
+        (input) phase -> Name of the phase
+        (input) srv -> Server instance or name the phase ran against
 
-    """Function:  move_slave
+    """
 
-    Description:  Calls the functions to setup the new master, locate the slave
-        to be moved, and moves the slave to the new master.  Used to
-        setup the new master from existing slave array and whether to
-        drop the rep connection between the old master and new master.
+    start = time.monotonic()
+    emit("phase_start", phase=phase, server=getattr(srv, "name", srv))
+
+    try:
+        yield
+
+    finally:
+        entry = {
+            "phase": phase, "server": getattr(srv, "name", srv),
+            "start": round(start - TIMING["start"], 6),
+            "seconds": round(time.monotonic() - start, 6)}
+
+        with TIMING_LOCK:
+            TIMING["phases"].append(entry)
+
+        emit("phase_end", **entry)
+
+
+def timing_report(args):
+
+    """Function:  timing_report
+
+    Description:  Writes the JSON timing report to the -P option file and
+        prints it with the -p option.  The report has each timed phase and
+        a summary of the count, total and maximum seconds for each phase.
+        A -P file which can not be written only prints a warning.
 
     Arguments:
-        (input) master -> Master class instance
-        (input) slaves -> Slave instance array
-        (input) **kwargs:
-            new_mst -> Name of slave to be the new master
-            slv_mv -> Name of slave to be moved to new master
-            args -> ArgParser class instance
-        (output) err_flag -> True|False - if an error has occurred
-        (output) err_msg -> Error message
+        (input) args -> ArgParser class instance
 
     """
 
-    args = kwargs.get("args")
-    slaves = list(slaves)
-    slave_move, err_flag, err_msg = mysql_libs.fetch_slv(
-        slaves, kwargs.get("slv_mv"))
+    with TIMING_LOCK:
+        phases = list(TIMING["phases"])
+        total = round(time.monotonic() - TIMING["start"], 6)
 
-    if not err_flag:
-        new_master, err_flag, err_msg = crt_slv_mst(slaves, **kwargs)
+    summary = {}
 
-        if not err_flag:
-            err_flag, err_msg = mv_slv_to_new_mst(
-                master, slaves, new_master, slave_move, **kwargs)
+    for entry in phases:
+        data = summary.setdefault(
+            entry["phase"], {"count": 0, "seconds": 0.0, "max": 0.0})
+        data["count"] += 1
+        data["seconds"] = round(data["seconds"] + entry["seconds"], 6)
+        data["max"] = max(data["max"], entry["seconds"])
 
-            if not err_flag:
-                is_slv_up(slave_move)
+    report = json.dumps(
+        {"version": __version__, "seconds": total, "summary": summary,
+         "phases": phases}, indent=4)
 
-                if args.arg_exist("-R"):
-                    slv_mst = mysql_libs.find_name(
-                        slaves, kwargs.get("new_mst"))
-                    mysql_libs.chg_slv_state([slv_mst], "stop")
-                    mysql_libs.reset_slave(slv_mst)
+    if args.arg_exist("-P"):
+        try:
+            with open(args.get_val("-P"), mode="w",
+                      encoding="UTF-8") as f_hdlr:
+                f_hdlr.write(report + "\n")
 
-                else:
-                    is_slv_up(mysql_libs.find_name(
-                        slaves, kwargs.get("new_mst")))
+        except OSError as err:
+            print(f"Warning:  Timing report not written.  {err}")
 
-            mysql_libs.disconnect(new_master)
+    if args.arg_exist("-p"):
+        print(report)
 
-    return err_flag, err_msg
 
+class Heartbeat():
 
-def move_slave_up(master, slaves, **kwargs):
+    """Class:  Heartbeat
 
-    """Function:  move_slave_up
+    Description:  Writes a heartbeat row with a sequence number to a table on
+        the master at a fixed interval from a thread with its own connection,
+        and measures the end-to-end lag of a slave from the heartbeats it
+        has applied.  The lag is measured with the program's clock, so the
+        clocks of the servers do not need to agree.
 
-    Description:  Find the slave that will be moved, creates the new and slave
-        master instances, sync up the databases between new master,
-        slave/master and slave and then move the slave from the
-        slave/master to the new master.
+    Methods:
+        __init__
+        start
+        stop
+        beat
+        lag
+        detach
+
+    """
+
+    def __init__(self, master, table, interval=HEARTBEAT_INTERVAL):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) master -> Master class instance with its own connection
+            (input) table -> [schema.]table name of the heartbeat table
+            (input) interval -> Seconds between the heartbeat writes
+
+        """
+
+        self.master = master
+        self.table = table
+        self.interval = interval
+        self.seq = time.time_ns()
+        self.sent = {}
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.thread = None
+        self.err_msg = None
+        self.detached = set()
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Creates the heartbeat table if it does not exist, writes
+            the first heartbeat and starts the writer thread.
+
+        Arguments:
+
+        """
+
+        self.master.sql(
+            f"CREATE TABLE IF NOT EXISTS {self.table} (server_id INT UNSIGNED"
+            f" NOT NULL PRIMARY KEY, seq BIGINT UNSIGNED NOT NULL,"
+            f" ts DATETIME(6) NOT NULL)")
+        self.beat()
+
+        def _run():
+            while not self.done.wait(self.interval):
+                try:
+                    self.beat()
+
+                except Exception as err:            # pylint:disable=W0718
+                    self.err_msg = f"Error:  Heartbeat write failed: {err}"
+                    break
+
+        self.thread = threading.Thread(target=_run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stops the writer thread and closes its connection.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+
+        if self.thread:
+            self.thread.join()
+
+        mysql_libs.disconnect(self.master)
+
+    def beat(self):
+
+        """Method:  beat
+
+        Description:  Writes the next heartbeat on the master.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.seq += 1
+            seq = self.seq
+            self.sent[seq] = time.monotonic()
+
+        self.master.sql(
+            f"REPLACE INTO {self.table} (server_id, seq, ts)"
+            f" VALUES (%s, %s, NOW(6))",
+            params=(self.master.server_id, seq))
+
+    def lag(self, slv):
+
+        """Method:  lag
+
+        Description:  Returns the lag of the slave in milliseconds, which is
+            the time the oldest heartbeat it has not applied has been
+            waiting.  None if the slave has not applied a heartbeat of this
+            run or was detached from the heartbeat.
+
+        Arguments:
+            (input) slv -> Class instance of slave
+            (output) lag -> Lag in milliseconds or None
+
+        """
+
+        if slv.name in self.detached:
+            return None
+
+        with timed("heartbeat_lag", slv):
+            data = slv.col_sql(
+                f"SELECT seq FROM {self.table} WHERE server_id = %s",
+                params=(self.master.server_id,))
+
+        now = time.monotonic()
+        seq = int(data[0]["seq"]) if data else None
+
+        with self.lock:
+            if seq not in self.sent:
+                return None
+
+            sent = self.sent.get(seq + 1, now)
+
+        return round(max(now - sent, 0.0) * 1000, 3)
+
+    def detach(self, slaves, new_master=None):
+
+        """Method:  detach
+
+        Description:  Stops measuring the lag of slaves moved to a new master
+            which does not receive the heartbeats, as their heartbeat lag
+            would only grow.  Their lag is then Seconds_Behind_Source.  With
+            a new master the slaves are kept if it is the heartbeat master or
+            has applied a heartbeat of this run.
+
+        Arguments:
+            (input) slaves -> List of class instances of slaves
+            (input) new_master -> Class instance of the new master of the
+                slaves or None if it does not receive the heartbeats
+
+        """
+
+        if new_master is not None and (
+                new_master.name == self.master.name
+                or self.lag(new_master) is not None):
+            return
+
+        self.detached.update(slv.name for slv in slaves)
+
+
+def heartbeat_source(master, args):
+
+    """Function:  heartbeat_source
+
+    Description:  Returns the top-most source of the operation, which the
+        heartbeat is written on:  the -m new master for -S, as it is the
+        master of the -c master, otherwise the -c master.
 
     Arguments:
         (input) master -> Master class instance
-        (input) slaves -> Slave instance array
-        (input) **kwargs:
-            new_mst -> Name of slave to be the new master
-            slv_mv -> Name of slave to be moved to new master
-            args -> ArgParser class instance
-        (output) err_flag -> True|False - if an error has occurred
-        (output) err_msg -> Error message
+        (input) args -> ArgParser class instance
+        (output) source -> Class instance of the server to write the
+            heartbeat on
 
     """
 
-    args = kwargs.get("args")
-    slaves = list(slaves)
-    slave_move, err_flag, err_msg = mysql_libs.fetch_slv(
-        slaves, kwargs.get("slv_mv"))
+    if args.arg_exist("-S"):
+        return cfg_mst_inst(args.get_val("-m"), args.get_val("-d"))
 
-    if err_flag:
-        return err_flag, err_msg
+    return master
 
-    cfg = gen_libs.load_module(kwargs.get("new_mst"), args.get_val("-d"))
-    new_master = mysql_class.MasterRep(
-        cfg.name, cfg.sid, cfg.user, cfg.japd,
-        os_type=getattr(machine, cfg.serv_os)(), host=cfg.host, port=cfg.port,
-        defaults_file=cfg.cfg_file,
-        extra_def_file=cfg.__dict__.get("extra_def_file", None),
-        rep_user=cfg.rep_user, rep_japd=cfg.rep_japd)
-    new_master.connect(silent=True)
-    slv_master = mysql_class.SlaveRep(
-        master.name, master.server_id, master.sql_user, master.sql_pass,
-        os_type=master.machine, host=master.host, port=master.port,
-        defaults_file=master.defaults_file, rep_user=master.rep_user,
-        rep_japd=master.rep_japd)
-    slv_master.connect(silent=True)
 
-    if new_master.conn_msg or slv_master.conn_msg:
-        err_flag = True
-        err_msg = "Detected problem in one of the connections"
+def start_heartbeat(master, table):
 
-        print("Error:  Connection problem for new master/slave master.")
-        print(f"\tNew Master:  {new_master.conn_msg}")
-        print(f"\tSlave Master:  {slv_master.conn_msg}")
+    """Function:  start_heartbeat
 
-        if new_master.conn:
-            mysql_libs.disconnect(new_master)
+    Description:  Starts the heartbeat writes on the master with a
+        connection of their own.
 
-        if slv_master.conn:
-            mysql_libs.disconnect(slv_master)
+    Arguments:
+        (input) master -> Master class instance
+        (input) table -> [schema.]table name of the heartbeat table
+        (output) heartbeat -> Heartbeat class instance or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
 
-    else:
-        err_flag, err_msg = mysql_libs.sync_rep_slv(new_master, slv_master)
+    """
 
-        if not err_flag:
-            err_flag, err_msg = mysql_libs.sync_rep_slv(
-                master, mysql_libs.find_name(slaves, kwargs.get("slv_mv")))
+    if not re.fullmatch(r"\w+(\.\w+)?", table):
+        return None, True, \
+            f"Error:  Heartbeat table name is not valid: {table}"
 
-            if not err_flag:
-                mysql_libs.change_master_to(new_master, slave_move)
-                mysql_libs.chg_slv_state([slave_move, slv_master], "start")
-                is_slv_up(slave_move)
-                is_slv_up(slv_master)
+    heartbeat = Heartbeat(crt_mst_inst(master), table)
 
-        mysql_libs.disconnect(new_master, slv_master)
+    if heartbeat.master.conn_msg:
+        return None, True, \
+            f"Error:  Heartbeat connection failed: {heartbeat.master.conn_msg}"
 
-    return err_flag, err_msg
+    heartbeat.start()
 
+    return heartbeat, False, None
 
-def create_instances(args, **kwargs):
 
-    """Function:  create_instances
+def slave_state(slv, heartbeat=None):
 
-    Description:  Create a Master_Rep instance for master and Slave_Rep
-        instances for slaves.  Slave instances will be appended to an array.
+    """Function:  slave_state
+
+    Description:  Returns the replication state of a slave:  if both of its
+        threads are running, its lag in seconds and the error which stopped
+        it.  With a heartbeat the lag is the heartbeat lag, otherwise it is
+        Seconds_Behind_Source.  A thread still connecting is not an error.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) kwargs:
-            slv_key -> Dictionary of keys and data types
-        (output) master -> Master instance
-        (output) slave -> Slave instance list
+        (input) slv -> Class instance of slave
+        (input) heartbeat -> Heartbeat class instance or None
+        (output) state -> Dictionary of the name, running, lag and error
 
     """
 
-    cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
-    master = mysql_class.MasterRep(
-        cfg.name, cfg.sid, cfg.user, cfg.japd,
-        os_type=getattr(machine, cfg.serv_os)(), host=cfg.host, port=cfg.port,
-        defaults_file=cfg.cfg_file,
-        extra_def_file=cfg.__dict__.get("extra_def_file", None),
-        rep_user=cfg.rep_user, rep_japd=cfg.rep_japd)
-    master.connect(silent=True)
-    slaves = []
-    slv_array = gen_libs.create_cfg_array(
-        args.get_val("-s"), cfg_path=args.get_val("-d"))
-    slv_array = gen_libs.transpose_dict(slv_array, kwargs.get("slv_key", {}))
-    slaves = mysql_libs.create_slv_array(slv_array)
+    status = slv.col_sql("SHOW REPLICA STATUS")
+    status = status[0] if status else {}
+    running = status.get("Replica_IO_Running") == "Yes" \
+        and status.get("Replica_SQL_Running") == "Yes"
+    lag = status.get("Seconds_Behind_Source")
+    error = None
 
-    return master, slaves
+    if heartbeat and running:
+        hb_lag = heartbeat.lag(slv)
+        lag = lag if hb_lag is None else hb_lag / 1000
 
+    if not status:
+        error = "Replication is not configured."
 
-def run_program(args, func_dict, **kwargs):
+    elif status.get("Replica_SQL_Running") != "Yes" \
+            and status.get("Last_SQL_Errno"):
+        error = f'SQL Error:  {status["Last_SQL_Errno"]}:' \
+            f'  {status.get("Last_SQL_Error")}'
 
-    """Function:  run_program
+    elif status.get("Replica_IO_Running") == "No" \
+            and status.get("Last_IO_Errno"):
+        error = f'IO Error:  {status["Last_IO_Errno"]}:' \
+            f'  {status.get("Last_IO_Error")}'
 
-    Description:  Creates class instance(s) and controls flow of the program.
+    return {"name": slv.name, "running": running,
+            "lag": None if lag is None else float(lag), "error": error}
+
+
+def wait_converged(slaves, **kwargs):
+
+    """Function:  wait_converged
+
+    Description:  Checks the slaves at the same time until each one is
+        running with a lag under the threshold, one of them is stopped by an
+        error or the deadline passes.  Each slave is checked again with a
+        doubling delay of up to a second and its state is printed when it
+        changes, with a slave_state event.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) func_dict -> Dictionary list of functions and options
-        (input) kwargs:
-            slv_key -> Dictionary of keys and data types
+        (input) slaves -> List of class instances of slaves
+        (input) **kwargs:
+            lag_max -> Seconds of lag a slave can have to be converged
+            converge_timeout -> Seconds to wait for the slaves to converge
+            heartbeat -> Heartbeat class instance or None
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error messages of the slaves which did not
+            converge
 
     """
 
-    func_dict = dict(func_dict)
-    master, slaves = create_instances(args, **kwargs)
+    lag_max = kwargs.get("lag_max", 1.0)
+    timeout = kwargs.get("converge_timeout", 60.0)
+    deadline = time.monotonic() + timeout
 
-    if slaves and not master.conn_msg \
-       and not [False for item in slaves if item.conn_msg]:
+    def _watch(slv):
+        delay = 0.05
+        last = None
 
-        # Intersect args and func_dict to call function
-        for item in set(args.get_args_keys()) & set(func_dict.keys()):
-            err_flag, err_msg = func_dict[item](
-                master, slaves, new_mst=args.get_val("-m"),
-                slv_mv=args.get_val("-n"), args=args)
+        with timed("converge", slv):
+            while True:
+                state = slave_state(slv, kwargs.get("heartbeat"))
+                lag = "unknown" if state["lag"] is None \
+                    else f'{state["lag"]:.3f}s'
 
-            if err_flag:
-                print(err_msg)
-                break
+                if (state["running"], lag) != last:
+                    last = (state["running"], lag)
+                    print(f'Slave {slv.name}:  running'
+                          f' {"Yes" if state["running"] else "No"}  lag {lag}',
+                          flush=True, file=kwargs.get("out"))
+                    emit("slave_state", server=slv.name,
+                         running=state["running"], lag=state["lag"],
+                         error=state["error"])
 
-        mysql_libs.disconnect(master, slaves)
+                if state["error"]:
+                    return f'Error:  Slave {slv.name} has stopped:' \
+                        f'  {state["error"]}'
 
-    else:
+                if state["running"] and state["lag"] is not None \
+                        and state["lag"] <= lag_max:
+                    return None
+
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    return f"Error:  Slave {slv.name} did not converge" \
+                        f" within {timeout} seconds."
+
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 1.0)
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slaves))) as pool:
+        errors = [msg for msg in pool.map(_watch, slaves) if msg]
+
+    return bool(errors), "\n".join(errors) if errors else None
+
+
+def crt_slv_mst(slaves, **kwargs):
+
+    """Function:  crt_slv_mst
+
+    Description:  Creates the new master from an existing slave within the
+        slave array.  Does ensure the slave is not in read-only mode.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            new_mst -> Name of slave to be the new master
+            out -> Stream of the output or None for standard out
+        (output) new_master -> Class instance of new master
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    new_master = None
+    slv = find_slv(slaves, kwargs.get("new_mst"))
+
+    if slv:
+
+        if gen_libs.is_true(slv.read_only):
+            err_flag = True
+            err_msg = \
+                f'Error:  New master {kwargs.get("new_mst")} is set to' \
+                f' read-only mode.'
+
+        # Assume slave is ready to be new master.
+        else:
+            new_master = crt_mst_inst(slv, share=True)
+
+            if new_master.conn_msg:
+                err_flag = True
+                err_msg = "Detected problem in new master connection"
+                print("Error:  Connection problem for new master.",
+                      file=kwargs.get("out"))
+                print(f"\tNew Master:  {new_master.conn_msg}",
+                      file=kwargs.get("out"))
+                emit("connection_error", server=new_master.name,
+                     message=new_master.conn_msg)
+
+    else:
+        err_flag = True
+        err_msg = \
+            f'Error: Slave(new master) {kwargs.get("new_mst")} was not found' \
+            f' in slave array.'
+
+    return new_master, err_flag, err_msg
+
+
+def crt_mst_inst(srv, **kwargs):
+
+    """Function:  crt_mst_inst
+
+    Description:  Creates and connects a master instance from a server
+        instance.  The master instance has its own connection, unless share
+        is set and the server is connected, then it uses the server's
+        connection and only reads the master status.
+
+    Arguments:
+        (input) srv -> Class instance of server
+        (input) **kwargs:
+            share -> True|False - use the server's connection
+        (output) mst -> Class instance of master
+
+    """
+
+    mst = mysql_class.MasterRep(
+        srv.name, srv.server_id, srv.sql_user, srv.sql_pass,
+        os_type=srv.machine, host=srv.host, port=srv.port,
+        defaults_file=srv.defaults_file, extra_def_file=srv.extra_def_file,
+        rep_user=srv.rep_user, rep_japd=srv.rep_japd)
+
+    if kwargs.get("share", False) and srv.conn:
+        mst.conn = srv.conn
+        mst.conn_msg = None
+
+        with timed("upd_mst_status", srv):
+            mst.upd_mst_status()
+
+    else:
+        with timed("connect", srv):
+            mst.connect(silent=True)
+
+    return mst
+
+
+def crt_slv_inst(srv, **kwargs):
+
+    """Function:  crt_slv_inst
+
+    Description:  Creates and connects a slave instance from a server
+        instance.  The slave instance has its own connection, unless share
+        is set and the server is connected, then it uses the server's
+        connection and only reads the slave status.
+
+    Arguments:
+        (input) srv -> Class instance of server
+        (input) **kwargs:
+            share -> True|False - use the server's connection
+        (output) slv -> Class instance of slave
+
+    """
+
+    slv = mysql_class.SlaveRep(
+        srv.name, srv.server_id, srv.sql_user, srv.sql_pass,
+        os_type=srv.machine, host=srv.host, port=srv.port,
+        defaults_file=srv.defaults_file, extra_def_file=srv.extra_def_file,
+        rep_user=srv.rep_user, rep_japd=srv.rep_japd)
+
+    if kwargs.get("share", False) and srv.conn:
+        slv.conn = srv.conn
+        slv.conn_msg = None
+
+        with timed("upd_slv_status", srv):
+            slv.upd_slv_status()
+
+    else:
+        with timed("connect", srv):
+            slv.connect(silent=True)
+
+    return slv
+
+
+def close_inst(inst, srv):
+
+    """Function:  close_inst
+
+    Description:  Disconnects an instance created by crt_mst_inst or
+        crt_slv_inst, unless it uses the connection of the server instance
+        it was created from.
+
+    Arguments:
+        (input) inst -> Class instance created from the server
+        (input) srv -> Class instance of server or None
+
+    """
+
+    if inst.conn and (srv is None or inst.conn is not srv.conn):
+        mysql_libs.disconnect(inst)
+
+
+class SyncProgress():
+
+    """Class:  SyncProgress
+
+    Description:  Tracks how far the slaves in a sync are from the target
+        position in the master's binary logs.  The distance is in bytes and
+        is measured across the binary log files from their sizes.  The apply
+        rate of each slave is taken from its samples in a sliding window and
+        the bytes left and an ETA are printed at an interval.
+
+    Methods:
+        __init__
+        offset
+        sample
+
+    """
+
+    def __init__(self, logs, target, interval, out=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) logs -> Rows of show binary logs from the master
+            (input) target -> (log file, log position) of the sync target
+            (input) interval -> Seconds between the prints for a slave
+            (input) out -> Stream of the output or None for standard out
+
+        """
+
+        self.starts = {}
+        total = 0
+
+        for row in logs:
+            self.starts[row["Log_name"]] = total
+            total += int(row["File_size"])
+
+        self.target = self.offset(*target)
+        self.interval = interval
+        self.out = out
+        self.samples = {}
+        self.printed = {}
+        self.lock = threading.Lock()
+
+    def offset(self, log_file, log_pos):
+
+        """Method:  offset
+
+        Description:  Returns the position as a byte offset across the
+            master's binary logs or None if the file is not in the logs.
+
+        Arguments:
+            (input) log_file -> Master binary log file name
+            (input) log_pos -> Master binary log position
+            (output) offset -> Byte offset or None
+
+        """
+
+        start = self.starts.get(log_file)
+
+        return None if start is None else start + int(log_pos)
+
+    def sample(self, name, log_file, log_pos):
+
+        """Method:  sample
+
+        Description:  Records the executed position of a slave and prints
+            its progress, with a sync_progress event, if the interval has
+            passed since its last print.
+
+        Arguments:
+            (input) name -> Name of the slave
+            (input) log_file -> Master binary log file the slave executed to
+            (input) log_pos -> Master binary log position the slave executed
+                to
+            (output) progress -> Dictionary of the bytes left, the apply rate
+                in bytes a second and the ETA in seconds, or None if the
+                position is not in the master's binary logs
+
+        """
+
+        pos = self.offset(log_file, log_pos)
+
+        if pos is None or self.target is None:
+            return None
+
+        now = time.monotonic()
+
+        with self.lock:
+            window = self.samples.setdefault(name, collections.deque())
+            window.append((now, pos))
+
+            while len(window) > 2 and window[0][0] < now - PROGRESS_WINDOW:
+                window.popleft()
+
+            seconds = window[-1][0] - window[0][0]
+            rate = (window[-1][1] - window[0][1]) / seconds if seconds else 0.0
+            left = max(self.target - pos, 0)
+            eta = left / rate if rate > 0 else None
+            show = now - self.printed.get(name, -self.interval) \
+                >= self.interval
+
+            if show:
+                self.printed[name] = now
+
+        if show:
+            print(f"Slave {name}:  {left} bytes to apply  rate {rate:.0f}"
+                  f" bytes/s  ETA "
+                  + ("unknown" if eta is None else f"{eta:.1f}s"),
+                  flush=True, file=self.out)
+            emit("sync_progress", server=name, file=log_file, pos=log_pos,
+                 left=left, rate=round(rate, 3),
+                 eta=None if eta is None else round(eta, 3))
+
+        return {"left": left, "rate": rate, "eta": eta}
+
+
+def sample_progress(slv, progress):
+
+    """Function:  sample_progress
+
+    Description:  Samples the executed position of the slave for the sync
+        progress.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) progress -> SyncProgress class instance or None
+
+    """
+
+    if progress:
+        data = slv.col_sql("SHOW REPLICA STATUS")
+
+        if data:
+            progress.sample(slv.name, data[0]["Relay_Source_Log_File"],
+                            data[0]["Exec_Source_Log_Pos"])
+
+
+def chk_replica(slv, data=None):
+
+    """Function:  chk_replica
+
+    Description:  Checks replication on the slave is still running during a
+        sync:  the slave has a replication status, neither thread has an
+        error, the SQL thread is running and the I/O thread is running or
+        connecting.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) data -> Replication status of the slave or None to read it
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    if data is None:
+        data = slv.col_sql("SHOW REPLICA STATUS")
+        data = data[0] if data else {}
+
+    if int(data.get("Last_SQL_Errno") or 0):
+        return True, \
+            f"Error:  Slave {slv.name} SQL error during sync: " \
+            f" {data['Last_SQL_Errno']}:  {data['Last_SQL_Error']}"
+
+    if int(data.get("Last_IO_Errno") or 0):
+        return True, \
+            f"Error:  Slave {slv.name} IO error during sync: " \
+            f" {data['Last_IO_Errno']}:  {data['Last_IO_Error']}"
+
+    if data.get("Replica_SQL_Running") != "Yes" \
+       or data.get("Replica_IO_Running") not in ["Yes", "Connecting"]:
+        return True, f"Error:  Slave {slv.name} replication stopped during" \
+            f" sync."
+
+    return False, None
+
+
+def wait_gtid(slv, gtid_set, **kwargs):
+
+    """Function:  wait_gtid
+
+    Description:  Waits on the server side until the slave has executed all
+        the transactions in the GTID set.  Replication on the slave is not
+        stopped.  The wait is done in one second slices so it can be
+        cancelled by another thread and replication on the slave is checked
+        between the slices.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) gtid_set -> GTID set the slave is to execute
+        (input) **kwargs:
+            timeout -> Seconds to wait, 0 will wait indefinitely
+            cancel -> threading.Event instance to cancel the wait
+            progress -> SyncProgress class instance or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    timeout = kwargs.get("timeout", 0)
+    cancel = kwargs.get("cancel", None)
+    deadline = time.monotonic() + timeout if timeout else None
+    status = "1"
+
+    while status == "1":
+        if cancel and cancel.is_set():
+            return True, f"Error:  Sync of slave {slv.name} was cancelled."
+
+        data = slv.col_sql(
+            "SELECT WAIT_FOR_EXECUTED_GTID_SET(%s, %s) AS status",
+            params=(gtid_set, 1))
+        status = str(data[0]["status"])
+
+        if status != "1" or (
+                deadline is not None and time.monotonic() >= deadline):
+            break
+
+        err_flag, err_msg = chk_replica(slv)
+
+        if err_flag:
+            return err_flag, err_msg
+
+        sample_progress(slv, kwargs.get("progress"))
+
+    if status != "0":
+        err_flag = True
+        err_msg = \
+            f"Error:  Slave {slv.name} did not reach the GTID set within" \
+            f" {timeout} seconds."
+
+    return err_flag, err_msg
+
+
+def wait_pos(slv, log_file, log_pos, **kwargs):
+
+    """Function:  wait_pos
+
+    Description:  Waits on the server side with SOURCE_POS_WAIT until the
+        slave has executed up to the master's binary log position.  The wait
+        is done in one second slices so it can be cancelled by another
+        thread and replication on the slave is checked between the slices.
+        A NULL return means the slave's SQL thread is not running, which is
+        left for the caller to check.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) log_file -> Master binary log file name
+        (input) log_pos -> Master binary log position
+        (input) **kwargs:
+            timeout -> Seconds to wait, 0 will wait indefinitely
+            cancel -> threading.Event instance to cancel the wait
+            progress -> SyncProgress class instance or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    timeout = kwargs.get("timeout", 0)
+    cancel = kwargs.get("cancel", None)
+    deadline = time.monotonic() + timeout if timeout else None
+    status = -1
+
+    while status == -1:
+        if cancel and cancel.is_set():
+            return True, f"Error:  Sync of slave {slv.name} was cancelled."
+
+        status = slv.col_sql(
+            "SELECT SOURCE_POS_WAIT(%s, %s, %s) AS status",
+            params=(log_file, int(log_pos), 1))[0]["status"]
+        status = -2 if status is None else int(status)
+
+        if status != -1 or (
+                deadline is not None and time.monotonic() >= deadline):
+            break
+
+        err_flag, err_msg = chk_replica(slv)
+
+        if err_flag:
+            return err_flag, err_msg
+
+        sample_progress(slv, kwargs.get("progress"))
+
+    if status == -1:
+        return True, \
+            f"Error:  Slave {slv.name} did not reach {log_file}:" \
+            f"{log_pos} within {timeout} seconds."
+
+    return False, None
+
+
+def sync_pos(slv, log_file, log_pos, **kwargs):
+
+    """Function:  sync_pos
+
+    Description:  Stops the slave and restarts it until it reaches the
+        master's binary log position, then checks the slave until its SQL
+        thread has executed up to the position.  The sync fails if a thread
+        stops or has an error before the position is reached.  With the
+        server wait option the slave is only checked once the server side
+        wait returns.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) log_file -> Master binary log file name
+        (input) log_pos -> Master binary log position
+        (input) **kwargs:
+            timeout -> Seconds to wait, 0 will wait indefinitely
+            cancel -> threading.Event instance to cancel the wait
+            interval -> Seconds between checks of the slave
+            server_wait -> True|False - wait on the server side
+            progress -> SyncProgress class instance or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    timeout = kwargs.get("timeout", 0)
+    cancel = kwargs.get("cancel", None)
+    deadline = time.monotonic() + timeout if timeout else None
+    target = (log_file, int(log_pos))
+    mysql_libs.chg_slv_state([slv], "stop")
+    slv.sql("START REPLICA UNTIL SOURCE_LOG_FILE=%s, SOURCE_LOG_POS=%s",
+            params=target)
+
+    if kwargs.get("server_wait", False):
+        err_flag, err_msg = wait_pos(slv, log_file, log_pos, **kwargs)
+
+        if err_flag:
+            return err_flag, err_msg
+
+    while True:
+        data = slv.col_sql("SHOW REPLICA STATUS")[0]
+
+        if (data["Relay_Source_Log_File"],
+                int(data["Exec_Source_Log_Pos"])) >= target:
+            return False, None
+
+        if kwargs.get("progress"):
+            kwargs["progress"].sample(
+                slv.name, data["Relay_Source_Log_File"],
+                data["Exec_Source_Log_Pos"])
+
+        err_flag, err_msg = chk_replica(slv, data)
+
+        if err_flag:
+            return err_flag, err_msg
+
+        if cancel and cancel.is_set():
+            return True, f"Error:  Sync of slave {slv.name} was cancelled."
+
+        if deadline is not None and time.monotonic() >= deadline:
+            return True, \
+                f"Error:  Slave {slv.name} did not reach {log_file}:" \
+                f"{log_pos} within {timeout} seconds."
+
+        time.sleep(kwargs.get("interval", 1))
+
+
+def sync_slaves(mst, slaves, **kwargs):
+
+    """Function:  sync_slaves
+
+    Description:  Syncs the slaves to the same point on the master at the same
+        time.  The master's executed GTID set or binary log position is taken
+        once and each slave is synced to it in its own thread.  The first
+        error cancels the syncs still running and replication is stopped and
+        started again on all the slaves, so none is left stopped at the
+        sync point.  With a progress interval the bytes each slave has
+        left to apply and its ETA are printed during the sync.
+
+    Arguments:
+        (input) mst -> Class instance of master
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            gtid -> True|False - use GTID sync
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait, 0 will wait indefinitely
+            progress -> Seconds between the progress prints, 0 for none
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    slaves = list(slaves)
+    cancel = threading.Event()
+    errors = []
+
+    if kwargs.get("gtid", False):
+        for svr in [mst] + slaves:
+            if not svr.gtid_mode:
+                return True, f"Error:  GTID mode is not enabled on {svr.name}."
+
+        func = wait_gtid
+
+        with timed("snapshot", mst):
+            target = (mst.col_sql(
+                "SELECT @@GLOBAL.gtid_executed AS gtid")[0]["gtid"],)
+
+    else:
+        # Stop the slaves first so none can run past the master position.
+        mysql_libs.chg_slv_state(slaves, "stop")
+        func = sync_pos
+
+        with timed("upd_mst_status", mst):
+            mst.upd_mst_status()
+
+        target = (mst.file, mst.pos)
+
+    progress = None
+
+    if kwargs.get("progress"):
+        with timed("binary_logs", mst):
+            if kwargs.get("gtid", False):
+                mst.upd_mst_status()
+
+            progress = SyncProgress(
+                mst.col_sql("SHOW BINARY LOGS"), (mst.file, mst.pos),
+                kwargs.get("progress"), out=kwargs.get("out"))
+
+    def _sync(slv):
+        with timed("sync", slv):
+            err_flag, err_msg = func(
+                slv, *target, cancel=cancel,
+                timeout=kwargs.get("timeout", 0),
+                server_wait=kwargs.get("server_wait", False),
+                progress=progress)
+
+        if err_flag and not cancel.is_set():
+            errors.append(err_msg)
+            cancel.set()
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slaves))) as pool:
+        list(pool.map(_sync, slaves))
+
+    if errors:
+        # Stop first to clear the UNTIL condition of the slaves still running.
+        mysql_libs.chg_slv_state(slaves, "stop")
+        mysql_libs.chg_slv_state(slaves, "start")
+
+        return True, errors[0]
+
+    return False, None
+
+
+def sync_slv(mst, slaves, **kwargs):
+
+    """Function:  sync_slv
+
+    Description:  Syncs the slaves with the master using either the GTID
+        sync, the server side wait sync or the binary log position sync in
+        mysql_libs.sync_rep_slv.  More than one slave is always synced with
+        sync_slaves so the slaves are synced at the same time, as is a slave
+        with a progress interval.
+
+    Arguments:
+        (input) mst -> Class instance of master
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            gtid -> True|False - use GTID sync
+            server_wait -> True|False - wait on the server side
+            progress -> Seconds between the progress prints, 0 for none
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    slaves = list(slaves)
+
+    if kwargs.get("gtid", False) or kwargs.get("server_wait", False) \
+       or kwargs.get("progress") or len(slaves) > 1:
+        return sync_slaves(mst, slaves, **kwargs)
+
+    with timed("sync", slaves[0]):
+        return mysql_libs.sync_rep_slv(mst, slaves[0])
+
+
+def change_source_gtid(mst, slv):
+
+    """Function:  change_source_gtid
+
+    Description:  Points the slave to the new master using GTID auto
+        positioning.  The slave's replication is stopped before the change and
+        is restarted by the caller.
+
+    Arguments:
+        (input) mst -> Class instance of new master
+        (input) slv -> Class instance of slave
+
+    """
+
+    mysql_libs.chg_slv_state([slv], "stop")
+    slv.sql(
+        "CHANGE REPLICATION SOURCE TO SOURCE_HOST=%s, SOURCE_PORT=%s,"
+        " SOURCE_USER=%s, SOURCE_PASSWORD=%s, SOURCE_AUTO_POSITION=1",
+        params=(mst.host, int(mst.port), mst.rep_user, mst.rep_japd))
+
+
+def repoint_slaves(new_master, slv_moves, **kwargs):
+
+    """Function:  repoint_slaves
+
+    Description:  Points the slaves to the new master at the same time, using
+        GTID auto positioning or the new master's current binary log
+        position.
+
+    Arguments:
+        (input) new_master -> Class instance of new master
+        (input) slv_moves -> List of class instances of slaves to be moved
+        (input) **kwargs:
+            gtid -> True|False - use GTID auto positioning
+
+    """
+
+    slv_moves = list(slv_moves)
+
+    def _repoint(slv):
+        with timed("change_master_to", slv):
+            if kwargs.get("gtid", False):
+                change_source_gtid(new_master, slv)
+
+            else:
+                mysql_libs.change_master_to(new_master, slv)
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slv_moves))) as pool:
+        list(pool.map(_repoint, slv_moves))
+
+
+def fetch_slaves(slaves, names):
+
+    """Function:  fetch_slaves
+
+    Description:  Locates the slaves in the slave array.  A SlaveArray is
+        searched with its index.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) names -> List of slave names
+        (output) slv_list -> List of slave instances
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    slv_list = []
+    err_flag = False
+    err_msg = None
+
+    for name in names:
+        if isinstance(slaves, SlaveArray):
+            slv = slaves.find_name(name)
+            err_flag = slv is None
+            err_msg = \
+                f"Error:  Slave {name} was not found in slave array." \
+                if err_flag else None
+
+        else:
+            slv, err_flag, err_msg = mysql_libs.fetch_slv(slaves, name)
+
+        if err_flag:
+            break
+
+        slv_list.append(slv)
+
+    return slv_list, err_flag, err_msg
+
+
+class MoveJournal():
+
+    """Class:  MoveJournal
+
+    Description:  Append-only journal of the steps of a move.  Each step is
+        written as a JSON line with the move's options, so the steps of an
+        unfinished move can be found and the move resumed.  A journal with
+        no file records nothing.
+
+    Methods:
+        __init__
+        load
+        record
+        resumed
+
+    """
+
+    def __init__(self, fname=None, key=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fname -> Name of the journal file or None
+            (input) key -> Dictionary of the options of the move or None
+                for any move
+
+        """
+
+        self.fname = fname
+        self.key = key
+        self.run = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self.steps = {}
+
+    def load(self, ended=("done", "rolled_back")):
+
+        """Method:  load
+
+        Description:  Loads the steps of the last move with the same options,
+            unless it ended.  A line which can not be read, such as one cut
+            short when the program was killed, is skipped.
+
+        Arguments:
+            (input) ended -> Steps which end a move
+            (output) last -> Name of the last completed step or None
+
+        """
+
+        entries = []
+
+        if os.path.isfile(self.fname):
+            with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+                for line in f_hdlr:
+                    try:
+                        entry = json.loads(line)
+
+                    except ValueError:
+                        continue
+
+                    if isinstance(entry, dict) and (
+                            self.key is None
+                            or entry.get("key") == self.key):
+                        entries.append(entry)
+
+        if not entries or entries[-1]["step"] in ended:
+            return None
+
+        self.run = entries[-1]["run"]
+        self.key = entries[-1]["key"]
+        self.steps = {entry["step"]: entry["data"] for entry in entries
+                      if entry["run"] == self.run}
+
+        return entries[-1]["step"]
+
+    def record(self, step, **data):
+
+        """Method:  record
+
+        Description:  Appends the step to the journal file and flushes it to
+            the disk, with a move_step event.
+
+        Arguments:
+            (input) step -> Name of the step
+            (input) **data -> Data of the step
+
+        """
+
+        self.steps[step] = data
+        emit("move_step", step=step, **data)
+
+        if self.fname:
+            with open(self.fname, mode="a", encoding="UTF-8") as f_hdlr:
+                f_hdlr.write(json.dumps(
+                    {"time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                     "run": self.run, "key": self.key, "step": step,
+                     "data": data}) + "\n")
+                f_hdlr.flush()
+                os.fsync(f_hdlr.fileno())
+
+    def resumed(self, step):
+
+        """Method:  resumed
+
+        Description:  Returns True if the step was completed.
+
+        Arguments:
+            (input) step -> Name of the step
+            (output) True|False - if the step was completed
+
+        """
+
+        return step in self.steps
+
+
+def open_journal(args, out=None, **key):
+
+    """Function:  open_journal
+
+    Description:  Returns the journal of the move from the -J option and
+        with the -r option loads the steps of the move to resume.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) out -> Stream of the output or None for standard out
+        (input) **key -> Options of the move
+        (output) journal -> MoveJournal class instance
+
+    """
+
+    if not args.arg_exist("-J"):
+        return MoveJournal()
+
+    journal = MoveJournal(args.get_val("-J"), key)
+
+    if args.arg_exist("-r"):
+        last = journal.load()
+
+        if last:
+            print(f"Resuming the move after step {last}.", file=out)
+
+        else:
+            print("No unfinished move found in the journal.", file=out)
+
+    return journal
+
+
+def stopped_at(slaves, target):
+
+    """Function:  stopped_at
+
+    Description:  Returns True if the SQL thread of each slave is stopped at
+        the master binary log position, which is where a position sync
+        leaves it.
+
+    Arguments:
+        (input) slaves -> List of class instances of slaves
+        (input) target -> Master binary log file and position or None
+        (output) True|False - if all the slaves are stopped at the position
+
+    """
+
+    if not target:
+        return False
+
+    for slv in slaves:
+        status = slv.col_sql("SHOW REPLICA STATUS")
+
+        if not status or status[0].get("Replica_SQL_Running") != "No" \
+           or (status[0]["Relay_Source_Log_File"],
+               int(status[0]["Exec_Source_Log_Pos"])) \
+           != (target[0], int(target[1])):
+            return False
+
+    return True
+
+
+def snapshot_slaves(slaves):
+
+    """Function:  snapshot_slaves
+
+    Description:  Returns the replication state of the slaves before they
+        are moved:  the host and port of the master, the master binary log
+        position executed up to, if auto positioning is used and the
+        executed GTID set.  A slave with no replication is left out.
+
+    Arguments:
+        (input) slaves -> List of class instances of slaves
+        (output) snapshot -> Dictionary of the state of each slave by name
+
+    """
+
+    snapshot = {}
+
+    for slv in slaves:
+        with timed("rollback_snapshot", slv):
+            status = slv.col_sql("SHOW REPLICA STATUS")
+            gtid_set = slv.col_sql("SELECT @@GLOBAL.gtid_executed AS gtid")[
+                0]["gtid"] if status and slv.gtid_mode else None
+
+        if status:
+            snapshot[slv.name] = {
+                "source": [status[0]["Source_Host"],
+                           int(status[0]["Source_Port"])],
+                "file": status[0]["Relay_Source_Log_File"],
+                "pos": int(status[0]["Exec_Source_Log_Pos"]),
+                "auto_position": str(status[0].get("Auto_Position")) == "1",
+                "gtid_executed": gtid_set}
+
+    return snapshot
+
+
+def mv_slv_to_new_mst(master, slaves, new_master, slv_moves, **kwargs):
+
+    """Function:  mv_slv_to_new_mst
+
+    Description:  Moves the slaves to the new master, but first syncs up
+        current master with the slaves and the new master before running a
+        Change Master To command.  The slaves and new master are synced at the
+        same time to the same point on the master.  In GTID mode the slaves
+        and new master are not stopped during the sync and the slaves are
+        auto positioned.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) new_master -> Class instance of new master
+        (input) slv_moves -> List of class instances of slaves to be moved
+        (input) **kwargs:
+            new_mst -> Name of slave to be the new master
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            journal -> MoveJournal class instance
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    slv_moves = list(slv_moves)
+    slv_mst = find_slv(slaves, kwargs.get("new_mst"))
+    journal = kwargs.get("journal") or MoveJournal()
+    gtid = kwargs.get("gtid", False)
+    err_flag, err_msg = False, None
+
+    if journal.resumed("started"):
+        return err_flag, err_msg
+
+    synced = journal.resumed("synced") and stopped_at(
+        [slv_mst] + slv_moves, journal.steps["synced"]["target"])
+
+    # The repointing target only holds while the slaves are still stopped
+    #   where the sync left them.
+    if journal.resumed("repointing") and (gtid or synced):
+        if not gtid:
+            new_master.file, new_master.pos = \
+                journal.steps["repointing"]["target"]
+
+    else:
+        if not synced:
+            err_flag, err_msg = sync_slaves(
+                master, [slv_mst] + slv_moves, **kwargs)
+
+            if err_flag:
+                return err_flag, err_msg
+
+            journal.record("synced", target=None if gtid
+                           else [master.file, master.pos])
+
+        if not gtid:
+            # Get latest log position.
+            with timed("upd_mst_status", new_master):
+                new_master.upd_mst_status()
+
+        if not journal.resumed("repointing"):
+            journal.record("snapshot", slaves=snapshot_slaves(slv_moves))
+
+        journal.record("repointing", target=None if gtid
+                       else [new_master.file, new_master.pos])
+
+    repoint_slaves(new_master, slv_moves, **kwargs)
+
+    with timed("chg_slv_state"):
+        mysql_libs.chg_slv_state([slv_mst] + slv_moves, "start")
+
+    journal.record("started")
+
+    return err_flag, err_msg
+
+
+def gtid_count(gtid_set):
+
+    """Function:  gtid_count
+
+    Description:  Returns the number of transactions in a GTID set.
+
+    Arguments:
+        (input) gtid_set -> GTID set, e.g. "uuid:1-5:7,uuid2:3"
+        (output) count -> Number of transactions
+
+    """
+
+    count = 0
+
+    for item in gtid_set.replace("\n", "").split(","):
+        for interval in item.strip().split(":")[1:]:
+            start, _, end = interval.partition("-")
+            count += int(end or start) - int(start) + 1
+
+    return count
+
+
+def probe_candidate(slv, mst_gtid=None, heartbeat=None):
+
+    """Function:  probe_candidate
+
+    Description:  Returns the details used to rank a slave as a candidate
+        for the new master:  its master and the server id and UUID of its
+        master, lag, relay log backlog, received
+        and executed GTID sets, read-only mode, binary logging, logging of
+        replicated updates, current load and with a master GTID set the
+        number of the master's transactions it has not executed.  With a
+        heartbeat the lag is the heartbeat lag in seconds, otherwise it is
+        Seconds_Behind_Source.
+
+    Arguments:
+        (input) slv -> Class instance of slave
+        (input) mst_gtid -> Executed GTID set of the master or None
+        (input) heartbeat -> Heartbeat class instance or None
+        (output) info -> Dictionary of the candidate details
+
+    """
+
+    with timed("probe_candidate", slv):
+        status = slv.col_sql("SHOW REPLICA STATUS")
+        variables = {
+            row["Variable_name"]: row["Value"] for row in slv.col_sql(
+                "SHOW GLOBAL VARIABLES WHERE Variable_name IN ('read_only',"
+                " 'log_bin', 'log_replica_updates', 'log_slave_updates')")}
+        load = slv.col_sql("SHOW GLOBAL STATUS LIKE 'Threads_running'")
+        missing = None
+
+        if mst_gtid is not None:
+            missing = gtid_count(slv.col_sql(
+                "SELECT GTID_SUBTRACT(%s, @@GLOBAL.gtid_executed) AS missing",
+                params=(mst_gtid,))[0]["missing"])
+
+    status = status[0] if status else {}
+    backlog = 0
+    lag = status.get("Seconds_Behind_Source")
+
+    if heartbeat and status:
+        hb_lag = heartbeat.lag(slv)
+        lag = lag if hb_lag is None else hb_lag / 1000
+
+    if status.get("Source_Log_File") == status.get("Relay_Source_Log_File"):
+        backlog = int(status.get("Read_Source_Log_Pos") or 0) \
+            - int(status.get("Exec_Source_Log_Pos") or 0)
+
+    return {
+        "name": slv.name,
+        "source": (status.get("Source_Host"),
+                   int(status.get("Source_Port") or 0)),
+        "source_id": int(status.get("Source_Server_Id") or 0),
+        "source_uuid": status.get("Source_UUID") or "",
+        "running": status.get("Replica_IO_Running") == "Yes"
+                   and status.get("Replica_SQL_Running") == "Yes",
+        "lag": lag,
+        "backlog": max(backlog, 0),
+        "retrieved": status.get("Retrieved_Gtid_Set") or "",
+        "executed": status.get("Executed_Gtid_Set") or "",
+        "read_only": gen_libs.is_true(variables.get("read_only")),
+        "log_bin": gen_libs.is_true(variables.get("log_bin")),
+        "log_replica_updates": gen_libs.is_true(variables.get(
+            "log_replica_updates", variables.get("log_slave_updates"))),
+        "load": int(load[0]["Value"]) if load else 0,
+        "missing": missing}
+
+
+def rank_candidates(infos, mst_uuid):
+
+    """Function:  rank_candidates
+
+    Description:  Ranks the candidates for the new master.  A candidate is
+        rejected if it does not replicate from the master, found from the
+        server UUID of its master and not its host name, its replication
+        is not running, it is read-only, or it does not write the
+        replicated updates to its binary log.  The others are ranked by the
+        transactions they are missing, their lag, their relay log backlog
+        and then their load, so the first will sync fastest.
+
+    Arguments:
+        (input) infos -> List of candidate details from probe_candidate
+        (input) mst_uuid -> Server UUID of the master
+        (output) ranking -> List of the ranked candidate details, each with
+            a list of the reasons it was rejected
+
+    """
+
+    checks = [
+        (lambda info: info["source_uuid"] == mst_uuid,
+         "not a slave of the master"),
+        (lambda info: info["running"], "replication not running"),
+        (lambda info: not info["read_only"], "read-only"),
+        (lambda info: info["log_bin"], "binary logging off"),
+        (lambda info: info["log_replica_updates"],
+         "log_replica_updates off")]
+
+    for info in infos:
+        info["rejected"] = [msg for check, msg in checks if not check(info)]
+
+    return sorted(infos, key=lambda info: (
+        bool(info["rejected"]), info["missing"] or 0,
+        float("inf") if info["lag"] is None else float(info["lag"]),
+        info["backlog"], info["load"], info["name"]))
+
+
+def select_new_master(master, slaves, **kwargs):
+
+    """Function:  select_new_master
+
+    Description:  Checks every slave which is not being moved at the same
+        time and selects the best candidate for the new master.  The
+        ranking is printed.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            slv_mv -> List of names of slaves to be moved to new master
+            args -> ArgParser class instance
+            gtid -> True|False - use GTID sync and auto positioning
+            heartbeat -> Heartbeat class instance or None
+            out -> Stream of the output or None for standard out
+        (output) new_mst -> Name of the selected slave or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    names = [slv.name for slv in slaves
+             if slv.name not in (kwargs.get("slv_mv") or [])]
+    open_slaves(slaves, names, args=kwargs.get("args"), optional=True,
+                out=kwargs.get("out"))
+    candidates = [slv for slv in (find_slv(slaves, name) for name in names)
+                  if slv.conn]
+    mst_gtid = None
+    mst_uuid = master.col_sql(
+        "SELECT @@GLOBAL.server_uuid AS uuid")[0]["uuid"]
+
+    if kwargs.get("gtid", False):
+        mst_gtid = master.col_sql(
+            "SELECT @@GLOBAL.gtid_executed AS gtid")[0]["gtid"]
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(candidates), get_conn_opts(
+                kwargs.get("args"))["workers"]))) as pool:
+        ranking = rank_candidates(
+            list(pool.map(lambda slv: probe_candidate(
+                slv, mst_gtid, heartbeat=kwargs.get("heartbeat")),
+                          candidates)), mst_uuid)
+
+    print("Candidates for the new master:", file=kwargs.get("out"))
+
+    for num, info in enumerate(ranking, 1):
+        print(f'\t{num}. {info["name"]}:  lag {info["lag"]}  backlog'
+              f' {info["backlog"]}  missing {info["missing"]}  load'
+              f' {info["load"]}'
+              + (f'  rejected: {", ".join(info["rejected"])}'
+                 if info["rejected"] else ""), file=kwargs.get("out"))
+
+    if not ranking or ranking[0]["rejected"]:
+        return None, True, "Error:  No slave is able to be the new master."
+
+    print(f'Selected new master:  {ranking[0]["name"]}',
+          file=kwargs.get("out"))
+    emit("new_master_selected", server=ranking[0]["name"],
+         candidates=ranking)
+
+    return ranking[0]["name"], False, None
+
+
+def move_slave(master, slaves, **kwargs):
+
+    """Function:  move_slave
+
+    Description:  Calls the functions to setup the new master, locate the
+        slaves to be moved, and moves the slaves to the new master.  Used to
+        setup the new master from existing slave array and whether to
+        drop the rep connection between the old master and new master.
+        Only the new master and the slaves to be moved are connected, unless
+        the new master is auto, then all slaves are checked to select it.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            new_mst -> Name of slave to be the new master or auto
+            slv_mv -> List of names of slaves to be moved to new master
+            args -> ArgParser class instance
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            lag_max -> Seconds of lag a moved slave can have
+            converge_timeout -> Seconds to wait for the slaves to converge
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    args = kwargs.get("args")
+    slv_names = kwargs.get("slv_mv")
+    slv_names = slv_names if isinstance(slv_names, list) else [slv_names]
+    journal = open_journal(
+        args, op="-R" if args.arg_exist("-R") else "-M", master=master.name,
+        new_mst=kwargs.get("new_mst"), slaves=sorted(slv_names),
+        gtid=kwargs.get("gtid", False), out=kwargs.get("out"))
+
+    if journal.resumed("selected"):
+        kwargs = dict(kwargs, new_mst=journal.steps["selected"]["new_mst"])
+
+    elif kwargs.get("new_mst") == "auto":
+        new_mst, err_flag, err_msg = select_new_master(
+            master, slaves, **dict(kwargs, slv_mv=slv_names))
+
+        if err_flag:
+            return err_flag, err_msg
+
+        kwargs = dict(kwargs, new_mst=new_mst)
+        journal.record("selected", new_mst=new_mst)
+
+    if kwargs.get("new_mst") and kwargs.get("new_mst") in slv_names:
+        return True, f'Error:  New master {kwargs.get("new_mst")} is also a' \
+            f' slave to be moved.'
+
+    kwargs = dict(kwargs, journal=journal)
+
+    err_flag, err_msg = open_slaves(
+        slaves, [kwargs.get("new_mst")] + slv_names, args=args,
+        out=kwargs.get("out"))
+
+    if not err_flag:
+        slv_moves, err_flag, err_msg = fetch_slaves(slaves, slv_names)
+
+    if not err_flag:
+        new_master, err_flag, err_msg = crt_slv_mst(slaves, **kwargs)
+
+        if not err_flag:
+            slv_mst = find_slv(slaves, kwargs.get("new_mst"))
+            err_flag, err_msg = mv_slv_to_new_mst(
+                master, slaves, new_master, slv_moves, **kwargs)
+
+            if not err_flag:
+                if args.arg_exist("-R"):
+                    mysql_libs.chg_slv_state([slv_mst], "stop")
+                    snapshot = journal.steps.get(
+                        "snapshot", {}).get("slaves", {})
+
+                    if slv_mst.name not in snapshot:
+                        journal.record("snapshot", slaves=dict(
+                            snapshot, **snapshot_slaves([slv_mst])))
+
+                    mysql_libs.reset_slave(slv_mst)
+
+                if kwargs.get("heartbeat"):
+                    kwargs["heartbeat"].detach(
+                        slv_moves, None if args.arg_exist("-R")
+                        else new_master)
+
+                err_flag, err_msg = wait_converged(
+                    slv_moves if args.arg_exist("-R")
+                    else slv_moves + [slv_mst], **kwargs)
+
+                if err_flag and args.arg_exist("-A"):
+                    err_flag, err_msg = auto_rollback(
+                        master, slv_moves + [slv_mst], err_msg, **kwargs)
+
+            if not err_flag:
+                journal.record("done")
+
+            close_inst(new_master, slv_mst)
+
+    return err_flag, err_msg
+
+
+def mv_slv_up(master, new_master, slv_master, slv_moves, **kwargs):
+
+    """Function:  mv_slv_up
+
+    Description:  Syncs the slave/master with the new master and the slaves
+        with the slave/master, then moves the slaves from the slave/master to
+        the new master.
+
+    Arguments:
+        (input) master -> Class instance of slave/master as a master
+        (input) new_master -> Class instance of new master
+        (input) slv_master -> Class instance of slave/master as a slave
+        (input) slv_moves -> List of class instances of slaves to be moved
+        (input) **kwargs:
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            lag_max -> Seconds of lag a moved slave can have
+            converge_timeout -> Seconds to wait for the slaves to converge
+            journal -> MoveJournal class instance
+            heartbeat -> Heartbeat class instance or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    slv_moves = list(slv_moves)
+    journal = kwargs.get("journal") or MoveJournal()
+    gtid = kwargs.get("gtid", False)
+
+    mst_synced = synced = False
+
+    if not journal.resumed("started"):
+        mst_synced = journal.resumed("mst_synced") and stopped_at(
+            [slv_master], journal.steps["mst_synced"]["target"])
+        synced = mst_synced and journal.resumed("synced") and stopped_at(
+            slv_moves, journal.steps["synced"]["target"])
+
+    # The repointing target only holds while the slaves are still stopped
+    #   where the syncs left them.
+    if journal.resumed("started") or (
+            journal.resumed("repointing") and (gtid or synced)):
+        if not gtid:
+            new_master.file, new_master.pos = \
+                journal.steps["repointing"]["target"]
+
+    else:
+        if mst_synced:
+            new_master.file, new_master.pos = \
+                journal.steps["mst_synced"]["target"]
+
+        else:
+            err_flag, err_msg = sync_slv(new_master, [slv_master], **kwargs)
+
+            if err_flag:
+                return err_flag, err_msg
+
+            journal.record("mst_synced", target=None if gtid
+                           else [new_master.file, new_master.pos])
+
+        if not synced:
+            err_flag, err_msg = sync_slv(master, slv_moves, **kwargs)
+
+            if err_flag:
+                return err_flag, err_msg
+
+            journal.record("synced", target=None if gtid
+                           else [master.file, master.pos])
+
+        if not journal.resumed("repointing"):
+            journal.record("snapshot", slaves=snapshot_slaves(slv_moves))
+
+        journal.record("repointing", target=None if gtid
+                       else [new_master.file, new_master.pos])
+
+    if not journal.resumed("started"):
+        repoint_slaves(new_master, slv_moves, **kwargs)
+
+        with timed("chg_slv_state"):
+            mysql_libs.chg_slv_state(slv_moves + [slv_master], "start")
+
+        journal.record("started")
+
+    if kwargs.get("heartbeat"):
+        kwargs["heartbeat"].detach(slv_moves, new_master)
+
+    err_flag, err_msg = wait_converged(slv_moves + [slv_master], **kwargs)
+
+    if not err_flag:
+        journal.record("done")
+
+    return err_flag, err_msg
+
+
+def cfg_mst_inst(name, path):
+
+    """Function:  cfg_mst_inst
+
+    Description:  Creates a master instance from a master configuration
+        file.  The instance is not connected.
+
+    Arguments:
+        (input) name -> Name of the master configuration file
+        (input) path -> Directory path to the configuration file
+        (output) mst -> Class instance of master
+
+    """
+
+    cfg = gen_libs.load_module(name, path)
+
+    return mysql_class.MasterRep(
+        cfg.name, cfg.sid, cfg.user, cfg.japd,
+        os_type=getattr(machine, cfg.serv_os)(), host=cfg.host, port=cfg.port,
+        defaults_file=cfg.cfg_file,
+        extra_def_file=cfg.__dict__.get("extra_def_file", None),
+        rep_user=cfg.rep_user, rep_japd=cfg.rep_japd)
+
+
+def move_slave_up(master, slaves, **kwargs):
+
+    """Function:  move_slave_up
+
+    Description:  Find the slaves that will be moved, creates the new and
+        slave master instances, sync up the databases between new master,
+        slave/master and slaves and then move the slaves from the
+        slave/master to the new master.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            new_mst -> Name of slave to be the new master
+            slv_mv -> List of names of slaves to be moved to new master
+            args -> ArgParser class instance
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    args = kwargs.get("args")
+    slv_names = kwargs.get("slv_mv")
+    slv_names = slv_names if isinstance(slv_names, list) else [slv_names]
+
+    if kwargs.get("new_mst") and kwargs.get("new_mst") in slv_names:
+        return True, f'Error:  New master {kwargs.get("new_mst")} is also a' \
+            f' slave to be moved.'
+
+    err_flag, err_msg = open_slaves(
+        slaves, slv_names, args=args, out=kwargs.get("out"))
+
+    if err_flag:
+        return err_flag, err_msg
+
+    slv_moves, err_flag, err_msg = fetch_slaves(slaves, slv_names)
+
+    if err_flag:
+        return err_flag, err_msg
+
+    kwargs = dict(kwargs, journal=open_journal(
+        args, op="-S", master=master.name, new_mst=kwargs.get("new_mst"),
+        slaves=sorted(slv_names), gtid=kwargs.get("gtid", False),
+        out=kwargs.get("out")))
+    new_master = cfg_mst_inst(kwargs.get("new_mst"), args.get_val("-d"))
+
+    with timed("connect", new_master):
+        new_master.connect(silent=True)
+
+    slv_master = crt_slv_inst(master, share=True)
+
+    if new_master.conn_msg or slv_master.conn_msg:
+        err_flag = True
+        err_msg = "Detected problem in one of the connections"
+
+        print("Error:  Connection problem for new master/slave master.",
+              file=kwargs.get("out"))
+        print(f"\tNew Master:  {new_master.conn_msg}", file=kwargs.get("out"))
+        print(f"\tSlave Master:  {slv_master.conn_msg}",
+              file=kwargs.get("out"))
+
+        for srv in [new_master, slv_master]:
+            if srv.conn_msg:
+                emit("connection_error", server=srv.name,
+                     message=srv.conn_msg)
+
+        if new_master.conn:
+            mysql_libs.disconnect(new_master)
+
+        close_inst(slv_master, master)
+
+    else:
+        err_flag, err_msg = mv_slv_up(
+            master, new_master, slv_master, slv_moves, **kwargs)
+
+        if err_flag and args.arg_exist("-A") \
+           and kwargs["journal"].resumed("started"):
+            err_flag, err_msg = auto_rollback(
+                master, slv_moves, err_msg, **kwargs)
+
+        mysql_libs.disconnect(new_master)
+        close_inst(slv_master, master)
+
+    return err_flag, err_msg
+
+
+def rollback_slave(source, slv, entry, **kwargs):
+
+    """Function:  rollback_slave
+
+    Description:  Points the slave back to the master it was moved from, at
+        the position or GTID state in its snapshot, and starts it.  A slave
+        which was not moved is only started.  A slave moved to a binary log
+        position which has applied transactions since the move is not
+        rolled back, as they would be applied again.
+
+    Arguments:
+        (input) source -> Class instance of the master the slave was moved
+            from
+        (input) slv -> Class instance of slave
+        (input) entry -> Dictionary of the snapshot of the slave
+        (input) **kwargs:
+            moved_to -> New master binary log position the slave was moved
+                to or None
+            gtid -> True|False - the slave was moved with auto positioning
+        (output) err_msg -> Error message or None
+
+    """
+
+    status = slv.col_sql("SHOW REPLICA STATUS")
+    status = status[0] if status else {}
+
+    if status and [status["Source_Host"], int(status["Source_Port"])] \
+       == list(entry["source"]):
+        mysql_libs.chg_slv_state([slv], "start")
+
+        return None
+
+    if kwargs.get("gtid", False) or entry["auto_position"]:
+        change_source_gtid(source, slv)
+
+    else:
+        if entry["gtid_executed"] is not None:
+            applied = slv.col_sql("SELECT @@GLOBAL.gtid_executed AS gtid")[
+                0]["gtid"] != entry["gtid_executed"]
+
+        else:
+            applied = bool(status) and [
+                status["Relay_Source_Log_File"],
+                int(status["Exec_Source_Log_Pos"])] \
+                != list(kwargs.get("moved_to") or [])
+
+        if applied:
+            return f"Error:  Slave {slv.name} has applied transactions since" \
+                f" the move and can not be rolled back to its position."
+
+        mysql_libs.chg_slv_state([slv], "stop")
+        slv.sql(
+            "CHANGE REPLICATION SOURCE TO SOURCE_HOST=%s, SOURCE_PORT=%s,"
+            " SOURCE_USER=%s, SOURCE_PASSWORD=%s, SOURCE_LOG_FILE=%s,"
+            " SOURCE_LOG_POS=%s, SOURCE_AUTO_POSITION=0",
+            params=(source.host, int(source.port), source.rep_user,
+                    source.rep_japd, entry["file"], int(entry["pos"])))
+
+    mysql_libs.chg_slv_state([slv], "start")
+
+    return None
+
+
+def rollback_slaves(source, slaves, **kwargs):
+
+    """Function:  rollback_slaves
+
+    Description:  Rolls back the slaves in the snapshot of the move at the
+        same time, then waits for them to converge.
+
+    Arguments:
+        (input) source -> Class instance of the master the slaves were moved
+            from
+        (input) slaves -> List of class instances of slaves
+        (input) **kwargs:
+            journal -> MoveJournal class instance with the snapshot
+            gtid -> True|False - the slaves were moved with auto positioning
+            lag_max -> Seconds of lag a slave can have
+            converge_timeout -> Seconds to wait for the slaves to converge
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    journal = kwargs.get("journal") or MoveJournal()
+    snapshot = journal.steps.get("snapshot", {}).get("slaves", {})
+    moved_to = journal.steps.get("repointing", {}).get("target")
+    slaves = [slv for slv in slaves if slv.name in snapshot]
+
+    def _rollback(slv):
+        with timed("rollback", slv):
+            try:
+                return rollback_slave(
+                    source, slv, snapshot[slv.name], moved_to=moved_to,
+                    gtid=kwargs.get("gtid", False))
+
+            except Exception as err:                # pylint:disable=W0718
+                return f"Error:  Rollback of slave {slv.name} failed: {err}"
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slaves))) as pool:
+        errors = [msg for msg in pool.map(_rollback, slaves) if msg]
+
+    if errors:
+        return True, "\n".join(errors)
+
+    journal.record("rolled_back")
+
+    return wait_converged(slaves, **kwargs)
+
+
+def auto_rollback(source, slaves, err_msg, **kwargs):
+
+    """Function:  auto_rollback
+
+    Description:  Rolls back a move whose slaves did not converge.
+
+    Arguments:
+        (input) source -> Class instance of the master the slaves were moved
+            from
+        (input) slaves -> List of class instances of slaves
+        (input) err_msg -> Error message of the move
+        (input) **kwargs:
+            journal -> MoveJournal class instance with the snapshot
+            gtid -> True|False - the slaves were moved with auto positioning
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True
+        (output) err_msg -> Error message
+
+    """
+
+    print(err_msg, file=kwargs.get("out"))
+    print("Rolling back the move.", file=kwargs.get("out"))
+    err_flag, err_msg = rollback_slaves(source, slaves, **kwargs)
+
+    return True, err_msg if err_flag \
+        else "Error:  The move did not converge and was rolled back."
+
+
+def rollback_move(master, slaves, **kwargs):
+
+    """Function:  rollback_move
+
+    Description:  Rolls back the last move in the journal which was not
+        rolled back, from the snapshot recorded before the move.
+
+    Arguments:
+        (input) master -> Master class instance the slaves were moved from
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            args -> ArgParser class instance
+            lag_max -> Seconds of lag a slave can have
+            converge_timeout -> Seconds to wait for the slaves to converge
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    args = kwargs.get("args")
+    journal = MoveJournal(args.get_val("-J"))
+    journal.load(ended=["rolled_back"])
+
+    if not journal.resumed("snapshot"):
+        return True, "Error:  No move to roll back was found in the journal."
+
+    if journal.key["master"] != master.name:
+        return True, f'Error:  The move in the journal was from master' \
+            f' {journal.key["master"]}.'
+
+    names = list(journal.steps["snapshot"]["slaves"])
+    err_flag, err_msg = open_slaves(
+        slaves, names, args=args, out=kwargs.get("out"))
+
+    if not err_flag:
+        slv_moves, err_flag, err_msg = fetch_slaves(slaves, names)
+
+    if not err_flag:
+        print(f'Rolling back the {journal.key["op"]} move of'
+              f' {", ".join(names)}.', file=kwargs.get("out"))
+        err_flag, err_msg = rollback_slaves(
+            master, slv_moves, **dict(kwargs, journal=journal,
+                                      gtid=journal.key["gtid"]))
+
+    return err_flag, err_msg
+
+
+def catch_up(slv_sets, deadline):
+
+    """Function:  catch_up
+
+    Description:  Waits at the same time for each slave to execute its GTID
+        set, until the deadline.
+
+    Arguments:
+        (input) slv_sets -> List of (slave instance, GTID set)
+        (input) deadline -> time.monotonic value to finish by
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message of the first slave to fail
+
+    """
+
+    def _wait(item):
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            return True, \
+                f"Error:  No time left for slave {item[0].name} to catch up."
+
+        with timed("catch_up", item[0]):
+            return wait_gtid(item[0], item[1], timeout=remaining)
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slv_sets))) as pool:
+        errors = [result for result in pool.map(_wait, slv_sets)
+                  if result[0]]
+
+    return errors[0] if errors else (False, None)
+
+
+def rank_failover(states):
+
+    """Function:  rank_failover
+
+    Description:  Ranks the slaves of a failed master as its replacement.
+        The slave with the most executed transactions is first.  When there
+        are other slaves to move under it, a slave without binary logging
+        or log_replica_updates is rejected, as the others could not catch up
+        from it.
+
+    Arguments:
+        (input) states -> List of slave details from probe_candidate, with
+            the executed GTID set after the relay logs were applied
+        (output) ranking -> List of the ranked slave details, each with a
+            list of the reasons it was rejected
+
+    """
+
+    for info in states:
+        info["rejected"] = []
+
+        if len(states) > 1 and not info["log_bin"]:
+            info["rejected"].append("binary logging off")
+
+        if len(states) > 1 and not info["log_replica_updates"]:
+            info["rejected"].append("log_replica_updates off")
+
+    return sorted(states, key=lambda info: (
+        bool(info["rejected"]), -gtid_count(info["executed"]), info["load"],
+        info["name"]))
+
+
+def failover(master, slaves, **kwargs):
+
+    """Function:  failover
+
+    Description:  Replaces a master which is down with the most advanced of
+        its slaves.  The reachable slaves are checked at the same time and
+        the slaves of the master first apply the transactions in their
+        relay logs.  The slave with the most executed transactions becomes
+        the new master, the other slaves are pointed to it with GTID auto
+        positioning and catch up from it.  All of this must finish within
+        the recovery time budget.  Slaves with transactions the new master
+        does not have are reported.  A master which can be connected to is
+        not failed over, as it may still be taking writes.  The slaves of
+        the master are found from the server id of its configuration file.
+
+    Arguments:
+        (input) master -> Master class instance, does not need a connection
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            args -> ArgParser class instance
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    if not master.conn_msg:
+        return True, f"Error:  Master {master.name} is up, failover refused."
+
+    args = kwargs.get("args")
+    budget = float(args.get_val("-B", def_val=60))
+    start = time.monotonic()
+    deadline = start + budget
+    open_slaves(slaves, [slv.name for slv in slaves], args=args,
+                optional=True, out=kwargs.get("out"))
+    survivors = [slv for slv in slaves if slv.conn]
+
+    for slv in survivors:
+        if not slv.gtid_mode:
+            return True, f"Error:  GTID mode is not enabled on {slv.name}."
+
+    def _executed(slv):
+        return slv.col_sql(
+            "SELECT @@GLOBAL.gtid_executed AS gtid")[0]["gtid"]
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(survivors))) as pool:
+        orphans = [
+            (slv, info) for slv, info in zip(
+                survivors, pool.map(probe_candidate, survivors))
+            if info["source_id"] == int(master.server_id)]
+
+    if not orphans:
+        return True, f"Error:  No reachable slave of {master.name}."
+
+    err_flag, err_msg = catch_up(
+        [(slv, info["retrieved"]) for slv, info in orphans], deadline)
+
+    if err_flag:
+        return err_flag, err_msg
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(orphans)) as pool:
+        for (slv, info), gtid in zip(
+                orphans, pool.map(_executed, [slv for slv, _ in orphans])):
+            info["executed"] = gtid
+
+    ranking = rank_failover([info for _, info in orphans])
+    print(f"Failover candidates for {master.name}:", file=kwargs.get("out"))
+
+    for num, info in enumerate(ranking, 1):
+        print(f'\t{num}. {info["name"]}:  executed'
+              f' {gtid_count(info["executed"])}  load {info["load"]}'
+              + (f'  rejected: {", ".join(info["rejected"])}'
+                 if info["rejected"] else ""), file=kwargs.get("out"))
+
+    if ranking[0]["rejected"]:
+        return True, "Error:  No slave is able to be the new master."
+
+    new_slv = [slv for slv, info in orphans if info is ranking[0]][0]
+    others = [slv for slv, _ in orphans if slv is not new_slv]
+    mysql_libs.chg_slv_state([new_slv], "stop")
+    mysql_libs.reset_slave(new_slv)
+    new_master = crt_mst_inst(new_slv, share=True)
+
+    for info in ranking[1:]:
+        errant = new_master.col_sql(
+            "SELECT GTID_SUBTRACT(%s, @@GLOBAL.gtid_executed) AS errant",
+            params=(info["executed"],))[0]["errant"]
+
+        if errant:
+            print(f'Warning:  Slave {info["name"]} has transactions the new'
+                  f' master does not have:  {errant}', file=kwargs.get("out"))
+
+    repoint_slaves(new_master, others, gtid=True)
+
+    with timed("chg_slv_state"):
+        mysql_libs.chg_slv_state(others, "start")
+
+    err_flag, err_msg = catch_up(
+        [(slv, ranking[0]["executed"]) for slv in others], deadline)
+
+    if not err_flag:
+        print(f"Failover to {new_slv.name} completed in"
+              f" {time.monotonic() - start:.3f} of {budget} seconds.",
+              file=kwargs.get("out"))
+        emit("failover_completed", server=new_slv.name,
+             seconds=round(time.monotonic() - start, 6), budget=budget)
+
+    return err_flag, err_msg
+
+
+def read_topology(fname, path):
+
+    """Function:  read_topology
+
+    Description:  Reads the target topology file.  Each line is the name of
+        a slave followed by the name of the server it will replicate from or
+        none.  Blank lines and lines starting with # are skipped.  A file
+        which can not be read or is not text is returned as an error.
+
+    Arguments:
+        (input) fname -> [path/]file name of the topology file
+        (input) path -> Directory path to the config files
+        (output) target -> Dictionary of slave name: master name or None
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    target = {}
+    err_flag = False
+    err_msg = None
+
+    if not os.path.isfile(fname):
+        fname = os.path.join(path, fname)
+
+    try:
+        with open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            for line in f_hdlr:
+                line = line.strip()
+
+                if not line or line.startswith("#"):
+                    continue
+
+                items = line.split()
+
+                if len(items) != 2 or items[0] in target:
+                    err_flag = True
+                    err_msg = f"Error:  Invalid topology line:  {line}"
+                    break
+
+                target[items[0]] = \
+                    None if items[1].lower() == "none" else items[1]
+
+    except (OSError, UnicodeDecodeError) as err:
+        err_flag = True
+        err_msg = f"Error:  Unable to read topology file {fname}: {err}"
+
+    return target, err_flag, err_msg
+
+
+def get_topology(master, slaves):
+
+    """Function:  get_topology
+
+    Description:  Returns the current replication tree by checking the
+        replica status of the slaves at the same time.  The master of a
+        slave is found by matching its host and port against the servers.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (output) current -> Dictionary of server name: master name or None
+
+    """
+
+    hosts = {(srv.host, int(srv.port)): srv.name
+             for srv in [master] + list(slaves)}
+
+    def _source(slv):
+        data = slv.col_sql("SHOW REPLICA STATUS")
+
+        if not data:
+            return None
+
+        return hosts.get(
+            (data[0]["Source_Host"], int(data[0]["Source_Port"])))
+
+    current = {master.name: None}
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(slaves))) as pool:
+        current.update(zip(
+            [slv.name for slv in slaves], pool.map(_source, slaves)))
+
+    return current
+
+
+def plan_topology(current, target):
+
+    """Function:  plan_topology
+
+    Description:  Works out the steps to change the current replication
+        tree to the target tree.  Slaves are placed in order of their depth
+        in the target tree so a slave's new master is already in place when
+        the slave is moved.  A step is either a move under a sibling (move),
+        a move under the master's master (up) or the removal of the slave's
+        replication (detach).
+
+    Arguments:
+        (input) current -> Dictionary of server name: master name or None
+        (input) target -> Dictionary of slave name: master name or None
+        (output) steps -> List of steps (step type, slave, from, to)
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    tree = dict(current)
+    final = dict(current)
+    final.update(target)
+    steps = []
+
+    for name, mst in target.items():
+        if name not in tree or (mst is not None and mst not in tree):
+            return [], True, f"Error:  Unknown server in topology:  {name}"
+
+    depth = {}
+
+    for name in final:
+        chain = [name]
+
+        while final[chain[-1]] is not None:
+            if final[chain[-1]] in chain:
+                return [], True, \
+                    f"Error:  Topology has a replication loop at {name}"
+
+            chain.append(final[chain[-1]])
+
+        depth[name] = len(chain)
+
+    for name in sorted(target, key=lambda item: depth[item]):
+        dst = target[name]
+
+        if tree[name] == dst:
+            continue
+
+        if dst is None:
+            steps.append(("detach", name, tree[name], None))
+            tree[name] = None
+            continue
+
+        # Masters of the new master, from the new master up to the top.
+        chain = [dst]
+
+        while tree[chain[-1]] is not None:
+            chain.append(tree[chain[-1]])
+
+        while tree[name] not in chain:
+            src = tree[name]
+
+            if src is None or tree[src] is None:
+                return [], True, \
+                    f"Error:  No move will place {name} under {dst}"
+
+            steps.append(("up", name, src, tree[src]))
+            tree[name] = tree[src]
+
+        for mst in reversed(chain[:chain.index(tree[name])]):
+            steps.append(("move", name, tree[name], mst))
+            tree[name] = mst
+
+    return steps, False, None
+
+
+def schedule_plan(steps):
+
+    """Function:  schedule_plan
+
+    Description:  Groups the steps into waves of steps which can run at the
+        same time.  A step is placed in the wave after the last step which
+        changes one of the same servers, which keeps the order of the steps
+        for each server.
+
+    Arguments:
+        (input) steps -> List of steps (step type, slave, from, to)
+        (output) waves -> List of lists of steps
+
+    """
+
+    waves = []
+    last = {}
+
+    for step in steps:
+        kind, name, src, dst = step
+        changed = {name, {"move": dst, "up": src}.get(kind)} - {None}
+        wave = max([last.get(srv, -1) for srv in changed]) + 1
+
+        if wave == len(waves):
+            waves.append([])
+
+        waves[wave].append(step)
+
+        for srv in changed:
+            last[srv] = wave
+
+    return waves
+
+
+def run_step(master, slaves, step, **kwargs):
+
+    """Function:  run_step
+
+    Description:  Runs one step of a topology change.  The masters of the
+        step are given their own connections so steps can run at the same
+        time.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) step -> Step (step type, slave, from, to)
+        (input) **kwargs:
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            lag_max -> Seconds of lag a moved slave can have
+            converge_timeout -> Seconds to wait for the slaves to converge
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    kind, name, src, dst = step
+    servers = {
+        srv: master if srv == master.name else find_slv(slaves, srv)
+        for srv in [name, src, dst]}
+    slv = servers[name]
+
+    if kind == "detach":
+        mysql_libs.chg_slv_state([slv], "stop")
+        mysql_libs.reset_slave(slv)
+
+        return False, None
+
+    src_mst = crt_mst_inst(servers[src])
+    dst_mst = crt_mst_inst(servers[dst])
+
+    if src_mst.conn_msg or dst_mst.conn_msg:
+        err_flag = True
+        err_msg = "Detected problem in one of the connections"
+        print(f"Error:  Connection problem for {kind} of {name}.",
+              file=kwargs.get("out"))
+        print(f"\t{src}:  {src_mst.conn_msg}", file=kwargs.get("out"))
+        print(f"\t{dst}:  {dst_mst.conn_msg}", file=kwargs.get("out"))
+
+    elif kind == "move":
+        err_flag, err_msg = mv_slv_to_new_mst(
+            src_mst, slaves, dst_mst, [slv], **dict(kwargs, new_mst=dst))
+
+        if not err_flag:
+            err_flag, err_msg = wait_converged(
+                [slv] if dst == master.name else [slv, servers[dst]],
+                **kwargs)
+
+    else:
+        err_flag, err_msg = mv_slv_up(
+            src_mst, dst_mst, servers[src], [slv], **kwargs)
+
+    mysql_libs.disconnect(
+        [mst for mst in [src_mst, dst_mst] if mst.conn])
+
+    return err_flag, err_msg
+
+
+def topology_change(master, slaves, **kwargs):
+
+    """Function:  topology_change
+
+    Description:  Changes the replication tree to the target topology in the
+        -T option file.  The steps are worked out from the current tree,
+        which is taken from the discovered graph when there is one, and the
+        steps in each wave are run at the same time.  No further waves are
+        run after a step fails.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            args -> ArgParser class instance
+            graph -> Dictionary of the discovered replication tree
+            gtid -> True|False - use GTID sync and auto positioning
+            server_wait -> True|False - wait on the server side
+            timeout -> Seconds to wait for a sync, 0 will wait indefinitely
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    args = kwargs.get("args")
+    err_flag, err_msg = open_slaves(
+        slaves, [slv.name for slv in slaves], args=args,
+        out=kwargs.get("out"))
+
+    if err_flag:
+        return err_flag, err_msg
+
+    target, err_flag, err_msg = read_topology(
+        args.get_val("-T"), args.get_val("-d"))
+
+    if err_flag:
+        return err_flag, err_msg
+
+    if kwargs.get("graph"):
+        current = dict.fromkeys([master.name] + [slv.name for slv in slaves])
+        current.update(
+            (slv, mst) for mst, slv in kwargs.get("graph")["edges"])
+
+    else:
+        current = get_topology(master, slaves)
+
+    steps, err_flag, err_msg = plan_topology(current, target)
+
+    for wave in [] if err_flag else schedule_plan(steps):
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(wave)) as pool:
+            results = list(pool.map(
+                lambda step: run_step(master, slaves, step, **kwargs), wave))
+
+        errors = [result for result in results if result[0]]
+
+        if errors:
+            err_flag, err_msg = errors[0]
+            break
+
+    return err_flag, err_msg
+
+
+class SlaveArray(list):
+
+    """Class:  SlaveArray
+
+    Description:  Slave instance array indexed by name, server id and
+        host:port.  The index is built when the array is created, so the
+        array is not changed afterwards.
+
+    Methods:
+        __init__
+        find_name
+        find_id
+        find_host
+
+    """
+
+    def __init__(self, slaves=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) slaves -> Slave instance list
+
+        """
+
+        super().__init__(slaves or [])
+        self.names = {slv.name: slv for slv in self}
+        self.ids = {int(slv.server_id): slv for slv in self}
+        self.hosts = {(slv.host, int(slv.port)): slv for slv in self}
+
+    def find_name(self, name):
+
+        """Method:  find_name
+
+        Description:  Returns the slave with the name or None.
+
+        Arguments:
+            (input) name -> Name of the slave
+
+        """
+
+        return self.names.get(name)
+
+    def find_id(self, server_id):
+
+        """Method:  find_id
+
+        Description:  Returns the slave with the server id or None.
+
+        Arguments:
+            (input) server_id -> Server id of the slave
+
+        """
+
+        return self.ids.get(int(server_id))
+
+    def find_host(self, host, port):
+
+        """Method:  find_host
+
+        Description:  Returns the slave with the host and port or None.
+
+        Arguments:
+            (input) host -> Host name of the slave
+            (input) port -> Port of the slave
+
+        """
+
+        return self.hosts.get((host, int(port)))
+
+
+def find_slv(slaves, name):
+
+    """Function:  find_slv
+
+    Description:  Returns the slave with the name.  A SlaveArray is searched
+        with its index, a list is searched with mysql_libs.find_name.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) name -> Name of the slave
+        (output) slv -> Class instance of slave or None
+
+    """
+
+    if isinstance(slaves, SlaveArray):
+        return slaves.find_name(name)
+
+    return mysql_libs.find_name(slaves, name)
+
+
+def create_slv_inst(slv_array):
+
+    """Function:  create_slv_inst
+
+    Description:  Create Slave_Rep instances from the slave configuration
+        array.  The instances are not connected to their databases.
+
+    Arguments:
+        (input) slv_array -> List of slave configuration dictionaries
+        (output) slaves -> Slave instance list
+
+    """
+
+    slaves = []
+
+    for slv in slv_array:
+        slaves.append(mysql_class.SlaveRep(
+            slv["name"], slv["sid"], slv["user"], slv["japd"],
+            os_type=getattr(machine, slv["serv_os"])(), host=slv["host"],
+            port=int(slv["port"]), defaults_file=slv["cfg_file"],
+            extra_def_file=slv.get("extra_def_file", None),
+            rep_user=slv["rep_user"], rep_japd=slv["rep_japd"],
+            ssl_client_ca=slv.get("ssl_client_ca", None),
+            ssl_ca_path=slv.get("ssl_ca_path", None),
+            ssl_client_key=slv.get("ssl_client_key", None),
+            ssl_client_cert=slv.get("ssl_client_cert", None),
+            ssl_client_flag=slv.get("ssl_client_flag", None),
+            ssl_disabled=slv.get("ssl_disabled", False),
+            ssl_verify_id=slv.get("ssl_verify_id", False),
+            ssl_verify_cert=slv.get("ssl_verify_cert", False),
+            tls_versions=slv.get("tls_versions", [])))
+
+    return slaves
+
+
+def connect_servers(servers, **kwargs):
+
+    """Function:  connect_servers
+
+    Description:  Connect to a list of servers at the same time, with up to
+        the number of workers connecting at once.  A server that does not
+        complete its connection within the timeout, measured from when its
+        own connection attempt started, is marked as down by setting its
+        conn_msg attribute and its attempt is left behind on a daemon thread,
+        so it holds neither a worker nor the program's exit.  Each attempt
+        connects a copy of the server, which is only copied back if the
+        attempt completed in time, so a late connection is disconnected and
+        never seen on a server marked as down.
+
+    Arguments:
+        (input) servers -> List of Server class instances
+        (input) **kwargs:
+            workers -> Number of connection threads
+            timeout -> Seconds allowed for each server to connect
+        (output) servers -> List of Server class instances
+
+    """
+
+    servers = list(servers)
+    timeout = kwargs.get("timeout", 30)
+    workers = max(1, kwargs.get("workers", 10))
+    changed = threading.Event()
+    lock = threading.Lock()
+    pending = list(servers)
+    running = {}
+    ended = set()
+
+    def _connect(svr):
+        attempt = copy.copy(svr)
+
+        try:
+            with timed("connect", svr):
+                attempt.connect(silent=True)
+
+        except Exception as err:                    # pylint:disable=W0718
+            attempt.conn_msg = str(err)
+
+        with lock:
+            late = id(svr) in ended
+
+            if not late:
+                vars(svr).update(vars(attempt))
+                ended.add(id(svr))
+
+        if late and attempt.conn:
+            mysql_libs.disconnect(attempt)
+
+        changed.set()
+
+    while pending or running:
+        while pending and len(running) < workers:
+            svr = pending.pop(0)
+            # A daemon thread, so one hung in a connection attempt does not
+            # hold the program open at exit.
+            thread = threading.Thread(target=_connect, args=(svr,),
+                                      daemon=True)
+            running[id(svr)] = (svr, time.monotonic(), thread)
+            thread.start()
+
+        changed.wait(0.1)
+        changed.clear()
+        now = time.monotonic()
+
+        for key, (svr, start, thread) in list(running.items()):
+            if not thread.is_alive():
+                del running[key]
+
+            elif now - start > timeout:
+                # Frees the slot of the hung attempt for the next server.
+                del running[key]
+
+                with lock:
+                    if key not in ended:
+                        ended.add(key)
+                        svr.conn_msg = \
+                            f"Connection timed out after {timeout} seconds"
+
+    return servers
+
+
+def get_conn_opts(args):
+
+    """Function:  get_conn_opts
+
+    Description:  Returns the connection pool settings from the arguments.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) Dictionary of connect_servers keyword arguments
+
+    """
+
+    return {"workers": int(float(args.get_val("-w", def_val=10))),
+            "timeout": float(args.get_val("-t", def_val=30))}
+
+
+def get_slv_names(args):
+
+    """Function:  get_slv_names
+
+    Description:  Returns the names of the slaves to be moved from the -n
+        option values and the -f option file, each name once in the order
+        given.  Blank lines and lines starting with # in the file are
+        skipped.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) names -> List of slave names
+
+    """
+
+    names = args.get_val("-n", def_val=[])
+    names = list(names) if isinstance(names, list) else [names]
+
+    if args.arg_exist("-f"):
+        fname = args.get_val("-f")
+
+        if not os.path.isfile(fname):
+            fname = os.path.join(args.get_val("-d"), fname)
+
+        with open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            names.extend(
+                line.strip() for line in f_hdlr
+                if line.strip() and not line.strip().startswith("#"))
+
+    # A name given twice would be synced by two threads on one connection.
+    return list(dict.fromkeys(names))
+
+
+def get_sync_opts(args):
+
+    """Function:  get_sync_opts
+
+    Description:  Returns the sync settings from the arguments.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) Dictionary of sync keyword arguments
+
+    """
+
+    return {"gtid": args.arg_exist("-g"),
+            "server_wait": args.arg_exist("-W"),
+            "timeout": float(args.get_val("-W", def_val=0)),
+            "lag_max": float(args.get_val("-l", def_val=1)),
+            "converge_timeout": float(args.get_val("-x", def_val=60)),
+            "progress": float(args.get_val("-I", def_val=0))}
+
+
+def open_slaves(slaves, names, **kwargs):
+
+    """Function:  open_slaves
+
+    Description:  Connects the named slaves in the slave array on their first
+        use.  Slaves already connected, or which have already failed to
+        connect, are not connected again.  Names not found in the slave array
+        are ignored and left for the caller to report.  Slaves which are not
+        required by the operation are only reported as a warning.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) names -> List of slave names to be connected
+        (input) **kwargs:
+            args -> ArgParser class instance
+            optional -> True|False - slaves are not required by the operation
+            out -> Stream of the output or None for standard out
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    needed = [find_slv(slaves, name) for name in dict.fromkeys(names)]
+    needed = [slv for slv in needed if slv]
+    connect_servers(
+        [slv for slv in needed if not slv.conn and not slv.conn_msg],
+        **get_conn_opts(kwargs.get("args")))
+    down = [slv for slv in needed if slv.conn_msg]
+
+    if down and kwargs.get("optional", False):
+        for slv in down:
+            print(f"Warning:  Slave {slv.name} is unreachable:"
+                  f" {slv.conn_msg}", file=kwargs.get("out"))
+
+    elif down:
+        err_flag = True
+        err_msg = "Detected problem in slave connection"
+        print("Error:  Connection problem for slave(s).",
+              file=kwargs.get("out"))
+
+        for slv in down:
+            print(f"\tSlave:  {slv.name}:  {slv.conn_msg}",
+                  file=kwargs.get("out"))
+            emit("connection_error", server=slv.name, message=slv.conn_msg)
+
+    return err_flag, err_msg
+
+
+def probe_server(srv):
+
+    """Function:  probe_server
+
+    Description:  Returns the replica status and the replicas of a server.
+
+    Arguments:
+        (input) srv -> Class instance of server
+        (output) status -> Dictionary of the replica status or empty
+        (output) replicas -> List of replicas from show replicas
+
+    """
+
+    with timed("probe", srv):
+        status = srv.col_sql("SHOW REPLICA STATUS")
+        replicas = srv.col_sql("SHOW REPLICAS")
+
+    return status[0] if status else {}, replicas
+
+
+def discover_slaves(master, slaves, **kwargs):
+
+    """Function:  discover_slaves
+
+    Description:  Discovers the slaves by walking the replication tree down
+        from the master a level at a time.  The servers in a level are
+        connected and probed at the same time.  A slave in the slave array
+        is used when its host and port match, otherwise a slave instance is
+        created with the master's configuration.  A replica without a
+        report_host is matched by its server id.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            args -> ArgParser class instance
+            out -> Stream of the output or None for standard out
+        (output) found -> Slave instance list of the discovered slaves
+        (output) graph -> Dictionary of the replication tree:
+            nodes -> Dictionary of server name: server details
+            edges -> List of [master name, slave name]
+
+    """
+
+    known = slaves if isinstance(slaves, SlaveArray) else SlaveArray(slaves)
+    seen = {(master.host, int(master.port))}
+    graph = {"nodes": {}, "edges": []}
+    found = []
+    level = [master]
+    depth = 0
+
+    while level:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(level)) as pool:
+            results = list(pool.map(probe_server, level))
+
+        nxt = []
+
+        for srv, (status, replicas) in zip(level, results):
+            graph["nodes"][srv.name] = {
+                "host": srv.host, "port": int(srv.port), "depth": depth,
+                "lag": status.get("Seconds_Behind_Source"),
+                "file": status.get("Relay_Source_Log_File"),
+                "pos": status.get("Exec_Source_Log_Pos"),
+                "gtid": status.get("Executed_Gtid_Set"),
+                "error": None}
+
+            for row in replicas:
+                slv = known.find_id(row["Server_Id"])
+
+                if not row["Host"] and not slv:
+                    print(f'Warning:  Replica {row["Server_Id"]} of'
+                          f' {srv.name} has no report_host set.',
+                          file=kwargs.get("out"))
+                    continue
+
+                key = (row["Host"], int(row["Port"])) if row["Host"] \
+                    else (slv.host, int(slv.port))
+
+                if key in seen:
+                    continue
+
+                seen.add(key)
+                slv = known.find_host(*key) or mysql_class.SlaveRep(
+                    f"{key[0]}:{key[1]}", row["Server_Id"], master.sql_user,
+                    master.sql_pass, os_type=master.machine, host=key[0],
+                    port=key[1], defaults_file=master.defaults_file,
+                    extra_def_file=master.extra_def_file,
+                    rep_user=master.rep_user, rep_japd=master.rep_japd)
+                graph["edges"].append([srv.name, slv.name])
+                nxt.append(slv)
+
+        connect_servers(
+            [slv for slv in nxt if not slv.conn],
+            **get_conn_opts(kwargs.get("args")))
+        depth += 1
+
+        for slv in nxt:
+            if slv.conn_msg:
+                print(f"Warning:  Slave {slv.name} is unreachable:"
+                      f" {slv.conn_msg}", file=kwargs.get("out"))
+                graph["nodes"][slv.name] = {
+                    "host": slv.host, "port": int(slv.port), "depth": depth,
+                    "lag": None, "file": None, "pos": None, "gtid": None,
+                    "error": slv.conn_msg}
+
+        found.extend(nxt)
+        level = [slv for slv in nxt if not slv.conn_msg]
+
+    return found, graph
+
+
+def cache_dir_error(cache_dir):
+
+    """Function:  cache_dir_error
+
+    Description:  Checks the cache directory is a directory owned by the user
+        which the group and others can not write to, so another user can
+        not change the cached configuration.
+
+    Arguments:
+        (input) cache_dir -> Cache directory
+        (output) err_msg -> Error message or None
+
+    """
+
+    try:
+        status = os.stat(cache_dir)
+
+    except OSError as err:
+        return f"Error:  Cache directory {cache_dir} can not be used:" \
+            f" {err.strerror}"
+
+    if not stat.S_ISDIR(status.st_mode):
+        return f"Error:  Cache directory {cache_dir} is not a directory."
+
+    if status.st_uid != os.getuid():
+        return f"Error:  Cache directory {cache_dir} is not owned by the" \
+            f" user."
+
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return f"Error:  Cache directory {cache_dir} is writable by the" \
+            f" group or others."
+
+    return None
+
+
+def strip_secrets(data):
+
+    """Function:  strip_secrets
+
+    Description:  Returns the parsed configuration with the values of the
+        secret entries, such as the passwords, set to None so they are not
+        written to the cache.
+
+    Arguments:
+        (input) data -> Dictionary or list of dictionaries of a configuration
+        (output) data -> Configuration without the secret values
+
+    """
+
+    if isinstance(data, list):
+        return [strip_secrets(item) for item in data]
+
+    return {key: None if key in CFG_SECRETS else val
+            for key, val in data.items()}
+
+
+def fill_mst_secrets(fname, data):
+
+    """Function:  fill_mst_secrets
+
+    Description:  Returns the cached master configuration with the secret
+        values read from the configuration module.  The module is parsed and
+        not run, so a secret which is not a literal is not read.
+
+    Arguments:
+        (input) fname -> Name of the master configuration module file
+        (input) data -> Dictionary of the cached master configuration
+        (output) data -> Master configuration or None if a secret is not read
+
+    """
+
+    secrets = {}
+
+    try:
+        with open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            tree = ast.parse(f_hdlr.read())
+
+        for node in tree.body:
+            if not isinstance(node, ast.Assign):
+                continue
+
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in data \
+                   and target.id in CFG_SECRETS:
+                    secrets[target.id] = ast.literal_eval(node.value)
+
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+        return None
+
+    if set(secrets) != set(CFG_SECRETS) & set(data):
+        return None
+
+    return dict(data, **secrets)
+
+
+def fill_slv_secrets(fname, data):
+
+    """Function:  fill_slv_secrets
+
+    Description:  Returns the cached slave configuration with the secret
+        values read from the slave configuration file.  The values of each
+        secret entry are given to the slaves with the entry in file order.
+
+    Arguments:
+        (input) fname -> Name of the slave configuration file
+        (input) data -> List of the cached slave configuration dictionaries
+        (output) data -> Slave configuration or None if a secret is not read
+
+    """
+
+    values = {key: [] for key in CFG_SECRETS}
+
+    try:
+        with open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            for line in f_hdlr:
+                key, _, val = line.strip().partition("=")
+
+                if not key.startswith("#") and key.strip() in values:
+                    values[key.strip()].append(val.strip())
+
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    for key, vals in values.items():
+        if len(vals) != len([item for item in data if key in item]):
+            return None
+
+        vals.reverse()
+
+    return [{key: values[key].pop() if key in CFG_SECRETS else val
+             for key, val in item.items()} for item in data]
+
+
+def write_cache(cache_file, cache):
+
+    """Function:  write_cache
+
+    Description:  Writes a configuration cache file.  The file is written
+        to a temporary file which then replaces the cache file, so a reader
+        never sees a partial file.  A cache which cannot be written is
+        skipped, the cache only saves the parsing.
+
+    Arguments:
+        (input) cache_file -> Name of the cache file
+        (input) cache -> Dictionary of the cache contents
+        (output) status -> True|False - if the cache was written
+
+    """
+
+    tmp_file = f"{cache_file}.{os.getpid()}"
+
+    try:
+        with os.fdopen(os.open(tmp_file, os.O_WRONLY | os.O_CREAT
+                               | os.O_TRUNC, 0o600),
+                       mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(cache, f_hdlr, separators=(",", ":"))
+
+        os.replace(tmp_file, cache_file)
+
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+        return False
+
+    return True
+
+
+def cached_load(fname, cache_dir, loader, key=None, fill=None):
+
+    """Function:  cached_load
+
+    Description:  Returns the parsed contents of a configuration file from
+        the cache in the cache directory, or from the loader when the file
+        has changed since it was cached.  An unchanged modification time
+        and size is a hit without reading the file, otherwise the file's
+        SHA-256 hash is checked before the loader is called.  A file changed
+        in the last two seconds is always hashed, as a change within the
+        same clock tick keeps the modification time.  The secret values are
+        not cached, on a hit they are read from the file by the fill
+        function.  A cache directory which fails cache_dir_error is not
+        used.
+
+    Arguments:
+        (input) fname -> Name of the configuration file
+        (input) cache_dir -> Cache directory or None to not use the cache
+        (input) loader -> Function which parses the configuration file
+        (input) key -> JSON data the parsed contents depend on
+        (input) fill -> Function which returns the cached contents with the
+            secret values from the file, or None if they can not be read
+        (output) data -> Parsed contents of the configuration file
+
+    """
+
+    try:
+        status = os.stat(fname)
+
+    except OSError:
+        status = None
+
+    if not cache_dir or status is None or cache_dir_error(cache_dir):
+        return loader()
+
+    fill = fill or (lambda fname, data: data)
+
+    cache_file = os.path.join(cache_dir, hashlib.sha256(
+        os.path.abspath(fname).encode()).hexdigest()[:16] + ".json")
+    ident = [__version__, key]
+    stamp = [status.st_mtime_ns, status.st_size]
+
+    if time.time_ns() - status.st_mtime_ns < 2000000000:
+        stamp = None
+
+    try:
+        with open(cache_file, mode="r", encoding="UTF-8") as f_hdlr:
+            cache = json.load(f_hdlr)
+
+    except (OSError, ValueError):
+        cache = {}
+
+    if not isinstance(cache, dict) or cache.get("ident") != ident:
+        cache = {}
+
+    if stamp and cache.get("stamp") == stamp:
+        data = fill(fname, cache["data"])
+
+        if data is not None:
+            return data
+
+    with open(fname, mode="rb") as f_hdlr:
+        digest = hashlib.sha256(f_hdlr.read()).hexdigest()
+
+    data = fill(fname, cache["data"]) if cache.get("digest") == digest \
+        else None
+    data = loader() if data is None else data
+    write_cache(cache_file, {"ident": ident, "stamp": stamp,
+                             "digest": digest, "data": strip_secrets(data)})
+
+    return data
+
+
+def load_mst_cfg(args):
+
+    """Function:  load_mst_cfg
+
+    Description:  Loads the master configuration module, from the cache if
+        the -C option is used.  A cached configuration is returned as a
+        namespace of the module's settings.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) cfg -> Master configuration module or namespace
+
+    """
+
+    name = args.get_val("-c")
+    path = args.get_val("-d")
+
+    if not args.arg_exist("-C"):
+        return gen_libs.load_module(name, path)
+
+    def _load():
+        return {
+            key: val
+            for key, val in vars(gen_libs.load_module(name, path)).items()
+            if not key.startswith("_")
+            and not isinstance(val, types.ModuleType)}
+
+    return types.SimpleNamespace(**cached_load(
+        os.path.join(path, name + ".py"), args.get_val("-C"), _load,
+        fill=fill_mst_secrets))
+
+
+def load_slv_cfg(args, slv_key):
+
+    """Function:  load_slv_cfg
+
+    Description:  Parses the slave configuration file and converts the data
+        types of the entries, from the cache if the -C option is used.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) slv_key -> Dictionary of keys and data types
+        (output) slv_array -> List of slave configuration dictionaries
+
+    """
+
+    def _load():
+        slv_array = gen_libs.create_cfg_array(
+            args.get_val("-s"), cfg_path=args.get_val("-d"))
+
+        return gen_libs.transpose_dict(slv_array, slv_key)
+
+    return cached_load(
+        os.path.join(args.get_val("-d"), args.get_val("-s")),
+        args.get_val("-C"), _load, key=slv_key, fill=fill_slv_secrets)
+
+
+def create_instances(args, **kwargs):
+
+    """Function:  create_instances
+
+    Description:  Create a Master_Rep instance for master and Slave_Rep
+        instances for slaves.  Slave instances will be appended to an array.
+        Only the master is connected, the slaves are connected on first use
+        by the operation which needs them.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+        (output) master -> Master instance
+        (output) slave -> SlaveArray of slave instances
+
+    """
+
+    with timed("load_config"):
+        cfg = load_mst_cfg(args)
+        master = mysql_class.MasterRep(
+            cfg.name, cfg.sid, cfg.user, cfg.japd,
+            os_type=getattr(machine, cfg.serv_os)(), host=cfg.host,
+            port=cfg.port, defaults_file=cfg.cfg_file,
+            extra_def_file=cfg.__dict__.get("extra_def_file", None),
+            rep_user=cfg.rep_user, rep_japd=cfg.rep_japd)
+        slaves = SlaveArray()
+
+        if args.arg_exist("-s"):
+            slv_array = load_slv_cfg(args, kwargs.get("slv_key", {}))
+            slaves = SlaveArray(create_slv_inst(slv_array))
+
+    connect_servers([master], **get_conn_opts(args))
+
+    return master, slaves
+
+
+def refresh_conns(master, slaves):
+
+    """Function:  refresh_conns
+
+    Description:  Reconnects the master and the connected slaves whose
+        connections have been lost, and clears the failed connections of
+        slaves so they are tried again on their next use.  Used by the daemon
+        to keep its connections usable between requests.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slaves -> Slave instance array
+
+    """
+
+    lost = [srv for srv in [master] + list(slaves)
+            if srv.conn and not srv.conn.is_connected()]
+
+    for srv in lost + [slv for slv in slaves if not slv.conn]:
+        srv.conn = None
+        srv.conn_msg = None
+
+    if master in lost:
+        connect_servers([master])
+
+
+def parse_request(argv, args, **kwargs):
+
+    """Function:  parse_request
+
+    Description:  Parses the options of a daemon request and checks them
+        with the same checks main uses for the command line.  Options which
+        are not allowed in a request are taken from the daemon's options.
+
+    Arguments:
+        (input) argv -> List of request options, e.g. ["-M", "-m", "name"]
+        (input) args -> ArgParser class instance of the daemon
+        (input) **kwargs:
+            func_dict -> Dictionary list of functions and options
+            req_opts -> List of options allowed in a request
+            opt_val -> List of options which require values
+            multi_val -> List of options which will have multiple values
+            opt_xor_val -> Dictionary of options which are xor
+            opt_con_req -> Dictionary of options which require other options
+            opt_con_or -> Dictionary of options which require one of others
+            opt_num -> List of options which require numeric values
+        (output) req_args -> ArgParser class instance of the request
+        (output) err_msg -> Error message or None
+
+    """
+
+    req_opts = kwargs.get("req_opts", [])
+    bad = [opt for opt in argv if opt.startswith("-") and opt not in req_opts]
+
+    if bad:
+        return None, f"Error:  Options not allowed in a request: {bad}"
+
+    req_args = gen_class.ArgParser(
+        [sys.argv[0]] + argv, opt_val=kwargs.get("opt_val", []),
+        multi_val=kwargs.get("multi_val", []))
+
+    if not req_args.arg_parse2():
+        return None, "Error:  Unable to parse the request options."
+
+    func_dict = kwargs.get("func_dict", {})
+
+    for opt, val in args.args_array.items():
+        if opt not in req_opts and opt not in func_dict:
+            req_args.args_array[opt] = val
+
+    ops = set(req_args.get_args_keys()) & set(func_dict)
+
+    if len(ops) != 1:
+        return None, "Error:  Request requires one operation option."
+
+    if req_args.arg_xor_dict(opt_xor_val=kwargs.get("opt_xor_val", {}))  \
+       and req_args.arg_cond_req(opt_con_req=kwargs.get("opt_con_req", {})) \
+       and req_args.arg_cond_req_or(opt_con_or=kwargs.get("opt_con_or", {})) \
+       and chk_num_args(req_args, kwargs.get("opt_num", [])):
+        return req_args, None
+
+    return None, "Error:  Invalid request options."
+
+
+def run_request(master, slaves, request, **kwargs):
+
+    """Function:  run_request
+
+    Description:  Runs a daemon request with the daemon's connections and
+        returns the response.  The output of the operation is written to a
+        stream of the request and returned in the response.  With the -H
+        option the heartbeat runs while the request runs.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slaves -> Slave instance array
+        (input) request -> Dictionary of the request, with an argv list
+        (input) **kwargs:
+            args -> ArgParser class instance of the daemon
+            func_dict -> Dictionary list of functions and options
+            req_chk -> Dictionary of the option checks for parse_request
+        (output) response -> Dictionary of the response
+
+    """
+
+    argv = request.get("argv")
+    err_flag = True
+    output = io.StringIO()
+    start = time.monotonic()
+
+    if not isinstance(argv, list) \
+       or not all(isinstance(item, str) for item in argv):
+        err_msg = "Error:  Request argv is not a list of options."
+
+    else:
+        req_args, err_msg = parse_request(
+            argv, kwargs.get("args"), func_dict=kwargs.get("func_dict"),
+            **kwargs.get("req_chk", {}))
+
+    if not err_msg:
+        item = list(set(req_args.get_args_keys())
+                    & set(kwargs.get("func_dict")))[0]
+        refresh_conns(master, slaves)
+        reset_timing()
+        locks = ServerLocks()
+        heartbeat = None
+
+        try:
+            err_flag, err_msg = lock_servers(
+                locks, master, slaves, req_args, item)
+
+            if not err_flag and req_args.arg_exist("-H") \
+               and not master.conn_msg:
+                heartbeat, hb_flag, hb_msg = start_heartbeat(
+                    heartbeat_source(master, req_args),
+                    req_args.get_val("-H"))
+
+                if hb_flag:
+                    print(f"Warning:  Running without the heartbeat."
+                          f"  {hb_msg}", file=output)
+
+            if not err_flag:
+                err_flag, err_msg = kwargs.get("func_dict")[item](
+                    master, slaves, new_mst=req_args.get_val("-m"),
+                    slv_mv=get_slv_names(req_args), args=req_args,
+                    heartbeat=heartbeat, out=output,
+                    **get_sync_opts(req_args))
+
+        except Exception as err:                    # pylint:disable=W0718
+            err_flag, err_msg = True, f"Error:  Request failed: {err}"
+
+        finally:
+            if heartbeat:
+                heartbeat.stop()
+
+                if heartbeat.err_msg:
+                    print(heartbeat.err_msg, file=output)
+
+            locks.release(out=output)
+
+    return {"status": "error" if err_flag else "ok", "msg": err_msg,
+            "output": output.getvalue(),
+            "seconds": round(time.monotonic() - start, 6)}
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+
+    """Class:  DaemonHandler
+
+    Description:  Handles a client connection to the daemon.  Each line from
+        the client is a JSON request, which is queued for the daemon and
+        answered with a JSON response line once it has run.  A ping request
+        is answered at once with the number of queued requests.
+
+    Methods:
+        handle
+        reply
+
+    """
+
+    def handle(self):
+
+        """Method:  handle
+
+        Description:  Reads the requests from the client and writes the
+            responses.
+
+        Arguments:
+
+        """
+
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+
+                if not isinstance(request, dict):
+                    raise ValueError("request is not a JSON object")
+
+            except ValueError as err:
+                self.reply({"status": "error",
+                            "msg": f"Error:  Invalid request: {err}"})
+                continue
+
+            if request.get("cmd") == "ping":
+                self.reply({"status": "ok",
+                            "queued": self.server.work.qsize()})
+                continue
+
+            future = concurrent.futures.Future()
+
+            # A request after the daemon stopped taking work is refused, as
+            #   it would never be run.
+            with self.server.work_lock:
+                if self.server.closing:
+                    future.set_result(
+                        {"status": "error",
+                         "msg": "Error:  Daemon is shutting down."})
+
+                else:
+                    self.server.work.put((request, future))
+
+            self.reply(future.result())
+
+    def reply(self, response):
+
+        """Method:  reply
+
+        Description:  Writes a response line to the client.
+
+        Arguments:
+            (input) response -> Dictionary of the response
+
+        """
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+        self.wfile.flush()
+
+
+def open_socket(path):
+
+    """Function:  open_socket
+
+    Description:  Creates the daemon's Unix socket server.  A socket file
+        left by a daemon which is no longer running is removed, a socket
+        with a daemon listening on it is an error.  The socket is only
+        usable by the user.
+
+    Arguments:
+        (input) path -> Path of the Unix socket
+        (output) server -> Socket server instance or None
+        (output) err_msg -> Error message or None
+
+    """
+
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(path) == 0:
+                return None, f"Error:  A daemon is listening on {path}"
+
+        os.remove(path)
+
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, DaemonHandler)
+
+    except OSError as err:
+        return None, f"Error:  Unable to listen on {path}: {err}"
+
+    os.chmod(path, 0o600)
+    server.daemon_threads = True
+    server.work = queue.Queue()
+    server.work_lock = threading.Lock()
+    server.closing = False
+
+    return server, None
+
+
+def run_daemon(master, slaves, **kwargs):
+
+    """Function:  run_daemon
+
+    Description:  Runs as a daemon which takes requests on a Unix socket and
+        runs them with its connections to the master and slaves, which are
+        kept between requests.  Requests are queued and run one at a time in
+        the order received, so requests on the same servers never overlap.
+        A shutdown request, SIGTERM or SIGINT stops the daemon after the
+        requests before it and the requests after it are refused.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slaves -> Slave instance array
+        (input) **kwargs:
+            args -> ArgParser class instance
+            func_dict -> Dictionary list of functions and options
+            req_chk -> Dictionary of the option checks for parse_request
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    path = kwargs.get("args").get_val("-L")
+    server, err_msg = open_socket(path)
+
+    if err_msg:
+        return True, err_msg
+
+    stop = threading.Event()
+    handlers = {sig: signal.signal(sig, lambda signum, frame: stop.set())
+                for sig in [signal.SIGTERM, signal.SIGINT]}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    while not stop.is_set():
+        try:
+            request, future = server.work.get(timeout=1)
+
+        except queue.Empty:
+            continue
+
+        if request.get("cmd") == "shutdown":
+            stop.set()
+            future.set_result({"status": "ok", "msg": "Shutting down"})
+
+        else:
+            future.set_result(run_request(master, slaves, request, **kwargs))
+
+    with server.work_lock:
+        server.closing = True
+
+    server.shutdown()
+
+    while not server.work.empty():
+        server.work.get()[1].set_result(
+            {"status": "error", "msg": "Error:  Daemon is shutting down."})
+
+    server.server_close()
+    os.remove(path)
+
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+    return False, None
+
+
+class LeaseLock():
+
+    """Class:  LeaseLock
+
+    Description:  Holds the coordination lock on a server with GET_LOCK from
+        a connection of its own.  The session's wait_timeout is set to the
+        lease and a thread checks the lock every third of the lease, which
+        keeps the session alive.  If the run stops, the server closes the
+        idle session after the lease and frees the lock.
+
+    Methods:
+        __init__
+        acquire
+        renew
+        release
+
+    """
+
+    def __init__(self, server, lease):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Master class instance with its own connection
+            (input) lease -> Seconds of the lease
+
+        """
+
+        self.server = server
+        self.lease = lease
+        self.done = threading.Event()
+        self.thread = None
+        self.err_msg = None
+
+    def acquire(self):
+
+        """Method:  acquire
+
+        Description:  Takes the lock, waiting up to the lease for another
+            run to free it, and starts the renewal thread.
+
+        Arguments:
+            (output) err_flag -> True|False - if an error has occurred
+            (output) err_msg -> Error message
+
+        """
+
+        if self.server.conn_msg:
+            return True, f"Error:  Lease connection to {self.server.name}" \
+                f" failed: {self.server.conn_msg}"
+
+        try:
+            self.server.sql("SET SESSION wait_timeout = %s",
+                            params=(self.lease,))
+
+            with timed("get_lock", self.server):
+                data = self.server.col_sql(
+                    "SELECT GET_LOCK(%s, %s) AS got",
+                    params=(LEASE_NAME, self.lease))
+
+        except Exception as err:                    # pylint:disable=W0718
+            return True, f"Error:  Lease on {self.server.name} failed: {err}"
+
+        if not data or data[0]["got"] != 1:
+            return True, f"Error:  Server {self.server.name} is leased by" \
+                f" another run."
+
+        def _run():
+            while not self.done.wait(self.lease / 3):
+                try:
+                    held = self.renew()
+
+                except Exception:                   # pylint:disable=W0718
+                    held = False
+
+                if not held:
+                    self.err_msg = \
+                        f"Warning:  Lease on {self.server.name} was lost."
+                    break
+
+        self.thread = threading.Thread(target=_run, daemon=True)
+        self.thread.start()
+
+        return False, None
+
+    def renew(self):
+
+        """Method:  renew
+
+        Description:  Checks the lock is still held by the session, which
+            also keeps the session from timing out.
+
+        Arguments:
+            (output) held -> True|False - if the lock is held
+
+        """
+
+        data = self.server.col_sql(
+            "SELECT IS_USED_LOCK(%s) = CONNECTION_ID() AS held",
+            params=(LEASE_NAME,))
+
+        return bool(data and data[0]["held"])
+
+    def release(self):
+
+        """Method:  release
+
+        Description:  Stops the renewal thread, frees the lock and closes the
+            connection.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+
+        if self.thread:
+            self.thread.join()
+
+            try:
+                self.server.sql("DO RELEASE_LOCK(%s)", params=(LEASE_NAME,))
+
+            except Exception:                       # pylint:disable=W0718
+                pass
+
+        if self.server.conn:
+            mysql_libs.disconnect(self.server)
+
+
+class ServerLocks():
+
+    """Class:  ServerLocks
+
+    Description:  Holds exclusive locks on the servers an operation changes,
+        so runs changing different servers can run at the same time.  Each
+        server is locked with a lock file named from its host and port in
+        a lock directory shared by the users of the program.  The locks are
+        not waited on, a server locked by another run is refused right away.
+        It also holds the coordination leases of the run.
+
+    Methods:
+        __init__
+        acquire
+        lease
+        release
+
+    """
+
+    def __init__(self, lock_dir=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) lock_dir -> Directory of the lock files
+
+        """
+
+        self.lock_dir = lock_dir or os.path.join(
+            tempfile.gettempdir(), "mysql_rep_change-locks")
+        self.held = {}
+        self.leases = []
+
+    def acquire(self, servers):
+
+        """Method:  acquire
+
+        Description:  Locks the servers which are not already held.  If a
+            server is locked by another run or its lock file can not be
+            opened, the locks taken by this call are released.
+
+        Arguments:
+            (input) servers -> List of (host, port) of the servers
+            (output) err_flag -> True|False - if an error has occurred
+            (output) err_msg -> Error message
+
+        """
+
+        taken = []
+        err_flag, err_msg = False, None
+
+        try:
+            try:
+                os.mkdir(self.lock_dir)
+                os.chmod(self.lock_dir, 0o1777)
+
+            except FileExistsError:
+                pass
+
+            for key in sorted({f"{str(host).lower()}:{int(port)}"
+                               for host, port in servers} - set(self.held)):
+                l_fd = os.open(
+                    os.path.join(
+                        self.lock_dir, "mysql_rep_change-"
+                        + re.sub(r"[^\w.-]", "_", key) + ".lock"),
+                    os.O_RDWR | os.O_CREAT, 0o666)
+
+                try:
+                    fcntl.flock(l_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                except BlockingIOError:
+                    os.close(l_fd)
+                    err_flag = True
+                    err_msg = f"Error:  Server {key} is locked by another run."
+                    break
+
+                except OSError:
+                    os.close(l_fd)
+                    raise
+
+                self.held[key] = l_fd
+                taken.append(key)
+
+        except OSError as err:
+            err_flag = True
+            err_msg = f"Error:  Unable to lock the servers: {err}"
+
+        if err_flag:
+            for item in taken:
+                os.close(self.held.pop(item))
+
+        return err_flag, err_msg
+
+    def lease(self, servers, lease):
+
+        """Method:  lease
+
+        Description:  Takes the coordination lease on each server, in the
+            order of their host and port so runs do not wait on each other.
+
+        Arguments:
+            (input) servers -> List of class instances of the servers
+            (input) lease -> Seconds of the lease
+            (output) err_flag -> True|False - if an error has occurred
+            (output) err_msg -> Error message
+
+        """
+
+        for srv in sorted(servers,
+                          key=lambda srv: (str(srv.host), int(srv.port))):
+            self.leases.append(LeaseLock(crt_mst_inst(srv), lease))
+            err_flag, err_msg = self.leases[-1].acquire()
+
+            if err_flag:
+                return err_flag, err_msg
+
+        return False, None
+
+    def release(self, out=None):
+
+        """Method:  release
+
+        Description:  Releases all the leases and locks held.  A lease which
+            was lost is printed.
+
+        Arguments:
+            (input) out -> Stream of the output or None for standard out
+
+        """
+
+        for lease in reversed(self.leases):
+            lease.release()
+
+            if lease.err_msg:
+                print(lease.err_msg, file=out)
+
+        for l_fd in self.held.values():
+            os.close(l_fd)
+
+        self.held = {}
+        self.leases = []
+
+
+def lock_targets(master, slaves, args, item):
+
+    """Function:  lock_targets
+
+    Description:  Returns the servers the operation changes:  the master,
+        the new master and the slaves to be moved.  A topology change, a
+        failover and a move to an automatically selected new master can
+        change any slave, so all the slaves are returned, as are they for a
+        rollback.
+
+    Arguments:
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) args -> ArgParser class instance
+        (input) item -> Option of the operation
+        (output) targets -> List of (host, port) of the servers
+
+    """
+
+    targets = [(master.host, master.port)]
+    names = get_slv_names(args)
+
+    if item in ["-T", "-F", "-U"] or args.get_val("-m") == "auto":
+        names = [slv.name for slv in slaves]
+
+    elif item == "-S":
+        cfg = gen_libs.load_module(args.get_val("-m"), args.get_val("-d"))
+        targets.append((cfg.host, cfg.port))
+
+    else:
+        names.append(args.get_val("-m"))
+
+    for name in names:
+        slv = find_slv(slaves, name)
+
+        if slv:
+            targets.append((slv.host, slv.port))
+
+    return targets
+
+
+def lock_servers(locks, master, slaves, args, item):
+
+    """Function:  lock_servers
+
+    Description:  Locks the servers the operation changes and with -G takes
+        the coordination lease on the master, and on the new master for -S.
+        A master which is down is not leased.
+
+    Arguments:
+        (input) locks -> ServerLocks class instance
+        (input) master -> Master class instance
+        (input) slaves -> Slave instance array
+        (input) args -> ArgParser class instance
+        (input) item -> Option of the operation
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag, err_msg = locks.acquire(
+        lock_targets(master, slaves, args, item))
+
+    if not err_flag and args.arg_exist("-G"):
+        servers = [] if master.conn_msg else [master]
+
+        if item == "-S":
+            servers.append(
+                cfg_mst_inst(args.get_val("-m"), args.get_val("-d")))
+
+        err_flag, err_msg = locks.lease(
+            servers, max(1, round(float(args.get_val("-G")))))
+
+    return err_flag, err_msg
+
+
+def run_program(args, func_dict, **kwargs):
+
+    """Function:  run_program
+
+    Description:  Creates class instance(s) and controls flow of the program.
+        With the -e option the events of the run are written as lines of JSON
+        from the run_start to the run_end event.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            req_chk -> Dictionary of the option checks for daemon requests
+
+    """
+
+    func_dict = dict(func_dict)
+    reset_timing()
+    open_events(args)
+    emit("run_start", version=__version__, operations=sorted(
+        set(args.get_args_keys()) & set(func_dict.keys())))
+    master, slaves = create_instances(args, **kwargs)
+    err_flag = False
+    graph = None
+
+    if args.arg_exist("-D") and not master.conn_msg:
+        with timed("discover", master):
+            slaves, graph = discover_slaves(master, slaves, args=args)
+
+        slaves = SlaveArray(slaves)
+
+        if not set(args.get_args_keys()) & set(func_dict.keys()):
+            print(json.dumps(graph, indent=4))
+
+    if slaves and (not master.conn_msg or args.arg_exist("-F")):
+        heartbeat = None
+
+        # The daemon runs the heartbeat for each request.
+        if args.arg_exist("-H") and not master.conn_msg \
+           and not args.arg_exist("-L"):
+            heartbeat, err_flag, err_msg = start_heartbeat(
+                heartbeat_source(master, args), args.get_val("-H"))
+
+            if err_flag:
+                print(f"Warning:  Running without the heartbeat.  {err_msg}")
+
+        locks = ServerLocks()
+
+        # Intersect args and func_dict to call function
+        for item in set(args.get_args_keys()) & set(func_dict.keys()):
+            # The daemon locks the servers of each request.
+            err_flag, err_msg = (False, None) if item == "-L" \
+                else lock_servers(locks, master, slaves, args, item)
+
+            if not err_flag:
+                with timed("operation " + item):
+                    err_flag, err_msg = func_dict[item](
+                        master, slaves, new_mst=args.get_val("-m"),
+                        slv_mv=get_slv_names(args), args=args, graph=graph,
+                        func_dict=func_dict,
+                        req_chk=kwargs.get("req_chk", {}),
+                        heartbeat=heartbeat, **get_sync_opts(args))
+
+            if err_flag:
+                print(err_msg)
+                emit("error", operation=item, message=err_msg)
+                break
+
+        locks.release()
+
+        if heartbeat:
+            heartbeat.stop()
+
+            if heartbeat.err_msg:
+                print(heartbeat.err_msg)
+
+        mysql_libs.disconnect(
+            [srv for srv in [master] + list(slaves) if srv.conn])
+
+    else:
+        err_flag = True
         print("Error:  Connection problem for master/slaves.")
         print(f"\tMaster:  {master.conn_msg}")
+        emit("error", message="Connection problem for master/slaves.",
+             master=master.conn_msg, slaves=len(slaves))
+
+        if not slaves:
+            print("\tSlaves:  No slaves found in slave configuration.")
 
         if master.conn:
             mysql_libs.disconnect(master)
 
-        for slv in slaves:
-            print(f"\tSlave:  {slv.conn_msg}")
-            if slv.conn:
-                mysql_libs.disconnect(slv)
+    timing_report(args)
+    emit("run_end", error=err_flag,
+         seconds=round(time.monotonic() - TIMING["start"], 6))
+    close_events()
+
+
+def chk_num_args(args, opt_num_list):
+
+    """Function:  chk_num_args
+
+    Description:  Checks to see if the values for the options in the list are
+        positive numbers.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_num_list -> List of options that require numeric values
+        (output) status -> True|False - if all values are valid
+
+    """
+
+    status = True
+
+    for opt in opt_num_list:
+        val = args.get_val(opt, def_val=None)
+
+        if val is None:
+            continue
+
+        try:
+            if float(val) <= 0:
+                raise ValueError
+
+        except (TypeError, ValueError):
+            print(f"Error:  Option {opt} requires a positive number: {val}")
+            status = False
+
+    return status
+
+
+def chk_slv_file(args):
+
+    """Function:  chk_slv_file
+
+    Description:  Checks the -f option file of slave names can be read.  A
+        file not found as given is looked for in the -d directory.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - if the file can be read
+
+    """
+
+    status = True
+
+    if args.arg_exist("-f"):
+        fname = args.get_val("-f")
+
+        if not os.path.isfile(fname):
+            fname = os.path.join(args.get_val("-d"), fname)
+
+        if not (os.path.isfile(fname) and os.access(fname, os.R_OK)):
+            print(f"Error:  Slave names file {fname} can not be read.")
+            status = False
+
+    return status
+
+
+def chk_cache_dir(args):
+
+    """Function:  chk_cache_dir
+
+    Description:  Checks the -C option cache directory is safe to cache the
+        configuration in, see cache_dir_error.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - if the cache directory can be used
+
+    """
+
+    err_msg = cache_dir_error(args.get_val("-C")) \
+        if args.arg_exist("-C") else None
+
+    if err_msg:
+        print(err_msg)
+
+    return not err_msg
 
 
 def main():
@@ -528,10 +4892,16 @@ def main():
     Variables:
         dir_perms_chk -> contains directories and their octal permissions
         func_dict -> dictionary list for the function calls or other options
+        opt_con_or_dict -> contains options that require one of the other
+            options
         opt_con_req_list -> contains the options that require other options
+        opt_multi_list -> contains the options that will have multiple values
+        opt_num_list -> contains the options which require numeric values
         opt_req_list -> contains the options that are required for the program
+        opt_slv_req -> contains the options required when -D is not used
         opt_val_list -> contains options which require values
         opt_xor_dict -> contains dict with key that is xor with it's values
+        req_chk -> contains the option checks for daemon requests
         slv_key -> contains dict with keys to be converted to data types
 
     Arguments:
@@ -539,13 +4909,32 @@ def main():
 
     """
 
-    dir_perms_chk = {"-d": 5}
-    func_dict = {"-M": move_slave, "-R": move_slave, "-S": move_slave_up}
+    dir_perms_chk = {"-d": 5, "-C": 7}
+    func_dict = {
+        "-M": move_slave, "-R": move_slave, "-S": move_slave_up,
+        "-T": topology_change, "-L": run_daemon, "-F": failover,
+        "-U": rollback_move}
+    opt_con_or_dict = {
+        "-M": ["-n", "-f"], "-R": ["-n", "-f"], "-S": ["-n", "-f"]}
     opt_con_req_list = {
-        "-M": ["-m", "-n"], "-R": ["-m", "-n"], "-S": ["-m", "-n"]}
-    opt_req_list = ["-c", "-d", "-s"]
-    opt_val_list = ["-c", "-d", "-m", "-n", "-s", "-y"]
-    opt_xor_dict = {"-M": ["-R", "-S"], "-R": ["-M", "-S"], "-S": ["-M", "-R"]}
+        "-M": ["-m"], "-R": ["-m"], "-S": ["-m"], "-B": ["-F"], "-F": ["-s"],
+        "-r": ["-J"], "-U": ["-J"]}
+    opt_multi_list = ["-n"]
+    opt_num_list = ["-B", "-G", "-I", "-l", "-t", "-W", "-w", "-x"]
+    opt_req_list = ["-c", "-d"]
+    opt_slv_req = ["-s"]
+    opt_val_list = [
+        "-B", "-C", "-c", "-d", "-e", "-f", "-G", "-H", "-I", "-J", "-L",
+        "-l", "-m", "-n", "-P", "-s", "-T", "-t", "-W", "-w", "-x", "-y"]
+    opt_xor_dict = {
+        opt: [item for item in func_dict if item != opt] for opt in func_dict}
+    req_chk = {
+        "req_opts": [
+            "-M", "-R", "-S", "-T", "-f", "-g", "-m", "-n", "-W", "-I", "-l",
+            "-x", "-r"],
+        "opt_val": opt_val_list, "multi_val": opt_multi_list,
+        "opt_xor_val": opt_xor_dict, "opt_con_req": opt_con_req_list,
+        "opt_con_or": opt_con_or_dict, "opt_num": opt_num_list}
     slv_key = {
         "sid": "int", "port": "int", "cfg_file": "None",
         "ssl_client_ca": "None", "ssl_ca_path": "None",
@@ -554,19 +4943,27 @@ def main():
         "ssl_verify_id": "bool", "ssl_verify_cert": "bool"}
 
     # Process argument list from command line.
-    args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=opt_multi_list)
 
     if args.arg_parse2()                                            \
        and not gen_libs.help_func(args, __version__, help_message)  \
        and args.arg_require(opt_req=opt_req_list)                   \
+       and (args.arg_exist("-D")                                    \
+            or args.arg_require(opt_req=opt_slv_req))               \
        and args.arg_xor_dict(opt_xor_val=opt_xor_dict)              \
        and args.arg_cond_req(opt_con_req=opt_con_req_list)          \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk):
+       and args.arg_cond_req_or(opt_con_or=opt_con_or_dict)         \
+       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)            \
+       and chk_num_args(args, opt_num_list)                         \
+       and chk_slv_file(args)                                       \
+       and chk_cache_dir(args):
 
         try:
             proglock = gen_class.ProgramLock(
-                sys.argv, args.get_val("-y", def_val=""))
-            run_program(args, func_dict, slv_key=slv_key)
+                sys.argv, args.get_val("-y")) if args.arg_exist("-y") \
+                else None
+            run_program(args, func_dict, slv_key=slv_key, req_chk=req_chk)
             del proglock
 
         except gen_class.SingleInstanceException:
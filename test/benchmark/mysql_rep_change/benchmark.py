@@ -0,0 +1,364 @@
+# Classification (U)
+
+"""Program:  benchmark.py
+
+    Description:  Benchmark of mysql_rep_change.py against an in-process
+        model of a replication fleet.  Each scenario runs run_program end to
+        end on a new fleet with the model in place of mysql_class and
+        mysql_libs, and reports the move time, the longest stall of a moved
+        slave, the round trips and connections to the servers and the
+        program's own timing of each phase.  The import time of the program
+        is also reported.
+
+    Usage:
+        test/benchmark/mysql_rep_change/benchmark.py
+            [-r replicas[,replicas...]] [-o file] [-b baseline_file]
+            [-T tolerance] [--latency seconds] [--apply-rate rate]
+            [--write-rate rate] [--interval seconds]
+
+    Arguments:
+        -r replicas => Comma separated replica counts.  Default 5,50,500.
+        -o file => Write the JSON results to the file.
+        -b baseline_file => JSON results of an earlier run to compare with.
+            Exits with 1 if a scenario is slower or makes more round trips
+            than the baseline by more than the tolerance.
+        -T tolerance => Allowed increase over the baseline.  Default 0.2.
+        --latency seconds => Query round trip latency.  Default 0.001.
+        --apply-rate rate => Transactions applied per second.
+            Default 50000.
+        --write-rate rate => Transactions written per second on the top
+            master.  Default 1000.
+        --interval seconds => Check interval of mysql_libs.sync_rep_slv.
+            Default 1.
+
+        Run from the base directory where the module file is located at.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import fake_fleet                               # pylint:disable=E0401,C0413
+
+
+class BenchArgs():
+
+    """Class:  BenchArgs
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self, args_array):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) args_array -> Dictionary of options and values
+
+        """
+
+        self.args_array = dict(args_array)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def get_scenarios(replicas):
+
+    """Function:  get_scenarios
+
+    Description:  Returns the scenarios for a fleet size as a list of
+        (scenario name, program options).
+
+    Arguments:
+        (input) replicas -> Number of replicas under the master
+        (output) scenarios -> List of (name, options)
+
+    """
+
+    base = {"-c": "master", "-d": "config", "-s": "slaves.txt"}
+    batch = [f"slave{num}" for num in range(2, min(replicas, 11) + 1)]
+    scenarios = [
+        ("move_slave", dict(base, **{"-M": True, "-m": "slave1",
+                                     "-n": ["slave2"]})),
+        ("move_slave gtid", dict(base, **{"-M": True, "-m": "slave1",
+                                          "-n": ["slave2"], "-g": True})),
+        ("move_slave server wait", dict(base, **{
+            "-M": True, "-m": "slave1", "-n": ["slave2"], "-W": "60"})),
+        ("move_slave_up", dict(base, **{"-S": True, "-m": "top",
+                                        "-n": ["slave2"]}))]
+
+    if len(batch) > 1:
+        scenarios.extend([
+            ("move_slave batch", dict(base, **{"-M": True, "-m": "slave1",
+                                               "-n": batch})),
+            ("move_slave_up batch", dict(base, **{"-S": True, "-m": "top",
+                                                  "-n": batch}))])
+
+    return scenarios
+
+
+def fleet_patches(fleet, interval):
+
+    """Function:  fleet_patches
+
+    Description:  Returns the patches which put the fleet model in place of
+        mysql_class, mysql_libs and the configuration files.
+
+    Arguments:
+        (input) fleet -> fake_fleet.Fleet instance
+        (input) interval -> Check interval of mysql_libs.sync_rep_slv
+        (output) patches -> List of mock patches
+
+    """
+
+    libs = fake_fleet.FakeLibs(fleet, interval=interval)
+
+    def _rep(name, *args, **kwargs):                    # pylint:disable=W0613
+        return fleet.handle(name, **kwargs)
+
+    patches = [
+        mock.patch.object(mysql_rep_change.mysql_class, "MasterRep", _rep),
+        mock.patch.object(mysql_rep_change.mysql_class, "SlaveRep", _rep),
+        mock.patch.object(
+            mysql_rep_change.gen_libs, "load_module",
+            lambda name, path: fleet.cfg(name)),
+        mock.patch.object(
+            mysql_rep_change.gen_libs, "create_cfg_array",
+            lambda *args, **kwargs: fleet.slv_cfgs()),
+        mock.patch.object(
+            mysql_rep_change.gen_libs, "transpose_dict",
+            lambda data, keys: data),
+        mock.patch.object(
+            mysql_rep_change, "machine",
+            types.SimpleNamespace(Linux=lambda: "Linux"))]
+
+    for func in ["find_name", "fetch_slv", "chg_slv_state", "sync_rep_slv",
+                 "change_master_to", "reset_slave", "disconnect"]:
+        patches.append(mock.patch.object(
+            mysql_rep_change.mysql_libs, func, getattr(libs, func)))
+
+    return patches
+
+
+def run_scenario(name, opts, replicas, **kwargs):
+
+    """Function:  run_scenario
+
+    Description:  Runs one scenario on a new fleet and returns its results.
+
+    Arguments:
+        (input) name -> Scenario name
+        (input) opts -> Dictionary of program options
+        (input) replicas -> Number of replicas under the master
+        (input) **kwargs:
+            interval -> Check interval of mysql_libs.sync_rep_slv
+            fleet options passed to fake_fleet.Fleet
+        (output) result -> Dictionary of the scenario results
+
+    """
+
+    interval = kwargs.pop("interval", 1)
+    fleet = fake_fleet.Fleet(replicas, **kwargs)
+    func_dict = {"-M": mysql_rep_change.move_slave,
+                 "-S": mysql_rep_change.move_slave_up}
+    output = io.StringIO()
+
+    with contextlib.ExitStack() as stack:
+        for patch in fleet_patches(fleet, interval):
+            stack.enter_context(patch)
+
+        stack.enter_context(contextlib.redirect_stdout(output))
+        start = time.monotonic()
+        mysql_rep_change.run_program(BenchArgs(opts), func_dict)
+        seconds = round(time.monotonic() - start, 6)
+
+    phases = {}
+
+    for entry in mysql_rep_change.TIMING["phases"]:
+        phases[entry["phase"]] = round(
+            phases.get(entry["phase"], 0.0) + entry["seconds"], 6)
+
+    result = {"scenario": name, "replicas": replicas, "seconds": seconds}
+    result.update(fleet.stats(opts["-n"]))
+    result["output"] = output.getvalue().strip()
+    result["phases"] = phases
+
+    return result
+
+
+def import_time():
+
+    """Function:  import_time
+
+    Description:  Returns the import time of the program module from
+        -X importtime in a new interpreter, so modules already loaded here
+        do not count.
+
+    Arguments:
+        (output) result -> Dictionary of the import results
+
+    """
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; sys.path.append({os.getcwd()!r});"
+         f" import mysql_rep_change"],
+        capture_output=True, check=True, text=True)
+    micros = 0
+
+    # Lines are "import time: self [us] | cumulative | imported package".
+    for line in proc.stderr.splitlines():
+        fields = [item.strip() for item in line.split("|")]
+
+        if len(fields) == 3 and fields[2] == "mysql_rep_change":
+            micros = int(fields[1])
+
+    return {"scenario": "import", "replicas": 0,
+            "seconds": round(micros / 1000000, 6), "round_trips": 0}
+
+
+def compare(results, baseline, tolerance):
+
+    """Function:  compare
+
+    Description:  Compares the results with a baseline and returns the
+        regressions.
+
+    Arguments:
+        (input) results -> List of scenario results
+        (input) baseline -> List of scenario results of an earlier run
+        (input) tolerance -> Allowed increase over the baseline
+        (output) regressions -> List of regression messages
+
+    """
+
+    base = {(item["scenario"], item["replicas"]): item for item in baseline}
+    regressions = []
+
+    for item in results:
+        old = base.get((item["scenario"], item["replicas"]))
+
+        for key in ["seconds", "round_trips"] if old else []:
+            if item[key] > old[key] * (1 + tolerance):
+                regressions.append(
+                    f'{item["scenario"]} with {item["replicas"]} replicas:'
+                    f' {key} {old[key]} -> {item[key]}')
+
+    return regressions
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Runs the scenarios for each fleet size and prints the
+        results.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(description="mysql_rep_change benchmark")
+    parser.add_argument("-r", default="5,50,500")
+    parser.add_argument("-o")
+    parser.add_argument("-b")
+    parser.add_argument("-T", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--apply-rate", type=float, default=50000.0)
+    parser.add_argument("--write-rate", type=float, default=1000.0)
+    parser.add_argument("--interval", type=float, default=1)
+    opts = parser.parse_args()
+    results = [import_time()]
+    print(f'{"import":<24} {"":>14}  {results[0]["seconds"]:>9.3f}s')
+
+    for replicas in [int(item) for item in opts.r.split(",")]:
+        for name, prog_opts in get_scenarios(replicas):
+            result = run_scenario(
+                name, prog_opts, replicas, interval=opts.interval,
+                latency=opts.latency, apply_rate=opts.apply_rate,
+                write_rate=opts.write_rate)
+            results.append(result)
+            print(f'{name:<24} {replicas:>5} replicas  '
+                  f'{result["seconds"]:>9.3f}s  stall'
+                  f' {result["stall_seconds"]:>9.3f}s  round trips'
+                  f' {result["round_trips"]:>6}  connects'
+                  f' {result["connects"]:>5}'
+                  f'{"  ERRORS" if result["errors"] else ""}')
+
+    if opts.o:
+        with open(opts.o, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(results, f_hdlr, indent=4)
+
+    if opts.b:
+        with open(opts.b, mode="r", encoding="UTF-8") as f_hdlr:
+            regressions = compare(results, json.load(f_hdlr), opts.T)
+
+        for item in regressions:
+            print(f"Regression:  {item}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
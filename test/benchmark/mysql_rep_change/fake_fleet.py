@@ -0,0 +1,757 @@
+# Classification (U)
+
+"""Program:  fake_fleet.py
+
+    Description:  In-process model of a MySQL replication fleet for
+        benchmarking mysql_rep_change.py.  Each node tracks its executed
+        transactions, replication source, apply rate and whether its
+        replication is running.  Connections to the nodes are handles which
+        stand in for mysql_class.MasterRep and mysql_class.SlaveRep, and the
+        module has stand ins for the mysql_libs functions used by the
+        program.  Every call to a node counts as a round trip and sleeps for
+        the node's query latency outside of the fleet lock, so concurrent
+        calls overlap the same way they would against real servers.
+
+        The binary log of every node holds the same transactions in the
+        same order, so a position is the count of executed transactions and
+        the executed GTID set is uuid:1-position.
+
+    Usage:
+        Imported by test/benchmark/mysql_rep_change/benchmark.py.
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import re
+import threading
+import time
+
+LOG_FILE = "binlog.000001"
+UUID = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+
+
+class FakeNode():                               # pylint:disable=R0902,R0903
+
+    """Class:  FakeNode
+
+    Description:  State of one server in the fleet.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, server_id, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Server name
+            (input) server_id -> Server id
+            (input) **kwargs:
+                port -> Port of the server
+                apply_rate -> Transactions applied per second
+                latency -> Seconds per query round trip
+                connect_latency -> Seconds per connection
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.host = f"{name}.fleet"
+        self.port = kwargs.get("port", 3306)
+        self.apply_rate = kwargs.get("apply_rate", 50000.0)
+        self.latency = kwargs.get("latency", 0.001)
+        self.connect_latency = kwargs.get("connect_latency", 0.005)
+        self.source = None
+        self.running = False
+        self.until = None
+        self.executed = 0.0
+        self.updated = time.monotonic()
+        self.stalled_since = None
+        self.stall = 0.0
+        self.round_trips = 0
+
+
+class Fleet():
+
+    """Class:  Fleet
+
+    Description:  Replication fleet of a top master, a master under the top
+        master and replicas under the master.  The top master takes writes
+        at a fixed rate and the other nodes apply them.
+
+    Methods:
+        __init__
+        node
+        find_host
+        advance
+        stop
+        start
+        repoint
+        handle
+        cfg
+        slv_cfgs
+        stats
+
+    """
+
+    def __init__(self, replicas, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) replicas -> Number of replicas under the master
+            (input) **kwargs:
+                write_rate -> Transactions written per second on top master
+                lag -> Seconds of transactions each replica is behind
+                apply_rate -> Transactions applied per second
+                latency -> Seconds per query round trip
+                connect_latency -> Seconds per connection
+
+        """
+
+        self.lock = threading.RLock()
+        self.write_rate = kwargs.get("write_rate", 1000.0)
+        self.started = time.monotonic()
+        self.errors = []
+        self.connects = 0
+        self.nodes = {}
+        node_opts = {
+            key: kwargs[key] for key in
+            ["apply_rate", "latency", "connect_latency"] if key in kwargs}
+        names = ["top", "master"] + [
+            f"slave{num}" for num in range(1, replicas + 1)]
+
+        for num, name in enumerate(names):
+            self.nodes[name] = FakeNode(
+                name, num + 1, port=3306 + num, **node_opts)
+
+        lag = kwargs.get("lag", 0.0) * self.write_rate
+
+        for name in names[1:]:
+            node = self.nodes[name]
+            node.source = self.nodes["top" if name == "master" else "master"]
+            node.running = True
+            node.executed = -lag if name != "master" else 0.0
+
+    def node(self, name):
+
+        """Method:  node
+
+        Description:  Returns the node with the name.
+
+        Arguments:
+            (input) name -> Server name
+
+        """
+
+        return self.nodes[name]
+
+    def find_host(self, host, port):
+
+        """Method:  find_host
+
+        Description:  Returns the node with the host and port or None.
+
+        Arguments:
+            (input) host -> Host name
+            (input) port -> Port
+
+        """
+
+        for node in self.nodes.values():
+            if node.host == host and int(node.port) == int(port):
+                return node
+
+        return None
+
+    def advance(self, node, now=None):
+
+        """Method:  advance
+
+        Description:  Brings the executed transactions of the node and its
+            sources up to the current time.
+
+        Arguments:
+            (input) node -> FakeNode instance
+            (input) now -> Current monotonic time
+
+        """
+
+        now = time.monotonic() if now is None else now
+
+        with self.lock:
+            if node.source is None and node.name == "top":
+                node.executed = (now - self.started) * self.write_rate
+                node.updated = now
+
+            elif node.source is not None and node.running:
+                self.advance(node.source, now)
+                target = node.source.executed
+
+                if node.until is not None:
+                    target = min(target, node.until)
+
+                node.executed = min(
+                    max(target, node.executed),
+                    node.executed + (now - node.updated) * node.apply_rate)
+                node.updated = now
+
+            else:
+                node.updated = now
+
+            return node.executed
+
+    def stop(self, node):
+
+        """Method:  stop
+
+        Description:  Stops replication on the node.
+
+        Arguments:
+            (input) node -> FakeNode instance
+
+        """
+
+        with self.lock:
+            self.advance(node)
+            node.running = False
+
+            if node.stalled_since is None:
+                node.stalled_since = time.monotonic()
+
+    def start(self, node, until=None):
+
+        """Method:  start
+
+        Description:  Starts replication on the node, to a position when until
+            is passed.
+
+        Arguments:
+            (input) node -> FakeNode instance
+            (input) until -> Position to stop at or None
+
+        """
+
+        with self.lock:
+            self.advance(node)
+            node.running = True
+            node.until = until
+
+            if until is None and node.stalled_since is not None:
+                node.stall += time.monotonic() - node.stalled_since
+                node.stalled_since = None
+
+            elif until is not None and node.stalled_since is None:
+                node.stalled_since = time.monotonic()
+
+    def repoint(self, node, source, pos=None):
+
+        """Method:  repoint
+
+        Description:  Points the node to a new source.  With a position the
+            node must have executed exactly up to the position, otherwise
+            the move would lose or repeat transactions.
+
+        Arguments:
+            (input) node -> FakeNode instance
+            (input) source -> FakeNode instance of the new source
+            (input) pos -> Source position or None for auto positioning
+
+        """
+
+        with self.lock:
+            self.advance(node)
+
+            if pos is not None and int(node.executed) != int(pos):
+                self.errors.append(
+                    f"{node.name} at {int(node.executed)} moved to"
+                    f" {source.name} at {pos}")
+
+            node.source = source
+
+    def handle(self, name, **kwargs):
+
+        """Method:  handle
+
+        Description:  Returns a new connection handle to a node.  Used in
+            place of mysql_class.MasterRep and mysql_class.SlaveRep.
+
+        Arguments:
+            (input) name -> Server name
+            (input) **kwargs:
+                host -> Host of the node, used when the name is not known
+                port -> Port of the node
+
+        """
+
+        node = self.nodes.get(name) or self.find_host(
+            kwargs.get("host"), kwargs.get("port"))
+
+        return FakeServer(self, node)
+
+    def cfg(self, name):
+
+        """Method:  cfg
+
+        Description:  Returns a configuration module stand in for a node.
+
+        Arguments:
+            (input) name -> Server name
+
+        """
+
+        node = self.nodes[name]
+
+        return type("Cfg", (), {
+            "name": node.name, "sid": node.server_id, "user": "root",
+            "japd": "japd", "serv_os": "Linux", "host": node.host,
+            "port": node.port, "cfg_file": None, "rep_user": "rep",
+            "rep_japd": "rep_japd"})
+
+    def slv_cfgs(self):
+
+        """Method:  slv_cfgs
+
+        Description:  Returns the slave configuration array of the master.
+
+        Arguments:
+
+        """
+
+        return [
+            {"name": node.name, "sid": node.server_id, "user": "root",
+             "japd": "japd", "serv_os": "Linux", "host": node.host,
+             "port": node.port, "cfg_file": None, "rep_user": "rep",
+             "rep_japd": "rep_japd"}
+            for node in self.nodes.values() if node.name.startswith("slave")]
+
+    def stats(self, names):
+
+        """Method:  stats
+
+        Description:  Returns the round trips and stall time of the fleet
+            and the longest stall of the named nodes.
+
+        Arguments:
+            (input) names -> Names of the nodes which were moved
+
+        """
+
+        with self.lock:
+            return {
+                "round_trips": sum(
+                    node.round_trips for node in self.nodes.values()),
+                "connects": self.connects,
+                "stall_seconds": round(max(
+                    [self.nodes[name].stall for name in names] + [0.0]), 6),
+                "errors": list(self.errors)}
+
+
+class FakeServer():                             # pylint:disable=R0902
+
+    """Class:  FakeServer
+
+    Description:  Connection handle to a node, standing in for
+        mysql_class.MasterRep and mysql_class.SlaveRep.
+
+    Methods:
+        __init__
+        connect
+        disconnect
+        sql
+        col_sql
+        upd_mst_status
+        upd_slv_status
+        is_slv_running
+        is_slv_error
+
+    """
+
+    def __init__(self, fleet, node):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fleet -> Fleet instance
+            (input) node -> FakeNode instance
+
+        """
+
+        self.fleet = fleet
+        self.node = node
+        self.name = node.name
+        self.server_id = node.server_id
+        self.host = node.host
+        self.port = node.port
+        self.sql_user = "root"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep"
+        self.rep_japd = "rep_japd"
+        self.read_only = "OFF"
+        self.gtid_mode = True
+        self.conn = None
+        self.conn_msg = None
+        self.file = None
+        self.pos = None
+        self.io_err = self.io_msg = self.sql_err = self.sql_msg = None
+
+    def _trip(self):
+
+        """Method:  _trip
+
+        Description:  Counts a round trip and waits for the query latency.
+
+        Arguments:
+
+        """
+
+        with self.fleet.lock:
+            self.node.round_trips += 1
+
+        time.sleep(self.node.latency)
+
+    def connect(self, silent=False):                    # pylint:disable=W0613
+
+        """Method:  connect
+
+        Description:  Connects to the node.
+
+        Arguments:
+
+        """
+
+        time.sleep(self.node.connect_latency)
+
+        with self.fleet.lock:
+            self.fleet.connects += 1
+
+        self.conn = True
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Disconnects from the node.
+
+        Arguments:
+
+        """
+
+        self.conn = None
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Runs a statement on the node.
+
+        Arguments:
+
+        """
+
+        self._trip()
+
+        if cmd.startswith("START REPLICA UNTIL"):
+            self.fleet.start(self.node, until=int(params[1]))
+
+        elif cmd.startswith("CHANGE REPLICATION SOURCE TO"):
+            self.fleet.repoint(
+                self.node, self.fleet.find_host(params[0], params[1]))
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Runs a query on the node and returns the rows.
+
+        Arguments:
+
+        """
+
+        self._trip()
+        fleet = self.fleet
+        node = self.node
+
+        if cmd.startswith("SELECT WAIT_FOR_EXECUTED_GTID_SET"):
+            target = int(re.search(r"-(\d+)$", params[0]).group(1))
+
+            return [{"status": self._wait(target, params[1:])}]
+
+        if cmd.startswith("SELECT SOURCE_POS_WAIT"):
+            status = self._wait(int(params[1]), params[2:])
+
+            return [{"status": -1 if status else 0}]
+
+        with fleet.lock:
+            executed = int(fleet.advance(node))
+
+            if cmd == "SELECT @@GLOBAL.gtid_executed AS gtid":
+                return [{"gtid": f"{UUID}:1-{executed}"}]
+
+            if cmd == "SHOW REPLICAS":
+                return [
+                    {"Host": rep.host, "Port": rep.port,
+                     "Server_Id": rep.server_id}
+                    for rep in fleet.nodes.values() if rep.source is node]
+
+            if cmd == "SHOW REPLICA STATUS" and node.source:
+                behind = fleet.advance(node.source) - node.executed
+
+                return [{
+                    "Source_Host": node.source.host,
+                    "Source_Port": node.source.port,
+                    "Replica_IO_Running": "Yes" if node.running else "No",
+                    "Replica_SQL_Running": "Yes" if node.running else "No",
+                    "Relay_Source_Log_File": LOG_FILE,
+                    "Exec_Source_Log_Pos": executed,
+                    "Seconds_Behind_Source": round(
+                        behind / fleet.write_rate),
+                    "Executed_Gtid_Set": f"{UUID}:1-{executed}",
+                    "Last_SQL_Errno": 0, "Last_SQL_Error": "",
+                    "Last_IO_Errno": 0, "Last_IO_Error": ""}]
+
+        return []
+
+    def _wait(self, target, timeout):
+
+        """Method:  _wait
+
+        Description:  Waits on the node until it has executed the target.
+            Returns 0 when reached and 1 on a timeout.
+
+        Arguments:
+            (input) target -> Position to wait for
+            (input) timeout -> Tuple of the timeout in seconds or empty
+
+        """
+
+        deadline = time.monotonic() + float(timeout[0]) if timeout else None
+
+        while self.fleet.advance(self.node) < target:
+            if deadline is not None and time.monotonic() >= deadline:
+                return 1
+
+            time.sleep(self.node.latency)
+
+        return 0
+
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  Updates the binary log file and position.
+
+        Arguments:
+
+        """
+
+        self._trip()
+        self.file = LOG_FILE
+        self.pos = int(self.fleet.advance(self.node))
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Reads the replication status of the node.
+
+        Arguments:
+
+        """
+
+        self._trip()
+
+    def is_slv_running(self):
+
+        """Method:  is_slv_running
+
+        Description:  Returns True if replication is running on the node.
+
+        Arguments:
+
+        """
+
+        self._trip()
+
+        return self.node.running and self.node.source is not None
+
+    def is_slv_error(self):
+
+        """Method:  is_slv_error
+
+        Description:  Returns False, the model has no replication errors.
+
+        Arguments:
+
+        """
+
+        return False
+
+
+class FakeLibs():
+
+    """Class:  FakeLibs
+
+    Description:  Stand ins for the mysql_libs functions used by
+        mysql_rep_change.py, working against the fleet.
+
+    Methods:
+        __init__
+        find_name
+        fetch_slv
+        chg_slv_state
+        sync_rep_slv
+        change_master_to
+        reset_slave
+        disconnect
+
+    """
+
+    def __init__(self, fleet, interval=1):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fleet -> Fleet instance
+            (input) interval -> Seconds between checks in sync_rep_slv
+
+        """
+
+        self.fleet = fleet
+        self.interval = interval
+
+    @staticmethod
+    def find_name(slaves, name):
+
+        """Method:  find_name
+
+        Description:  Scans the slaves for the name.
+
+        Arguments:
+
+        """
+
+        for slv in slaves:
+            if slv.name == name:
+                return slv
+
+        return None
+
+    def fetch_slv(self, slaves, name):
+
+        """Method:  fetch_slv
+
+        Description:  Returns the slave with the name and an error status.
+
+        Arguments:
+
+        """
+
+        slv = self.find_name(slaves, name)
+
+        if slv:
+            return slv, False, None
+
+        return None, True, f"Error: Slave {name} was not found."
+
+    def chg_slv_state(self, slaves, opt):
+
+        """Method:  chg_slv_state
+
+        Description:  Stops or starts replication on the slaves.
+
+        Arguments:
+
+        """
+
+        for slv in slaves:
+            slv.sql(f"{opt.upper()} REPLICA")
+
+            if opt == "stop":
+                self.fleet.stop(slv.node)
+
+            else:
+                self.fleet.start(slv.node)
+
+    def sync_rep_slv(self, mst, slv):
+
+        """Method:  sync_rep_slv
+
+        Description:  Syncs the slave to the master's position by starting
+            replication until the position and checking it at an interval.
+
+        Arguments:
+
+        """
+
+        self.chg_slv_state([slv], "stop")
+        mst.upd_mst_status()
+        slv.sql("START REPLICA UNTIL SOURCE_LOG_FILE=%s, SOURCE_LOG_POS=%s",
+                params=(mst.file, mst.pos))
+
+        while slv.col_sql("SHOW REPLICA STATUS")[0][
+                "Exec_Source_Log_Pos"] < mst.pos:
+            time.sleep(self.interval)
+
+        return False, None
+
+    def change_master_to(self, mst, slv):
+
+        """Method:  change_master_to
+
+        Description:  Points the slave to the master at the master's
+            position.
+
+        Arguments:
+
+        """
+
+        slv.sql("CHANGE MASTER TO")
+        self.fleet.repoint(slv.node, mst.node, pos=mst.pos)
+
+    def reset_slave(self, slv):
+
+        """Method:  reset_slave
+
+        Description:  Removes the replication of the slave.
+
+        Arguments:
+
+        """
+
+        slv.sql("RESET REPLICA ALL")
+
+        with self.fleet.lock:
+            slv.node.source = None
+
+    @staticmethod
+    def disconnect(*servers):
+
+        """Method:  disconnect
+
+        Description:  Disconnects the servers and lists of servers.
+
+        Arguments:
+
+        """
+
+        for srv in servers:
+            for item in srv if isinstance(srv, list) else [srv]:
+                item.disconnect()
@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  auto_rollback.py
+
+    Description:  Unit testing of auto_rollback in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/auto_rollback.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rolled_back
+        test_rollback_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.err_msg = "Error:  Not converged"
+
+    @mock.patch("builtins.print", mock.Mock())
+    @mock.patch("mysql_rep_change.rollback_slaves")
+    def test_rolled_back(self, mock_rb):
+
+        """Function:  test_rolled_back
+
+        Description:  Test a move which was rolled back.
+
+        Arguments:
+
+        """
+
+        mock_rb.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.auto_rollback(
+                "Master", ["Slave1"], self.err_msg, journal="Journal"),
+            (True, "Error:  The move did not converge and was rolled back."))
+        mock_rb.assert_called_once_with(
+            "Master", ["Slave1"], journal="Journal")
+
+    @mock.patch("builtins.print")
+    @mock.patch("mysql_rep_change.rollback_slaves")
+    def test_rollback_fails(self, mock_rb, mock_print):
+
+        """Function:  test_rollback_fails
+
+        Description:  Test a move whose rollback fails.
+
+        Arguments:
+
+        """
+
+        mock_rb.return_value = (True, "Error:  Rollback failed")
+
+        self.assertEqual(mysql_rep_change.auto_rollback(
+            "Master", ["Slave1"], self.err_msg),
+                         (True, "Error:  Rollback failed"))
+        mock_print.assert_any_call(self.err_msg, file=None)
+        mock_print.assert_any_call("Rolling back the move.", file=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  cache_dir_error.py
+
+    Description:  Unit testing of cache_dir_error in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/cache_dir_error.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cache_dir
+        test_missing_dir
+        test_not_dir
+        test_group_writable
+        test_other_owner
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cache_dir = tempfile.mkdtemp()
+
+    def test_cache_dir(self):
+
+        """Function:  test_cache_dir
+
+        Description:  Test with a directory only the user can write to.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_change.cache_dir_error(self.cache_dir))
+
+    def test_missing_dir(self):
+
+        """Function:  test_missing_dir
+
+        Description:  Test with a directory which does not exist.
+
+        Arguments:
+
+        """
+
+        cache_dir = os.path.join(self.cache_dir, "missing")
+
+        self.assertEqual(
+            mysql_rep_change.cache_dir_error(cache_dir),
+            f"Error:  Cache directory {cache_dir} can not be used:"
+            f" No such file or directory")
+
+    def test_not_dir(self):
+
+        """Function:  test_not_dir
+
+        Description:  Test with a file in place of the directory.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.cache_dir, "cache")
+
+        with open(fname, mode="w", encoding="UTF-8"):
+            pass
+
+        self.assertEqual(
+            mysql_rep_change.cache_dir_error(fname),
+            f"Error:  Cache directory {fname} is not a directory.")
+
+    def test_group_writable(self):
+
+        """Function:  test_group_writable
+
+        Description:  Test with a directory the group can write to.
+
+        Arguments:
+
+        """
+
+        os.chmod(self.cache_dir, 0o770)
+
+        self.assertEqual(
+            mysql_rep_change.cache_dir_error(self.cache_dir),
+            f"Error:  Cache directory {self.cache_dir} is writable by the"
+            f" group or others.")
+
+    @mock.patch("mysql_rep_change.os.getuid")
+    def test_other_owner(self, mock_uid):
+
+        """Function:  test_other_owner
+
+        Description:  Test with a directory owned by another user.
+
+        Arguments:
+
+        """
+
+        mock_uid.return_value = os.stat(self.cache_dir).st_uid + 1
+
+        self.assertEqual(
+            mysql_rep_change.cache_dir_error(self.cache_dir),
+            f"Error:  Cache directory {self.cache_dir} is not owned by the"
+            f" user.")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cache_dir)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,343 @@
+# Classification (U)
+
+"""Program:  cached_load.py
+
+    Description:  Unit testing of cached_load in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/cached_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache_dir
+        test_missing_file
+        test_cache_miss
+        test_cache_hit
+        test_touched_file
+        test_changed_file
+        test_changed_key
+        test_recent_file
+        test_corrupt_cache
+        test_unsafe_cache_dir
+        test_secrets
+        test_fill_fails
+        write_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.fname = os.path.join(self.tmp_dir, "slaves.txt")
+        self.data = [{"name": "Slave1", "port": 3306, "cfg_file": None}]
+        self.loader = mock.Mock(return_value=self.data)
+        os.mkdir(self.cache_dir, 0o700)
+        self.write_file("name = Slave1\n", 1000000)
+
+    def test_no_cache_dir(self):
+
+        """Function:  test_no_cache_dir
+
+        Description:  Test without a cache directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(self.fname, None, self.loader),
+            self.data)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a configuration file which does not exist.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "no_file.txt")
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(fname, self.cache_dir, self.loader),
+            self.data)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_cache_miss(self):
+
+        """Function:  test_cache_miss
+
+        Description:  Test the first load writes the cache.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(
+                self.fname, self.cache_dir, self.loader), self.data)
+        self.assertEqual(self.loader.call_count, 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_cache_hit(self):
+
+        """Function:  test_cache_hit
+
+        Description:  Test a second load is from the cache.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+
+        with mock.patch("mysql_rep_change.open", create=True,
+                        side_effect=open) as mock_open:
+            self.assertEqual(
+                mysql_rep_change.cached_load(
+                    self.fname, self.cache_dir, self.loader), self.data)
+            self.assertEqual(mock_open.call_count, 1)
+
+        self.assertEqual(self.loader.call_count, 1)
+
+    def test_touched_file(self):
+
+        """Function:  test_touched_file
+
+        Description:  Test a file with a new modification time and the same
+            contents.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+        os.utime(self.fname, (1000000, 1000000))
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(
+                self.fname, self.cache_dir, self.loader), self.data)
+        self.assertEqual(self.loader.call_count, 1)
+
+    def test_changed_file(self):
+
+        """Function:  test_changed_file
+
+        Description:  Test a file which has changed since it was cached.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+        self.write_file("name = Slave2\n", 2000000)
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_changed_key(self):
+
+        """Function:  test_changed_key
+
+        Description:  Test a cache made with a different data type map.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.cached_load(
+            self.fname, self.cache_dir, self.loader, key={"port": "int"})
+
+        mysql_rep_change.cached_load(
+            self.fname, self.cache_dir, self.loader, key={"sid": "int"})
+
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_recent_file(self):
+
+        """Function:  test_recent_file
+
+        Description:  Test a file changed in the last two seconds is hashed.
+
+        Arguments:
+
+        """
+
+        self.write_file("name = Slave1\n", None)
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+        cache_file = os.path.join(
+            self.cache_dir, os.listdir(self.cache_dir)[0])
+
+        with open(cache_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertIsNone(json.load(f_hdlr)["stamp"])
+
+    def test_corrupt_cache(self):
+
+        """Function:  test_corrupt_cache
+
+        Description:  Test with a cache file which is not valid JSON.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+        cache_file = os.path.join(
+            self.cache_dir, os.listdir(self.cache_dir)[0])
+
+        with open(cache_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("{")
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(
+                self.fname, self.cache_dir, self.loader), self.data)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_unsafe_cache_dir(self):
+
+        """Function:  test_unsafe_cache_dir
+
+        Description:  Test a cache directory others can write to is not
+            used.
+
+        Arguments:
+
+        """
+
+        os.chmod(self.cache_dir, 0o777)
+
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+        mysql_rep_change.cached_load(self.fname, self.cache_dir, self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_secrets(self):
+
+        """Function:  test_secrets
+
+        Description:  Test the secrets are not cached and are filled in on a
+            hit.
+
+        Arguments:
+
+        """
+
+        self.loader.return_value = [{"name": "Slave1", "japd": "pwd"}]
+        fill = mock.Mock(return_value=[{"name": "Slave1", "japd": "new"}])
+
+        mysql_rep_change.cached_load(
+            self.fname, self.cache_dir, self.loader, fill=fill)
+        cache_file = os.path.join(
+            self.cache_dir, os.listdir(self.cache_dir)[0])
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(
+                self.fname, self.cache_dir, self.loader, fill=fill),
+            [{"name": "Slave1", "japd": "new"}])
+        self.assertEqual(self.loader.call_count, 1)
+        fill.assert_called_once_with(
+            self.fname, [{"name": "Slave1", "japd": None}])
+
+        with open(cache_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertNotIn("pwd", f_hdlr.read())
+
+    def test_fill_fails(self):
+
+        """Function:  test_fill_fails
+
+        Description:  Test the loader is used when the secrets can not be
+            read.
+
+        Arguments:
+
+        """
+
+        fill = mock.Mock(return_value=None)
+
+        mysql_rep_change.cached_load(
+            self.fname, self.cache_dir, self.loader, fill=fill)
+
+        self.assertEqual(
+            mysql_rep_change.cached_load(
+                self.fname, self.cache_dir, self.loader, fill=fill),
+            self.data)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def write_file(self, data, mtime):
+
+        """Function:  write_file
+
+        Description:  Writes the configuration file and sets its
+            modification time.
+
+        Arguments:
+            (input) data -> Contents of the file
+            (input) mtime -> Modification time or None for the current time
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(data)
+
+        if mtime:
+            os.utime(self.fname, (mtime, mtime))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  catch_up.py
+
+    Description:  Unit testing of catch_up in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/catch_up.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name="Slave1"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_slaves
+        test_no_time
+        test_wait_fails
+        test_catch_up
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slv_sets = [(Server("Slave1"), "uuid:1-5"),
+                         (Server("Slave2"), "uuid:1-6")]
+        self.deadline = time.monotonic() + 60
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_no_slaves(self, mock_wait):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves to wait on.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.catch_up([], self.deadline),
+                         (False, None))
+        mock_wait.assert_not_called()
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_no_time(self, mock_wait):
+
+        """Function:  test_no_time
+
+        Description:  Test with the deadline passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.catch_up(self.slv_sets, time.monotonic() - 1),
+            (True, "Error:  No time left for slave Slave1 to catch up."))
+        mock_wait.assert_not_called()
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_wait_fails(self, mock_wait):
+
+        """Function:  test_wait_fails
+
+        Description:  Test with a slave which does not catch up.
+
+        Arguments:
+
+        """
+
+        mock_wait.side_effect = lambda slv, gtid_set, timeout: (
+            (True, "Error:  Timeout") if slv.name == "Slave2"
+            else (False, None))
+
+        self.assertEqual(
+            mysql_rep_change.catch_up(self.slv_sets, self.deadline),
+            (True, "Error:  Timeout"))
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_catch_up(self, mock_wait):
+
+        """Function:  test_catch_up
+
+        Description:  Test waiting on each slave with the time left.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.catch_up(self.slv_sets, self.deadline),
+            (False, None))
+        self.assertEqual(
+            sorted((call[0][0].name, call[0][1])
+                   for call in mock_wait.call_args_list),
+            [("Slave1", "uuid:1-5"), ("Slave2", "uuid:1-6")])
+        self.assertTrue(
+            all(0 < call[1]["timeout"] <= 60
+                for call in mock_wait.call_args_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  cfg_mst_inst.py
+
+    Description:  Unit testing of cfg_mst_inst in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/cfg_mst_inst.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class stub holder for a master configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Top"
+        self.sid = 11
+        self.user = "mysql_user"
+        self.japd = None
+        self.serv_os = "Linux"
+        self.host = "hostname"
+        self.port = 3306
+        self.cfg_file = "cfg_file"
+        self.rep_user = "rep_user"
+        self.rep_japd = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cfg_mst_inst
+        test_extra_def_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    @mock.patch("mysql_rep_change.machine.Linux",
+                mock.Mock(return_value="Linux"))
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    def test_cfg_mst_inst(self, mock_load, mock_master):
+
+        """Function:  test_cfg_mst_inst
+
+        Description:  Test creating the master from its configuration.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        self.assertEqual(
+            mysql_rep_change.cfg_mst_inst("top", "config"),
+            mock_master.return_value)
+        mock_load.assert_called_once_with("top", "config")
+        mock_master.assert_called_once_with(
+            "Top", 11, "mysql_user", None, os_type="Linux", host="hostname",
+            port=3306, defaults_file="cfg_file", extra_def_file=None,
+            rep_user="rep_user", rep_japd=None)
+
+    @mock.patch("mysql_rep_change.machine.Linux",
+                mock.Mock(return_value="Linux"))
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    def test_extra_def_file(self, mock_load, mock_master):
+
+        """Function:  test_extra_def_file
+
+        Description:  Test with an extra defaults file in the configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.extra_def_file = "mysql.cfg"
+        mock_load.return_value = self.cfg
+
+        mysql_rep_change.cfg_mst_inst("top", "config")
+
+        self.assertEqual(mock_master.call_args[1]["extra_def_file"],
+                         "mysql.cfg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  change_source_gtid.py
+
+    Description:  Unit testing of change_source_gtid in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/change_source_gtid.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master_Name"
+        self.host = "HostName"
+        self.port = "3306"
+        self.rep_user = "RepUser"
+        self.rep_japd = "RepJapd"
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.cmd = None
+        self.params = None
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_change_source_gtid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.slave = SlaveRep()
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_change_source_gtid(self, mock_state):
+
+        """Function:  test_change_source_gtid
+
+        Description:  Test pointing the slave to the new master.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.change_source_gtid(self.master, self.slave)
+
+        mock_state.assert_called_once_with([self.slave], "stop")
+        self.assertEqual(
+            (self.slave.params, "SOURCE_AUTO_POSITION=1" in self.slave.cmd),
+            (("HostName", 3306, "RepUser", "RepJapd"), True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  chk_cache_dir.py
+
+    Description:  Unit testing of chk_cache_dir in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/chk_cache_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache_option
+        test_cache_dir
+        test_unsafe_cache_dir
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_cache_option(self):
+
+        """Function:  test_no_cache_option
+
+        Description:  Test with no -C option.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_change.chk_cache_dir(self.args))
+
+    @mock.patch("mysql_rep_change.cache_dir_error",
+                mock.Mock(return_value=None))
+    def test_cache_dir(self):
+
+        """Function:  test_cache_dir
+
+        Description:  Test with a cache directory which can be used.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "cache"
+
+        self.assertTrue(mysql_rep_change.chk_cache_dir(self.args))
+
+    @mock.patch("mysql_rep_change.cache_dir_error",
+                mock.Mock(return_value="Error:  Cache directory"))
+    def test_unsafe_cache_dir(self):
+
+        """Function:  test_unsafe_cache_dir
+
+        Description:  Test with a cache directory which can not be used.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "cache"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_change.chk_cache_dir(self.args))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  chk_num_args.py
+
+    Description:  Unit testing of chk_num_args in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/chk_num_args.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_options
+        test_negative_value
+        test_invalid_value
+        test_valid_values
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_num_list = ["-t", "-w"]
+
+    def test_no_options(self):
+
+        """Function:  test_no_options
+
+        Description:  Test with no numeric options passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_change.chk_num_args(self.args, self.opt_num_list))
+
+    def test_negative_value(self):
+
+        """Function:  test_negative_value
+
+        Description:  Test with a negative value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "-5"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.chk_num_args(self.args, self.opt_num_list))
+
+    def test_invalid_value(self):
+
+        """Function:  test_invalid_value
+
+        Description:  Test with a non-numeric value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-w": "ten"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.chk_num_args(self.args, self.opt_num_list))
+
+    def test_valid_values(self):
+
+        """Function:  test_valid_values
+
+        Description:  Test with valid numeric values.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "2.5", "-w": "20"}
+
+        self.assertTrue(
+            mysql_rep_change.chk_num_args(self.args, self.opt_num_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
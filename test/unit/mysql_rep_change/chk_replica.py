@@ -0,0 +1,233 @@
+# Classification (U)
+
+"""Program:  chk_replica.py
+
+    Description:  Unit testing of chk_replica in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/chk_replica.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.status = [
+            {"Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes",
+             "Last_IO_Errno": 0, "Last_IO_Error": "", "Last_SQL_Errno": 0,
+             "Last_SQL_Error": ""}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_running
+        test_io_connecting
+        test_status_passed
+        test_not_slave
+        test_sql_stopped
+        test_io_stopped
+        test_sql_error
+        test_io_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.err_msg = "Error:  Slave Slave1 replication stopped during sync."
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test with replication running.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.chk_replica(self.slave), (False, None))
+        self.assertEqual(self.slave.cmd, "SHOW REPLICA STATUS")
+
+    def test_io_connecting(self):
+
+        """Function:  test_io_connecting
+
+        Description:  Test with the I/O thread connecting.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0]["Replica_IO_Running"] = "Connecting"
+
+        self.assertEqual(
+            mysql_rep_change.chk_replica(self.slave), (False, None))
+
+    def test_status_passed(self):
+
+        """Function:  test_status_passed
+
+        Description:  Test with the replication status passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.chk_replica(self.slave, self.slave.status[0]),
+            (False, None))
+        self.assertFalse(hasattr(self.slave, "cmd"))
+
+    def test_not_slave(self):
+
+        """Function:  test_not_slave
+
+        Description:  Test with a server which is not a slave.
+
+        Arguments:
+
+        """
+
+        self.slave.status = []
+
+        self.assertEqual(mysql_rep_change.chk_replica(self.slave),
+                         (True, self.err_msg))
+
+    def test_sql_stopped(self):
+
+        """Function:  test_sql_stopped
+
+        Description:  Test with the SQL thread stopped without an error.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0]["Replica_SQL_Running"] = "No"
+
+        self.assertEqual(mysql_rep_change.chk_replica(self.slave),
+                         (True, self.err_msg))
+
+    def test_io_stopped(self):
+
+        """Function:  test_io_stopped
+
+        Description:  Test with the I/O thread stopped without an error.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0]["Replica_IO_Running"] = "No"
+
+        self.assertEqual(mysql_rep_change.chk_replica(self.slave),
+                         (True, self.err_msg))
+
+    def test_sql_error(self):
+
+        """Function:  test_sql_error
+
+        Description:  Test with an SQL thread error.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0].update(
+            {"Replica_SQL_Running": "No", "Last_SQL_Errno": 1062,
+             "Last_SQL_Error": "Duplicate entry"})
+
+        self.assertEqual(
+            mysql_rep_change.chk_replica(self.slave),
+            (True, "Error:  Slave Slave1 SQL error during sync:  1062:"
+             "  Duplicate entry"))
+
+    def test_io_error(self):
+
+        """Function:  test_io_error
+
+        Description:  Test with an I/O thread error.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0].update(
+            {"Replica_IO_Running": "Connecting", "Last_IO_Errno": 2003,
+             "Last_IO_Error": "Can't connect"})
+
+        self.assertEqual(
+            mysql_rep_change.chk_replica(self.slave),
+            (True, "Error:  Slave Slave1 IO error during sync:  2003:"
+             "  Can't connect"))
+
+
+if __name__ == "__main__":
+    unittest.main()
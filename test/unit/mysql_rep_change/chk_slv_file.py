@@ -0,0 +1,202 @@
+# Classification (U)
+
+"""Program:  chk_slv_file.py
+
+    Description:  Unit testing of chk_slv_file in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/chk_slv_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file_option
+        test_file
+        test_file_in_dir
+        test_missing_file
+        test_directory
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.cfg_dir, "slaves.txt")
+        self.args = ArgParser()
+        self.args.args_array = {"-d": self.cfg_dir}
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("Slave1\n")
+
+    def test_no_file_option(self):
+
+        """Function:  test_no_file_option
+
+        Description:  Test with no -f option.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_change.chk_slv_file(self.args))
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with a file found as given.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = self.fname
+
+        self.assertTrue(mysql_rep_change.chk_slv_file(self.args))
+
+    def test_file_in_dir(self):
+
+        """Function:  test_file_in_dir
+
+        Description:  Test with a file found in the -d directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = "slaves.txt"
+
+        self.assertTrue(mysql_rep_change.chk_slv_file(self.args))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a file which does not exist.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = "missing.txt"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_change.chk_slv_file(self.args))
+
+    def test_directory(self):
+
+        """Function:  test_directory
+
+        Description:  Test with a directory in place of the file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = self.cfg_dir
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_change.chk_slv_file(self.args))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  close_events.py
+
+    Description:  Unit testing of close_events in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/close_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_sink
+        test_file
+        test_stdout
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.EVENTS["sink"] = None
+
+    def test_no_sink(self):
+
+        """Function:  test_no_sink
+
+        Description:  Test with no event stream.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.close_events()
+
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test a file is closed.
+
+        Arguments:
+
+        """
+
+        sink = io.StringIO()
+        mysql_rep_change.EVENTS["sink"] = sink
+
+        mysql_rep_change.close_events()
+
+        self.assertTrue(sink.closed)
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+
+    def test_stdout(self):
+
+        """Function:  test_stdout
+
+        Description:  Test standard out is not closed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.EVENTS["sink"] = sys.stdout
+
+        mysql_rep_change.close_events()
+
+        self.assertFalse(sys.stdout.closed)
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+
+
+if __name__ == "__main__":
+    unittest.main()
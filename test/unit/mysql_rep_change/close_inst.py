@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  close_inst.py
+
+    Description:  Unit testing of close_inst in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/close_inst.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, conn=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_connected
+        test_shared_conn
+        test_no_server
+        test_close_inst
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.srv = Server("SrvConn")
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_not_connected(self, mock_disc):
+
+        """Function:  test_not_connected
+
+        Description:  Test with an instance which is not connected.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.close_inst(Server(), self.srv)
+
+        mock_disc.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_shared_conn(self, mock_disc):
+
+        """Function:  test_shared_conn
+
+        Description:  Test with an instance using the server connection.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.close_inst(Server(self.srv.conn), self.srv)
+
+        mock_disc.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_no_server(self, mock_disc):
+
+        """Function:  test_no_server
+
+        Description:  Test with no server instance.
+
+        Arguments:
+
+        """
+
+        inst = Server("InstConn")
+
+        mysql_rep_change.close_inst(inst, None)
+
+        mock_disc.assert_called_once_with(inst)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_close_inst(self, mock_disc):
+
+        """Function:  test_close_inst
+
+        Description:  Test with an instance with its own connection.
+
+        Arguments:
+
+        """
+
+        inst = Server("InstConn")
+
+        mysql_rep_change.close_inst(inst, self.srv)
+
+        mock_disc.assert_called_once_with(inst)
+
+
+if __name__ == "__main__":
+    unittest.main()
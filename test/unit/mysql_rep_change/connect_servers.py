@@ -0,0 +1,262 @@
+# Classification (U)
+
+"""Program:  connect_servers.py
+
+    Description:  Unit testing of connect_servers in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/connect_servers.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, delay=0, err_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Server_Name"
+        self.conn = None
+        self.conn_msg = None
+        self.delay = delay
+        self.err_msg = err_msg
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  connect method.
+
+        Arguments:
+
+        """
+
+        time.sleep(self.delay)
+
+        if self.err_msg:
+            self.conn_msg = self.err_msg
+
+        else:
+            self.conn = True
+
+        return silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_list
+        test_connect_timeout
+        test_connect_error
+        test_connect_servers
+        test_hung_frees_worker
+        test_daemon_thread
+        test_connect_exception
+        test_late_connection
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server2 = Server()
+        self.server3 = Server(err_msg="Connection Error")
+        self.server4 = Server(delay=1)
+        self.err_msg = "Connection timed out after 0.2 seconds"
+
+    def test_empty_list(self):
+
+        """Function:  test_empty_list
+
+        Description:  Test with no servers in the list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.connect_servers([]), [])
+
+    def test_connect_timeout(self):
+
+        """Function:  test_connect_timeout
+
+        Description:  Test with a server which does not connect in time.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.connect_servers(
+            [self.server, self.server4], workers=2, timeout=0.2)
+
+        self.assertEqual(
+            (self.server.conn_msg, self.server4.conn_msg),
+            (None, self.err_msg))
+
+    def test_connect_error(self):
+
+        """Function:  test_connect_error
+
+        Description:  Test with a server which fails to connect.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.connect_servers(
+            [self.server, self.server3], workers=2)
+
+        self.assertEqual(
+            (self.server.conn, self.server3.conn_msg),
+            (True, "Connection Error"))
+
+    def test_connect_servers(self):
+
+        """Function:  test_connect_servers
+
+        Description:  Test with all servers connecting.
+
+        Arguments:
+
+        """
+
+        servers = mysql_rep_change.connect_servers(
+            [self.server, self.server2], workers=1)
+
+        self.assertEqual(
+            [svr.conn for svr in servers], [True, True])
+
+    def test_hung_frees_worker(self):
+
+        """Function:  test_hung_frees_worker
+
+        Description:  Test a hung connection attempt frees its worker for the
+            next server once it times out.
+
+        Arguments:
+
+        """
+
+        start = time.monotonic()
+
+        mysql_rep_change.connect_servers(
+            [self.server4, self.server], workers=1, timeout=0.2)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(
+            (self.server.conn, self.server4.conn_msg), (True, self.err_msg))
+
+    def test_daemon_thread(self):
+
+        """Function:  test_daemon_thread
+
+        Description:  Test a hung connection attempt is left on a daemon
+            thread, so it does not hold the program open at exit.
+
+        Arguments:
+
+        """
+
+        before = set(threading.enumerate())
+
+        mysql_rep_change.connect_servers([self.server4], timeout=0.2)
+
+        hung = set(threading.enumerate()) - before
+        self.assertTrue(hung)
+        self.assertTrue(all(thread.daemon for thread in hung))
+
+    def test_connect_exception(self):
+
+        """Function:  test_connect_exception
+
+        Description:  Test with a connection attempt which raises an exception.
+
+        Arguments:
+
+        """
+
+        self.server.connect = mock.Mock(side_effect=OSError("No route"))
+
+        mysql_rep_change.connect_servers([self.server])
+
+        self.assertEqual(self.server.conn_msg, "No route")
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_late_connection(self, mock_disc):
+
+        """Function:  test_late_connection
+
+        Description:  Test a connection completed after the timeout is
+            disconnected and not set on the server.
+
+        Arguments:
+
+        """
+
+        self.server4.delay = 0.4
+        before = set(threading.enumerate())
+
+        mysql_rep_change.connect_servers([self.server4], timeout=0.2)
+
+        for thread in set(threading.enumerate()) - before:
+            thread.join()
+
+        self.assertEqual(
+            (self.server4.conn, self.server4.conn_msg), (None, self.err_msg))
+        # Attempts left behind by the other tests may also end meanwhile.
+        late = [call[0][0] for call in mock_disc.call_args_list
+                if call[0][0].delay == 0.4]
+        self.assertEqual([attempt.conn for attempt in late], [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        arg_exist
         get_val
 
     """
@@ -52,6 +53,18 @@ class ArgParser():                                      # pylint:disable=R0903
         self.cmdline = None
         self.args_array = {}
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def get_val(self, skey, def_val=None):
 
         """Method:  get_val
@@ -157,6 +170,7 @@ class UnitTest(unittest.TestCase):
     Methods:
         setUp
         test_create_instances
+        test_no_slave_file
 
     """
 
@@ -172,19 +186,24 @@ class UnitTest(unittest.TestCase):
 
         self.cfg = Cfg()
         self.master = MasterRep()
+        self.slave = MasterRep()
         self.args = ArgParser()
         self.args.args_array = {
             "-c": "mysql_cfg", "-d": "config", "-s": "slave"}
+        self.args2 = ArgParser()
+        self.args2.args_array = {"-c": "mysql_cfg", "-d": "config", "-D": True}
         self.name = "Server_Name"
 
-    @mock.patch("mysql_rep_change.mysql_libs.create_slv_array",
-                mock.Mock(return_value="SlaveArray"))
+    @mock.patch("mysql_rep_change.connect_servers",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.create_slv_inst")
     @mock.patch("mysql_rep_change.gen_libs.create_cfg_array",
                 mock.Mock(return_value=[]))
     @mock.patch("mysql_rep_change.gen_libs.transpose_dict")
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
-    def test_create_instances(self, mock_inst, mock_cfg, mock_trans):
+    def test_create_instances(                  # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cfg, mock_trans, mock_slv):
 
         """Function:  test_create_instances
 
@@ -197,10 +216,36 @@ class UnitTest(unittest.TestCase):
         mock_inst.return_value = self.master
         mock_cfg.return_value = self.cfg
         mock_trans.return_value = []
+        mock_slv.return_value = [self.slave]
 
         master, slaves = mysql_rep_change.create_instances(self.args)
 
-        self.assertEqual((master.name, slaves), (self.name, "SlaveArray"))
+        self.assertEqual((master.name, slaves), (self.name, [self.slave]))
+        self.assertEqual(slaves.find_name(self.name), self.slave)
+
+
+    @mock.patch("mysql_rep_change.connect_servers",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.gen_libs.create_cfg_array")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    def test_no_slave_file(self, mock_inst, mock_cfg, mock_array):
+
+        """Function:  test_no_slave_file
+
+        Description:  Test with no slave config file.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.master
+        mock_cfg.return_value = self.cfg
+
+        master, slaves = mysql_rep_change.create_instances(self.args2)
+
+        self.assertEqual((master.name, slaves), (self.name, []))
+        mock_array.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  create_slv_inst.py
+
+    Description:  Unit testing of create_slv_inst in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/create_slv_inst.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_array
+        test_create_slv_inst
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slv_array = [
+            {"name": "Slave1", "sid": 11, "user": "user", "japd": None,
+             "serv_os": "Linux", "host": "hostname", "port": 3306,
+             "cfg_file": None, "rep_user": "repuser", "rep_japd": None},
+            {"name": "Slave2", "sid": 12, "user": "user", "japd": None,
+             "serv_os": "Linux", "host": "hostname2", "port": "3306",
+             "cfg_file": None, "rep_user": "repuser", "rep_japd": None,
+             "ssl_disabled": True}]
+
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_empty_array(self, mock_slv):
+
+        """Function:  test_empty_array
+
+        Description:  Test with an empty slave configuration array.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.create_slv_inst([]), [])
+        mock_slv.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_create_slv_inst(self, mock_slv):
+
+        """Function:  test_create_slv_inst
+
+        Description:  Test creating slave instances without connecting.
+
+        Arguments:
+
+        """
+
+        mock_slv.return_value = mock.MagicMock()
+
+        slaves = mysql_rep_change.create_slv_inst(self.slv_array)
+
+        self.assertEqual(
+            (len(slaves), mock_slv.call_count,
+             mock_slv.return_value.connect.called), (2, 2, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
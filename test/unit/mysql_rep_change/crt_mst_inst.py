@@ -0,0 +1,175 @@
+# Classification (U)
+
+"""Program:  crt_mst_inst.py
+
+    Description:  Unit testing of crt_mst_inst in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/crt_mst_inst.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = True
+        self.conn_msg = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_mst_inst
+        test_share_not_connected
+        test_share_conn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = Server("Slave1")
+        self.master = Server("Slave1")
+
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    def test_crt_mst_inst(self, mock_mst):
+
+        """Function:  test_crt_mst_inst
+
+        Description:  Test creating a master instance from a server.
+
+        Arguments:
+
+        """
+
+        self.master.connect = mock.Mock()
+        mock_mst.return_value = self.master
+
+        self.assertEqual(
+            mysql_rep_change.crt_mst_inst(self.slave), self.master)
+        self.master.connect.assert_called_once_with(silent=True)
+        self.assertEqual(mock_mst.call_args[1]["host"], self.slave.host)
+
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    def test_share_not_connected(self, mock_mst):
+
+        """Function:  test_share_not_connected
+
+        Description:  Test sharing the connection of a server which is not
+            connected.
+
+        Arguments:
+
+        """
+
+        self.slave.conn = None
+        self.master.connect = mock.Mock()
+        mock_mst.return_value = self.master
+
+        mysql_rep_change.crt_mst_inst(self.slave, share=True)
+
+        self.master.connect.assert_called_once_with(silent=True)
+
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    def test_share_conn(self, mock_mst):
+
+        """Function:  test_share_conn
+
+        Description:  Test the master instance uses the server's connection.
+
+        Arguments:
+
+        """
+
+        self.slave.conn = "SlaveConn"
+        self.master.conn = None
+        self.master.conn_msg = "Not connected"
+        self.master.connect = mock.Mock()
+        self.master.upd_mst_status = mock.Mock()
+        mock_mst.return_value = self.master
+
+        mysql_rep_change.crt_mst_inst(self.slave, share=True)
+
+        self.assertEqual((self.master.conn, self.master.conn_msg),
+                         ("SlaveConn", None))
+        self.master.connect.assert_not_called()
+        self.master.upd_mst_status.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+# Classification (U)
+
+"""Program:  crt_slv_inst.py
+
+    Description:  Unit testing of crt_slv_inst in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/crt_slv_inst.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = True
+        self.conn_msg = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_slv_inst
+        test_share_not_connected
+        test_share_conn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master")
+        self.slave = Server("Master")
+
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_crt_slv_inst(self, mock_slv):
+
+        """Function:  test_crt_slv_inst
+
+        Description:  Test creating a slave instance from a server.
+
+        Arguments:
+
+        """
+
+        self.slave.connect = mock.Mock()
+        mock_slv.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.crt_slv_inst(self.master), self.slave)
+        self.slave.connect.assert_called_once_with(silent=True)
+        self.assertEqual(mock_slv.call_args[1]["host"], self.master.host)
+
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_share_not_connected(self, mock_slv):
+
+        """Function:  test_share_not_connected
+
+        Description:  Test sharing the connection of a server which is not
+            connected.
+
+        Arguments:
+
+        """
+
+        self.master.conn = None
+        self.slave.connect = mock.Mock()
+        mock_slv.return_value = self.slave
+
+        mysql_rep_change.crt_slv_inst(self.master, share=True)
+
+        self.slave.connect.assert_called_once_with(silent=True)
+
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_share_conn(self, mock_slv):
+
+        """Function:  test_share_conn
+
+        Description:  Test the slave instance uses the server's connection.
+
+        Arguments:
+
+        """
+
+        self.master.conn = "MasterConn"
+        self.slave.conn = None
+        self.slave.conn_msg = "Not connected"
+        self.slave.connect = mock.Mock()
+        self.slave.upd_slv_status = mock.Mock()
+        mock_slv.return_value = self.slave
+
+        mysql_rep_change.crt_slv_inst(self.master, share=True)
+
+        self.assertEqual((self.slave.conn, self.slave.conn_msg),
+                         ("MasterConn", None))
+        self.slave.connect.assert_not_called()
+        self.slave.upd_slv_status.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
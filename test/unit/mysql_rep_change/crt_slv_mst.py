@@ -36,6 +36,7 @@ class MasterRep():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        upd_mst_status
         connect
 
     """
@@ -65,6 +66,18 @@ class MasterRep():                                      # pylint:disable=R0903
         self.conn = True
         self.conn_msg = None
 
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  upd_mst_status method.
+
+        Arguments:
+
+        """
+
+        return True
+
     def connect(self, silent=False):
 
         """Method:  connect
@@ -116,6 +129,9 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.defaults_file = None
         self.rep_user = "RepUser"
         self.rep_japd = None
+        self.extra_def_file = None
+        self.conn = "SlaveConn"
+        self.conn_msg = None
         self.extra_def_file = "FileName"
         self.conn = True
         self.conn_msg = None
@@ -186,6 +202,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        self.slave.conn = None
         self.master.conn = False
         self.master.conn_msg = "Error Connection"
 
@@ -258,6 +275,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual((master.name, err_flag, err_msg),
                          (self.name, False, None))
+        self.assertEqual(master.conn, self.slave.conn)
 
 
 if __name__ == "__main__":
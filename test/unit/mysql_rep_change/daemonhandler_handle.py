@@ -0,0 +1,269 @@
+# Classification (U)
+
+"""Program:  daemonhandler_handle.py
+
+    Description:  Unit testing of daemonhandler_handle in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/daemonhandler_handle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import json
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Work():                                           # pylint:disable=R0903
+
+    """Class:  Work
+
+    Description:  Class stub holder for queue.Queue class.  Requests put on
+        the queue are answered at once.
+
+    Methods:
+        __init__
+        put
+        qsize
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.requests = []
+
+    def put(self, item):
+
+        """Method:  put
+
+        Description:  Method stub holder for queue.Queue.put.
+
+        Arguments:
+
+        """
+
+        self.requests.append(item[0])
+        item[1].set_result({"status": "ok", "msg": None})
+
+    def qsize(self):
+
+        """Method:  qsize
+
+        Description:  Method stub holder for queue.Queue.qsize.
+
+        Arguments:
+
+        """
+
+        return 3
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for socketserver server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.work = Work()
+        self.work_lock = threading.Lock()
+        self.closing = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_line
+        test_invalid_json
+        test_not_object
+        test_ping
+        test_handle
+        test_closing
+        handle
+        responses
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.handler = mysql_rep_change.DaemonHandler.__new__(
+            mysql_rep_change.DaemonHandler)
+        self.handler.server = Server()
+        self.handler.wfile = io.BytesIO()
+
+    def test_empty_line(self):
+
+        """Function:  test_empty_line
+
+        Description:  Test empty lines are skipped.
+
+        Arguments:
+
+        """
+
+        self.handle(b"\n")
+
+        self.assertEqual(self.responses(), [])
+
+    def test_invalid_json(self):
+
+        """Function:  test_invalid_json
+
+        Description:  Test with a line which is not JSON.
+
+        Arguments:
+
+        """
+
+        self.handle(b"-M -m Slave1\n")
+
+        self.assertEqual(self.responses()[0]["status"], "error")
+
+    def test_not_object(self):
+
+        """Function:  test_not_object
+
+        Description:  Test with a JSON line which is not an object.
+
+        Arguments:
+
+        """
+
+        self.handle(b"[1, 2]\n")
+
+        self.assertEqual(
+            self.responses(),
+            [{"status": "error", "msg": "Error:  Invalid request: request is"
+              " not a JSON object"}])
+
+    def test_ping(self):
+
+        """Function:  test_ping
+
+        Description:  Test a ping request is answered without queueing.
+
+        Arguments:
+
+        """
+
+        self.handle(b'{"cmd": "ping"}\n')
+
+        self.assertEqual(self.responses(), [{"status": "ok", "queued": 3}])
+        self.assertEqual(self.handler.server.work.requests, [])
+
+    def test_handle(self):
+
+        """Function:  test_handle
+
+        Description:  Test requests are queued and answered in order.
+
+        Arguments:
+
+        """
+
+        self.handle(b'{"argv": ["-M"]}\n{"argv": ["-S"]}\n')
+
+        self.assertEqual(self.responses(), [{"status": "ok", "msg": None}] * 2)
+        self.assertEqual(self.handler.server.work.requests,
+                         [{"argv": ["-M"]}, {"argv": ["-S"]}])
+
+    def test_closing(self):
+
+        """Function:  test_closing
+
+        Description:  Test requests are refused once the daemon is shutting
+            down.
+
+        Arguments:
+
+        """
+
+        self.handler.server.closing = True
+        self.handle(b'{"argv": ["-M"]}\n')
+
+        self.assertEqual(
+            self.responses(),
+            [{"status": "error", "msg": "Error:  Daemon is shutting down."}])
+        self.assertEqual(self.handler.server.work.requests, [])
+
+    def handle(self, data):
+
+        """Function:  handle
+
+        Description:  Runs the handler on the client data.
+
+        Arguments:
+            (input) data -> Bytes sent by the client
+
+        """
+
+        self.handler.rfile = io.BytesIO(data)
+        self.handler.handle()
+
+    def responses(self):
+
+        """Function:  responses
+
+        Description:  Returns the responses written to the client.
+
+        Arguments:
+            (output) List of response dictionaries
+
+        """
+
+        return [json.loads(line)
+                for line in self.handler.wfile.getvalue().splitlines()]
+
+
+if __name__ == "__main__":
+    unittest.main()
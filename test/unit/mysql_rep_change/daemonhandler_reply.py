@@ -0,0 +1,73 @@
+# Classification (U)
+
+"""Program:  daemonhandler_reply.py
+
+    Description:  Unit testing of daemonhandler_reply in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/daemonhandler_reply.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reply
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.handler = mysql_rep_change.DaemonHandler.__new__(
+            mysql_rep_change.DaemonHandler)
+        self.handler.wfile = io.BytesIO()
+
+    def test_reply(self):
+
+        """Function:  test_reply
+
+        Description:  Test writing a response line.
+
+        Arguments:
+
+        """
+
+        self.handler.reply({"status": "ok", "msg": None})
+
+        self.assertEqual(self.handler.wfile.getvalue(),
+                         b'{"status": "ok", "msg": null}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+# Classification (U)
+
+"""Program:  discover_slaves.py
+
+    Description:  Unit testing of discover_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/discover_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306, server_id=10):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = None
+        self.conn_msg = None
+        self.status = []
+        self.replicas = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return self.status if cmd == "SHOW REPLICA STATUS" else self.replicas
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_discover_slaves
+        test_unreachable_slave
+        test_no_report_host
+        test_match_server_id
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master", host="host1")
+        self.master.replicas = [
+            {"Host": "host2", "Port": 3306, "Server_Id": 11},
+            {"Host": "host3", "Port": 3306, "Server_Id": 12}]
+        self.slave = Server("Slave1", host="host2", server_id=11)
+        self.slave.status = [
+            {"Seconds_Behind_Source": 5, "Relay_Source_Log_File": "binlog.1",
+             "Exec_Source_Log_Pos": 100, "Executed_Gtid_Set": ""}]
+        self.slave.replicas = [
+            {"Host": "host1", "Port": 3306, "Server_Id": 10}]
+        self.slave2 = Server("host3:3306", host="host3", server_id=12)
+        self.slave2.replicas = [{"Host": "", "Port": 3306, "Server_Id": 13}]
+        self.slaves = [self.slave]
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_discover_slaves(self, mock_slv, mock_conn):
+
+        """Function:  test_discover_slaves
+
+        Description:  Test discovering the replication tree.
+
+        Arguments:
+
+        """
+
+        mock_slv.return_value = self.slave2
+
+        with gen_libs.no_std_out():
+            slaves, graph = mysql_rep_change.discover_slaves(
+                self.master, self.slaves)
+
+        self.assertEqual(slaves, [self.slave, self.slave2])
+        self.assertEqual(
+            graph["edges"], [["Master", "Slave1"], ["Master", "host3:3306"]])
+        self.assertEqual(graph["nodes"]["Slave1"]["lag"], 5)
+        self.assertEqual(graph["nodes"]["Slave1"]["depth"], 1)
+        self.assertEqual(mock_slv.call_args[0][0], "host3:3306")
+        self.assertEqual(mock_conn.call_count, 2)
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_unreachable_slave(self, mock_slv, mock_conn):
+
+        """Function:  test_unreachable_slave
+
+        Description:  Test with a discovered slave which is unreachable.
+
+        Arguments:
+
+        """
+
+        self.slave2.conn_msg = "Connection error"
+        mock_slv.return_value = self.slave2
+
+        with gen_libs.no_std_out():
+            _, graph = mysql_rep_change.discover_slaves(
+                self.master, self.slaves)
+
+        self.assertEqual(
+            graph["nodes"]["host3:3306"]["error"], "Connection error")
+        mock_conn.assert_called_with([])
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_no_report_host(self, mock_slv):
+
+        """Function:  test_no_report_host
+
+        Description:  Test with a replica which has no report_host set.
+
+        Arguments:
+
+        """
+
+        mock_slv.return_value = self.slave2
+
+        with gen_libs.no_std_out():
+            slaves, _ = mysql_rep_change.discover_slaves(
+                self.master, self.slaves)
+
+        self.assertEqual(len(slaves), 2)
+
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    def test_match_server_id(self, mock_slv):
+
+        """Function:  test_match_server_id
+
+        Description:  Test with a replica with no report_host matched by its
+            server id.
+
+        Arguments:
+
+        """
+
+        self.master.replicas = [{"Host": "", "Port": 3306, "Server_Id": 11}]
+
+        slaves, graph = mysql_rep_change.discover_slaves(
+            self.master, self.slaves)
+
+        self.assertEqual(slaves, [self.slave])
+        self.assertEqual(graph["edges"], [["Master", "Slave1"]])
+        mock_slv.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
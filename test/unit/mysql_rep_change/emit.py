@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  emit.py
+
+    Description:  Unit testing of emit in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/emit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_sink
+        test_event
+        test_lines
+        test_not_json
+        test_closed_sink
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = io.StringIO()
+        mysql_rep_change.EVENTS["sink"] = self.sink
+
+    def test_no_sink(self):
+
+        """Function:  test_no_sink
+
+        Description:  Test with no event stream.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.EVENTS["sink"] = None
+
+        mysql_rep_change.emit("run_start")
+
+        self.assertEqual(self.sink.getvalue(), "")
+
+    def test_event(self):
+
+        """Function:  test_event
+
+        Description:  Test an event is written as a line of JSON.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.emit("slave_state", server="Slave1", lag=0.5)
+
+        event = json.loads(self.sink.getvalue())
+
+        self.assertEqual(
+            (event["event"], event["server"], event["lag"]),
+            ("slave_state", "Slave1", 0.5))
+        self.assertIn("time", event)
+        self.assertIn("elapsed", event)
+
+    def test_lines(self):
+
+        """Function:  test_lines
+
+        Description:  Test each event is on its own line.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.emit("run_start")
+        mysql_rep_change.emit("run_end", error=False)
+
+        self.assertEqual(
+            [json.loads(line)["event"]
+             for line in self.sink.getvalue().splitlines()],
+            ["run_start", "run_end"])
+
+    def test_not_json(self):
+
+        """Function:  test_not_json
+
+        Description:  Test data which is not JSON is written as text.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.emit("error", message=ValueError("Bad value"))
+
+        self.assertEqual(json.loads(self.sink.getvalue())["message"],
+                         "Bad value")
+
+    def test_closed_sink(self):
+
+        """Function:  test_closed_sink
+
+        Description:  Test the events stop when the stream is closed.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+        mysql_rep_change.emit("run_start")
+
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.EVENTS["sink"] = None
+
+
+if __name__ == "__main__":
+    unittest.main()
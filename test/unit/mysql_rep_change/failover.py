@@ -0,0 +1,438 @@
+# Classification (U)
+
+"""Program:  failover.py
+
+    Description:  Unit testing of failover in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/failover.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-B": "60"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name="Slave1", executed="uuid:1-10"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.host = name
+        self.port = 3306
+        self.server_id = "10"
+        self.conn = True
+        self.gtid_mode = True
+        self.executed = executed
+        self.errant = {}
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if "GTID_SUBTRACT" in cmd:
+            return [{"errant": self.errant.get(params[0], "")}]
+
+        return [{"gtid": self.executed}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_gtid
+        test_no_orphans
+        test_relay_logs_fail
+        test_none_able
+        test_errant
+        test_catch_up_fails
+        test_failover
+        test_down_slave
+        probe
+        test_master_up
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master")
+        self.master.conn = None
+        self.master.conn_msg = "Connection refused"
+        self.slaves = [Server("Slave1"), Server("Slave2", "uuid:1-15"),
+                       Server("Slave3", "uuid:1-12")]
+        self.args = ArgParser()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_no_gtid(self, mock_probe):
+
+        """Function:  test_no_gtid
+
+        Description:  Test with GTID mode off on a slave.
+
+        Arguments:
+
+        """
+
+        self.slaves[1].gtid_mode = False
+
+        self.assertEqual(
+            mysql_rep_change.failover(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  GTID mode is not enabled on Slave2."))
+        mock_probe.assert_not_called()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_no_orphans(self, mock_probe):
+
+        """Function:  test_no_orphans
+
+        Description:  Test with no reachable slave of the master.
+
+        Arguments:
+
+        """
+
+        self.slaves[0].conn = None
+        mock_probe.side_effect = lambda slv: self.probe(slv, 20)
+
+        self.assertEqual(
+            mysql_rep_change.failover(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  No reachable slave of Master."))
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_relay_logs_fail(               # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_relay_logs_fail
+
+        Description:  Test with a slave not applying its relay logs in time.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        mock_catch.return_value = (True, "Error:  Timeout")
+
+        self.assertEqual(
+            mysql_rep_change.failover(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  Timeout"))
+        self.assertEqual(
+            [(slv.name, gtid) for slv, gtid in mock_catch.call_args[0][0]],
+            [("Slave1", "uuid:1-12"), ("Slave2", "uuid:1-12"),
+             ("Slave3", "uuid:1-12")])
+        mock_libs.reset_slave.assert_not_called()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_none_able(                     # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_none_able
+
+        Description:  Test with no slave able to be the new master.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        mock_probe.side_effect = lambda slv: dict(
+            self.probe(slv), log_bin=False)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.failover(
+                    self.master, self.slaves, args=self.args),
+                (True, "Error:  No slave is able to be the new master."))
+
+        mock_libs.reset_slave.assert_not_called()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_errant(                        # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_errant
+
+        Description:  Test a slave with transactions the new master lacks.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        self.slaves[1].errant = {"uuid:1-10": "uuid2:1"}
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.failover(
+                self.master, self.slaves, args=self.args)
+
+        self.assertEqual(
+            [cmd[1] for cmd in self.slaves[1].cmds if cmd[1]],
+            [("uuid:1-12",), ("uuid:1-10",)])
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_catch_up_fails(                # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_catch_up_fails
+
+        Description:  Test with a slave not catching up in time.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        mock_catch.side_effect = [(False, None), (True, "Error:  Timeout")]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.failover(
+                    self.master, self.slaves, args=self.args),
+                (True, "Error:  Timeout"))
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_failover(                      # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_failover
+
+        Description:  Test failing over to the most advanced slave.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.failover(
+                    self.master, self.slaves, args=self.args), (False, None))
+
+        mock_libs.reset_slave.assert_called_once_with(self.slaves[1])
+        mock_crt.assert_called_once_with(self.slaves[1], share=True)
+        mock_repoint.assert_called_once_with(
+            self.slaves[1], [self.slaves[0], self.slaves[2]], gtid=True)
+        mock_libs.chg_slv_state.assert_called_with(
+            [self.slaves[0], self.slaves[2]], "start")
+        self.assertEqual(
+            [(slv.name, gtid) for slv, gtid in mock_catch.call_args[0][0]],
+            [("Slave1", "uuid:1-15"), ("Slave3", "uuid:1-15")])
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    @mock.patch("mysql_rep_change.mysql_libs")
+    @mock.patch("mysql_rep_change.catch_up")
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_down_slave(                    # pylint:disable=R0913,R0917
+            self, mock_probe, mock_catch, mock_libs, mock_crt, mock_repoint):
+
+        """Function:  test_down_slave
+
+        Description:  Test a slave which is not connected is skipped.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.probe
+        mock_catch.return_value = (False, None)
+        mock_libs.chg_slv_state.return_value = True
+        mock_crt.side_effect = lambda srv, share: srv
+        self.slaves[1].conn = None
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.failover(
+                    self.master, self.slaves, args=self.args), (False, None))
+
+        mock_libs.reset_slave.assert_called_once_with(self.slaves[2])
+        mock_repoint.assert_called_once_with(
+            self.slaves[2], [self.slaves[0]], gtid=True)
+
+    def probe(self, slv, source_id=10):
+
+        """Function:  probe
+
+        Description:  Stub holder for mysql_rep_change.probe_candidate.
+
+        Arguments:
+            (input) slv -> Slave instance
+            (input) source_id -> Server id of the slave's master
+            (output) Dictionary of the slave details
+
+        """
+
+        return {
+            "name": slv.name, "source_id": source_id,
+            "retrieved": "uuid:1-12",
+            "executed": "uuid:1-8", "log_bin": True,
+            "log_replica_updates": True, "load": 1}
+
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_master_up(self, mock_open):
+
+        """Function:  test_master_up
+
+        Description:  Test a master which can be connected to is not failed
+            over.
+
+        Arguments:
+
+        """
+
+        self.master.conn_msg = None
+
+        self.assertEqual(
+            mysql_rep_change.failover(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  Master Master is up, failover refused."))
+        mock_open.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  fetch_slaves.py
+
+    Description:  Unit testing of fetch_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/fetch_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, server_id):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.host = "hostname"
+        self.port = 3306 + server_id
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_found
+        test_not_found
+        test_slave_array
+        test_slave_array_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slaves = ["Slave1", "Slave2"]
+        self.names = ["Slave1", "Slave2"]
+        self.err_msg = "Error:  Slave Slave2 was not found in slave array."
+        self.slave = SlaveRep("Slave1", 1)
+        self.slave2 = SlaveRep("Slave2", 2)
+        self.slv_array = mysql_rep_change.SlaveArray([self.slave, self.slave2])
+
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    def test_all_found(self, mock_fetch):
+
+        """Function:  test_all_found
+
+        Description:  Test with all slaves found.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = [
+            ("Slave1", False, None), ("Slave2", False, None)]
+
+        self.assertEqual(
+            mysql_rep_change.fetch_slaves(self.slaves, self.names),
+            (["Slave1", "Slave2"], False, None))
+
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    def test_not_found(self, mock_fetch):
+
+        """Function:  test_not_found
+
+        Description:  Test with a slave not found.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = [
+            ("Slave1", False, None), (None, True, self.err_msg)]
+
+        self.assertEqual(
+            mysql_rep_change.fetch_slaves(self.slaves, self.names),
+            (["Slave1"], True, self.err_msg))
+
+
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    def test_slave_array(self, mock_fetch):
+
+        """Function:  test_slave_array
+
+        Description:  Test with a SlaveArray.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.fetch_slaves(self.slv_array, self.names),
+            ([self.slave, self.slave2], False, None))
+        mock_fetch.assert_not_called()
+
+    def test_slave_array_not_found(self):
+
+        """Function:  test_slave_array_not_found
+
+        Description:  Test with a slave not found in a SlaveArray.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.fetch_slaves(
+                mysql_rep_change.SlaveArray([self.slave]), self.names),
+            ([self.slave], True, self.err_msg))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  fill_mst_secrets.py
+
+    Description:  Unit testing of fill_mst_secrets in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/fill_mst_secrets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fill
+        test_not_literal
+        test_missing_secret
+        test_missing_file
+        write_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "master.py")
+        self.data = {"name": "Master", "japd": None, "rep_japd": None}
+
+    def test_fill(self):
+
+        """Function:  test_fill
+
+        Description:  Test the secrets are read from the module.
+
+        Arguments:
+
+        """
+
+        self.write_file(
+            'name = "Master"\njapd = "pwd"\nrep_japd = "rep_pwd"\n')
+
+        self.assertEqual(
+            mysql_rep_change.fill_mst_secrets(self.fname, self.data),
+            {"name": "Master", "japd": "pwd", "rep_japd": "rep_pwd"})
+
+    def test_not_literal(self):
+
+        """Function:  test_not_literal
+
+        Description:  Test with a secret which is not a literal.
+
+        Arguments:
+
+        """
+
+        self.write_file(
+            'import os\njapd = os.environ["PWD"]\nrep_japd = "rep_pwd"\n')
+
+        self.assertIsNone(
+            mysql_rep_change.fill_mst_secrets(self.fname, self.data))
+
+    def test_missing_secret(self):
+
+        """Function:  test_missing_secret
+
+        Description:  Test with a secret which is not in the module.
+
+        Arguments:
+
+        """
+
+        self.write_file('japd = "pwd"\n')
+
+        self.assertIsNone(
+            mysql_rep_change.fill_mst_secrets(self.fname, self.data))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a module which does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_change.fill_mst_secrets(self.fname, self.data))
+
+    def write_file(self, text):
+
+        """Function:  write_file
+
+        Description:  Writes the master configuration module.
+
+        Arguments:
+            (input) text -> Contents of the module
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(text)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+if __name__ == "__main__":
+    unittest.main()
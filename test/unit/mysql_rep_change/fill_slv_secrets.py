@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  fill_slv_secrets.py
+
+    Description:  Unit testing of fill_slv_secrets in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/fill_slv_secrets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fill
+        test_count_mismatch
+        test_missing_file
+        write_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "slaves.txt")
+        self.data = [
+            {"name": "Slave1", "japd": None, "rep_japd": None},
+            {"name": "Slave2", "japd": None}]
+
+    def test_fill(self):
+
+        """Function:  test_fill
+
+        Description:  Test the secrets are given to the slaves in file
+            order.
+
+        Arguments:
+
+        """
+
+        self.write_file(
+            "# japd = commented\nname = Slave1\njapd = pwd1\n"
+            "rep_japd = rep=pwd\nname = Slave2\njapd = pwd2\n")
+
+        self.assertEqual(
+            mysql_rep_change.fill_slv_secrets(self.fname, self.data),
+            [{"name": "Slave1", "japd": "pwd1", "rep_japd": "rep=pwd"},
+             {"name": "Slave2", "japd": "pwd2"}])
+
+    def test_count_mismatch(self):
+
+        """Function:  test_count_mismatch
+
+        Description:  Test with a file which has a different number of
+            secrets than the cache.
+
+        Arguments:
+
+        """
+
+        self.write_file("name = Slave1\njapd = pwd1\nrep_japd = rep_pwd\n")
+
+        self.assertIsNone(
+            mysql_rep_change.fill_slv_secrets(self.fname, self.data))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a file which does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_change.fill_slv_secrets(self.fname, self.data))
+
+    def write_file(self, text):
+
+        """Function:  write_file
+
+        Description:  Writes the slave configuration file.
+
+        Arguments:
+            (input) text -> Contents of the file
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(text)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  find_slv.py
+
+    Description:  Unit testing of find_slv in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/find_slv.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, server_id, host, port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.host = host
+        self.port = port
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_array
+        test_slave_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep("Slave1", 11, "host1")
+        self.slave2 = SlaveRep("Slave2", "12", "host2", port="3307")
+        self.slv_array = mysql_rep_change.SlaveArray([self.slave, self.slave2])
+
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_slave_array(self, mock_find):
+
+        """Function:  test_slave_array
+
+        Description:  Test with a SlaveArray.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.find_slv(self.slv_array, "Slave1"), self.slave)
+        mock_find.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_slave_list(self, mock_find):
+
+        """Function:  test_slave_list
+
+        Description:  Test with a slave list.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.find_slv([self.slave], "Slave1"), self.slave)
+        mock_find.assert_called_once_with([self.slave], "Slave1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  get_conn_opts.py
+
+    Description:  Unit testing of get_conn_opts in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/get_conn_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default_values
+        test_passed_values
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args2.args_array = {"-t": "5", "-w": "40"}
+
+    def test_default_values(self):
+
+        """Function:  test_default_values
+
+        Description:  Test with the default values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.get_conn_opts(self.args),
+                         {"workers": 10, "timeout": 30.0})
+
+    def test_passed_values(self):
+
+        """Function:  test_passed_values
+
+        Description:  Test with values passed on the command line.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.get_conn_opts(self.args2),
+                         {"workers": 40, "timeout": 5.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
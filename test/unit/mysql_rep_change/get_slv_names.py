@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  get_slv_names.py
+
+    Description:  Unit testing of get_slv_names in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/get_slv_names.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single_name
+        test_multiple_names
+        test_name_file
+        test_name_file_in_dir
+        test_duplicate_names
+        test_name_file_overlap
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args3 = ArgParser()
+        self.args.args_array = {"-n": "Slave1"}
+        self.args2.args_array = {"-n": ["Slave1", "Slave2"]}
+        self.args3.args_array = {
+            "-n": ["Slave1"], "-f": "slaves.txt", "-d": "config"}
+        self.data = "Slave2\n\n# Comment\n  Slave3  \n"
+
+    def test_single_name(self):
+
+        """Function:  test_single_name
+
+        Description:  Test with a single slave name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.get_slv_names(self.args), ["Slave1"])
+
+    def test_multiple_names(self):
+
+        """Function:  test_multiple_names
+
+        Description:  Test with multiple slave names.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.get_slv_names(self.args2), ["Slave1", "Slave2"])
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_name_file(self):
+
+        """Function:  test_name_file
+
+        Description:  Test with a file of slave names.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data)) as mock_file:
+            self.assertEqual(
+                mysql_rep_change.get_slv_names(self.args3),
+                ["Slave1", "Slave2", "Slave3"])
+            mock_file.assert_called_once_with(
+                "slaves.txt", mode="r", encoding="UTF-8")
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=False))
+    def test_name_file_in_dir(self):
+
+        """Function:  test_name_file_in_dir
+
+        Description:  Test with a file of slave names in the -d directory.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data)) as mock_file:
+            self.assertEqual(
+                mysql_rep_change.get_slv_names(self.args3),
+                ["Slave1", "Slave2", "Slave3"])
+            mock_file.assert_called_once_with(
+                os.path.join("config", "slaves.txt"), mode="r",
+                encoding="UTF-8")
+
+    def test_duplicate_names(self):
+
+        """Function:  test_duplicate_names
+
+        Description:  Test with a slave name given twice.
+
+        Arguments:
+
+        """
+
+        self.args2.args_array = {"-n": ["Slave2", "Slave1", "Slave2"]}
+
+        self.assertEqual(
+            mysql_rep_change.get_slv_names(self.args2), ["Slave2", "Slave1"])
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_name_file_overlap(self):
+
+        """Function:  test_name_file_overlap
+
+        Description:  Test with a slave name in both -n and the file.
+
+        Arguments:
+
+        """
+
+        self.args3.args_array["-n"] = ["Slave3"]
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data)):
+            self.assertEqual(
+                mysql_rep_change.get_slv_names(self.args3),
+                ["Slave3", "Slave2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
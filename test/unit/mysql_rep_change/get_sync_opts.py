@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  get_sync_opts.py
+
+    Description:  Unit testing of get_sync_opts in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/get_sync_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default_values
+        test_passed_values
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args2.args_array = {
+            "-g": True, "-W": "600", "-l": "0.5", "-x": "120", "-I": "5"}
+
+    def test_default_values(self):
+
+        """Function:  test_default_values
+
+        Description:  Test with the default values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.get_sync_opts(self.args),
+                         {"gtid": False, "server_wait": False,
+                          "timeout": 0.0, "lag_max": 1.0,
+                          "converge_timeout": 60.0, "progress": 0.0})
+
+    def test_passed_values(self):
+
+        """Function:  test_passed_values
+
+        Description:  Test with values passed on the command line.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.get_sync_opts(self.args2),
+                         {"gtid": True, "server_wait": True,
+                          "timeout": 600.0, "lag_max": 0.5,
+                          "converge_timeout": 120.0, "progress": 5.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  get_topology.py
+
+    Description:  Unit testing of get_topology in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/get_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = True
+        self.conn_msg = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_get_topology
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master", host="host1")
+        self.slave = Server("Slave1", host="host2")
+        self.slave2 = Server("Slave2", host="host3")
+        self.slave3 = Server("Slave3", host="host4")
+        self.slave.data = [{"Source_Host": "host1", "Source_Port": "3306"}]
+        self.slave2.data = [{"Source_Host": "host2", "Source_Port": 3306}]
+        self.slave3.data = []
+        self.slaves = [self.slave, self.slave2, self.slave3]
+
+    def test_get_topology(self):
+
+        """Function:  test_get_topology
+
+        Description:  Test getting the current replication tree.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.get_topology(self.master, self.slaves),
+            {"Master": None, "Slave1": "Master", "Slave2": "Slave1",
+             "Slave3": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
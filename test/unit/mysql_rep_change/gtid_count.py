@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  gtid_count.py
+
+    Description:  Unit testing of gtid_count in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/gtid_count.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_single
+        test_gtid_count
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3E11FA47-71CA-11E1-9E33-C80AA9429562"
+        self.uuid2 = "4E11FA47-71CA-11E1-9E33-C80AA9429562"
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.gtid_count(""), 0)
+
+    def test_single(self):
+
+        """Function:  test_single
+
+        Description:  Test with single transactions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.gtid_count(self.uuid + ":7"), 1)
+
+    def test_gtid_count(self):
+
+        """Function:  test_gtid_count
+
+        Description:  Test with intervals from more than one server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.gtid_count(
+                f"{self.uuid}:1-5:7,\n{self.uuid2}:3-4"), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  heartbeat_beat.py
+
+    Description:  Unit testing of heartbeat_beat in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_beat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_beat
+        test_sequence
+        test_write_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.heartbeat = mysql_rep_change.Heartbeat(self.master, "db.hb")
+
+    def test_beat(self):
+
+        """Function:  test_beat
+
+        Description:  Test writing a heartbeat.
+
+        Arguments:
+
+        """
+
+        seq = self.heartbeat.seq
+        self.heartbeat.beat()
+
+        self.assertEqual(self.master.cmds, [(
+            "REPLACE INTO db.hb (server_id, seq, ts)"
+            " VALUES (%s, %s, NOW(6))", (10, seq + 1))])
+        self.assertEqual(list(self.heartbeat.sent), [seq + 1])
+
+    def test_sequence(self):
+
+        """Function:  test_sequence
+
+        Description:  Test each heartbeat has the next sequence number.
+
+        Arguments:
+
+        """
+
+        seq = self.heartbeat.seq
+        self.heartbeat.beat()
+        self.heartbeat.beat()
+
+        self.assertEqual([cmd[1][1] for cmd in self.master.cmds],
+                         [seq + 1, seq + 2])
+
+    def test_write_fails(self):
+
+        """Function:  test_write_fails
+
+        Description:  Test with the write failing.
+
+        Arguments:
+
+        """
+
+        self.master.fail = True
+
+        with self.assertRaises(RuntimeError):
+            self.heartbeat.beat()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+# Classification (U)
+
+"""Program:  heartbeat_detach.py
+
+    Description:  Unit testing of heartbeat_detach in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_detach.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name="Slave1"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.seq = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return [{"seq": self.seq}] if self.seq is not None else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_new_master
+        test_heartbeat_master
+        test_new_master_beats
+        test_new_master_no_beats
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = SlaveRep()
+        self.new_master = SlaveRep("Top")
+        self.heartbeat = mysql_rep_change.Heartbeat(self.master, "db.hb")
+        self.heartbeat.sent = {self.heartbeat.seq: time.monotonic()}
+
+    def test_no_new_master(self):
+
+        """Function:  test_no_new_master
+
+        Description:  Test the slaves are detached with no new master.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.detach([self.slave])
+
+        self.assertEqual(self.heartbeat.detached, {"Slave1"})
+        self.assertIsNone(self.heartbeat.lag(self.slave))
+        self.assertEqual(self.slave.cmds, [])
+
+    def test_heartbeat_master(self):
+
+        """Function:  test_heartbeat_master
+
+        Description:  Test the slaves are kept when moved to the heartbeat
+            master.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.detach([self.slave], self.master)
+
+        self.assertEqual(self.heartbeat.detached, set())
+
+    def test_new_master_beats(self):
+
+        """Function:  test_new_master_beats
+
+        Description:  Test the slaves are kept when the new master receives the
+            heartbeats.
+
+        Arguments:
+
+        """
+
+        self.new_master.seq = self.heartbeat.seq
+
+        self.heartbeat.detach([self.slave], self.new_master)
+
+        self.assertEqual(self.heartbeat.detached, set())
+
+    def test_new_master_no_beats(self):
+
+        """Function:  test_new_master_no_beats
+
+        Description:  Test the slaves are detached when the new master does not
+            receive the heartbeats.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.detach([self.slave], self.new_master)
+
+        self.assertEqual(self.heartbeat.detached, {"Slave1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  heartbeat_init.py
+
+    Description:  Unit testing of heartbeat_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_init
+        test_interval
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test the class initialization.
+
+        Arguments:
+
+        """
+
+        heartbeat = mysql_rep_change.Heartbeat(self.master, "db.hb")
+
+        self.assertEqual(
+            (heartbeat.master, heartbeat.table, heartbeat.interval,
+             heartbeat.sent, heartbeat.thread, heartbeat.err_msg),
+            (self.master, "db.hb", mysql_rep_change.HEARTBEAT_INTERVAL, {},
+             None, None))
+        self.assertFalse(heartbeat.done.is_set())
+
+    def test_interval(self):
+
+        """Function:  test_interval
+
+        Description:  Test with an interval.
+
+        Arguments:
+
+        """
+
+        heartbeat = mysql_rep_change.Heartbeat(self.master, "hb", interval=1)
+
+        self.assertEqual(heartbeat.interval, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+# Classification (U)
+
+"""Program:  heartbeat_lag.py
+
+    Description:  Unit testing of heartbeat_lag in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_lag.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.seq = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        return [{"seq": self.seq}] if self.seq is not None else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_row
+        test_other_run
+        test_caught_up
+        test_lag
+        test_detached
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = SlaveRep()
+        self.heartbeat = mysql_rep_change.Heartbeat(self.master, "db.hb")
+        self.seq = self.heartbeat.seq
+        now = time.monotonic()
+        self.heartbeat.sent = {
+            self.seq: now - 5, self.seq + 1: now - 1, self.seq + 2: now}
+
+    def test_no_row(self):
+
+        """Function:  test_no_row
+
+        Description:  Test with no heartbeat row on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.heartbeat.lag(self.slave))
+        self.assertEqual(self.slave.cmds, [(
+            "SELECT seq FROM db.hb WHERE server_id = %s", (10,))])
+
+    def test_other_run(self):
+
+        """Function:  test_other_run
+
+        Description:  Test with a heartbeat from another run.
+
+        Arguments:
+
+        """
+
+        self.slave.seq = 5
+
+        self.assertIsNone(self.heartbeat.lag(self.slave))
+
+    def test_caught_up(self):
+
+        """Function:  test_caught_up
+
+        Description:  Test with the slave applying the last heartbeat.
+
+        Arguments:
+
+        """
+
+        self.slave.seq = self.seq + 2
+
+        self.assertEqual(self.heartbeat.lag(self.slave), 0.0)
+
+    def test_lag(self):
+
+        """Function:  test_lag
+
+        Description:  Test the lag is from the first heartbeat not applied.
+
+        Arguments:
+
+        """
+
+        self.slave.seq = self.seq
+
+        self.assertGreaterEqual(self.heartbeat.lag(self.slave), 1000.0)
+        self.assertLess(self.heartbeat.lag(self.slave), 2000.0)
+
+    def test_detached(self):
+
+        """Function:  test_detached
+
+        Description:  Test a detached slave has no heartbeat lag.
+
+        Arguments:
+
+        """
+
+        self.slave.seq = self.seq
+        self.heartbeat.detached.add("Slave1")
+
+        self.assertIsNone(self.heartbeat.lag(self.slave))
+        self.assertEqual(self.slave.cmds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  heartbeat_source.py
+
+    Description:  Unit testing of heartbeat_source in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_source.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-m": "top", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_master
+        test_move_up
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mysql_rep_change.cfg_mst_inst")
+    def test_master(self, mock_cfg):
+
+        """Function:  test_master
+
+        Description:  Test the heartbeat is written on the master.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = True
+
+        self.assertEqual(
+            mysql_rep_change.heartbeat_source("Master", self.args), "Master")
+        mock_cfg.assert_not_called()
+
+    @mock.patch("mysql_rep_change.cfg_mst_inst")
+    def test_move_up(self, mock_cfg):
+
+        """Function:  test_move_up
+
+        Description:  Test the heartbeat is written on the new master for -S.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+        mock_cfg.return_value = "Top"
+
+        self.assertEqual(
+            mysql_rep_change.heartbeat_source("Master", self.args), "Top")
+        mock_cfg.assert_called_once_with("top", "config")
+
+
+if __name__ == "__main__":
+    unittest.main()
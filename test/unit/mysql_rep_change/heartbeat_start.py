@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  heartbeat_start.py
+
+    Description:  Unit testing of heartbeat_start in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_start
+        test_writes
+        test_write_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.heartbeat = mysql_rep_change.Heartbeat(
+            self.master, "db.hb", interval=0.005)
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test creating the table and starting the writes.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.start()
+        self.heartbeat.done.set()
+        self.heartbeat.thread.join()
+
+        self.assertTrue(self.master.cmds[0][0].startswith(
+            "CREATE TABLE IF NOT EXISTS db.hb (server_id INT UNSIGNED"))
+        self.assertTrue(self.master.cmds[1][0].startswith(
+            "REPLACE INTO db.hb"))
+        self.assertIsNone(self.heartbeat.err_msg)
+
+    def test_writes(self):
+
+        """Function:  test_writes
+
+        Description:  Test heartbeats are written at the interval.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.start()
+        time.sleep(0.05)
+        self.heartbeat.done.set()
+        self.heartbeat.thread.join()
+
+        self.assertGreater(len(self.heartbeat.sent), 2)
+
+    def test_write_fails(self):
+
+        """Function:  test_write_fails
+
+        Description:  Test the writer stops when a write fails.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.start()
+        self.master.fail = True
+        self.heartbeat.thread.join(timeout=1)
+
+        self.assertFalse(self.heartbeat.thread.is_alive())
+        self.assertEqual(self.heartbeat.err_msg,
+                         "Error:  Heartbeat write failed: Lost connection")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  heartbeat_stop.py
+
+    Description:  Unit testing of heartbeat_stop in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/heartbeat_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_started
+        test_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.heartbeat = mysql_rep_change.Heartbeat(
+            self.master, "db.hb", interval=0.005)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_not_started(self, mock_disconn):
+
+        """Function:  test_not_started
+
+        Description:  Test stopping a heartbeat which was not started.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.stop()
+
+        self.assertTrue(self.heartbeat.done.is_set())
+        mock_disconn.assert_called_once_with(self.master)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_stop(self, mock_disconn):
+
+        """Function:  test_stop
+
+        Description:  Test stopping the writer thread.
+
+        Arguments:
+
+        """
+
+        self.heartbeat.start()
+        self.heartbeat.stop()
+
+        self.assertFalse(self.heartbeat.thread.is_alive())
+        mock_disconn.assert_called_once_with(self.master)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  import_time.py
+
+    Description:  Unit testing of the modules loaded by the import of
+        mysql_rep_change.py.  The import is done in a new interpreter, so
+        modules loaded by other tests do not count.  The import time is
+        measured by test/benchmark/mysql_rep_change/benchmark.py.
+
+    Usage:
+        test/unit/mysql_rep_change/import_time.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+# Modules which are only to be loaded when the databases are used.
+HEAVY = ["mysql_lib.mysql_class", "mysql_lib.mysql_libs", "mysql.connector",
+         "google.protobuf"]
+
+CODE = """
+import json, sys
+sys.path.append({cwd!r})
+import mysql_rep_change
+print(json.dumps({{"loaded": [
+    mod for mod in {heavy!r} if mod in sys.modules]}}))
+"""
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_heavy_modules
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.run(
+            [sys.executable, "-c", CODE.format(cwd=os.getcwd(), heavy=HEAVY)],
+            capture_output=True, check=True, text=True)
+        self.results = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    def test_heavy_modules(self):
+
+        """Function:  test_heavy_modules
+
+        Description:  Test the database modules are not loaded on import.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.results["loaded"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  lazymodule_getattr.py
+
+    Description:  Unit testing of lazymodule_getattr in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/lazymodule_getattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_module
+        test_uninitialized
+        test_cached
+        test_attribute
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lazy = mysql_rep_change.LazyModule("json")
+
+    def test_missing_module(self):
+
+        """Function:  test_missing_module
+
+        Description:  Test with a module which does not exist.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_change.LazyModule("no_such_module")
+
+        with self.assertRaises(ImportError):
+            lazy.dumps                          # pylint:disable=W0104
+
+    def test_uninitialized(self):
+
+        """Function:  test_uninitialized
+
+        Description:  Test with an instance which was not initialized.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_change.LazyModule.__new__(
+            mysql_rep_change.LazyModule)
+
+        self.assertFalse(hasattr(lazy, "module"))
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test the module is imported once.
+
+        Arguments:
+
+        """
+
+        with mock.patch("importlib.import_module",
+                        return_value=mysql_rep_change.json) as mock_import:
+            self.lazy.dumps                     # pylint:disable=W0104
+            self.lazy.loads                     # pylint:disable=W0104
+
+        self.assertEqual(mock_import.call_count, 1)
+
+    def test_attribute(self):
+
+        """Function:  test_attribute
+
+        Description:  Test returning an attribute of the module.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.lazy.dumps, mysql_rep_change.json.dumps)
+        self.assertIs(self.lazy.module, mysql_rep_change.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
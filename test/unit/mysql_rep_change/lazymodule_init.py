@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  lazymodule_init.py
+
+    Description:  Unit testing of lazymodule_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/lazymodule_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_imported
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "json"
+
+    def test_not_imported(self):
+
+        """Function:  test_not_imported
+
+        Description:  Test the module is not imported on creation.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_change.LazyModule("no_such_module")
+
+        self.assertIsNone(lazy.module)
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test the class initialization.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_change.LazyModule(self.name)
+
+        self.assertEqual((lazy.name, lazy.module), (self.name, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
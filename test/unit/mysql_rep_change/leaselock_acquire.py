@@ -0,0 +1,272 @@
+# Classification (U)
+
+"""Program:  leaselock_acquire.py
+
+    Description:  Unit testing of leaselock_acquire in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/leaselock_acquire.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.conn = "Connection"
+        self.conn_msg = None
+        self.fail = False
+        self.got = 1
+        self.held = 1
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+        return [{"got": self.got}] if "GET_LOCK" in cmd \
+            else [{"held": self.held}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_conn_fails
+        test_query_fails
+        test_leased
+        test_lock_error
+        test_acquire
+        test_renewed
+        test_lost
+        test_renew_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lease = mysql_rep_change.LeaseLock(self.server, 30)
+
+    def test_conn_fails(self):
+
+        """Function:  test_conn_fails
+
+        Description:  Test with the lease connection failing.
+
+        Arguments:
+
+        """
+
+        self.server.conn_msg = "Connection refused"
+
+        self.assertEqual(
+            self.lease.acquire(),
+            (True, "Error:  Lease connection to Master failed: Connection"
+             " refused"))
+        self.assertEqual(self.server.cmds, [])
+
+    def test_query_fails(self):
+
+        """Function:  test_query_fails
+
+        Description:  Test with the lock query failing.
+
+        Arguments:
+
+        """
+
+        self.server.fail = True
+
+        self.assertEqual(
+            self.lease.acquire(),
+            (True, "Error:  Lease on Master failed: Lost connection"))
+        self.assertIsNone(self.lease.thread)
+
+    def test_leased(self):
+
+        """Function:  test_leased
+
+        Description:  Test with the lock held by another run.
+
+        Arguments:
+
+        """
+
+        self.server.got = 0
+
+        self.assertEqual(
+            self.lease.acquire(),
+            (True, "Error:  Server Master is leased by another run."))
+        self.assertIsNone(self.lease.thread)
+
+    def test_lock_error(self):
+
+        """Function:  test_lock_error
+
+        Description:  Test with GET_LOCK returning NULL.
+
+        Arguments:
+
+        """
+
+        self.server.got = None
+
+        self.assertTrue(self.lease.acquire()[0])
+
+    def test_acquire(self):
+
+        """Function:  test_acquire
+
+        Description:  Test taking the lock.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.lease.acquire(), (False, None))
+        self.assertEqual(self.server.cmds[:2], [
+            ("SET SESSION wait_timeout = %s", (30,)),
+            ("SELECT GET_LOCK(%s, %s) AS got", ("mysql_rep_change", 30))])
+        self.assertTrue(self.lease.thread.is_alive())
+
+        self.lease.done.set()
+        self.lease.thread.join()
+
+    def test_renewed(self):
+
+        """Function:  test_renewed
+
+        Description:  Test the lease is renewed.
+
+        Arguments:
+
+        """
+
+        self.lease.lease = 0.03
+        self.lease.acquire()
+        time.sleep(0.1)
+
+        self.lease.done.set()
+        self.lease.thread.join()
+
+        self.assertIn(
+            ("SELECT IS_USED_LOCK(%s) = CONNECTION_ID() AS held",
+             ("mysql_rep_change",)), self.server.cmds)
+        self.assertIsNone(self.lease.err_msg)
+
+    def test_lost(self):
+
+        """Function:  test_lost
+
+        Description:  Test a lease which is lost.
+
+        Arguments:
+
+        """
+
+        self.lease.lease = 0.03
+        self.lease.acquire()
+        self.server.held = 0
+        self.lease.thread.join(1)
+
+        self.assertEqual(self.lease.err_msg,
+                         "Warning:  Lease on Master was lost.")
+
+    def test_renew_fails(self):
+
+        """Function:  test_renew_fails
+
+        Description:  Test a renewal which fails.
+
+        Arguments:
+
+        """
+
+        self.lease.lease = 0.03
+        self.lease.acquire()
+        self.server.fail = True
+        self.lease.thread.join(1)
+
+        self.assertEqual(self.lease.err_msg,
+                         "Warning:  Lease on Master was lost.")
+
+
+if __name__ == "__main__":
+    unittest.main()
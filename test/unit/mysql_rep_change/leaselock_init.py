@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  leaselock_init.py
+
+    Description:  Unit testing of leaselock_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/leaselock_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.conn = "Connection"
+        self.conn_msg = None
+        self.fail = False
+        self.got = 1
+        self.held = 1
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+        return [{"got": self.got}] if "GET_LOCK" in cmd \
+            else [{"held": self.held}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lease = mysql_rep_change.LeaseLock(self.server, 30)
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test the class initialization.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.lease.server, self.lease.lease, self.lease.thread,
+             self.lease.err_msg), (self.server, 30, None, None))
+        self.assertFalse(self.lease.done.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
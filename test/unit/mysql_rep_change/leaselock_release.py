@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  leaselock_release.py
+
+    Description:  Unit testing of leaselock_release in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/leaselock_release.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.conn = "Connection"
+        self.conn_msg = None
+        self.fail = False
+        self.got = 1
+        self.held = 1
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+        return [{"got": self.got}] if "GET_LOCK" in cmd \
+            else [{"held": self.held}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_acquired
+        test_no_conn
+        test_release
+        test_release_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lease = mysql_rep_change.LeaseLock(self.server, 30)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_not_acquired(self, mock_disconn):
+
+        """Function:  test_not_acquired
+
+        Description:  Test releasing a lease which was not taken.
+
+        Arguments:
+
+        """
+
+        self.lease.release()
+
+        self.assertEqual(self.server.cmds, [])
+        mock_disconn.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_no_conn(self, mock_disconn):
+
+        """Function:  test_no_conn
+
+        Description:  Test releasing a lease with no connection.
+
+        Arguments:
+
+        """
+
+        self.server.conn = None
+        self.lease.release()
+
+        mock_disconn.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_release(self, mock_disconn):
+
+        """Function:  test_release
+
+        Description:  Test releasing the lock.
+
+        Arguments:
+
+        """
+
+        self.lease.acquire()
+        self.lease.release()
+
+        self.assertFalse(self.lease.thread.is_alive())
+        self.assertEqual(self.server.cmds[-1],
+                         ("DO RELEASE_LOCK(%s)", ("mysql_rep_change",)))
+        mock_disconn.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    def test_release_fails(self, mock_disconn):
+
+        """Function:  test_release_fails
+
+        Description:  Test with freeing the lock failing.
+
+        Arguments:
+
+        """
+
+        self.lease.acquire()
+        self.server.fail = True
+        self.lease.release()
+
+        mock_disconn.assert_called_once_with(self.server)
+
+
+if __name__ == "__main__":
+    unittest.main()
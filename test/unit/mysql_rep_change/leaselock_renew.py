@@ -0,0 +1,163 @@
+# Classification (U)
+
+"""Program:  leaselock_renew.py
+
+    Description:  Unit testing of leaselock_renew in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/leaselock_renew.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.conn = "Connection"
+        self.conn_msg = None
+        self.fail = False
+        self.got = 1
+        self.held = 1
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+        return [{"got": self.got}] if "GET_LOCK" in cmd \
+            else [{"held": self.held}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_held
+        test_not_held
+        test_freed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lease = mysql_rep_change.LeaseLock(self.server, 30)
+
+    def test_held(self):
+
+        """Function:  test_held
+
+        Description:  Test with the lock held by the session.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.lease.renew())
+
+    def test_not_held(self):
+
+        """Function:  test_not_held
+
+        Description:  Test with the lock not held by the session.
+
+        Arguments:
+
+        """
+
+        self.server.held = 0
+
+        self.assertFalse(self.lease.renew())
+
+    def test_freed(self):
+
+        """Function:  test_freed
+
+        Description:  Test with the lock freed.
+
+        Arguments:
+
+        """
+
+        self.server.held = None
+
+        self.assertFalse(self.lease.renew())
+
+
+if __name__ == "__main__":
+    unittest.main()
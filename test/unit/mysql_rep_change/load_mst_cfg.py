@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  load_mst_cfg.py
+
+    Description:  Unit testing of load_mst_cfg in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/load_mst_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Stub holder for configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.port = 3306
+        self.cfg_file = None
+        self.os = os
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache
+        test_cache
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "master", "-d": "config"}
+        self.cfg = Cfg()
+
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    def test_no_cache(self, mock_load):
+
+        """Function:  test_no_cache
+
+        Description:  Test without the -C option.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        self.assertIs(mysql_rep_change.load_mst_cfg(self.args), self.cfg)
+        mock_load.assert_called_once_with("master", "config")
+
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    def test_cache(self, mock_load):
+
+        """Function:  test_cache
+
+        Description:  Test with the -C option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "cache"
+        mock_load.return_value = self.cfg
+
+        with mock.patch("mysql_rep_change.cached_load",
+                        side_effect=lambda fname, cache_dir, loader, fill:
+                        loader()) as mock_cache:
+            cfg = mysql_rep_change.load_mst_cfg(self.args)
+
+        self.assertEqual(vars(cfg), {"name": "Master", "port": 3306,
+                                     "cfg_file": None})
+        self.assertEqual(mock_cache.call_args[0][:2],
+                         (os.path.join("config", "master.py"), "cache"))
+        self.assertIs(mock_cache.call_args[1]["fill"],
+                      mysql_rep_change.fill_mst_secrets)
+
+
+if __name__ == "__main__":
+    unittest.main()
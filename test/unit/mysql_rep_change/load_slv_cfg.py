@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  load_slv_cfg.py
+
+    Description:  Unit testing of load_slv_cfg in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/load_slv_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache
+        test_cache
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "config", "-s": "slaves.txt"}
+        self.slv_key = {"port": "int"}
+        self.slv_array = [{"name": "Slave1", "port": "3306"}]
+        self.results = [{"name": "Slave1", "port": 3306}]
+
+    @mock.patch("mysql_rep_change.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_change.gen_libs.create_cfg_array")
+    def test_no_cache(self, mock_array, mock_trans):
+
+        """Function:  test_no_cache
+
+        Description:  Test without the -C option.
+
+        Arguments:
+
+        """
+
+        mock_array.return_value = self.slv_array
+        mock_trans.return_value = self.results
+
+        with mock.patch("mysql_rep_change.cached_load",
+                        side_effect=lambda fname, cache_dir, loader, key, fill:
+                        loader()) as mock_cache:
+            self.assertEqual(
+                mysql_rep_change.load_slv_cfg(self.args, self.slv_key),
+                self.results)
+
+        mock_array.assert_called_once_with("slaves.txt", cfg_path="config")
+        mock_trans.assert_called_once_with(self.slv_array, self.slv_key)
+        mock_cache.assert_called_once_with(
+            os.path.join("config", "slaves.txt"), None, mock.ANY,
+            key=self.slv_key, fill=mysql_rep_change.fill_slv_secrets)
+
+    @mock.patch("mysql_rep_change.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_change.gen_libs.create_cfg_array")
+    def test_cache(self, mock_array, mock_trans):
+
+        """Function:  test_cache
+
+        Description:  Test with the -C option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "cache"
+        mock_array.return_value = self.slv_array
+        mock_trans.return_value = self.results
+
+        with mock.patch("mysql_rep_change.cached_load",
+                        side_effect=lambda fname, cache_dir, loader, key, fill:
+                        loader()) as mock_cache:
+            self.assertEqual(
+                mysql_rep_change.load_slv_cfg(self.args, self.slv_key),
+                self.results)
+
+        mock_array.assert_called_once_with("slaves.txt", cfg_path="config")
+        mock_trans.assert_called_once_with(self.slv_array, self.slv_key)
+        mock_cache.assert_called_once_with(
+            os.path.join("config", "slaves.txt"), "cache", mock.ANY,
+            key=self.slv_key, fill=mysql_rep_change.fill_slv_secrets)
+
+
+if __name__ == "__main__":
+    unittest.main()
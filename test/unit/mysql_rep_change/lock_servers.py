@@ -0,0 +1,238 @@
+# Classification (U)
+
+"""Program:  lock_servers.py
+
+    Description:  Unit testing of lock_servers in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/lock_servers.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_locked
+        test_no_lease
+        test_lease
+        test_short_lease
+        test_master_down
+        test_move_up
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = mock.Mock(conn_msg=None)
+        self.locks = mock.Mock()
+        self.locks.acquire.return_value = (False, None)
+        self.locks.lease.return_value = (False, None)
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    def test_locked(self):
+
+        """Function:  test_locked
+
+        Description:  Test with a server locked by another run.
+
+        Arguments:
+
+        """
+
+        self.locks.acquire.return_value = (True, "Error:  Locked")
+        self.args.args_array = {"-G": "30"}
+
+        self.assertEqual(
+            mysql_rep_change.lock_servers(
+                self.locks, self.master, [], self.args, "-M"),
+            (True, "Error:  Locked"))
+        self.locks.acquire.assert_called_once_with([("mst", 3306)])
+        self.locks.lease.assert_not_called()
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    def test_no_lease(self):
+
+        """Function:  test_no_lease
+
+        Description:  Test without the -G option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.lock_servers(
+                self.locks, self.master, [], self.args, "-M"),
+            (False, None))
+        self.locks.lease.assert_not_called()
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    def test_lease(self):
+
+        """Function:  test_lease
+
+        Description:  Test the master is leased.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": "30"}
+
+        self.assertEqual(
+            mysql_rep_change.lock_servers(
+                self.locks, self.master, [], self.args, "-M"),
+            (False, None))
+        self.locks.lease.assert_called_once_with([self.master], 30)
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    def test_short_lease(self):
+
+        """Function:  test_short_lease
+
+        Description:  Test a lease under a second is a second.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": "0.2"}
+
+        mysql_rep_change.lock_servers(
+            self.locks, self.master, [], self.args, "-M")
+
+        self.locks.lease.assert_called_once_with([self.master], 1)
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    def test_master_down(self):
+
+        """Function:  test_master_down
+
+        Description:  Test a master which is down is not leased.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": "30"}
+        self.master.conn_msg = "Connection refused"
+
+        mysql_rep_change.lock_servers(
+            self.locks, self.master, [], self.args, "-F")
+
+        self.locks.lease.assert_called_once_with([], 30)
+
+    @mock.patch("mysql_rep_change.lock_targets",
+                mock.Mock(return_value=[("mst", 3306)]))
+    @mock.patch("mysql_rep_change.cfg_mst_inst")
+    def test_move_up(self, mock_cfg):
+
+        """Function:  test_move_up
+
+        Description:  Test the new master is leased for -S.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": "30", "-m": "top", "-d": "config"}
+        self.locks.lease.return_value = (True, "Error:  Leased")
+
+        self.assertEqual(
+            mysql_rep_change.lock_servers(
+                self.locks, self.master, [], self.args, "-S"),
+            (True, "Error:  Leased"))
+        mock_cfg.assert_called_once_with("top", "config")
+        self.locks.lease.assert_called_once_with(
+            [self.master, mock_cfg.return_value], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+# Classification (U)
+
+"""Program:  lock_targets.py
+
+    Description:  Unit testing of lock_targets in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/lock_targets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, host):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.host = host
+        self.port = 3306
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_move
+        test_slave_not_found
+        test_auto
+        test_topology
+        test_failover
+        test_move_up
+        test_rollback
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = Server("Master", "mst")
+        self.slaves = [Server("Slave1", "slv1"), Server("Slave2", "slv2"),
+                       Server("Slave3", "slv3")]
+
+    def test_move(self):
+
+        """Function:  test_move
+
+        Description:  Test a move locks the master, new master and moved
+            slaves.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-m": "Slave1", "-n": ["Slave2"]}
+
+        self.assertEqual(
+            mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-M"),
+            [("mst", 3306), ("slv2", 3306), ("slv1", 3306)])
+
+    def test_slave_not_found(self):
+
+        """Function:  test_slave_not_found
+
+        Description:  Test a slave not in the slave list is skipped.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-m": "Slave1", "-n": ["Slave9"]}
+
+        self.assertEqual(
+            mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-R"),
+            [("mst", 3306), ("slv1", 3306)])
+
+    def test_auto(self):
+
+        """Function:  test_auto
+
+        Description:  Test a move to an automatically selected new master.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-m": "auto", "-n": ["Slave2"]}
+
+        self.assertEqual(
+            mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-M"),
+            [("mst", 3306), ("slv1", 3306), ("slv2", 3306),
+             ("slv3", 3306)])
+
+    def test_topology(self):
+
+        """Function:  test_topology
+
+        Description:  Test a topology change locks all the slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            len(mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-T")), 4)
+
+    def test_failover(self):
+
+        """Function:  test_failover
+
+        Description:  Test a failover locks all the slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            len(mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-F")), 4)
+
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    def test_move_up(self, mock_load):
+
+        """Function:  test_move_up
+
+        Description:  Test a move up locks the new master from its
+            configuration.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-m": "top", "-d": "config", "-n": ["Slave2"]}
+        mock_load.return_value = mock.Mock(host="top", port="3307")
+
+        self.assertEqual(
+            mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-S"),
+            [("mst", 3306), ("top", "3307"), ("slv2", 3306)])
+        mock_load.assert_called_once_with("top", "config")
+
+    def test_rollback(self):
+
+        """Function:  test_rollback
+
+        Description:  Test a rollback locks all the slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            len(mysql_rep_change.lock_targets(
+                self.master, self.slaves, self.args, "-U")), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
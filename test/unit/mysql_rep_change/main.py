@@ -39,6 +39,8 @@ class ArgParser():
         arg_dir_chk
         arg_require
         arg_cond_req
+        arg_cond_req_or
+        arg_exist
         arg_xor_dict
         get_val
         arg_parse2
@@ -63,6 +65,8 @@ class ArgParser():
         self.dir_perms_chk2 = True
         self.opt_con_req = None
         self.opt_con_req2 = True
+        self.opt_con_or = None
+        self.opt_con_or2 = True
         self.opt_xor_val = None
         self.opt_xor_val2 = True
         self.argparse2 = True
@@ -109,6 +113,33 @@ class ArgParser():
 
         return self.opt_con_req2
 
+    def arg_cond_req_or(self, opt_con_or):
+
+        """Method:  arg_cond_req_or
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_cond_req_or.
+
+        Arguments:
+
+        """
+
+        self.opt_con_or = opt_con_or
+
+        return self.opt_con_or2
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def arg_xor_dict(self, opt_xor_val):
 
         """Method:  arg_xor_dict
@@ -189,16 +220,22 @@ class UnitTest(unittest.TestCase):
         test_help_false
         test_arg_req_false
         test_arg_req_true
+        test_slave_file_req
+        test_discover_no_slave_file
         test_arg_xor_false
         test_arg_xor_true
         test_arg_cond_false
         test_arg_cond_true
+        test_arg_cond_or_false
+        test_arg_cond_or_true
         test_arg_dir_false
         test_arg_dir_true
         test_run_program
         test_programlock_true
         test_programlock_false
         test_programlock_id
+        test_slv_file_false
+        test_cache_dir_false
 
     """
 
@@ -327,6 +364,47 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_change.main())
 
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_slave_file_req(self, mock_arg, mock_help):
+
+        """Function:  test_slave_file_req
+
+        Description:  Test the slave config file is required without -D.
+
+        Arguments:
+
+        """
+
+        self.args.opt_xor_val2 = False
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_change.main())
+        self.assertEqual(self.args.opt_req, ["-s"])
+
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_discover_no_slave_file(self, mock_arg, mock_help):
+
+        """Function:  test_discover_no_slave_file
+
+        Description:  Test the slave config file is not required with -D.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-D": True}
+        self.args.opt_xor_val2 = False
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_change.main())
+        self.assertEqual(self.args.opt_req, ["-c", "-d"])
+
     @mock.patch("mysql_rep_change.gen_libs.help_func")
     @mock.patch("mysql_rep_change.gen_class.ArgParser")
     def test_arg_xor_false(self, mock_arg, mock_help):
@@ -396,6 +474,44 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        self.args.opt_con_or2 = False
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_change.main())
+
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_arg_cond_or_false(self, mock_arg, mock_help):
+
+        """Function:  test_arg_cond_or_false
+
+        Description:  Test arg_cond_req_or if returns false.
+
+        Arguments:
+
+        """
+
+        self.args.opt_con_or2 = False
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_change.main())
+
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_arg_cond_or_true(self, mock_arg, mock_help):
+
+        """Function:  test_arg_cond_or_true
+
+        Description:  Test arg_cond_req_or if returns true.
+
+        Arguments:
+
+        """
+
         self.args.dir_perms_chk2 = False
 
         mock_arg.return_value = self.args
@@ -495,7 +611,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_arg.return_value = self.args
+        mock_arg.return_value = self.args2
         mock_help.return_value = False
         mock_lock.side_effect = \
             mysql_rep_change.gen_class.SingleInstanceException
@@ -523,6 +639,52 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_change.main())
 
+    @mock.patch("mysql_rep_change.run_program")
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_slv_file_false(self, mock_arg, mock_help, mock_run):
+
+        """Function:  test_slv_file_false
+
+        Description:  Test with a -f file which can not be read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = "MissingFile"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_change.main())
+
+        mock_run.assert_not_called()
+
+    @mock.patch("mysql_rep_change.run_program")
+    @mock.patch("mysql_rep_change.gen_libs.help_func")
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_cache_dir_false(self, mock_arg, mock_help, mock_run):
+
+        """Function:  test_cache_dir_false
+
+        Description:  Test with a -C directory which can not be used.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "MissingDir"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_change.main())
+
+        mock_run.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
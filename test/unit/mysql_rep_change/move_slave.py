@@ -99,6 +99,7 @@ class MasterRep():                                      # pylint:disable=R0903
         self.rep_user = "RepUser"
         self.rep_japd = None
         self.extra_def_file = "FileName"
+        self.conn = "Conn"
 
     def upd_mst_status(self):
 
@@ -145,6 +146,7 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.defaults_file = None
         self.rep_user = "RepUser"
         self.rep_japd = None
+        self.conn = "Conn"
 
 
 class UnitTest(unittest.TestCase):
@@ -156,10 +158,24 @@ class UnitTest(unittest.TestCase):
     Methods:
         setUp
         test_no_r_option
+        test_multiple_slaves
+        test_shared_conn
+        test_auto_new_master
+        test_auto_fails
         test_r_option
         test_move_fails
         test_create_slave_fails
         test_fetch_slv_fails
+        test_open_slaves_fails
+        test_resume_auto
+        test_journal_auto
+        test_move_not_done
+        test_auto_rollback
+        test_no_auto_rollback
+        test_r_option_snapshot
+        test_heartbeat_r_option
+        test_heartbeat_no_r_option
+        test_new_master_in_slaves
 
     """
 
@@ -180,13 +196,15 @@ class UnitTest(unittest.TestCase):
         self.err_msg = "Error: Fetch Failed"
         self.err_msg2 = "Error: Create Slave Failed"
         self.err_msg3 = "Error: Move of Slave to Master Failed"
+        self.err_msg4 = "Detected problem in slave connection"
         self.args = ArgParser()
         self.args2 = ArgParser()
         self.args.args_array = {"-R": True}
         self.args2.args_array = {}
         self.new_mst = "NewMaster"
 
-    @mock.patch("mysql_rep_change.is_slv_up", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
@@ -194,6 +212,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_no_r_option(self, mock_newmst):
 
         """Function:  test_no_r_option
@@ -211,13 +231,137 @@ class UnitTest(unittest.TestCase):
                 self.master, self.slaves, args=self.args2,
                 new_mst=self.new_mst), (False, None))
 
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_multiple_slaves(                   # pylint:disable=R0913,R0917
+            self, mock_open, mock_newmst, mock_move, mock_fetch, mock_up):
+
+        """Function:  test_multiple_slaves
+
+        Description:  Test with more than one slave to move.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (False, None)
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_move.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        mock_fetch.side_effect = [
+            ("SlaveMove1", False, None), ("SlaveMove2", False, None)]
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2,
+                new_mst=self.new_mst, slv_mv=["Slave1", "Slave2"]),
+            (False, None))
+        mock_open.assert_called_once_with(
+            self.slaves, [self.new_mst, "Slave1", "Slave2"], args=self.args2,
+            out=None)
+        self.assertEqual(
+            mock_move.call_args[0][3], ["SlaveMove1", "SlaveMove2"])
+        self.assertEqual(mock_up.call_args[0][0][:2],
+                         ["SlaveMove1", "SlaveMove2"])
+        self.assertEqual(len(mock_up.call_args[0][0]), 3)
+
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_shared_conn(self, mock_newmst, mock_find, mock_disc):
+
+        """Function:  test_shared_conn
+
+        Description:  Test a new master using the slave's connection is
+            not disconnected.
+
+        Arguments:
+
+        """
+
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_find.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2,
+                new_mst=self.new_mst), (False, None))
+        mock_disc.assert_not_called()
+
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.select_new_master",
+                mock.Mock(return_value=("Slave2", False, None)))
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_auto_new_master(self, mock_open, mock_newmst):
+
+        """Function:  test_auto_new_master
+
+        Description:  Test with the new master selected automatically.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (False, None)
+        mock_newmst.return_value = (self.new_master, False, None)
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2, new_mst="auto",
+                slv_mv="Slave3"), (False, None))
+        self.assertEqual(mock_open.call_args[0][1], ["Slave2", "Slave3"])
+        self.assertEqual(mock_newmst.call_args[1]["new_mst"], "Slave2")
+
+    @mock.patch("mysql_rep_change.select_new_master",
+                mock.Mock(return_value=(None, True, "Error:  No slave")))
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_auto_fails(self, mock_open):
+
+        """Function:  test_auto_fails
+
+        Description:  Test with no slave able to be the new master.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2, new_mst="auto",
+                slv_mv="Slave3"), (True, "Error:  No slave"))
+        mock_open.assert_not_called()
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_change.mysql_libs.reset_slave",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.find_name",
-                mock.Mock(return_value="SlaveMaster"))
-    @mock.patch("mysql_rep_change.is_slv_up", mock.Mock(return_value=True))
+                mock.Mock(return_value=SlaveRep()))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
@@ -225,6 +369,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_r_option(self, mock_newmst):
 
         """Function:  test_r_option
@@ -248,6 +394,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=("SlaveMove", False, None)))
     @mock.patch("mysql_rep_change.crt_slv_mst")
     @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_move_fails(self, mock_move, mock_newmst):
 
         """Function:  test_move_fails
@@ -269,6 +417,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
                 mock.Mock(return_value=("SlaveMove", False, None)))
     @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_create_slave_fails(self, mock_crt):
 
         """Function:  test_sync_fails
@@ -285,6 +435,8 @@ class UnitTest(unittest.TestCase):
             self.master, self.slaves, args=self.args2), (True, self.err_msg2))
 
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_fetch_slv_fails(self, mock_fetch):
 
         """Function:  test_fetch_slv_fails
@@ -301,5 +453,344 @@ class UnitTest(unittest.TestCase):
             self.master, self.slaves, args=self.args2), (True, self.err_msg))
 
 
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_open_slaves_fails(self, mock_open, mock_fetch):
+
+        """Function:  test_open_slaves_fails
+
+        Description:  Test with connecting to the slaves fails.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (True, self.err_msg4)
+
+        self.assertEqual(mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args2), (True, self.err_msg4))
+        mock_fetch.assert_not_called()
+
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.open_journal")
+    @mock.patch("mysql_rep_change.select_new_master")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_resume_auto(                   # pylint:disable=R0913,R0917
+            self, mock_newmst, mock_select, mock_journal, mock_move):
+
+        """Function:  test_resume_auto
+
+        Description:  Test resuming a move uses the new master in the journal.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+        mock_journal.return_value = journal
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_move.return_value = (False, None)
+        journal.steps = {"selected": {"new_mst": "Slave4"}}
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2, new_mst="auto",
+                slv_mv="Slave3"), (False, None))
+        mock_select.assert_not_called()
+        self.assertEqual(mock_newmst.call_args[1]["new_mst"], "Slave4")
+        self.assertIs(mock_move.call_args[1]["journal"], journal)
+
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.open_journal")
+    @mock.patch("mysql_rep_change.select_new_master")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_journal_auto(                  # pylint:disable=R0913,R0917
+            self, mock_newmst, mock_select, mock_journal, mock_move):
+
+        """Function:  test_journal_auto
+
+        Description:  Test the selected new master is recorded in the journal.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+        mock_journal.return_value = journal
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_move.return_value = (False, None)
+        mock_select.return_value = ("Slave2", False, None)
+
+        mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args2, new_mst="auto",
+            slv_mv="Slave3")
+
+        self.assertEqual(journal.steps, {"selected": {"new_mst": "Slave2"},
+                                         "done": {}})
+        self.assertEqual(mock_journal.call_args[1], {
+            "op": "-M", "master": "Server_Name", "new_mst": "auto",
+            "slaves": ["Slave3"], "gtid": False, "out": None})
+
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.open_journal")
+    @mock.patch("mysql_rep_change.select_new_master")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_move_not_done(                 # pylint:disable=R0913,R0917
+            self, mock_newmst, mock_select, mock_journal, mock_move):
+
+        """Function:  test_move_not_done
+
+        Description:  Test a move which fails is not recorded as done.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+        mock_journal.return_value = journal
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_move.return_value = (False, None)
+        mock_move.return_value = (True, self.err_msg3)
+
+        mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args, new_mst=self.new_mst,
+            slv_mv="Slave3")
+
+        self.assertEqual(journal.steps, {})
+        self.assertEqual(mock_journal.call_args[1]["op"], "-R")
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(True, "Error:  Not converged")))
+    @mock.patch("mysql_rep_change.auto_rollback")
+    @mock.patch("mysql_rep_change.find_slv")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_auto_rollback(self, mock_newmst, mock_find, mock_rb):
+
+        """Function:  test_auto_rollback
+
+        Description:  Test a move which does not converge is rolled back
+            with -A.
+
+        Arguments:
+
+        """
+
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_find.return_value = self.new_master
+        mock_rb.return_value = (True, "Error:  Rolled back")
+        self.args2.args_array = {"-A": True}
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2,
+                new_mst=self.new_mst), (True, "Error:  Rolled back"))
+        self.assertEqual(mock_rb.call_args[0][:3], (
+            self.master, ["SlaveMove", self.new_master],
+            "Error:  Not converged"))
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(True, "Error:  Not converged")))
+    @mock.patch("mysql_rep_change.auto_rollback")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_no_auto_rollback(self, mock_newmst, mock_rb):
+
+        """Function:  test_no_auto_rollback
+
+        Description:  Test a move which does not converge is not rolled
+            back without -A.
+
+        Arguments:
+
+        """
+
+        mock_newmst.return_value = (self.new_master, False, None)
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2,
+                new_mst=self.new_mst), (True, "Error:  Not converged"))
+        mock_rb.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.reset_slave",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.snapshot_slaves")
+    @mock.patch("mysql_rep_change.open_journal")
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.find_slv",
+                mock.Mock(return_value=SlaveRep()))
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_r_option_snapshot(self, mock_newmst, mock_journal, mock_snap):
+
+        """Function:  test_r_option_snapshot
+
+        Description:  Test the new master is added to the snapshot with -R.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"snapshot": {"slaves": {"SlaveMove": {}}}}
+        mock_journal.return_value = journal
+        mock_newmst.return_value = (self.new_master, False, None)
+        mock_snap.return_value = {"NewMaster": {}}
+
+        mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args, new_mst=self.new_mst)
+
+        self.assertEqual(journal.steps["snapshot"]["slaves"],
+                         {"SlaveMove": {}, "NewMaster": {}})
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.reset_slave",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.find_slv",
+                mock.Mock(return_value=SlaveRep()))
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_heartbeat_r_option(self, mock_newmst):
+
+        """Function:  test_heartbeat_r_option
+
+        Description:  Test the moved slaves are detached from the heartbeat
+            with -R.
+
+        Arguments:
+
+        """
+
+        mock_newmst.return_value = (self.new_master, False, None)
+        heartbeat = mock.Mock()
+
+        mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args, new_mst=self.new_mst,
+            heartbeat=heartbeat)
+
+        heartbeat.detach.assert_called_once_with(["SlaveMove"], None)
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.reset_slave",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.find_slv",
+                mock.Mock(return_value=SlaveRep()))
+    @mock.patch("mysql_rep_change.crt_slv_mst")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_heartbeat_no_r_option(self, mock_newmst):
+
+        """Function:  test_heartbeat_no_r_option
+
+        Description:  Test the moved slaves are kept on the heartbeat their new
+            master receives without -R.
+
+        Arguments:
+
+        """
+
+        mock_newmst.return_value = (self.new_master, False, None)
+        heartbeat = mock.Mock()
+
+        mysql_rep_change.move_slave(
+            self.master, self.slaves, args=self.args2, new_mst=self.new_mst,
+            heartbeat=heartbeat)
+
+        heartbeat.detach.assert_called_once_with(
+            ["SlaveMove"], self.new_master)
+
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_new_master_in_slaves(self, mock_open, mock_move):
+
+        """Function:  test_new_master_in_slaves
+
+        Description:  Test with the new master among the slaves to move.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.move_slave(
+                self.master, self.slaves, args=self.args2,
+                new_mst="Slave1", slv_mv=["Slave1", "Slave2"]),
+            (True, "Error:  New master Slave1 is also a slave to be moved."))
+        mock_open.assert_not_called()
+        mock_move.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -36,6 +36,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        arg_exist
         get_val
 
     """
@@ -53,6 +54,18 @@ class ArgParser():                                      # pylint:disable=R0903
         self.cmdline = None
         self.args_array = {}
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def get_val(self, skey, def_val=None):
 
         """Method:  get_val
@@ -100,8 +113,11 @@ class MasterRep():
         self.rep_user = "RepUser"
         self.rep_japd = None
         self.defaults_file = None
+        self.extra_def_file = None
         self.conn = True
         self.conn_msg = None
+        self.file = "mysql-bin.000002"
+        self.pos = 200
 
     def upd_mst_status(self):
 
@@ -141,6 +157,7 @@ class SlaveRep():                                       # pylint:disable=R0903
 
     Methods:
         __init__
+        upd_slv_status
         connect
 
     """
@@ -166,9 +183,22 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.rep_user = "RepUser"
         self.rep_japd = None
         self.defaults_file = None
+        self.extra_def_file = None
         self.conn = True
         self.conn_msg = None
 
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  upd_slv_status method.
+
+        Arguments:
+
+        """
+
+        return True
+
     def connect(self, silent=False):
 
         """Method:  connect
@@ -232,9 +262,16 @@ class UnitTest(unittest.TestCase):
         test_no_slave_master
         test_no_new_master
         test_slave_moved
+        test_shared_conn
+        test_gtid_slave_moved
         test_find_slave_fails
         test_sync_slave_fails
         test_fetch_slv_fails
+        test_open_slaves_fails
+        test_journal
+        test_auto_rollback
+        test_no_auto_rollback
+        test_new_master_in_slaves
 
     """
 
@@ -258,6 +295,7 @@ class UnitTest(unittest.TestCase):
         self.err_msg2 = "Error: Sync Replication2 Failed"
         self.err_msg3 = "Connection error"
         self.err_msg4 = "Detected problem in one of the connections"
+        self.err_msg5 = "Detected problem in slave connection"
         self.new_mst = "NewMaster"
 
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
@@ -267,6 +305,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_no_slave_new_master(self, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_no_slave_new_master
@@ -299,6 +339,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_no_slave_master(self, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_no_slave_master
@@ -309,6 +351,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        master = MasterRep()
+        master.conn = None
         self.slave.conn = False
         self.slave.conn_msg = self.err_msg3
 
@@ -319,7 +363,7 @@ class UnitTest(unittest.TestCase):
         with gen_libs.no_std_out():
             self.assertEqual(
                 mysql_rep_change.move_slave_up(
-                    self.master, self.slaves, args=self.args,
+                    master, self.slaves, args=self.args,
                     new_mst=self.new_mst), (True, self.err_msg4))
 
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
@@ -329,6 +373,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_no_new_master(self, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_no_new_master
@@ -352,7 +398,10 @@ class UnitTest(unittest.TestCase):
                     self.master, self.slaves, args=self.args,
                     new_mst=self.new_mst), (True, self.err_msg4))
 
-    @mock.patch("mysql_rep_change.is_slv_up", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.change_master_to",
@@ -367,6 +416,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
     @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_slave_moved(self, mock_sync, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_slave_moved
@@ -387,6 +438,94 @@ class UnitTest(unittest.TestCase):
                 self.master, self.slaves, args=self.args,
                 new_mst=self.new_mst), (False, None))
 
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_shared_conn(                    # pylint:disable=R0913,R0917
+            self, mock_sync, mock_inst, mock_cfg, mock_slv, mock_disc):
+
+        """Function:  test_shared_conn
+
+        Description:  Test the slave master uses the master connection.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = [(False, None), (False, None)]
+        self.master.conn = "MasterConn"
+        new_master = MasterRep()
+        mock_inst.return_value = new_master
+        mock_cfg.return_value = self.cfg
+        mock_slv.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.move_slave_up(
+                self.master, self.slaves, args=self.args,
+                new_mst=self.new_mst), (False, None))
+        self.assertIs(self.slave.conn, self.master.conn)
+        mock_disc.assert_called_once_with(new_master)
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.change_source_gtid")
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_gtid_slave_moved(                  # pylint:disable=R0913,R0917
+            self, mock_sync, mock_inst, mock_cfg, mock_slv, mock_gtid,
+            mock_chg):
+
+        """Function:  test_gtid_slave_moved
+
+        Description:  Test with slave moved up in GTID mode.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = [(False, None), (False, None)]
+        mock_inst.return_value = self.master
+        mock_cfg.return_value = self.cfg
+        mock_slv.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.move_slave_up(
+                self.master, self.slaves, args=self.args,
+                new_mst=self.new_mst, gtid=True), (False, None))
+        mock_gtid.assert_called_once_with(self.master, "SlaveMove")
+        mock_chg.assert_not_called()
+
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
@@ -397,6 +536,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
     @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_find_slave_fails(self, mock_sync, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_find_slave_fails
@@ -425,6 +566,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_change.gen_libs.load_module")
     @mock.patch("mysql_rep_change.mysql_class.MasterRep")
     @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_sync_slave_fails(self, mock_sync, mock_inst, mock_cfg, mock_slv):
 
         """Function:  test_sync_slave_fails
@@ -446,6 +589,8 @@ class UnitTest(unittest.TestCase):
                 new_mst=self.new_mst), (True, self.err_msg))
 
     @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
     def test_fetch_slv_fails(self, mock_fetch):
 
         """Function:  test_fetch_slv_fails
@@ -462,5 +607,162 @@ class UnitTest(unittest.TestCase):
             self.master, self.slaves, args=self.args), (True, self.err_msg))
 
 
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_open_slaves_fails(self, mock_open, mock_fetch):
+
+        """Function:  test_open_slaves_fails
+
+        Description:  Test with connecting to the slave fails.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (True, self.err_msg5)
+
+        self.assertEqual(mysql_rep_change.move_slave_up(
+            self.master, self.slaves, args=self.args), (True, self.err_msg5))
+        mock_fetch.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.mv_slv_up")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_journal(self, mock_up, mock_inst, mock_cfg, mock_slv):
+
+        """Function:  test_journal
+
+        Description:  Test the move is given its journal.
+
+        Arguments:
+
+        """
+
+        mock_up.return_value = (False, None)
+        mock_inst.return_value = self.master
+        mock_cfg.return_value = self.cfg
+        mock_slv.return_value = self.slave
+        self.args.args_array["-J"] = "move.journal"
+
+        mysql_rep_change.move_slave_up(
+            self.master, self.slaves, args=self.args, new_mst=self.new_mst,
+            slv_mv=["Slave2", "Slave1"])
+
+        journal = mock_up.call_args[1]["journal"]
+        self.assertEqual((journal.fname, journal.key), ("move.journal", {
+            "op": "-S", "master": self.master.name, "new_mst": self.new_mst,
+            "slaves": ["Slave1", "Slave2"], "gtid": False}))
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.MoveJournal.resumed",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.auto_rollback")
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.mv_slv_up")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_auto_rollback(                 # pylint:disable=R0913,R0917
+            self, mock_up, mock_inst, mock_cfg, mock_slv, mock_rb):
+
+        """Function:  test_auto_rollback
+
+        Description:  Test a move which does not converge is rolled back
+            with -A.
+
+        Arguments:
+
+        """
+
+        mock_up.return_value = (True, "Error:  Not converged")
+        mock_inst.return_value = self.master
+        mock_cfg.return_value = self.cfg
+        mock_slv.return_value = self.slave
+        mock_rb.return_value = (True, "Error:  Rolled back")
+        self.args.args_array["-A"] = True
+
+        self.assertEqual(
+            mysql_rep_change.move_slave_up(
+                self.master, self.slaves, args=self.args,
+                new_mst=self.new_mst, slv_mv=["Slave1"]),
+            (True, "Error:  Rolled back"))
+        self.assertEqual(mock_rb.call_args[0], (
+            self.master, ["SlaveMove"], "Error:  Not converged"))
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.fetch_slv",
+                mock.Mock(return_value=("SlaveMove", False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.MoveJournal.resumed",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.auto_rollback")
+    @mock.patch("mysql_rep_change.mysql_class.SlaveRep")
+    @mock.patch("mysql_rep_change.gen_libs.load_module")
+    @mock.patch("mysql_rep_change.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_change.mv_slv_up")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_no_auto_rollback(              # pylint:disable=R0913,R0917
+            self, mock_up, mock_inst, mock_cfg, mock_slv, mock_rb):
+
+        """Function:  test_no_auto_rollback
+
+        Description:  Test a move which does not converge is not rolled
+            back without -A.
+
+        Arguments:
+
+        """
+
+        mock_up.return_value = (True, "Error:  Not converged")
+        mock_inst.return_value = self.master
+        mock_cfg.return_value = self.cfg
+        mock_slv.return_value = self.slave
+
+        self.assertEqual(
+            mysql_rep_change.move_slave_up(
+                self.master, self.slaves, args=self.args,
+                new_mst=self.new_mst, slv_mv=["Slave1"]),
+            (True, "Error:  Not converged"))
+        mock_rb.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mv_slv_up")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_new_master_in_slaves(self, mock_open, mock_up):
+
+        """Function:  test_new_master_in_slaves
+
+        Description:  Test with the new master among the slaves to move.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.move_slave_up(
+                self.master, self.slaves, args=self.args,
+                new_mst="Slave1", slv_mv=["Slave1", "Slave2"]),
+            (True, "Error:  New master Slave1 is also a slave to be moved."))
+        mock_open.assert_not_called()
+        mock_up.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
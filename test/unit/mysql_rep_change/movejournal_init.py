@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  movejournal_init.py
+
+    Description:  Unit testing of movejournal_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/movejournal_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file
+        test_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.key = {"op": "-S", "master": "Master", "new_mst": "Top",
+                    "slaves": ["Slave1"], "gtid": False}
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test a journal with no file.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+
+        self.assertEqual((journal.fname, journal.key, journal.steps),
+                         (None, None, {}))
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test a journal with a file.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal("move.journal", self.key)
+
+        self.assertEqual((journal.fname, journal.key), ("move.journal",
+                                                        self.key))
+        self.assertTrue(journal.run.endswith(f"-{os.getpid()}"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+# Classification (U)
+
+"""Program:  movejournal_load.py
+
+    Description:  Unit testing of movejournal_load in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/movejournal_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write
+        test_no_file
+        test_unfinished
+        test_finished
+        test_last_run
+        test_other_move
+        test_cut_line
+        tearDown
+        test_rolled_back
+        test_ended
+        test_any_move
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.key = {"op": "-S", "master": "Master", "new_mst": "Top",
+                    "slaves": ["Slave1"], "gtid": False}
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "move.journal")
+        self.journal = mysql_rep_change.MoveJournal(self.fname, self.key)
+
+    def write(self, entries):
+
+        """Function:  write
+
+        Description:  Writes the entries to the journal file.
+
+        Arguments:
+            (input) entries -> List of (run, key, step, data)
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            for run, key, step, data in entries:
+                f_hdlr.write(json.dumps({"run": run, "key": key,
+                                         "step": step, "data": data}) + "\n")
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no journal file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.journal.load())
+        self.assertEqual(self.journal.steps, {})
+
+    def test_unfinished(self):
+
+        """Function:  test_unfinished
+
+        Description:  Test the steps of an unfinished move are loaded.
+
+        Arguments:
+
+        """
+
+        self.write([
+            ("run1", self.key, "mst_synced", {"target": ["bin.1", 4]}),
+            ("run1", self.key, "synced", {"target": ["bin.2", 8]})])
+
+        self.assertEqual(self.journal.load(), "synced")
+        self.assertEqual(self.journal.run, "run1")
+        self.assertEqual(self.journal.steps, {
+            "mst_synced": {"target": ["bin.1", 4]},
+            "synced": {"target": ["bin.2", 8]}})
+
+    def test_finished(self):
+
+        """Function:  test_finished
+
+        Description:  Test a move which finished is not loaded.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "synced", {"target": None}),
+                    ("run1", self.key, "done", {})])
+
+        self.assertIsNone(self.journal.load())
+        self.assertEqual(self.journal.steps, {})
+
+    def test_last_run(self):
+
+        """Function:  test_last_run
+
+        Description:  Test only the steps of the last move are loaded.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "synced", {"target": None}),
+                    ("run2", self.key, "started", {})])
+
+        self.journal.load()
+
+        self.assertEqual(self.journal.steps, {"started": {}})
+
+    def test_other_move(self):
+
+        """Function:  test_other_move
+
+        Description:  Test the steps of a move with other options are skipped.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "synced", {"target": None}),
+                    ("run2", {"op": "-M"}, "synced", {"target": None})])
+
+        self.assertEqual(self.journal.load(), "synced")
+        self.assertEqual(self.journal.run, "run1")
+
+    def test_cut_line(self):
+
+        """Function:  test_cut_line
+
+        Description:  Test a line which was cut short is skipped.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "synced", {"target": None})])
+
+        with open(self.fname, mode="a", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write('{"run": "run1", "key"')
+
+        self.assertEqual(self.journal.load(), "synced")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_rolled_back(self):
+
+        """Function:  test_rolled_back
+
+        Description:  Test a move which was rolled back is not loaded.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "started", {}),
+                    ("run1", self.key, "rolled_back", {})])
+
+        self.assertIsNone(self.journal.load())
+
+    def test_ended(self):
+
+        """Function:  test_ended
+
+        Description:  Test a finished move is loaded for a rollback.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "started", {}),
+                    ("run1", self.key, "done", {})])
+
+        self.assertEqual(self.journal.load(ended=["rolled_back"]), "done")
+
+    def test_any_move(self):
+
+        """Function:  test_any_move
+
+        Description:  Test the last move is loaded with no options.
+
+        Arguments:
+
+        """
+
+        self.write([("run1", self.key, "synced", {"target": None}),
+                    ("run2", {"op": "-M"}, "started", {})])
+        journal = mysql_rep_change.MoveJournal(self.fname)
+
+        self.assertEqual(journal.load(), "started")
+        self.assertEqual((journal.run, journal.key), ("run2", {"op": "-M"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
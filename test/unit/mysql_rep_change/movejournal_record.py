@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  movejournal_record.py
+
+    Description:  Unit testing of movejournal_record in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/movejournal_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file
+        test_record
+        test_append
+        tearDown
+        test_event
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.key = {"op": "-S", "master": "Master", "new_mst": "Top",
+                    "slaves": ["Slave1"], "gtid": False}
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "move.journal")
+        self.journal = mysql_rep_change.MoveJournal(self.fname, self.key)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test recording a step with no file.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.MoveJournal()
+        journal.record("synced", target=["mysql-bin.000002", 200])
+
+        self.assertEqual(journal.steps,
+                         {"synced": {"target": ["mysql-bin.000002", 200]}})
+        self.assertFalse(os.path.exists(self.fname))
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test the steps are appended to the file.
+
+        Arguments:
+
+        """
+
+        self.journal.record("synced", target=["mysql-bin.000002", 200])
+        self.journal.record("started")
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            entries = [json.loads(line) for line in f_hdlr]
+
+        self.assertEqual(
+            [(entry["run"], entry["key"], entry["step"], entry["data"])
+             for entry in entries],
+            [(self.journal.run, self.key, "synced",
+              {"target": ["mysql-bin.000002", 200]}),
+             (self.journal.run, self.key, "started", {})])
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test the file is appended to.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("old line\n")
+
+        self.journal.record("started")
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(f_hdlr.readline(), "old line\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mysql_rep_change.emit")
+    def test_event(self, mock_emit):
+
+        """Function:  test_event
+
+        Description:  Test a move_step event is written for a step.
+
+        Arguments:
+
+        """
+
+        self.journal.record("synced", target=["mysql-bin.000002", 200])
+
+        mock_emit.assert_called_once_with(
+            "move_step", step="synced", target=["mysql-bin.000002", 200])
+
+
+if __name__ == "__main__":
+    unittest.main()
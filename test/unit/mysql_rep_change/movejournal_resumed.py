@@ -0,0 +1,82 @@
+# Classification (U)
+
+"""Program:  movejournal_resumed.py
+
+    Description:  Unit testing of movejournal_resumed in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/movejournal_resumed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resumed
+        test_not_resumed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.journal = mysql_rep_change.MoveJournal()
+
+    def test_resumed(self):
+
+        """Function:  test_resumed
+
+        Description:  Test with a step which was completed.
+
+        Arguments:
+
+        """
+
+        self.journal.steps = {"synced": {"target": None}}
+
+        self.assertTrue(self.journal.resumed("synced"))
+
+    def test_not_resumed(self):
+
+        """Function:  test_not_resumed
+
+        Description:  Test with a step which was not completed.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.journal.resumed("synced"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,6 +58,8 @@ class MasterRep():                                      # pylint:disable=R0903
         self.host = "HostName"
         self.port = 3306
         self.defaults_file = None
+        self.file = "mysql-bin.000002"
+        self.pos = 200
 
     def upd_mst_status(self):
 
@@ -114,6 +116,13 @@ class UnitTest(unittest.TestCase):
         setUp
         test_sync_fails
         test_sync_slaves
+        test_gtid_sync_slaves
+        test_journal_steps
+        test_resume_started
+        test_resume_repointing
+        test_resume_synced
+        test_resume_not_synced
+        test_resume_repointing_moved
 
     """
 
@@ -132,10 +141,11 @@ class UnitTest(unittest.TestCase):
         self.slaves = [self.slave]
         self.new_master = MasterRep()
         self.slv_mv = SlaveRep()
+        self.slv_moves = [self.slv_mv]
         self.new_mst = "SlaveName"
         self.err_msg = "Error: Sync failed"
 
-    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
     @mock.patch("mysql_rep_change.mysql_libs.find_name")
     def test_sync_fails(self, mock_find, mock_sync):
 
@@ -151,14 +161,16 @@ class UnitTest(unittest.TestCase):
         mock_sync.return_value = (True, self.err_msg)
 
         self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
-            self.master, self.slaves, self.new_master, self.slv_mv,
+            self.master, self.slaves, self.new_master, self.slv_moves,
             new_mst=self.new_mst), (True, self.err_msg))
 
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.mysql_libs.change_master_to",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv",
+    @mock.patch("mysql_rep_change.sync_slaves",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_change.mysql_libs.find_name")
     def test_sync_slaves(self, mock_find):
@@ -174,9 +186,221 @@ class UnitTest(unittest.TestCase):
         mock_find.return_value = self.slave
 
         self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
-            self.master, self.slaves, self.new_master, self.slv_mv,
+            self.master, self.slaves, self.new_master, self.slv_moves,
             new_mst=self.new_mst), (False, None))
 
 
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.change_source_gtid")
+    @mock.patch("mysql_rep_change.sync_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_gtid_sync_slaves(self, mock_find, mock_gtid, mock_chg):
+
+        """Function:  test_gtid_sync_slaves
+
+        Description:  Test with syncing up slaves in GTID mode.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, gtid=True), (False, None))
+        mock_gtid.assert_called_once_with(self.new_master, self.slv_mv)
+        mock_chg.assert_not_called()
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_journal_steps(self, mock_find, mock_sync, mock_chg, mock_state):
+
+        """Function:  test_journal_steps
+
+        Description:  Test the steps are recorded in the journal.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        self.assertEqual(journal.steps, {
+            "synced": {"target": ["mysql-bin.000002", 200]},
+            "snapshot": {"slaves": {}},
+            "repointing": {"target": ["mysql-bin.000002", 200]},
+            "started": {}})
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_resume_started(self, mock_find, mock_sync, mock_chg, mock_state):
+
+        """Function:  test_resume_started
+
+        Description:  Test resuming a move whose slaves were started.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"started": {}}
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        mock_state.assert_not_called()
+
+    @mock.patch("mysql_rep_change.stopped_at",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_resume_repointing(             # pylint:disable=R0913,R0917
+            self, mock_find, mock_sync, mock_chg, mock_state):
+
+        """Function:  test_resume_repointing
+
+        Description:  Test resuming a move which was repointing the slaves.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"synced": {"target": ["mysql-bin.000001", 100]},
+                         "repointing": {"target": ["mysql-bin.000009", 9]}}
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        self.assertEqual((self.new_master.file, self.new_master.pos),
+                         ("mysql-bin.000009", 9))
+        mock_chg.assert_called_once_with(self.new_master, self.slv_mv)
+        self.assertIn("started", journal.steps)
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_resume_synced(                 # pylint:disable=R0913,R0917
+            self, mock_find, mock_sync, mock_chg, mock_state, mock_stopped):
+
+        """Function:  test_resume_synced
+
+        Description:  Test resuming a move with the servers still synced.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        mock_stopped.return_value = True
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"synced": {"target": ["mysql-bin.000001", 100]}}
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        mock_stopped.assert_called_once_with(
+            [self.slave] + self.slv_moves, ["mysql-bin.000001", 100])
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_resume_not_synced(             # pylint:disable=R0913,R0917
+            self, mock_find, mock_sync, mock_chg, mock_state, mock_stopped):
+
+        """Function:  test_resume_not_synced
+
+        Description:  Test resuming a move with servers no longer synced.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        mock_stopped.return_value = False
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"synced": {"target": ["mysql-bin.000001", 100]}}
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        mock_sync.assert_called_once()
+
+    @mock.patch("mysql_rep_change.snapshot_slaves")
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    @mock.patch("mysql_rep_change.mysql_libs.find_name")
+    def test_resume_repointing_moved(       # pylint:disable=R0913,R0917
+            self, mock_find, mock_sync, mock_chg, mock_state, mock_stopped,
+            mock_snap):
+
+        """Function:  test_resume_repointing_moved
+
+        Description:  Test resuming a move which was repointing the slaves
+            with the servers no longer synced.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave
+        mock_sync.return_value = (False, None)
+        mock_stopped.return_value = False
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"synced": {"target": ["mysql-bin.000001", 100]},
+                         "snapshot": {"slaves": {"Slave1": {}}},
+                         "repointing": {"target": ["mysql-bin.000009", 9]}}
+
+        self.assertEqual(mysql_rep_change.mv_slv_to_new_mst(
+            self.master, self.slaves, self.new_master, self.slv_moves,
+            new_mst=self.new_mst, journal=journal), (False, None))
+        mock_stopped.assert_called_once_with(
+            [self.slave] + self.slv_moves, ["mysql-bin.000001", 100])
+        mock_sync.assert_called_once()
+        mock_snap.assert_not_called()
+        self.assertEqual(journal.steps["repointing"],
+                         {"target": ["mysql-bin.000002", 200]})
+        mock_chg.assert_called_once_with(self.new_master, self.slv_mv)
+
+
 if __name__ == "__main__":
     unittest.main()
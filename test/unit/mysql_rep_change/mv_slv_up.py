@@ -0,0 +1,420 @@
+# Classification (U)
+
+"""Program:  mv_slv_up.py
+
+    Description:  Unit testing of mv_slv_up in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/mv_slv_up.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_move_up
+        test_not_converged
+        test_master_sync_fails
+        test_slave_sync_fails
+        test_journal_steps
+        test_gtid_journal
+        test_resume_started
+        test_resume_repointing
+        test_resume_synced
+        test_resume_mst_synced
+        test_heartbeat_detach
+        test_resume_repointing_moved
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = mock.Mock(file="mysql-bin.000003", pos=300)
+        self.new_master = mock.Mock(file="mysql-bin.000002", pos=200)
+        self.slv_master = "SlaveMasterSlave"
+        self.slv_moves = ["Slave1", "Slave2"]
+        self.err_msg = "Error:  Sync failed"
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_move_up(self, mock_sync, mock_repoint, mock_state, mock_up):
+
+        """Function:  test_move_up
+
+        Description:  Test with the slaves moved up.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves), (False, None))
+        mock_repoint.assert_called_once_with(self.new_master, self.slv_moves)
+        mock_state.assert_called_once_with(
+            self.slv_moves + [self.slv_master], "start")
+        mock_up.assert_called_once_with(self.slv_moves + [self.slv_master])
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.repoint_slaves",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_not_converged(self, mock_sync, mock_up):
+
+        """Function:  test_not_converged
+
+        Description:  Test with a slave which does not converge.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (True, self.err_msg)
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves), (True, self.err_msg))
+
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_master_sync_fails(self, mock_sync, mock_repoint):
+
+        """Function:  test_master_sync_fails
+
+        Description:  Test with the slave/master sync failing.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (True, self.err_msg)
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves), (True, self.err_msg))
+        self.assertEqual(mock_sync.call_count, 1)
+        mock_repoint.assert_not_called()
+
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_slave_sync_fails(self, mock_sync, mock_repoint):
+
+        """Function:  test_slave_sync_fails
+
+        Description:  Test with the slaves sync failing.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = [(False, None), (True, self.err_msg)]
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves), (True, self.err_msg))
+        mock_repoint.assert_not_called()
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_journal_steps(self, mock_sync, mock_repoint, mock_state, mock_up):
+
+        """Function:  test_journal_steps
+
+        Description:  Test the steps are recorded in the journal.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        self.assertEqual(journal.steps, {
+            "mst_synced": {"target": ["mysql-bin.000002", 200]},
+            "synced": {"target": ["mysql-bin.000003", 300]},
+            "snapshot": {"slaves": {}},
+            "repointing": {"target": ["mysql-bin.000002", 200]},
+            "started": {}, "done": {}})
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_gtid_journal(self, mock_sync, mock_repoint, mock_state, mock_up):
+
+        """Function:  test_gtid_journal
+
+        Description:  Test no positions are recorded in GTID mode.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+
+        mysql_rep_change.mv_slv_up(
+            self.master, self.new_master, self.slv_master, self.slv_moves,
+            journal=journal, gtid=True)
+
+        self.assertEqual(journal.steps["repointing"], {"target": None})
+
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_resume_started(                # pylint:disable=R0913,R0917
+            self, mock_sync, mock_repoint, mock_state, mock_up):
+
+        """Function:  test_resume_started
+
+        Description:  Test resuming a move whose slaves were started.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"repointing": {"target": ["mysql-bin.000009", 9]},
+                         "started": {}}
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        mock_repoint.assert_not_called()
+        mock_up.assert_called_once_with(
+            self.slv_moves + [self.slv_master], journal=journal)
+
+    @mock.patch("mysql_rep_change.stopped_at",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_resume_repointing(             # pylint:disable=R0913,R0917
+            self, mock_sync, mock_repoint, mock_state, mock_up):
+
+        """Function:  test_resume_repointing
+
+        Description:  Test resuming a move which was repointing the slaves.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"mst_synced": {"target": ["mysql-bin.000002", 200]},
+                         "synced": {"target": ["mysql-bin.000003", 300]},
+                         "repointing": {"target": ["mysql-bin.000009", 9]}}
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        self.assertEqual((self.new_master.file, self.new_master.pos),
+                         ("mysql-bin.000009", 9))
+        mock_repoint.assert_called_once()
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_resume_synced(                 # pylint:disable=R0913,R0917
+            self, mock_sync, mock_repoint, mock_state, mock_up, mock_stopped):
+
+        """Function:  test_resume_synced
+
+        Description:  Test resuming a move with the servers still synced.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        mock_stopped.return_value = True
+        journal.steps = {"mst_synced": {"target": ["mysql-bin.000009", 9]},
+                         "synced": {"target": ["mysql-bin.000003", 300]}}
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        mock_sync.assert_not_called()
+        self.assertEqual(journal.steps["repointing"],
+                         {"target": ["mysql-bin.000009", 9]})
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_resume_mst_synced(             # pylint:disable=R0913,R0917
+            self, mock_sync, mock_repoint, mock_state, mock_up, mock_stopped):
+
+        """Function:  test_resume_mst_synced
+
+        Description:  Test resuming with only the slave/master still synced.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        journal = mysql_rep_change.MoveJournal()
+        mock_stopped.side_effect = [True, False]
+        journal.steps = {"mst_synced": {"target": ["mysql-bin.000009", 9]},
+                         "synced": {"target": ["mysql-bin.000003", 300]}}
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        mock_sync.assert_called_once_with(
+            self.master, self.slv_moves, journal=journal)
+
+    @mock.patch("mysql_rep_change.snapshot_slaves",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.repoint_slaves",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_heartbeat_detach(self, mock_sync, mock_up):
+
+        """Function:  test_heartbeat_detach
+
+        Description:  Test the moved slaves are detached from a heartbeat their
+            new master does not receive.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        heartbeat = mock.Mock()
+
+        mysql_rep_change.mv_slv_up(
+            self.master, self.new_master, self.slv_master, self.slv_moves,
+            heartbeat=heartbeat)
+
+        heartbeat.detach.assert_called_once_with(
+            self.slv_moves, self.new_master)
+
+    @mock.patch("mysql_rep_change.snapshot_slaves")
+    @mock.patch("mysql_rep_change.stopped_at")
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.repoint_slaves")
+    @mock.patch("mysql_rep_change.sync_slv")
+    def test_resume_repointing_moved(       # pylint:disable=R0913,R0917
+            self, mock_sync, mock_repoint, mock_up, mock_stopped, mock_snap):
+
+        """Function:  test_resume_repointing_moved
+
+        Description:  Test resuming a move which was repointing the slaves
+            with the slaves no longer synced.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+        mock_up.return_value = (False, None)
+        mock_stopped.side_effect = [True, False]
+        journal = mysql_rep_change.MoveJournal()
+        journal.steps = {"mst_synced": {"target": ["mysql-bin.000009", 9]},
+                         "synced": {"target": ["mysql-bin.000003", 300]},
+                         "snapshot": {"slaves": {"Slave1": {}}},
+                         "repointing": {"target": ["mysql-bin.000009", 9]}}
+
+        self.assertEqual(
+            mysql_rep_change.mv_slv_up(
+                self.master, self.new_master, self.slv_master,
+                self.slv_moves, journal=journal), (False, None))
+        mock_stopped.assert_called_with(
+            self.slv_moves, ["mysql-bin.000003", 300])
+        mock_sync.assert_called_once_with(
+            self.master, self.slv_moves, journal=journal)
+        mock_snap.assert_not_called()
+        mock_repoint.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
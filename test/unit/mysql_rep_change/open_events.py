@@ -0,0 +1,199 @@
+# Classification (U)
+
+"""Program:  open_events.py
+
+    Description:  Unit testing of open_events in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/open_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_option
+        test_stdout
+        test_file
+        test_file_descriptor
+        test_bad_file_descriptor
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "events.ndjson")
+
+    def test_no_option(self):
+
+        """Function:  test_no_option
+
+        Description:  Test without the -e option.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.open_events(self.args)
+
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+
+    def test_stdout(self):
+
+        """Function:  test_stdout
+
+        Description:  Test with standard out.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-e": "-"}
+
+        mysql_rep_change.open_events(self.args)
+
+        self.assertIs(mysql_rep_change.EVENTS["sink"], sys.stdout)
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with a file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-e": self.fname}
+
+        mysql_rep_change.open_events(self.args)
+
+        self.assertEqual(mysql_rep_change.EVENTS["sink"].name, self.fname)
+
+    def test_file_descriptor(self):
+
+        """Function:  test_file_descriptor
+
+        Description:  Test with a file descriptor.
+
+        Arguments:
+
+        """
+
+        f_desc = os.open(self.fname, os.O_WRONLY | os.O_CREAT)
+        self.args.args_array = {"-e": str(f_desc)}
+
+        mysql_rep_change.open_events(self.args)
+        mysql_rep_change.close_events()
+
+        os.write(f_desc, b"open")
+        os.close(f_desc)
+
+    @mock.patch("builtins.print")
+    def test_bad_file_descriptor(self, mock_print):
+
+        """Function:  test_bad_file_descriptor
+
+        Description:  Test with a file descriptor which is not open.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-e": "987"}
+
+        mysql_rep_change.open_events(self.args)
+
+        self.assertIsNone(mysql_rep_change.EVENTS["sink"])
+        self.assertTrue(mock_print.call_args[0][0].startswith(
+            "Warning:  Running without the event stream."))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.close_events()
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  open_journal.py
+
+    Description:  Unit testing of open_journal in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/open_journal.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_journal
+        test_journal
+        test_resume
+        test_nothing_to_resume
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_journal(self):
+
+        """Function:  test_no_journal
+
+        Description:  Test without the -J option.
+
+        Arguments:
+
+        """
+
+        journal = mysql_rep_change.open_journal(self.args, op="-M")
+
+        self.assertIsNone(journal.fname)
+
+    @mock.patch("mysql_rep_change.MoveJournal.load")
+    def test_journal(self, mock_load):
+
+        """Function:  test_journal
+
+        Description:  Test with the -J option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-J": "move.journal"}
+
+        journal = mysql_rep_change.open_journal(self.args, op="-M")
+
+        self.assertEqual((journal.fname, journal.key),
+                         ("move.journal", {"op": "-M"}))
+        mock_load.assert_not_called()
+
+    @mock.patch("builtins.print")
+    @mock.patch("mysql_rep_change.MoveJournal.load")
+    def test_resume(self, mock_load, mock_print):
+
+        """Function:  test_resume
+
+        Description:  Test resuming a move.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-J": "move.journal", "-r": True}
+        mock_load.return_value = "synced"
+
+        mysql_rep_change.open_journal(self.args, op="-M")
+
+        mock_print.assert_called_once_with(
+            "Resuming the move after step synced.", file=None)
+
+    @mock.patch("builtins.print")
+    @mock.patch("mysql_rep_change.MoveJournal.load")
+    def test_nothing_to_resume(self, mock_load, mock_print):
+
+        """Function:  test_nothing_to_resume
+
+        Description:  Test with no unfinished move to resume.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-J": "move.journal", "-r": True}
+        mock_load.return_value = None
+
+        mysql_rep_change.open_journal(self.args, op="-M")
+
+        mock_print.assert_called_once_with(
+            "No unfinished move found in the journal.", file=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  open_slaves.py
+
+    Description:  Unit testing of open_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/open_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.conn = None
+        self.conn_msg = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_optional_slave_down
+        test_slave_down
+        test_already_connected
+        test_open_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep("Slave1")
+        self.slave2 = SlaveRep("Slave2")
+        self.slave3 = SlaveRep("Slave3")
+        self.slaves = [self.slave, self.slave2, self.slave3]
+        self.err_msg = "Detected problem in slave connection"
+
+    def set_down(self, servers, **kwargs):
+
+        """Function:  set_down
+
+        Description:  Marks the servers passed as failing to connect.
+
+        Arguments:
+
+        """
+
+        for svr in servers:
+            svr.conn_msg = "Connection Error"
+
+        return kwargs
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_optional_slave_down(self, mock_conn):
+
+        """Function:  test_optional_slave_down
+
+        Description:  Test with an optional slave failing to connect.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = self.set_down
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.open_slaves(
+                    self.slaves, ["Slave2"], optional=True), (False, None))
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_slave_down(self, mock_conn):
+
+        """Function:  test_slave_down
+
+        Description:  Test with a required slave failing to connect.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = self.set_down
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.open_slaves(self.slaves, ["Slave2"]),
+                (True, self.err_msg))
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_already_connected(self, mock_conn):
+
+        """Function:  test_already_connected
+
+        Description:  Test with a slave which is already connected.
+
+        Arguments:
+
+        """
+
+        self.slave.conn = True
+
+        mysql_rep_change.open_slaves(self.slaves, ["Slave1", "Slave2"])
+
+        mock_conn.assert_called_once_with([self.slave2])
+
+    @mock.patch("mysql_rep_change.get_conn_opts",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_open_slaves(self, mock_conn):
+
+        """Function:  test_open_slaves
+
+        Description:  Test only the named slaves are connected.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.open_slaves(
+                self.slaves, ["Slave1", "Slave3", "Slave9"]), (False, None))
+        mock_conn.assert_called_once_with([self.slave, self.slave3])
+
+
+if __name__ == "__main__":
+    unittest.main()
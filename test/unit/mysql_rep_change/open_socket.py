@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  open_socket.py
+
+    Description:  Unit testing of open_socket in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/open_socket.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bad_directory
+        test_daemon_listening
+        test_stale_socket
+        test_open_socket
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "daemon.sock")
+
+    def test_bad_directory(self):
+
+        """Function:  test_bad_directory
+
+        Description:  Test with a directory which does not exist.
+
+        Arguments:
+
+        """
+
+        path = os.path.join(self.tmp_dir, "no_dir", "daemon.sock")
+
+        server, err_msg = mysql_rep_change.open_socket(path)
+
+        self.assertIsNone(server)
+        self.assertTrue(err_msg.startswith("Error:  Unable to listen on"))
+
+    def test_daemon_listening(self):
+
+        """Function:  test_daemon_listening
+
+        Description:  Test with a daemon listening on the socket.
+
+        Arguments:
+
+        """
+
+        server, _ = mysql_rep_change.open_socket(self.path)
+
+        try:
+            self.assertEqual(
+                mysql_rep_change.open_socket(self.path),
+                (None, f"Error:  A daemon is listening on {self.path}"))
+
+        finally:
+            server.server_close()
+
+    def test_stale_socket(self):
+
+        """Function:  test_stale_socket
+
+        Description:  Test a socket left by a stopped daemon is replaced.
+
+        Arguments:
+
+        """
+
+        server, _ = mysql_rep_change.open_socket(self.path)
+        server.server_close()
+
+        server, err_msg = mysql_rep_change.open_socket(self.path)
+        server.server_close()
+
+        self.assertIsNone(err_msg)
+
+    def test_open_socket(self):
+
+        """Function:  test_open_socket
+
+        Description:  Test creating the socket server.
+
+        Arguments:
+
+        """
+
+        server, err_msg = mysql_rep_change.open_socket(self.path)
+        server.server_close()
+
+        self.assertIsNone(err_msg)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        self.assertTrue(server.work.empty())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+# Classification (U)
+
+"""Program:  parse_request.py
+
+    Description:  Unit testing of parse_request in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/parse_request.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_parse2
+        get_args_keys
+        get_val
+        arg_xor_dict
+        arg_cond_req
+        arg_cond_req_or
+
+    """
+
+    def __init__(self, cmdline=None, opt_val=None, multi_val=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = cmdline
+        self.opt_val = opt_val or []
+        self.multi_val = multi_val or []
+        self.args_array = {}
+        self.parse_status = True
+        self.chk_status = True
+
+    def arg_parse2(self):
+
+        """Method:  arg_parse2
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_parse2.
+
+        Arguments:
+
+        """
+
+        opt = None
+
+        for item in self.cmdline[1:]:
+            if item.startswith("-"):
+                opt = item
+                self.args_array[opt] = [] if opt in self.multi_val else True
+
+            elif opt in self.multi_val:
+                self.args_array[opt].append(item)
+
+            elif opt in self.opt_val:
+                self.args_array[opt] = item
+
+        return self.parse_status
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_xor_dict(self, opt_xor_val):
+
+        """Method:  arg_xor_dict
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_xor_dict.
+
+        Arguments:
+
+        """
+
+        return bool(opt_xor_val) and self.chk_status
+
+    def arg_cond_req(self, opt_con_req):
+
+        """Method:  arg_cond_req
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_cond_req.
+
+        Arguments:
+
+        """
+
+        return bool(opt_con_req) and self.chk_status
+
+    def arg_cond_req_or(self, opt_con_or):
+
+        """Method:  arg_cond_req_or
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_cond_req_or.
+
+        Arguments:
+
+        """
+
+        return bool(opt_con_or) and self.chk_status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bad_option
+        test_parse_fails
+        test_no_operation
+        test_invalid_options
+        test_daemon_options
+        test_parse_request
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.argv = ["-M", "-m", "Slave1", "-n", "Slave2", "Slave3"]
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "master", "-d": "config", "-L": "sock"}
+        self.req_args = ArgParser(
+            ["mysql_rep_change.py"] + self.argv, opt_val=["-m", "-n"],
+            multi_val=["-n"])
+        self.req_chk = {
+            "func_dict": {"-M": None, "-S": None, "-L": None},
+            "req_opts": ["-M", "-S", "-m", "-n"], "opt_val": ["-m", "-n"],
+            "multi_val": ["-n"], "opt_xor_val": {"-M": ["-S"]},
+            "opt_con_req": {"-M": ["-m"]}, "opt_con_or": {"-M": ["-n"]},
+            "opt_num": []}
+
+    def test_bad_option(self):
+
+        """Function:  test_bad_option
+
+        Description:  Test with an option not allowed in a request.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.parse_request(
+                ["-M", "-c", "other"], self.args, **self.req_chk),
+            (None, "Error:  Options not allowed in a request: ['-c']"))
+
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_parse_fails(self, mock_arg):
+
+        """Function:  test_parse_fails
+
+        Description:  Test with options which fail to parse.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.req_args
+        self.req_args.parse_status = False
+
+        self.assertEqual(
+            mysql_rep_change.parse_request(self.argv, self.args,
+                                           **self.req_chk),
+            (None, "Error:  Unable to parse the request options."))
+
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_no_operation(self, mock_arg):
+
+        """Function:  test_no_operation
+
+        Description:  Test with no operation in the request.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = ArgParser(
+            ["mysql_rep_change.py", "-m", "Slave1"], opt_val=["-m"])
+
+        self.assertEqual(
+            mysql_rep_change.parse_request(["-m", "Slave1"], self.args,
+                                           **self.req_chk),
+            (None, "Error:  Request requires one operation option."))
+
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_invalid_options(self, mock_arg):
+
+        """Function:  test_invalid_options
+
+        Description:  Test with options which fail the checks.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.req_args
+        self.req_args.chk_status = False
+
+        self.assertEqual(
+            mysql_rep_change.parse_request(self.argv, self.args,
+                                           **self.req_chk),
+            (None, "Error:  Invalid request options."))
+
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_daemon_options(self, mock_arg):
+
+        """Function:  test_daemon_options
+
+        Description:  Test the daemon options are added to the request.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.req_args
+
+        req_args, err_msg = mysql_rep_change.parse_request(
+            self.argv, self.args, **self.req_chk)
+
+        self.assertIsNone(err_msg)
+        self.assertEqual(req_args.args_array, {
+            "-M": True, "-m": "Slave1", "-n": ["Slave2", "Slave3"],
+            "-c": "master", "-d": "config"})
+
+    @mock.patch("mysql_rep_change.gen_class.ArgParser")
+    def test_parse_request(self, mock_arg):
+
+        """Function:  test_parse_request
+
+        Description:  Test parsing a request.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.req_args
+
+        req_args, err_msg = mysql_rep_change.parse_request(
+            self.argv, self.args, **self.req_chk)
+
+        self.assertEqual((req_args, err_msg), (self.req_args, None))
+        mock_arg.assert_called_once_with(
+            [mysql_rep_change.sys.argv[0]] + self.argv,
+            opt_val=self.req_chk["opt_val"],
+            multi_val=self.req_chk["multi_val"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  plan_topology.py
+
+    Description:  Unit testing of plan_topology in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/plan_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_changes
+        test_sibling_move
+        test_move_up
+        test_move_up_and_down
+        test_parent_first
+        test_detach
+        test_unknown_server
+        test_replication_loop
+        test_no_move
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.current = {
+            "Master": None, "Slave1": "Master", "Slave2": "Master",
+            "Slave3": "Slave1", "Slave4": "Slave3", "Slave5": None}
+
+    def test_no_changes(self):
+
+        """Function:  test_no_changes
+
+        Description:  Test with the target matching the current tree.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave1": "Master"}),
+            ([], False, None))
+
+    def test_sibling_move(self):
+
+        """Function:  test_sibling_move
+
+        Description:  Test with a move under a sibling.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave2": "Slave1"}),
+            ([("move", "Slave2", "Master", "Slave1")], False, None))
+
+    def test_move_up(self):
+
+        """Function:  test_move_up
+
+        Description:  Test with a move under the master's master.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave4": "Master"}),
+            ([("up", "Slave4", "Slave3", "Slave1"),
+              ("up", "Slave4", "Slave1", "Master")], False, None))
+
+    def test_move_up_and_down(self):
+
+        """Function:  test_move_up_and_down
+
+        Description:  Test with a move into another subtree.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave3": "Slave2"}),
+            ([("up", "Slave3", "Slave1", "Master"),
+              ("move", "Slave3", "Master", "Slave2")], False, None))
+
+    def test_parent_first(self):
+
+        """Function:  test_parent_first
+
+        Description:  Test that a new master is moved before its slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(
+                self.current, {"Slave1": "Slave2", "Slave2": "Master"}),
+            ([("move", "Slave1", "Master", "Slave2")], False, None))
+
+    def test_detach(self):
+
+        """Function:  test_detach
+
+        Description:  Test with the replication of a slave removed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave2": None}),
+            ([("detach", "Slave2", "Master", None)], False, None))
+
+    def test_unknown_server(self):
+
+        """Function:  test_unknown_server
+
+        Description:  Test with a server not in the current tree.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave9": "Master"}),
+            ([], True, "Error:  Unknown server in topology:  Slave9"))
+
+    def test_replication_loop(self):
+
+        """Function:  test_replication_loop
+
+        Description:  Test with a target tree which has a loop.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_change.plan_topology(
+                self.current, {"Slave1": "Slave4"})[1])
+
+    def test_no_move(self):
+
+        """Function:  test_no_move
+
+        Description:  Test with a server which no move can attach.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.plan_topology(self.current, {"Slave5": "Master"}),
+            ([], True, "Error:  No move will place Slave5 under Master"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+# Classification (U)
+
+"""Program:  probe_candidate.py
+
+    Description:  Unit testing of probe_candidate in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/probe_candidate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.cmds = []
+        self.status = [{
+            "Source_Host": "master", "Source_Port": "3306",
+            "Source_Server_Id": "10", "Source_UUID": "master-uuid",
+            "Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes",
+            "Seconds_Behind_Source": 2, "Source_Log_File": "binlog.000010",
+            "Relay_Source_Log_File": "binlog.000010",
+            "Read_Source_Log_Pos": 5000, "Exec_Source_Log_Pos": 4000,
+            "Retrieved_Gtid_Set": "uuid:1-9", "Executed_Gtid_Set": "uuid:1-8"}]
+        self.variables = {"read_only": "OFF", "log_bin": "ON",
+                          "log_replica_updates": "ON"}
+        self.missing = "uuid:5-7"
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("SHOW REPLICA"):
+            return self.status
+
+        if cmd.startswith("SHOW GLOBAL VARIABLES"):
+            return [{"Variable_name": key, "Value": val}
+                    for key, val in self.variables.items()]
+
+        if cmd.startswith("SHOW GLOBAL STATUS"):
+            return [{"Variable_name": "Threads_running", "Value": "4"}]
+
+        return [{"missing": self.missing}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_slave
+        test_other_log_file
+        test_log_slave_updates
+        test_gtid
+        test_heartbeat
+        test_heartbeat_unknown
+        test_probe_candidate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = Server()
+
+    def test_not_slave(self):
+
+        """Function:  test_not_slave
+
+        Description:  Test with a server which is not a slave.
+
+        Arguments:
+
+        """
+
+        self.slave.status = []
+
+        info = mysql_rep_change.probe_candidate(self.slave)
+
+        self.assertEqual(
+            (info["source"], info["running"], info["lag"], info["backlog"]),
+            ((None, 0), False, None, 0))
+        self.assertEqual((info["retrieved"], info["executed"]), ("", ""))
+
+    def test_other_log_file(self):
+
+        """Function:  test_other_log_file
+
+        Description:  Test with the relay log on an older master log file.
+
+        Arguments:
+
+        """
+
+        self.slave.status[0]["Relay_Source_Log_File"] = "binlog.000009"
+
+        self.assertEqual(
+            mysql_rep_change.probe_candidate(self.slave)["backlog"], 0)
+
+    def test_log_slave_updates(self):
+
+        """Function:  test_log_slave_updates
+
+        Description:  Test with a server using the log_slave_updates name.
+
+        Arguments:
+
+        """
+
+        self.slave.variables = {"read_only": "ON", "log_bin": "ON",
+                                "log_slave_updates": "ON"}
+
+        info = mysql_rep_change.probe_candidate(self.slave)
+
+        self.assertEqual((info["read_only"], info["log_replica_updates"]),
+                         (True, True))
+
+    def test_gtid(self):
+
+        """Function:  test_gtid
+
+        Description:  Test counting the missing transactions.
+
+        Arguments:
+
+        """
+
+        info = mysql_rep_change.probe_candidate(self.slave, "uuid:1-7")
+
+        self.assertEqual(info["missing"], 3)
+        self.assertEqual(self.slave.cmds[-1][1], ("uuid:1-7",))
+
+    def test_heartbeat(self):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the lag is taken from the heartbeat.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        heartbeat.lag.return_value = 250.0
+
+        self.assertEqual(mysql_rep_change.probe_candidate(
+            self.slave, heartbeat=heartbeat)["lag"], 0.25)
+
+    def test_heartbeat_unknown(self):
+
+        """Function:  test_heartbeat_unknown
+
+        Description:  Test with a slave which has not applied a heartbeat.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        heartbeat.lag.return_value = None
+
+        self.assertEqual(mysql_rep_change.probe_candidate(
+            self.slave, heartbeat=heartbeat)["lag"], 2)
+
+    def test_probe_candidate(self):
+
+        """Function:  test_probe_candidate
+
+        Description:  Test the candidate details.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.probe_candidate(self.slave), {
+            "name": "Slave1", "source": ("master", 3306),
+            "source_id": 10, "source_uuid": "master-uuid", "running": True,
+            "lag": 2, "backlog": 1000, "retrieved": "uuid:1-9",
+            "executed": "uuid:1-8", "read_only": False, "log_bin": True,
+            "log_replica_updates": True, "load": 4, "missing": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  probe_server.py
+
+    Description:  Unit testing of probe_server in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/probe_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = None
+        self.conn_msg = None
+        self.status = []
+        self.replicas = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return self.status if cmd == "SHOW REPLICA STATUS" else self.replicas
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replica
+        test_no_replica_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server("Slave1")
+        self.server.status = [{"Seconds_Behind_Source": 0}]
+        self.server.replicas = [
+            {"Host": "host2", "Port": 3306, "Server_Id": 11}]
+        self.server2 = Server("Master")
+
+    def test_replica(self):
+
+        """Function:  test_replica
+
+        Description:  Test with a server which is a replica.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.probe_server(self.server),
+            ({"Seconds_Behind_Source": 0},
+             [{"Host": "host2", "Port": 3306, "Server_Id": 11}]))
+
+    def test_no_replica_status(self):
+
+        """Function:  test_no_replica_status
+
+        Description:  Test with a server which is not a replica.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.probe_server(self.server2), ({}, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  rank_candidates.py
+
+    Description:  Unit testing of rank_candidates in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/rank_candidates.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rejected
+        test_rejected_last
+        test_source_host
+        test_no_lag
+        test_rank_candidates
+        info
+        test_sub_second_lag
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mst_uuid = "master-uuid"
+
+    def test_rejected(self):
+
+        """Function:  test_rejected
+
+        Description:  Test the reasons a candidate is rejected.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", source_uuid="other-uuid", running=False,
+                      read_only=True, log_bin=False,
+                      log_replica_updates=False)], self.mst_uuid)
+
+        self.assertEqual(ranking[0]["rejected"], [
+            "not a slave of the master", "replication not running",
+            "read-only", "binary logging off", "log_replica_updates off"])
+
+    def test_rejected_last(self):
+
+        """Function:  test_rejected_last
+
+        Description:  Test rejected candidates are ranked last.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", read_only=True), self.info("Slave2", lag=60)],
+            self.mst_uuid)
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave2", "Slave1"])
+
+    def test_source_host(self):
+
+        """Function:  test_source_host
+
+        Description:  Test a candidate is matched to the master by its
+            server UUID and not by the host name of its master.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", source=("10.0.0.5", 3306)),
+            self.info("Slave2", source_uuid="other-uuid")], self.mst_uuid)
+
+        self.assertEqual(
+            [(info["name"], info["rejected"]) for info in ranking],
+            [("Slave1", []), ("Slave2", ["not a slave of the master"])])
+
+    def test_no_lag(self):
+
+        """Function:  test_no_lag
+
+        Description:  Test a candidate with an unknown lag is ranked after
+            the others.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", lag=None), self.info("Slave2", lag=60)],
+            self.mst_uuid)
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave2", "Slave1"])
+
+    def test_rank_candidates(self):
+
+        """Function:  test_rank_candidates
+
+        Description:  Test ranking by missing transactions, lag, backlog
+            and load.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", load=5), self.info("Slave2", missing=3),
+            self.info("Slave3", lag=1), self.info("Slave4", backlog=100),
+            self.info("Slave5")], self.mst_uuid)
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave5", "Slave1", "Slave4", "Slave3", "Slave2"])
+
+    def info(self, name, **kwargs):
+
+        """Function:  info
+
+        Description:  Returns the details of a candidate.
+
+        Arguments:
+            (input) name -> Name of the candidate
+            (input) **kwargs -> Details to change
+            (output) Dictionary of the candidate details
+
+        """
+
+        info = {
+            "name": name, "source": ("master", 3306),
+            "source_uuid": "master-uuid", "running": True,
+            "lag": 0, "backlog": 0, "read_only": False, "log_bin": True,
+            "log_replica_updates": True, "load": 1, "missing": None}
+        info.update(kwargs)
+
+        return info
+
+    def test_sub_second_lag(self):
+
+        """Function:  test_sub_second_lag
+
+        Description:  Test a sub-second heartbeat lag is ranked before the
+            backlog.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_candidates([
+            self.info("Slave1", lag=0.9, backlog=5),
+            self.info("Slave2", lag=0.01, backlog=6)], self.mst_uuid)
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave2", "Slave1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  rank_failover.py
+
+    Description:  Unit testing of rank_failover in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/rank_failover.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single_slave
+        test_rejected
+        test_rank_failover
+        info
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slaves = []
+
+    def test_single_slave(self):
+
+        """Function:  test_single_slave
+
+        Description:  Test a single slave without binary logging.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_failover([
+            self.info("Slave1", log_bin=False, log_replica_updates=False)])
+
+        self.assertEqual(ranking[0]["rejected"], [])
+
+    def test_rejected(self):
+
+        """Function:  test_rejected
+
+        Description:  Test the reasons a slave is rejected.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_failover([
+            self.info("Slave1", executed="uuid:1-20", log_bin=False,
+                      log_replica_updates=False), self.info("Slave2")])
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave2", "Slave1"])
+        self.assertEqual(ranking[1]["rejected"], [
+            "binary logging off", "log_replica_updates off"])
+
+    def test_rank_failover(self):
+
+        """Function:  test_rank_failover
+
+        Description:  Test ranking by executed transactions and load.
+
+        Arguments:
+
+        """
+
+        ranking = mysql_rep_change.rank_failover([
+            self.info("Slave1", load=5), self.info("Slave2", executed=""),
+            self.info("Slave3", executed="uuid:1-12"), self.info("Slave4")])
+
+        self.assertEqual([info["name"] for info in ranking],
+                         ["Slave3", "Slave4", "Slave1", "Slave2"])
+
+    def info(self, name, **kwargs):
+
+        """Function:  info
+
+        Description:  Returns the details of a slave.
+
+        Arguments:
+            (input) name -> Name of the slave
+            (input) **kwargs -> Details to change
+            (output) Dictionary of the slave details
+
+        """
+
+        return dict({
+            "name": name, "executed": "uuid:1-10", "log_bin": True,
+            "log_replica_updates": True, "load": 1}, **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  read_topology.py
+
+    Description:  Unit testing of read_topology in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/read_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_topology
+        test_file_in_dir
+        test_invalid_line
+        test_duplicate_slave
+        test_missing_file
+        test_not_text
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "topology.txt"
+        self.path = "config"
+        self.data = "# Target\n\nSlave1 Master\nSlave2  Slave1\nSlave3 none\n"
+        self.data2 = "Slave1 Master Slave2\n"
+        self.data3 = "Slave1 Master\nSlave1 Slave2\n"
+        self.target = {"Slave1": "Master", "Slave2": "Slave1", "Slave3": None}
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_read_topology(self):
+
+        """Function:  test_read_topology
+
+        Description:  Test reading the topology file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data)) as mock_file:
+            self.assertEqual(
+                mysql_rep_change.read_topology(self.fname, self.path),
+                (self.target, False, None))
+            mock_file.assert_called_once_with(
+                self.fname, mode="r", encoding="UTF-8")
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=False))
+    def test_file_in_dir(self):
+
+        """Function:  test_file_in_dir
+
+        Description:  Test with the topology file in the -d directory.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data)) as mock_file:
+            mysql_rep_change.read_topology(self.fname, self.path)
+            mock_file.assert_called_once_with(
+                os.path.join(self.path, self.fname), mode="r",
+                encoding="UTF-8")
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_invalid_line(self):
+
+        """Function:  test_invalid_line
+
+        Description:  Test with an invalid line in the topology file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data2)):
+            self.assertEqual(
+                mysql_rep_change.read_topology(self.fname, self.path),
+                ({}, True,
+                 "Error:  Invalid topology line:  Slave1 Master Slave2"))
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_duplicate_slave(self):
+
+        """Function:  test_duplicate_slave
+
+        Description:  Test with a slave listed twice in the topology file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.mock_open(read_data=self.data3)):
+            self.assertTrue(
+                mysql_rep_change.read_topology(self.fname, self.path)[1])
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=False))
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a topology file which does not exist.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.Mock(side_effect=FileNotFoundError(
+                            "No such file"))):
+            self.assertEqual(
+                mysql_rep_change.read_topology(self.fname, self.path),
+                ({}, True, "Error:  Unable to read topology file "
+                 + os.path.join(self.path, self.fname) + ": No such file"))
+
+    @mock.patch("mysql_rep_change.os.path.isfile",
+                mock.Mock(return_value=True))
+    def test_not_text(self):
+
+        """Function:  test_not_text
+
+        Description:  Test with a topology file which is not text.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open",
+                        mock.Mock(side_effect=UnicodeDecodeError(
+                            "utf-8", b"\xff", 0, 1, "invalid start byte"))):
+            target, err_flag, err_msg = mysql_rep_change.read_topology(
+                self.fname, self.path)
+
+        self.assertEqual((target, err_flag), ({}, True))
+        self.assertTrue(err_msg.startswith(
+            "Error:  Unable to read topology file topology.txt: "))
+
+
+if __name__ == "__main__":
+    unittest.main()
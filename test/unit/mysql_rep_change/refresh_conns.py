@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  refresh_conns.py
+
+    Description:  Unit testing of refresh_conns in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/refresh_conns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection.
+
+    Methods:
+        __init__
+        is_connected
+
+    """
+
+    def __init__(self, alive=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.alive = alive
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.alive
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, conn=None, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.conn = conn
+        self.conn_msg = conn_msg
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_connected
+        test_lost_slave
+        test_failed_slave
+        test_lost_master
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn()
+        self.master = Server("Master", conn=Conn())
+        self.slave1 = Server("Slave1", conn=self.conn)
+        self.slave2 = Server("Slave2", conn_msg="Connection refused")
+
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_all_connected(self, mock_conn):
+
+        """Function:  test_all_connected
+
+        Description:  Test with all connections alive.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.refresh_conns(self.master, [self.slave1])
+
+        self.assertIs(self.slave1.conn, self.conn)
+        mock_conn.assert_not_called()
+
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_lost_slave(self, mock_conn):
+
+        """Function:  test_lost_slave
+
+        Description:  Test with a lost slave connection.
+
+        Arguments:
+
+        """
+
+        self.slave1.conn.alive = False
+
+        mysql_rep_change.refresh_conns(self.master, [self.slave1])
+
+        self.assertIsNone(self.slave1.conn)
+        self.assertIsNone(self.slave1.conn_msg)
+        mock_conn.assert_not_called()
+
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_failed_slave(self, mock_conn):
+
+        """Function:  test_failed_slave
+
+        Description:  Test a slave which failed to connect is tried again.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.refresh_conns(self.master, [self.slave2])
+
+        self.assertIsNone(self.slave2.conn_msg)
+        mock_conn.assert_not_called()
+
+    @mock.patch("mysql_rep_change.connect_servers")
+    def test_lost_master(self, mock_conn):
+
+        """Function:  test_lost_master
+
+        Description:  Test with a lost master connection.
+
+        Arguments:
+
+        """
+
+        self.master.conn.alive = False
+
+        mysql_rep_change.refresh_conns(self.master, [self.slave1])
+
+        mock_conn.assert_called_once_with([self.master])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  repoint_slaves.py
+
+    Description:  Unit testing of repoint_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/repoint_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gtid_mode
+        test_position_mode
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.new_master = "NewMaster"
+        self.slv_moves = ["Slave1", "Slave2"]
+
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.change_source_gtid")
+    def test_gtid_mode(self, mock_gtid, mock_chg):
+
+        """Function:  test_gtid_mode
+
+        Description:  Test with GTID auto positioning.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.repoint_slaves(
+            self.new_master, self.slv_moves, gtid=True)
+
+        self.assertEqual(mock_gtid.call_count, 2)
+        mock_gtid.assert_any_call(self.new_master, "Slave2")
+        mock_chg.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.change_master_to")
+    @mock.patch("mysql_rep_change.change_source_gtid")
+    def test_position_mode(self, mock_gtid, mock_chg):
+
+        """Function:  test_position_mode
+
+        Description:  Test with binary log positions.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.repoint_slaves(self.new_master, self.slv_moves)
+
+        self.assertEqual(mock_chg.call_count, 2)
+        mock_chg.assert_any_call(self.new_master, "Slave1")
+        mock_gtid.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
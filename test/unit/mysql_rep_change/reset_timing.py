@@ -0,0 +1,71 @@
+# Classification (U)
+
+"""Program:  reset_timing.py
+
+    Description:  Unit testing of reset_timing in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/reset_timing.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reset_timing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.TIMING["phases"] = [{"phase": "connect"}]
+        mysql_rep_change.TIMING["start"] = 0.0
+
+    def test_reset_timing(self):
+
+        """Function:  test_reset_timing
+
+        Description:  Test clearing the timing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.reset_timing()
+
+        self.assertEqual(mysql_rep_change.TIMING["phases"], [])
+        self.assertGreater(mysql_rep_change.TIMING["start"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
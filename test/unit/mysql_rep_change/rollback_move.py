@@ -0,0 +1,215 @@
+# Classification (U)
+
+"""Program:  rollback_move.py
+
+    Description:  Unit testing of rollback_move in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/rollback_move.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-J": "move.journal"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_nothing_to_roll_back
+        test_other_master
+        test_open_slaves_fails
+        test_rollback
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = MasterRep()
+        self.slaves = ["Slave1", "Slave2"]
+        self.journal = mysql_rep_change.MoveJournal()
+        self.journal.load = mock.Mock(return_value="done")
+        self.journal.key = {"op": "-M", "master": "Master", "gtid": True}
+        self.journal.steps = {"snapshot": {"slaves": {"Slave1": {}}}}
+
+    @mock.patch("mysql_rep_change.MoveJournal")
+    def test_nothing_to_roll_back(self, mock_journal):
+
+        """Function:  test_nothing_to_roll_back
+
+        Description:  Test with no move to roll back in the journal.
+
+        Arguments:
+
+        """
+
+        self.journal.steps = {}
+        mock_journal.return_value = self.journal
+
+        self.assertEqual(
+            mysql_rep_change.rollback_move(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  No move to roll back was found in the journal."))
+        self.journal.load.assert_called_once_with(ended=["rolled_back"])
+
+    @mock.patch("mysql_rep_change.open_slaves")
+    @mock.patch("mysql_rep_change.MoveJournal")
+    def test_other_master(self, mock_journal, mock_open):
+
+        """Function:  test_other_master
+
+        Description:  Test with a move from another master.
+
+        Arguments:
+
+        """
+
+        self.journal.key["master"] = "Other"
+        mock_journal.return_value = self.journal
+
+        self.assertEqual(
+            mysql_rep_change.rollback_move(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  The move in the journal was from master Other."))
+        mock_open.assert_not_called()
+
+    @mock.patch("mysql_rep_change.open_slaves")
+    @mock.patch("mysql_rep_change.MoveJournal")
+    def test_open_slaves_fails(self, mock_journal, mock_open):
+
+        """Function:  test_open_slaves_fails
+
+        Description:  Test with a slave which fails to connect.
+
+        Arguments:
+
+        """
+
+        mock_journal.return_value = self.journal
+        mock_open.return_value = (True, "Error:  Connection failed")
+
+        self.assertEqual(
+            mysql_rep_change.rollback_move(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  Connection failed"))
+
+    @mock.patch("builtins.print", mock.Mock())
+    @mock.patch("mysql_rep_change.rollback_slaves")
+    @mock.patch("mysql_rep_change.fetch_slaves")
+    @mock.patch("mysql_rep_change.open_slaves")
+    @mock.patch("mysql_rep_change.MoveJournal")
+    def test_rollback(self, mock_journal, mock_open, mock_fetch, mock_rb):
+
+        """Function:  test_rollback
+
+        Description:  Test the slaves of the move are rolled back.
+
+        Arguments:
+
+        """
+
+        mock_journal.return_value = self.journal
+        mock_open.return_value = (False, None)
+        mock_fetch.return_value = (["SlaveInst"], False, None)
+        mock_rb.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.rollback_move(
+                self.master, self.slaves, args=self.args), (False, None))
+        mock_fetch.assert_called_once_with(self.slaves, ["Slave1"])
+        mock_rb.assert_called_once_with(
+            self.master, ["SlaveInst"], args=self.args, journal=self.journal,
+            gtid=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
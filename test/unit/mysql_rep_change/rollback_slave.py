@@ -0,0 +1,269 @@
+# Classification (U)
+
+"""Program:  rollback_slave.py
+
+    Description:  Unit testing of rollback_slave in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/rollback_slave.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.host = "master"
+        self.port = 3306
+        self.rep_user = "rep"
+        self.rep_japd = "japd"
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.gtid_mode = False
+        self.gtid_set = "uuid:1-10"
+        self.cmds = []
+        self.status = {
+            "Source_Host": "master", "Source_Port": "3306",
+            "Relay_Source_Log_File": "mysql-bin.000002",
+            "Exec_Source_Log_Pos": "200"}
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if cmd.startswith("SELECT"):
+            return [{"gtid": self.gtid_set}]
+
+        return [self.status] if self.status else []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_moved
+        test_position
+        test_applied
+        test_applied_gtid_set
+        test_reset_slave
+        test_gtid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.slave = SlaveRep()
+        self.entry = {
+            "source": ["master", 3306], "file": "mysql-bin.000001",
+            "pos": 100, "auto_position": False, "gtid_executed": None}
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_not_moved(self, mock_state):
+
+        """Function:  test_not_moved
+
+        Description:  Test a slave which was not moved is only started.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_change.rollback_slave(
+            self.master, self.slave, self.entry))
+        mock_state.assert_called_once_with([self.slave], "start")
+        self.assertEqual(self.slave.cmds, [])
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_position(self, mock_state):
+
+        """Function:  test_position
+
+        Description:  Test a slave is pointed back to its position.
+
+        Arguments:
+
+        """
+
+        self.slave.status["Source_Host"] = "new_master"
+
+        self.assertIsNone(mysql_rep_change.rollback_slave(
+            self.master, self.slave, self.entry,
+            moved_to=["mysql-bin.000002", 200]))
+        self.assertEqual(self.slave.cmds[0][1], (
+            "master", 3306, "rep", "japd", "mysql-bin.000001", 100))
+        self.assertEqual(mock_state.call_count, 2)
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_applied(self, mock_state):
+
+        """Function:  test_applied
+
+        Description:  Test a slave which applied transactions is not rolled
+            back.
+
+        Arguments:
+
+        """
+
+        self.slave.status["Source_Host"] = "new_master"
+        self.slave.status["Exec_Source_Log_Pos"] = "300"
+
+        self.assertEqual(
+            mysql_rep_change.rollback_slave(
+                self.master, self.slave, self.entry,
+                moved_to=["mysql-bin.000002", 200]),
+            "Error:  Slave Slave1 has applied transactions since the move"
+            " and can not be rolled back to its position.")
+        self.assertEqual(self.slave.cmds, [])
+        mock_state.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_applied_gtid_set(self, mock_state):
+
+        """Function:  test_applied_gtid_set
+
+        Description:  Test a slave whose GTID set changed is not rolled back.
+
+        Arguments:
+
+        """
+
+        self.slave.status["Source_Host"] = "new_master"
+        self.entry["gtid_executed"] = "uuid:1-9"
+
+        self.assertIsNotNone(mysql_rep_change.rollback_slave(
+            self.master, self.slave, self.entry,
+            moved_to=["mysql-bin.000002", 200]))
+        mock_state.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_reset_slave(self, mock_state):
+
+        """Function:  test_reset_slave
+
+        Description:  Test a new master whose replication was reset.
+
+        Arguments:
+
+        """
+
+        self.slave.status = None
+
+        self.assertIsNone(mysql_rep_change.rollback_slave(
+            self.master, self.slave, self.entry,
+            moved_to=["mysql-bin.000002", 200]))
+        self.assertEqual(len(self.slave.cmds), 1)
+
+    @mock.patch("mysql_rep_change.change_source_gtid")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_gtid(self, mock_state, mock_gtid):
+
+        """Function:  test_gtid
+
+        Description:  Test a slave moved with auto positioning.
+
+        Arguments:
+
+        """
+
+        self.slave.status["Source_Host"] = "new_master"
+
+        self.assertIsNone(mysql_rep_change.rollback_slave(
+            self.master, self.slave, self.entry, gtid=True))
+        mock_gtid.assert_called_once_with(self.master, self.slave)
+        self.assertEqual(self.slave.cmds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
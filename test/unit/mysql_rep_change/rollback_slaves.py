@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  rollback_slaves.py
+
+    Description:  Unit testing of rollback_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/rollback_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rollback
+        test_rollback_fails
+        test_rollback_raises
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.slaves = [SlaveRep("Slave1"), SlaveRep("Slave2")]
+        self.journal = mysql_rep_change.MoveJournal()
+        self.journal.steps = {
+            "snapshot": {"slaves": {"Slave1": {"file": "mysql-bin.000001"}}},
+            "repointing": {"target": ["mysql-bin.000002", 200]}}
+
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.rollback_slave")
+    def test_rollback(self, mock_slave, mock_up):
+
+        """Function:  test_rollback
+
+        Description:  Test the slaves in the snapshot are rolled back.
+
+        Arguments:
+
+        """
+
+        mock_slave.return_value = None
+        mock_up.return_value = (False, None)
+
+        self.assertEqual(mysql_rep_change.rollback_slaves(
+            self.master, self.slaves, journal=self.journal), (False, None))
+        mock_slave.assert_called_once_with(
+            self.master, self.slaves[0], {"file": "mysql-bin.000001"},
+            moved_to=["mysql-bin.000002", 200], gtid=False)
+        mock_up.assert_called_once_with(
+            [self.slaves[0]], journal=self.journal)
+        self.assertTrue(self.journal.resumed("rolled_back"))
+
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.rollback_slave")
+    def test_rollback_fails(self, mock_slave, mock_up):
+
+        """Function:  test_rollback_fails
+
+        Description:  Test with a slave which is not rolled back.
+
+        Arguments:
+
+        """
+
+        mock_slave.return_value = "Error:  Rollback failed"
+
+        self.assertEqual(mysql_rep_change.rollback_slaves(
+            self.master, self.slaves, journal=self.journal),
+                         (True, "Error:  Rollback failed"))
+        mock_up.assert_not_called()
+        self.assertFalse(self.journal.resumed("rolled_back"))
+
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.rollback_slave")
+    def test_rollback_raises(self, mock_slave, mock_up):
+
+        """Function:  test_rollback_raises
+
+        Description:  Test with a rollback which raises an exception.
+
+        Arguments:
+
+        """
+
+        mock_slave.side_effect = Exception("Lost connection")
+
+        self.assertEqual(
+            mysql_rep_change.rollback_slaves(
+                self.master, self.slaves, journal=self.journal),
+            (True, "Error:  Rollback of slave Slave1 failed: Lost connection"))
+        mock_up.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+# Classification (U)
+
+"""Program:  run_daemon.py
+
+    Description:  Unit testing of run_daemon in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/run_daemon.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, path):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-L": path}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_socket_error
+        test_signal
+        test_run_daemon
+        test_after_shutdown
+        client
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "daemon.sock")
+        self.args = ArgParser(self.path)
+        self.master = "Master"
+        self.slaves = ["Slave1"]
+        self.responses = []
+
+    @mock.patch("mysql_rep_change.open_socket",
+                mock.Mock(return_value=(None, "Error:  Unable to listen")))
+    def test_socket_error(self):
+
+        """Function:  test_socket_error
+
+        Description:  Test with a socket which cannot be opened.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.run_daemon(
+                self.master, self.slaves, args=ArgParser(self.path)),
+            (True, "Error:  Unable to listen"))
+
+    def test_signal(self):
+
+        """Function:  test_signal
+
+        Description:  Test the daemon stops on SIGTERM.
+
+        Arguments:
+
+        """
+
+        threading.Timer(
+            0.5, os.kill, [os.getpid(), signal.SIGTERM]).start()
+
+        self.assertEqual(
+            mysql_rep_change.run_daemon(self.master, self.slaves,
+                                        args=self.args), (False, None))
+        self.assertFalse(os.path.exists(self.path))
+
+    @mock.patch("mysql_rep_change.run_request")
+    def test_run_daemon(self, mock_run):
+
+        """Function:  test_run_daemon
+
+        Description:  Test running requests until a shutdown request.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = {"status": "ok", "msg": None}
+        client = threading.Thread(target=self.client, args=[
+            [{"cmd": "ping"}, {"argv": ["-M"]}, {"cmd": "shutdown"}]])
+        client.start()
+
+        self.assertEqual(
+            mysql_rep_change.run_daemon(self.master, self.slaves,
+                                        args=self.args), (False, None))
+        client.join()
+
+        self.assertEqual(self.responses, [
+            {"status": "ok", "queued": 0}, {"status": "ok", "msg": None},
+            {"status": "ok", "msg": "Shutting down"}])
+        mock_run.assert_called_once_with(
+            self.master, self.slaves, {"argv": ["-M"]}, args=self.args)
+        self.assertFalse(os.path.exists(self.path))
+
+    @mock.patch("mysql_rep_change.run_request")
+    def test_after_shutdown(self, mock_run):
+
+        """Function:  test_after_shutdown
+
+        Description:  Test a request after a shutdown request is refused.
+
+        Arguments:
+
+        """
+
+        client = threading.Thread(target=self.client, args=[
+            [{"cmd": "shutdown"}, {"argv": ["-M"]}]])
+        client.start()
+
+        self.assertEqual(
+            mysql_rep_change.run_daemon(self.master, self.slaves,
+                                        args=self.args), (False, None))
+        client.join(timeout=5)
+
+        self.assertFalse(client.is_alive())
+        self.assertEqual(self.responses, [
+            {"status": "ok", "msg": "Shutting down"},
+            {"status": "error", "msg": "Error:  Daemon is shutting down."}])
+        mock_run.assert_not_called()
+
+    def client(self, requests):
+
+        """Function:  client
+
+        Description:  Sends the requests to the daemon and saves the
+            responses.
+
+        Arguments:
+            (input) requests -> List of request dictionaries
+
+        """
+
+        while not os.path.exists(self.path):
+            time.sleep(0.01)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            rfile = sock.makefile("rb")
+
+            for request in requests:
+                sock.sendall(json.dumps(request).encode() + b"\n")
+                self.responses.append(json.loads(rfile.readline()))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,6 +36,7 @@ class ArgParser():
 
     Methods:
         __init__
+        arg_exist
         get_args_keys
         get_val
 
@@ -54,6 +55,18 @@ class ArgParser():
         self.cmdline = None
         self.args_array = {}
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def get_args_keys(self):
 
         """Method:  get_args_keys
@@ -203,14 +216,25 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_no_slaves
         test_no_master_slave_conn
         test_two_no_slave_conn
         test_one_no_slave_conn
         test_no_master_conn
+        test_failover_no_master_conn
+        test_heartbeat
+        test_heartbeat_fails
+        test_daemon_heartbeat
+        test_servers_locked
         test_with_option_fails
         test_with_multiple_options
         test_with_option
         test_no_option
+        test_discover
+        test_discover_with_option
+        test_timing_report
+        test_events
+        test_events_no_conn
 
     """
 
@@ -234,6 +258,11 @@ class UnitTest(unittest.TestCase):
         self.args3.args_array = {
             "-m": "master", "-n": "slaves", "-M": True, "-R": True}
         self.args4.args_array = {"-m": "master", "-n": "slaves", "-S": True}
+        self.args5 = ArgParser()
+        self.args6 = ArgParser()
+        self.args5.args_array = {"-D": True}
+        self.args6.args_array = {"-D": True, "-T": "topology.txt"}
+        self.graph = {"nodes": {}, "edges": [["Master", "Slave"]]}
         self.func_names = {"-M": move_slave, "-R": move_slave,
                            "-S": move_slave_up}
         self.master = MasterRep()
@@ -252,6 +281,25 @@ class UnitTest(unittest.TestCase):
         self.slave_list2 = [self.slave, self.slave2, self.slave3]
         self.slave_list3 = [self.slave, self.slave2, self.slave3, self.slave4]
 
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_no_slaves(self, mock_create):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves in the slave configuration.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, [])
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.run_program(self.args2, self.func_names))
+
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_change.create_instances")
@@ -278,7 +326,8 @@ class UnitTest(unittest.TestCase):
 
         """Function:  test_two_no_slave_conn
 
-        Description:  Test with two no slave connections.
+        Description:  Test with two no slave connections which are not
+            required by the operation.
 
         Arguments:
 
@@ -297,7 +346,8 @@ class UnitTest(unittest.TestCase):
 
         """Function:  test_one_no_slave_conn
 
-        Description:  Test with one no slave connection.
+        Description:  Test with one no slave connection which is not
+            required by the operation.
 
         Arguments:
 
@@ -328,8 +378,132 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 mysql_rep_change.run_program(self.args2, self.func_names))
 
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_failover_no_master_conn(self, mock_create, mock_disconn):
+
+        """Function:  test_failover_no_master_conn
+
+        Description:  Test the failover is run with no master connection.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master2, self.slave_list)
+        mock_failover = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-F": True}
+
+        self.assertFalse(
+            mysql_rep_change.run_program(self.args, {"-F": mock_failover}))
+        self.assertEqual(mock_failover.call_args[0],
+                         (self.master2, self.slave_list))
+        mock_disconn.assert_called_once_with(self.slave_list)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.start_heartbeat")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_heartbeat(self, mock_create, mock_start):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the heartbeat is passed to the operation.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock(err_msg=None)
+        mock_create.return_value = (self.master, self.slave_list)
+        mock_start.return_value = (heartbeat, False, None)
+        mock_move = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-M": True, "-H": "db.hb"}
+
+        self.assertFalse(
+            mysql_rep_change.run_program(self.args, {"-M": mock_move}))
+        mock_start.assert_called_once_with(self.master, "db.hb")
+        self.assertIs(mock_move.call_args[1]["heartbeat"], heartbeat)
+        heartbeat.stop.assert_called_once_with()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.start_heartbeat")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_heartbeat_fails(self, mock_create, mock_start):
+
+        """Function:  test_heartbeat_fails
+
+        Description:  Test the operation runs when the heartbeat fails.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, self.slave_list)
+        mock_start.return_value = (None, True, "Error:  Heartbeat")
+        mock_move = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-M": True, "-H": "db.hb"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.run_program(self.args, {"-M": mock_move}))
+
+        self.assertIsNone(mock_move.call_args[1]["heartbeat"])
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.start_heartbeat")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_daemon_heartbeat(self, mock_create, mock_start):
+
+        """Function:  test_daemon_heartbeat
+
+        Description:  Test the heartbeat is not started for the daemon, which
+            starts it for each request.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, self.slave_list)
+        mock_daemon = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-L": "daemon.sock", "-H": "db.hb"}
+
+        self.assertFalse(
+            mysql_rep_change.run_program(self.args, {"-L": mock_daemon}))
+        mock_start.assert_not_called()
+        self.assertIsNone(mock_daemon.call_args[1]["heartbeat"])
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.ServerLocks.acquire",
+                mock.Mock(return_value=(True, "Error:  Server locked.")))
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_servers_locked(self, mock_create):
+
+        """Function:  test_servers_locked
+
+        Description:  Test the operation is not run with a server locked by
+            another run.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, self.slave_list)
+        mock_move = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-M": True, "-m": "Slave1", "-n": ["Slave2"]}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.run_program(self.args, {"-M": mock_move}))
+
+        mock_move.assert_not_called()
+
     @mock.patch("mysql_rep_change.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
     @mock.patch("mysql_rep_change.create_instances")
     def test_with_option_fails(self, mock_create):
 
@@ -402,5 +576,124 @@ class UnitTest(unittest.TestCase):
             mysql_rep_change.run_program(self.args, self.func_names))
 
 
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.discover_slaves")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_discover(self, mock_create, mock_disc):
+
+        """Function:  test_discover
+
+        Description:  Test with -D option and no move option.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, [])
+        mock_disc.return_value = (self.slave_list, self.graph)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_change.run_program(self.args5, self.func_names))
+
+        mock_disc.assert_called_once_with(self.master, [], args=self.args5)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.discover_slaves")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_discover_with_option(self, mock_create, mock_disc):
+
+        """Function:  test_discover_with_option
+
+        Description:  Test with -D option passes the graph to the option.
+
+        Arguments:
+
+        """
+
+        topology_change = mock.Mock(return_value=(False, None))
+        mock_create.return_value = (self.master, [])
+        mock_disc.return_value = (self.slave_list, self.graph)
+
+        self.assertFalse(
+            mysql_rep_change.run_program(
+                self.args6, {"-T": topology_change}))
+        self.assertEqual(
+            topology_change.call_args[1]["graph"], self.graph)
+
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.timing_report")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_timing_report(self, mock_create, mock_report):
+
+        """Function:  test_timing_report
+
+        Description:  Test the timing report is written after the run.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, self.slave_list)
+
+        self.assertFalse(
+            mysql_rep_change.run_program(self.args2, self.func_names))
+        mock_report.assert_called_once_with(self.args2)
+        self.assertIn(
+            "operation -M",
+            [item["phase"] for item in mysql_rep_change.TIMING["phases"]])
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.emit")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_events(self, mock_create, mock_emit):
+
+        """Function:  test_events
+
+        Description:  Test the events of a run with an option which fails.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master, self.slave_list)
+        mock_move = mock.Mock(return_value=(True, "Error:  Move failed"))
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.run_program(self.args2, {"-M": mock_move})
+
+        events = [item[0][0] for item in mock_emit.call_args_list]
+        self.assertEqual((events[0], events[-1]), ("run_start", "run_end"))
+        mock_emit.assert_any_call(
+            "error", operation="-M", message="Error:  Move failed")
+        self.assertTrue(mock_emit.call_args_list[-1][1]["error"])
+
+    @mock.patch("mysql_rep_change.emit")
+    @mock.patch("mysql_rep_change.create_instances")
+    def test_events_no_conn(self, mock_create, mock_emit):
+
+        """Function:  test_events_no_conn
+
+        Description:  Test the events of a run with no master connection.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = (self.master2, self.slave_list)
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.run_program(self.args2, self.func_names)
+
+        self.assertEqual(mock_emit.call_args_list[1][0][0], "error")
+        self.assertTrue(mock_emit.call_args_list[-1][1]["error"])
+
+
 if __name__ == "__main__":
     unittest.main()
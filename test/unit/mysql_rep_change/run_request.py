@@ -0,0 +1,378 @@
+# Classification (U)
+
+"""Program:  run_request.py
+
+    Description:  Unit testing of run_request in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/run_request.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bad_argv
+        test_invalid_request
+        test_operation_fails
+        test_operation_raises
+        test_heartbeat
+        test_heartbeat_fails
+        test_output
+        test_run_request
+        test_servers_locked
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.slaves = ["Slave1", "Slave2"]
+        self.request = {"argv": ["-M", "-m", "Slave1", "-n", "Slave2"]}
+        self.req_args = ArgParser()
+        self.req_args.args_array = {"-M": True, "-m": "Slave1"}
+        self.func = mock.Mock(return_value=(False, None))
+        self.kwargs = {"args": ArgParser(), "func_dict": {"-M": self.func},
+                       "req_chk": {}}
+
+    def test_bad_argv(self):
+
+        """Function:  test_bad_argv
+
+        Description:  Test with an argv which is not a list of strings.
+
+        Arguments:
+
+        """
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, {"argv": "-M"}, **self.kwargs)
+
+        self.assertEqual(
+            (response["status"], response["msg"]),
+            ("error", "Error:  Request argv is not a list of options."))
+
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_invalid_request(self, mock_parse, mock_refresh):
+
+        """Function:  test_invalid_request
+
+        Description:  Test with request options which are not valid.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (None, "Error:  Invalid request options.")
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual((response["status"], response["msg"]),
+                         ("error", "Error:  Invalid request options."))
+        mock_refresh.assert_not_called()
+
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_operation_fails(self, mock_parse, mock_refresh):
+
+        """Function:  test_operation_fails
+
+        Description:  Test with an operation which fails.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (self.req_args, None)
+        self.func.return_value = (True, "Error:  Sync failed")
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual((response["status"], response["msg"]),
+                         ("error", "Error:  Sync failed"))
+
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_operation_raises(self, mock_parse, mock_refresh):
+
+        """Function:  test_operation_raises
+
+        Description:  Test with an operation which raises an exception.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (self.req_args, None)
+        self.func.side_effect = RuntimeError("lost connection")
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual(
+            (response["status"], response["msg"]),
+            ("error", "Error:  Request failed: lost connection"))
+
+    @mock.patch("mysql_rep_change.heartbeat_source",
+                mock.Mock(return_value="Source"))
+    @mock.patch("mysql_rep_change.start_heartbeat")
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns", mock.Mock())
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_heartbeat(self, mock_parse, mock_start):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the heartbeat runs only while the request runs.
+
+        Arguments:
+
+        """
+
+        master = mock.Mock(conn_msg=None)
+        heartbeat = mock.Mock(err_msg=None)
+        self.req_args.args_array["-H"] = "mysql.heartbeat"
+        mock_parse.return_value = (self.req_args, None)
+        mock_start.return_value = (heartbeat, False, None)
+        self.func.side_effect = lambda *args, **kwargs: (
+            heartbeat.stop.assert_not_called(), (False, None))[1]
+
+        response = mysql_rep_change.run_request(
+            master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual(response["status"], "ok")
+        mock_start.assert_called_once_with("Source", "mysql.heartbeat")
+        self.assertIs(self.func.call_args[1]["heartbeat"], heartbeat)
+        heartbeat.stop.assert_called_once_with()
+
+    @mock.patch("mysql_rep_change.heartbeat_source",
+                mock.Mock(return_value="Source"))
+    @mock.patch("mysql_rep_change.start_heartbeat",
+                mock.Mock(return_value=(None, True, "Error:  No table.")))
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns", mock.Mock())
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_heartbeat_fails(self, mock_parse):
+
+        """Function:  test_heartbeat_fails
+
+        Description:  Test the request runs without the heartbeat when it
+            does not start.
+
+        Arguments:
+
+        """
+
+        self.req_args.args_array["-H"] = "mysql.heartbeat"
+        mock_parse.return_value = (self.req_args, None)
+
+        response = mysql_rep_change.run_request(
+            mock.Mock(conn_msg=None), self.slaves, self.request,
+            **self.kwargs)
+
+        self.assertEqual(response["status"], "ok")
+        self.assertEqual(
+            response["output"], "Warning:  Running without the heartbeat."
+            "  Error:  No table.\n")
+        self.assertIsNone(self.func.call_args[1]["heartbeat"])
+
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_output(self, mock_parse, mock_refresh):
+
+        """Function:  test_output
+
+        Description:  Test the operation output is returned.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (self.req_args, None)
+        self.func.side_effect = lambda *args, **kwargs: (
+            print("Moving Slave2", file=kwargs["out"]), (False, None))[1]
+
+        with mock.patch("sys.stdout") as mock_stdout:
+            response = mysql_rep_change.run_request(
+                self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual(response["output"], "Moving Slave2\n")
+        mock_stdout.write.assert_not_called()
+
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.get_sync_opts",
+                mock.Mock(return_value={"gtid": False}))
+    @mock.patch("mysql_rep_change.get_slv_names",
+                mock.Mock(return_value=["Slave2"]))
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_run_request(self, mock_parse, mock_refresh):
+
+        """Function:  test_run_request
+
+        Description:  Test running a request.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (self.req_args, None)
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual((response["status"], response["msg"]), ("ok", None))
+        mock_refresh.assert_called_once_with(self.master, self.slaves)
+        self.func.assert_called_once_with(
+            self.master, self.slaves, new_mst="Slave1", slv_mv=["Slave2"],
+            args=self.req_args, heartbeat=None,
+            out=self.func.call_args[1]["out"], gtid=False)
+
+    @mock.patch("mysql_rep_change.ServerLocks.acquire",
+                mock.Mock(return_value=(True, "Error:  Server locked.")))
+    @mock.patch("mysql_rep_change.lock_targets", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_change.refresh_conns")
+    @mock.patch("mysql_rep_change.parse_request")
+    def test_servers_locked(self, mock_parse, mock_refresh):
+
+        """Function:  test_servers_locked
+
+        Description:  Test with a server locked by another run.
+
+        Arguments:
+
+        """
+
+        mock_parse.return_value = (self.req_args, None)
+
+        response = mysql_rep_change.run_request(
+            self.master, self.slaves, self.request, **self.kwargs)
+
+        self.assertEqual((response["status"], response["msg"]),
+                         ("error", "Error:  Server locked."))
+        self.func.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
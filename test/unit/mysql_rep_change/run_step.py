@@ -0,0 +1,243 @@
+# Classification (U)
+
+"""Program:  run_step.py
+
+    Description:  Unit testing of run_step in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/run_step.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, host="hostname", port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "japd"
+        self.machine = "Linux"
+        self.host = host
+        self.port = port
+        self.defaults_file = None
+        self.extra_def_file = None
+        self.rep_user = "rep_user"
+        self.rep_japd = "rep_japd"
+        self.conn = True
+        self.conn_msg = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_detach
+        test_move
+        test_move_fails
+        test_up
+        test_connection_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master")
+        self.slave = Server("Slave1")
+        self.slave2 = Server("Slave2")
+        self.slaves = [self.slave, self.slave2]
+        self.src_mst = Server("Master")
+        self.dst_mst = Server("Slave1")
+        self.err_msg = "Error:  Sync failed"
+
+    @mock.patch("mysql_rep_change.mysql_libs.reset_slave")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_detach(self, mock_state, mock_reset):
+
+        """Function:  test_detach
+
+        Description:  Test with a detach step.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.run_step(
+                self.master, self.slaves,
+                ("detach", "Slave2", "Master", None)), (False, None))
+        mock_state.assert_called_once_with([self.slave2], "stop")
+        mock_reset.assert_called_once_with(self.slave2)
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_move(self, mock_crt, mock_move, mock_up, mock_disc):
+
+        """Function:  test_move
+
+        Description:  Test with a move step.
+
+        Arguments:
+
+        """
+
+        mock_crt.side_effect = [self.src_mst, self.dst_mst]
+        mock_move.return_value = (False, None)
+        mock_up.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.run_step(
+                self.master, self.slaves,
+                ("move", "Slave2", "Master", "Slave1"), gtid=True,
+                new_mst=None), (False, None))
+        mock_move.assert_called_once_with(
+            self.src_mst, self.slaves, self.dst_mst, [self.slave2],
+            gtid=True, new_mst="Slave1")
+        mock_up.assert_called_once_with(
+            [self.slave2, self.slave], gtid=True, new_mst=None)
+        mock_disc.assert_called_once_with([self.src_mst, self.dst_mst])
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_converged")
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_move_fails(self, mock_crt, mock_move, mock_up):
+
+        """Function:  test_move_fails
+
+        Description:  Test with a move step which fails.
+
+        Arguments:
+
+        """
+
+        mock_crt.side_effect = [self.src_mst, self.dst_mst]
+        mock_move.return_value = (True, self.err_msg)
+
+        self.assertEqual(
+            mysql_rep_change.run_step(
+                self.master, self.slaves,
+                ("move", "Slave2", "Master", "Slave1")), (True, self.err_msg))
+        mock_up.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.mv_slv_up")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_up(self, mock_crt, mock_up):
+
+        """Function:  test_up
+
+        Description:  Test with an up step.
+
+        Arguments:
+
+        """
+
+        mock_crt.side_effect = [self.dst_mst, self.src_mst]
+        mock_up.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.run_step(
+                self.master, self.slaves,
+                ("up", "Slave2", "Slave1", "Master")), (False, None))
+        mock_up.assert_called_once_with(
+            self.dst_mst, self.src_mst, self.slave, [self.slave2])
+
+    @mock.patch("mysql_rep_change.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_change.mv_slv_to_new_mst")
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_connection_fails(self, mock_crt, mock_move, mock_disc):
+
+        """Function:  test_connection_fails
+
+        Description:  Test with a master connection failing.
+
+        Arguments:
+
+        """
+
+        self.dst_mst.conn = None
+        self.dst_mst.conn_msg = "Error connecting"
+        mock_crt.side_effect = [self.src_mst, self.dst_mst]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.run_step(
+                    self.master, self.slaves,
+                    ("move", "Slave2", "Master", "Slave1")),
+                (True, "Detected problem in one of the connections"))
+
+        mock_move.assert_not_called()
+        mock_disc.assert_called_once_with([self.src_mst])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  sample_progress.py
+
+    Description:  Unit testing of sample_progress in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/sample_progress.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.status = [{"Relay_Source_Log_File": "mysql-bin.000002",
+                        "Exec_Source_Log_Pos": 150}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_progress
+        test_not_slave
+        test_sample_progress
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.progress = mock.Mock()
+
+    def test_no_progress(self):
+
+        """Function:  test_no_progress
+
+        Description:  Test with no progress to sample.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.sample_progress(self.slave, None)
+
+        self.assertFalse(hasattr(self.slave, "cmd"))
+
+    def test_not_slave(self):
+
+        """Function:  test_not_slave
+
+        Description:  Test with a server which is not a slave.
+
+        Arguments:
+
+        """
+
+        self.slave.status = []
+
+        mysql_rep_change.sample_progress(self.slave, self.progress)
+
+        self.progress.sample.assert_not_called()
+
+    def test_sample_progress(self):
+
+        """Function:  test_sample_progress
+
+        Description:  Test sampling the executed position.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.sample_progress(self.slave, self.progress)
+
+        self.assertEqual(self.slave.cmd, "SHOW REPLICA STATUS")
+        self.progress.sample.assert_called_once_with(
+            "Slave1", "mysql-bin.000002", 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
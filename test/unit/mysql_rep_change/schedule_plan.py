@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  schedule_plan.py
+
+    Description:  Unit testing of schedule_plan in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/schedule_plan.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_independent_steps
+        test_dependent_steps
+        test_detach_step
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.step = ("move", "Slave2", "Master", "Slave1")
+        self.step2 = ("move", "Slave5", "Slave3", "Slave4")
+        self.step3 = ("up", "Slave6", "Slave2", "Slave1")
+        self.step4 = ("detach", "Slave7", "Slave1", None)
+
+    def test_independent_steps(self):
+
+        """Function:  test_independent_steps
+
+        Description:  Test with steps in separate subtrees.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.schedule_plan([self.step, self.step2]),
+            [[self.step, self.step2]])
+
+    def test_dependent_steps(self):
+
+        """Function:  test_dependent_steps
+
+        Description:  Test with a step which changes a server of an earlier
+            step.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.schedule_plan(
+                [self.step, self.step2, self.step3]),
+            [[self.step, self.step2], [self.step3]])
+
+    def test_detach_step(self):
+
+        """Function:  test_detach_step
+
+        Description:  Test that a detach step only changes its slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.schedule_plan([self.step, self.step4]),
+            [[self.step, self.step4]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,303 @@
+# Classification (U)
+
+"""Program:  select_new_master.py
+
+    Description:  Unit testing of select_new_master in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/select_new_master.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name="Master", conn=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.host = "master"
+        self.port = 3306
+        self.conn = conn
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return [{"gtid": "uuid:1-10", "uuid": "master-uuid"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_none_able
+        test_no_candidates
+        test_gtid
+        test_heartbeat
+        test_select_new_master
+        test_down_slave
+        info
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slaves = [Server("Slave1"), Server("Slave2"), Server("Slave3")]
+        self.args = ArgParser()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_none_able(self, mock_probe):
+
+        """Function:  test_none_able
+
+        Description:  Test with no slave able to be the new master.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = lambda slv, mst_gtid, heartbeat: self.info(
+            slv.name, read_only=True)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.select_new_master(
+                    self.master, self.slaves, args=self.args),
+                (None, True, "Error:  No slave is able to be the new master."))
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_no_candidates(self, mock_probe):
+
+        """Function:  test_no_candidates
+
+        Description:  Test with no slaves left to check.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.select_new_master(
+                    self.master, self.slaves, args=self.args,
+                    slv_mv=["Slave1", "Slave2", "Slave3"]),
+                (None, True, "Error:  No slave is able to be the new master."))
+        mock_probe.assert_not_called()
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_gtid(self, mock_probe):
+
+        """Function:  test_gtid
+
+        Description:  Test the master GTID set is passed to the probe.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = lambda slv, mst_gtid, heartbeat: self.info(
+            slv.name)
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.select_new_master(
+                self.master, self.slaves, args=self.args, gtid=True)
+
+        self.assertEqual(mock_probe.call_args[0][1], "uuid:1-10")
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_heartbeat(self, mock_probe):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the heartbeat is passed to the probe.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        mock_probe.side_effect = lambda slv, mst_gtid, heartbeat: self.info(
+            slv.name)
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.select_new_master(
+                self.master, self.slaves, args=self.args, heartbeat=heartbeat)
+
+        self.assertIs(mock_probe.call_args[1]["heartbeat"], heartbeat)
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_select_new_master(self, mock_probe):
+
+        """Function:  test_select_new_master
+
+        Description:  Test selecting the new master.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = lambda slv, mst_gtid, heartbeat: self.info(
+            slv.name, lag={"Slave1": 9, "Slave2": 0, "Slave3": 1}[slv.name])
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.select_new_master(
+                    self.master, self.slaves, args=self.args,
+                    slv_mv=["Slave3"]), ("Slave2", False, None))
+
+        self.assertEqual(
+            sorted(call[0][0].name for call in mock_probe.call_args_list),
+            ["Slave1", "Slave2"])
+
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.probe_candidate")
+    def test_down_slave(self, mock_probe):
+
+        """Function:  test_down_slave
+
+        Description:  Test a slave which is not connected is not checked.
+
+        Arguments:
+
+        """
+
+        self.slaves[0].conn = None
+        mock_probe.side_effect = lambda slv, mst_gtid, heartbeat: self.info(
+            slv.name)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.select_new_master(
+                    self.master, self.slaves, args=self.args),
+                ("Slave2", False, None))
+
+    def info(self, name, **kwargs):
+
+        """Function:  info
+
+        Description:  Returns the details of a candidate.
+
+        Arguments:
+            (input) name -> Name of the candidate
+            (input) **kwargs -> Details to change
+            (output) Dictionary of the candidate details
+
+        """
+
+        info = {
+            "name": name, "source": ("master", 3306),
+            "source_uuid": "master-uuid", "running": True,
+            "lag": 0, "backlog": 0, "read_only": False, "log_bin": True,
+            "log_replica_updates": True, "load": 1, "missing": None}
+        info.update(kwargs)
+
+        return info
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  serverlocks_acquire.py
+
+    Description:  Unit testing of serverlocks_acquire in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/serverlocks_acquire.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import stat
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_acquire
+        test_same_server
+        test_already_held
+        test_locked
+        test_other_servers
+        tearDown
+        test_lock_file_fails
+        test_new_lock_dir
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lock_dir = tempfile.mkdtemp()
+        self.locks = mysql_rep_change.ServerLocks(self.lock_dir)
+        self.other = mysql_rep_change.ServerLocks(self.lock_dir)
+
+    def test_acquire(self):
+
+        """Function:  test_acquire
+
+        Description:  Test locking the servers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.locks.acquire([("Host1", 3306), ("host2", "3307")]),
+            (False, None))
+        self.assertEqual(sorted(self.locks.held), ["host1:3306", "host2:3307"])
+        self.assertTrue(os.path.isfile(os.path.join(
+            self.lock_dir, "mysql_rep_change-host1_3306.lock")))
+
+    def test_same_server(self):
+
+        """Function:  test_same_server
+
+        Description:  Test a server listed twice is locked once.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.locks.acquire([("host1", 3306), ("HOST1", "3306")]),
+            (False, None))
+        self.assertEqual(list(self.locks.held), ["host1:3306"])
+
+    def test_already_held(self):
+
+        """Function:  test_already_held
+
+        Description:  Test with a server already held by the instance.
+
+        Arguments:
+
+        """
+
+        self.locks.acquire([("host1", 3306)])
+
+        self.assertEqual(self.locks.acquire([("host1", 3306)]), (False, None))
+
+    def test_locked(self):
+
+        """Function:  test_locked
+
+        Description:  Test with a server locked by another run.
+
+        Arguments:
+
+        """
+
+        self.other.acquire([("host2", 3306)])
+
+        self.assertEqual(
+            self.locks.acquire([("host1", 3306), ("host2", 3306)]),
+            (True, "Error:  Server host2:3306 is locked by another run."))
+        self.assertEqual(self.locks.held, {})
+
+    def test_other_servers(self):
+
+        """Function:  test_other_servers
+
+        Description:  Test with other servers locked by another run.
+
+        Arguments:
+
+        """
+
+        self.other.acquire([("host2", 3306)])
+
+        self.assertEqual(self.locks.acquire([("host1", 3306)]), (False, None))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.other.release()
+        self.locks.release()
+        shutil.rmtree(self.lock_dir)
+
+    def test_lock_file_fails(self):
+
+        """Function:  test_lock_file_fails
+
+        Description:  Test with a lock file which can not be opened.
+
+        Arguments:
+
+        """
+
+        os.mkdir(os.path.join(
+            self.lock_dir, "mysql_rep_change-host2_3306.lock"))
+
+        err_flag, err_msg = self.locks.acquire(
+            [("host1", 3306), ("host2", 3306)])
+
+        self.assertTrue(err_flag)
+        self.assertTrue(
+            err_msg.startswith("Error:  Unable to lock the servers: "))
+        self.assertEqual(self.locks.held, {})
+        self.assertEqual(self.other.acquire([("host1", 3306)]), (False, None))
+
+    def test_new_lock_dir(self):
+
+        """Function:  test_new_lock_dir
+
+        Description:  Test the lock directory is created for all users.
+
+        Arguments:
+
+        """
+
+        lock_dir = os.path.join(self.lock_dir, "locks")
+        locks = mysql_rep_change.ServerLocks(lock_dir)
+
+        self.assertEqual(locks.acquire([("host1", 3306)]), (False, None))
+        self.assertEqual(stat.S_IMODE(os.stat(lock_dir).st_mode), 0o1777)
+        locks.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
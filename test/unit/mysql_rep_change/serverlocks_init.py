@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  serverlocks_init.py
+
+    Description:  Unit testing of serverlocks_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/serverlocks_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lock_dir
+        test_default_dir
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lock_dir = tempfile.mkdtemp()
+        self.locks = mysql_rep_change.ServerLocks(self.lock_dir)
+
+    def test_lock_dir(self):
+
+        """Function:  test_lock_dir
+
+        Description:  Test with a lock directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.locks.lock_dir, self.locks.held, self.locks.leases),
+            (self.lock_dir, {}, []))
+
+    def test_default_dir(self):
+
+        """Function:  test_default_dir
+
+        Description:  Test the default lock directory.
+
+        Arguments:
+
+        """
+
+        locks = mysql_rep_change.ServerLocks()
+
+        self.assertEqual(locks.lock_dir, os.path.join(
+            tempfile.gettempdir(), "mysql_rep_change-locks"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.locks.release()
+        shutil.rmtree(self.lock_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
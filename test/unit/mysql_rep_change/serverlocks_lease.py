@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  serverlocks_lease.py
+
+    Description:  Unit testing of serverlocks_lease in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/serverlocks_lease.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+LEASED = []
+
+
+class LeaseLock():                                      # pylint:disable=R0903
+
+    """Class:  LeaseLock
+
+    Description:  Class stub holder for mysql_rep_change.LeaseLock class.
+
+    Methods:
+        __init__
+        acquire
+
+    """
+
+    def __init__(self, server, lease):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.server = server
+        self.lease = lease
+
+    def acquire(self):
+
+        """Method:  acquire
+
+        Description:  Method stub holder for
+            mysql_rep_change.LeaseLock.acquire.
+
+        Arguments:
+
+        """
+
+        if self.server in LEASED:
+            return True, \
+                f"Error:  Server {self.server} is leased by another run."
+
+        return False, None
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, host, port):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.host = host
+        self.port = port
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lease
+        test_leased
+        test_no_servers
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.locks = mysql_rep_change.ServerLocks()
+        self.servers = [Server("Slave2", "host2", 3306),
+                        Server("Slave1", "host1", "3307"),
+                        Server("Master", "host1", 3306)]
+
+    @mock.patch("mysql_rep_change.LeaseLock", LeaseLock)
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_lease(self, mock_inst):
+
+        """Function:  test_lease
+
+        Description:  Test taking the leases in host and port order.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = lambda srv: srv.name
+
+        self.assertEqual(self.locks.lease(self.servers, 30), (False, None))
+        self.assertEqual(
+            [(item.server, item.lease) for item in self.locks.leases],
+            [("Master", 30), ("Slave1", 30), ("Slave2", 30)])
+
+    @mock.patch("mysql_rep_change.LeaseLock", LeaseLock)
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_leased(self, mock_inst):
+
+        """Function:  test_leased
+
+        Description:  Test with a server leased by another run.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = lambda srv: srv.name
+        LEASED.append("Slave1")
+
+        self.assertEqual(
+            self.locks.lease(self.servers, 30),
+            (True, "Error:  Server Slave1 is leased by another run."))
+        self.assertEqual([item.server for item in self.locks.leases],
+                         ["Master", "Slave1"])
+
+    @mock.patch("mysql_rep_change.LeaseLock", LeaseLock)
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_no_servers(self, mock_inst):
+
+        """Function:  test_no_servers
+
+        Description:  Test with no servers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.locks.lease([], 30), (False, None))
+        self.assertEqual(self.locks.leases, [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        LEASED.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
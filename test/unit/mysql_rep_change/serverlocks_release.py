@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  serverlocks_release.py
+
+    Description:  Unit testing of serverlocks_release in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/serverlocks_release.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_release
+        test_nothing_held
+        test_leases
+        test_lease_lost
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lock_dir = tempfile.mkdtemp()
+        self.locks = mysql_rep_change.ServerLocks(self.lock_dir)
+        self.other = mysql_rep_change.ServerLocks(self.lock_dir)
+
+    def test_release(self):
+
+        """Function:  test_release
+
+        Description:  Test releasing the locks.
+
+        Arguments:
+
+        """
+
+        self.locks.acquire([("host1", 3306)])
+        self.locks.release()
+
+        self.assertEqual(self.locks.held, {})
+        self.assertEqual(self.other.acquire([("host1", 3306)]), (False, None))
+
+    def test_nothing_held(self):
+
+        """Function:  test_nothing_held
+
+        Description:  Test with no locks held.
+
+        Arguments:
+
+        """
+
+        self.locks.release()
+
+        self.assertEqual(self.locks.held, {})
+
+    def test_leases(self):
+
+        """Function:  test_leases
+
+        Description:  Test the leases are released.
+
+        Arguments:
+
+        """
+
+        lease = mock.Mock(err_msg=None)
+        self.locks.leases = [lease]
+        self.locks.release()
+
+        lease.release.assert_called_once_with()
+        self.assertEqual(self.locks.leases, [])
+
+    @mock.patch("builtins.print")
+    def test_lease_lost(self, mock_print):
+
+        """Function:  test_lease_lost
+
+        Description:  Test a lease which was lost is printed.
+
+        Arguments:
+
+        """
+
+        lease = mock.Mock(err_msg="Warning:  Lease on Master was lost.")
+        self.locks.leases = [lease]
+        self.locks.release()
+
+        mock_print.assert_called_once_with(
+            "Warning:  Lease on Master was lost.", file=None)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.other.release()
+        self.locks.release()
+        shutil.rmtree(self.lock_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  slave_state.py
+
+    Description:  Unit testing of slave_state in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/slave_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name="Slave1"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.status = {
+            "Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes",
+            "Seconds_Behind_Source": 3, "Last_IO_Errno": 0,
+            "Last_IO_Error": "", "Last_SQL_Errno": 0, "Last_SQL_Error": ""}
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd                                  # pylint:disable=W0201
+
+        return [self.status] if self.status else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_slave
+        test_sql_error
+        test_io_error
+        test_connecting
+        test_heartbeat
+        test_heartbeat_unknown
+        test_slave_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+
+    def test_not_slave(self):
+
+        """Function:  test_not_slave
+
+        Description:  Test with a server which is not a slave.
+
+        Arguments:
+
+        """
+
+        self.slave.status = {}
+
+        self.assertEqual(mysql_rep_change.slave_state(self.slave), {
+            "name": "Slave1", "running": False, "lag": None,
+            "error": "Replication is not configured."})
+
+    def test_sql_error(self):
+
+        """Function:  test_sql_error
+
+        Description:  Test with the SQL thread stopped by an error.
+
+        Arguments:
+
+        """
+
+        self.slave.status.update({
+            "Replica_SQL_Running": "No", "Seconds_Behind_Source": None,
+            "Last_SQL_Errno": 1062, "Last_SQL_Error": "Duplicate entry"})
+
+        self.assertEqual(mysql_rep_change.slave_state(self.slave)["error"],
+                         "SQL Error:  1062:  Duplicate entry")
+
+    def test_io_error(self):
+
+        """Function:  test_io_error
+
+        Description:  Test with the IO thread stopped by an error.
+
+        Arguments:
+
+        """
+
+        self.slave.status.update({
+            "Replica_IO_Running": "No", "Last_IO_Errno": 13114,
+            "Last_IO_Error": "Got fatal error"})
+
+        self.assertEqual(mysql_rep_change.slave_state(self.slave)["error"],
+                         "IO Error:  13114:  Got fatal error")
+
+    def test_connecting(self):
+
+        """Function:  test_connecting
+
+        Description:  Test with the IO thread still connecting.
+
+        Arguments:
+
+        """
+
+        self.slave.status.update({
+            "Replica_IO_Running": "Connecting", "Last_IO_Errno": 2003,
+            "Last_IO_Error": "Can't connect"})
+
+        self.assertEqual(mysql_rep_change.slave_state(self.slave), {
+            "name": "Slave1", "running": False, "lag": 3.0, "error": None})
+
+    def test_heartbeat(self):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the lag is taken from the heartbeat.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        heartbeat.lag.return_value = 20.0
+
+        self.assertEqual(
+            mysql_rep_change.slave_state(self.slave, heartbeat)["lag"], 0.02)
+
+    def test_heartbeat_unknown(self):
+
+        """Function:  test_heartbeat_unknown
+
+        Description:  Test with a slave which has not applied a heartbeat.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        heartbeat.lag.return_value = None
+
+        self.assertEqual(
+            mysql_rep_change.slave_state(self.slave, heartbeat)["lag"], 3.0)
+
+    def test_slave_state(self):
+
+        """Function:  test_slave_state
+
+        Description:  Test with a running slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.slave_state(self.slave), {
+            "name": "Slave1", "running": True, "lag": 3.0, "error": None})
+        self.assertEqual(self.slave.cmd, "SHOW REPLICA STATUS")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  slavearray_find_name.py
+
+    Description:  Unit testing of SlaveArray.find_name in
+        mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/slavearray_find_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, server_id, host, port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.host = host
+        self.port = port
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_found
+        test_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep("Slave1", 11, "host1")
+        self.slave2 = SlaveRep("Slave2", "12", "host2", port="3307")
+        self.slv_array = mysql_rep_change.SlaveArray([self.slave, self.slave2])
+
+    def test_found(self):
+
+        """Function:  test_found
+
+        Description:  Test with the slave found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.slv_array.find_name("Slave2"), self.slave2)
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with the slave not found.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.slv_array.find_name("Slave3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
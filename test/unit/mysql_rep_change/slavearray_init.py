@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  slavearray_init.py
+
+    Description:  Unit testing of SlaveArray.__init__ in
+        mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/slavearray_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, server_id, host, port=3306):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.host = host
+        self.port = port
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep("Slave1", 11, "host1")
+        self.slave2 = SlaveRep("Slave2", "12", "host2", port="3307")
+        self.slv_array = mysql_rep_change.SlaveArray([self.slave, self.slave2])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        slv_array = mysql_rep_change.SlaveArray()
+
+        self.assertEqual(
+            (slv_array, slv_array.names, slv_array.ids, slv_array.hosts),
+            ([], {}, {}, {}))
+
+    def test_slaves(self):
+
+        """Function:  test_slaves
+
+        Description:  Test with slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.slv_array, [self.slave, self.slave2])
+        self.assertEqual(
+            self.slv_array.ids, {11: self.slave, 12: self.slave2})
+        self.assertEqual(
+            self.slv_array.hosts,
+            {("host1", 3306): self.slave, ("host2", 3307): self.slave2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+# Classification (U)
+
+"""Program:  snapshot_slaves.py
+
+    Description:  Unit testing of snapshot_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/snapshot_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.gtid_mode = False
+        self.gtid_set = "uuid:1-10"
+        self.cmds = []
+        self.status = {
+            "Source_Host": "master", "Source_Port": "3306",
+            "Relay_Source_Log_File": "mysql-bin.000002",
+            "Exec_Source_Log_Pos": "200"}
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if cmd.startswith("SELECT"):
+            return [{"gtid": self.gtid_set}]
+
+        return [self.status] if self.status else []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_snapshot
+        test_gtid_mode
+        test_no_replication
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+
+    def test_snapshot(self):
+
+        """Function:  test_snapshot
+
+        Description:  Test the snapshot of a slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.snapshot_slaves([self.slave]), {
+            "Slave1": {"source": ["master", 3306], "file": "mysql-bin.000002",
+                       "pos": 200, "auto_position": False,
+                       "gtid_executed": None}})
+
+    def test_gtid_mode(self):
+
+        """Function:  test_gtid_mode
+
+        Description:  Test the snapshot of a slave in GTID mode.
+
+        Arguments:
+
+        """
+
+        self.slave.gtid_mode = True
+        self.slave.status["Auto_Position"] = "1"
+
+        snapshot = mysql_rep_change.snapshot_slaves([self.slave])
+
+        self.assertEqual((snapshot["Slave1"]["auto_position"],
+                          snapshot["Slave1"]["gtid_executed"]),
+                         (True, "uuid:1-10"))
+
+    def test_no_replication(self):
+
+        """Function:  test_no_replication
+
+        Description:  Test a slave with no replication is left out.
+
+        Arguments:
+
+        """
+
+        self.slave.status = None
+
+        self.assertEqual(mysql_rep_change.snapshot_slaves([self.slave]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  start_heartbeat.py
+
+    Description:  Unit testing of start_heartbeat in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/start_heartbeat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master"
+        self.server_id = 10
+        self.conn_msg = None
+        self.fail = False
+        self.cmds = []
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  Method stub holder for mysql_class.Server.sql.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmds.append((cmd, params))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bad_table
+        test_conn_fails
+        test_start_heartbeat
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.hb_master = Server()
+
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_bad_table(self, mock_crt):
+
+        """Function:  test_bad_table
+
+        Description:  Test with a table name which is not valid.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.start_heartbeat(self.master, "hb; DROP"),
+            (None, True,
+             "Error:  Heartbeat table name is not valid: hb; DROP"))
+        mock_crt.assert_not_called()
+
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_conn_fails(self, mock_crt):
+
+        """Function:  test_conn_fails
+
+        Description:  Test with the heartbeat connection failing.
+
+        Arguments:
+
+        """
+
+        self.hb_master.conn_msg = "Connection Error"
+        mock_crt.return_value = self.hb_master
+
+        self.assertEqual(
+            mysql_rep_change.start_heartbeat(self.master, "db.hb"),
+            (None, True,
+             "Error:  Heartbeat connection failed: Connection Error"))
+
+    @mock.patch("mysql_rep_change.crt_mst_inst")
+    def test_start_heartbeat(self, mock_crt):
+
+        """Function:  test_start_heartbeat
+
+        Description:  Test starting the heartbeat.
+
+        Arguments:
+
+        """
+
+        mock_crt.return_value = self.hb_master
+
+        heartbeat, err_flag, err_msg = mysql_rep_change.start_heartbeat(
+            self.master, "hb")
+        heartbeat.done.set()
+        heartbeat.thread.join()
+
+        self.assertEqual((heartbeat.master, heartbeat.table, err_flag,
+                          err_msg), (self.hb_master, "hb", False, None))
+        mock_crt.assert_called_once_with(self.master)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  stopped_at.py
+
+    Description:  Unit testing of stopped_at in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/stopped_at.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+        self.status = {
+            "Replica_SQL_Running": "No",
+            "Relay_Source_Log_File": "mysql-bin.000002",
+            "Exec_Source_Log_Pos": "200"}
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return [self.status] if self.status else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_target
+        test_stopped_at
+        test_running
+        test_other_position
+        test_no_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slaves = [SlaveRep(), SlaveRep()]
+
+    def test_no_target(self):
+
+        """Function:  test_no_target
+
+        Description:  Test with no target position.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_change.stopped_at(self.slaves, None))
+
+    def test_stopped_at(self):
+
+        """Function:  test_stopped_at
+
+        Description:  Test with the slaves stopped at the position.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_change.stopped_at(
+            self.slaves, ["mysql-bin.000002", 200]))
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test with a slave which is running.
+
+        Arguments:
+
+        """
+
+        self.slaves[1].status["Replica_SQL_Running"] = "Yes"
+
+        self.assertFalse(mysql_rep_change.stopped_at(
+            self.slaves, ["mysql-bin.000002", 200]))
+
+    def test_other_position(self):
+
+        """Function:  test_other_position
+
+        Description:  Test with a slave stopped at another position.
+
+        Arguments:
+
+        """
+
+        self.slaves[1].status["Exec_Source_Log_Pos"] = "100"
+
+        self.assertFalse(mysql_rep_change.stopped_at(
+            self.slaves, ["mysql-bin.000002", 200]))
+
+    def test_no_status(self):
+
+        """Function:  test_no_status
+
+        Description:  Test with a slave with no replication.
+
+        Arguments:
+
+        """
+
+        self.slaves[0].status = None
+
+        self.assertFalse(mysql_rep_change.stopped_at(
+            self.slaves, ["mysql-bin.000002", 200]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  strip_secrets.py
+
+    Description:  Unit testing of strip_secrets in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/strip_secrets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_dict
+        test_list
+
+    """
+
+    def test_dict(self):
+
+        """Function:  test_dict
+
+        Description:  Test the secrets of a configuration are removed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.strip_secrets(
+                {"name": "Master", "japd": "pwd", "rep_japd": "rep_pwd"}),
+            {"name": "Master", "japd": None, "rep_japd": None})
+
+    def test_list(self):
+
+        """Function:  test_list
+
+        Description:  Test the secrets of each slave are removed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.strip_secrets(
+                [{"name": "Slave1", "japd": "pwd1"}, {"name": "Slave2"}]),
+            [{"name": "Slave1", "japd": None}, {"name": "Slave2"}])
+
+if __name__ == "__main__":
+    unittest.main()
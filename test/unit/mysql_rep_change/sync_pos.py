@@ -0,0 +1,336 @@
+# Classification (U)
+
+"""Program:  sync_pos.py
+
+    Description:  Unit testing of sync_pos in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/sync_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.params = None
+        self.status = []
+        self.data = {"Relay_Source_Log_File": "mysql-bin.000010",
+                     "Exec_Source_Log_Pos": 100, "Last_SQL_Errno": 0,
+                     "Last_SQL_Error": "", "Last_IO_Errno": 0,
+                     "Last_IO_Error": "", "Replica_IO_Running": "Yes",
+                     "Replica_SQL_Running": "Yes"}
+
+    def sql(self, cmd, params=None):
+
+        """Method:  sql
+
+        Description:  sql method.
+
+        Arguments:
+
+        """
+
+        self.params = params
+
+        return cmd
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  col_sql method.
+
+        Arguments:
+
+        """
+
+        if self.status:
+            self.data["Exec_Source_Log_Pos"] = self.status.pop(0)
+
+        return [dict(self.data, cmd=cmd)]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_server_wait_fails
+        test_server_wait
+        test_sql_error
+        test_cancelled
+        test_timed_out
+        test_later_log_file
+        test_position_reached
+        test_progress
+        test_io_error
+        test_sql_stopped
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.log_file = "mysql-bin.000010"
+        self.cancel = threading.Event()
+        self.err_msg = \
+            "Error:  Slave Slave_Name SQL error during sync:  1062:  Dup"
+        self.err_msg2 = "Error:  Sync of slave Slave_Name was cancelled."
+        self.err_msg3 = \
+            "Error:  Slave Slave_Name did not reach mysql-bin.000010:500" \
+            " within 0.1 seconds."
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_pos")
+    def test_server_wait_fails(self, mock_wait):
+
+        """Function:  test_server_wait_fails
+
+        Description:  Test with the server side wait timing out.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (True, self.err_msg3)
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(
+                self.slave, self.log_file, 500, server_wait=True),
+            (True, self.err_msg3))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.wait_pos")
+    def test_server_wait(self, mock_wait):
+
+        """Function:  test_server_wait
+
+        Description:  Test with the server side wait and a single check of
+            the slave.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (False, None)
+        self.slave.status = [500]
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(
+                self.slave, self.log_file, 500, server_wait=True),
+            (False, None))
+        self.assertEqual(self.slave.status, [])
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_sql_error(self):
+
+        """Function:  test_sql_error
+
+        Description:  Test with a SQL error on the slave.
+
+        Arguments:
+
+        """
+
+        self.slave.data["Last_SQL_Errno"] = 1062
+        self.slave.data["Last_SQL_Error"] = "Dup"
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(self.slave, self.log_file, 500),
+            (True, self.err_msg))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_cancelled(self):
+
+        """Function:  test_cancelled
+
+        Description:  Test with the sync cancelled by another thread.
+
+        Arguments:
+
+        """
+
+        self.cancel.set()
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(
+                self.slave, self.log_file, 500, cancel=self.cancel),
+            (True, self.err_msg2))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_timed_out(self):
+
+        """Function:  test_timed_out
+
+        Description:  Test with the slave not reaching the position in time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(
+                self.slave, self.log_file, 500, timeout=0.1, interval=0.05),
+            (True, self.err_msg3))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_later_log_file(self):
+
+        """Function:  test_later_log_file
+
+        Description:  Test with the slave in a later binary log file.
+
+        Arguments:
+
+        """
+
+        self.slave.data["Relay_Source_Log_File"] = "mysql-bin.000011"
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(self.slave, self.log_file, 500),
+            (False, None))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    def test_position_reached(self, mock_state):
+
+        """Function:  test_position_reached
+
+        Description:  Test with the slave reaching the position.
+
+        Arguments:
+
+        """
+
+        self.slave.status = [200, 500]
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(
+                self.slave, self.log_file, "500", interval=0),
+            (False, None))
+        mock_state.assert_called_once_with([self.slave], "stop")
+        self.assertEqual(self.slave.params, (self.log_file, 500))
+
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_progress(self):
+
+        """Function:  test_progress
+
+        Description:  Test the progress is sampled on each check until the
+            position is reached.
+
+        Arguments:
+
+        """
+
+        progress = mock.Mock()
+        self.slave.status = [200, 500]
+
+        mysql_rep_change.sync_pos(
+            self.slave, self.log_file, 500, interval=0, progress=progress)
+
+        progress.sample.assert_called_once_with(
+            "Slave_Name", self.log_file, 200)
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_io_error(self):
+
+        """Function:  test_io_error
+
+        Description:  Test with an I/O error on the slave during the sync.
+
+        Arguments:
+
+        """
+
+        self.slave.data.update(
+            {"Replica_IO_Running": "No", "Last_IO_Errno": 13114,
+             "Last_IO_Error": "Got fatal error"})
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(self.slave, self.log_file, 500),
+            (True, "Error:  Slave Slave_Name IO error during sync:  13114:"
+             "  Got fatal error"))
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    def test_sql_stopped(self):
+
+        """Function:  test_sql_stopped
+
+        Description:  Test with the SQL thread stopped without an error
+            before the position.
+
+        Arguments:
+
+        """
+
+        self.slave.data["Replica_SQL_Running"] = "No"
+
+        self.assertEqual(
+            mysql_rep_change.sync_pos(self.slave, self.log_file, 500),
+            (True, "Error:  Slave Slave_Name replication stopped during"
+             " sync."))
+
+
+if __name__ == "__main__":
+    unittest.main()
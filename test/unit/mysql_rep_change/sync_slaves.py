@@ -0,0 +1,291 @@
+# Classification (U)
+
+"""Program:  sync_slaves.py
+
+    Description:  Unit testing of sync_slaves in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/sync_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        upd_mst_status
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.gtid_mode = True
+        self.gtid = "3E11FA47-71CA-11E1-9E33-C80AA9429562:1-5"
+        self.file = None
+        self.pos = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  col_sql method.
+
+        Arguments:
+
+        """
+
+        return [{"gtid": self.gtid, "cmd": cmd}]
+
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  upd_mst_status method.
+
+        Arguments:
+
+        """
+
+        self.file = "mysql-bin.000010"
+        self.pos = 500
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        sync_fail
+        test_gtid_mode_off
+        test_sync_fails
+        test_position_sync
+        test_gtid_sync
+        test_progress
+        test_gtid_progress
+        test_sync_fails_restart
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server("Master")
+        self.slave = Server("Slave1")
+        self.slave2 = Server("Slave2")
+        self.slaves = [self.slave, self.slave2]
+        self.err_msg = "Error:  GTID mode is not enabled on Slave2."
+        self.err_msg2 = "Error:  Sync failed on Slave1"
+
+    def sync_fail(self, slv, *args, **kwargs):
+
+        """Function:  sync_fail
+
+        Description:  Fails the sync of Slave1 and checks Slave2 was
+            cancelled.
+
+        Arguments:
+
+        """
+
+        if slv.name == "Slave1" and args:
+            return True, self.err_msg2
+
+        kwargs["cancel"].wait(5)
+
+        return True, f"Error:  Sync of slave {slv.name} was cancelled."
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_gtid_mode_off(self, mock_wait):
+
+        """Function:  test_gtid_mode_off
+
+        Description:  Test with GTID mode off on a slave.
+
+        Arguments:
+
+        """
+
+        self.slave2.gtid_mode = False
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(
+                self.master, self.slaves, gtid=True), (True, self.err_msg))
+        mock_wait.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.sync_pos")
+    def test_sync_fails(self, mock_sync, mock_state):
+
+        """Function:  test_sync_fails
+
+        Description:  Test with the first error cancelling the other sync and
+            restarting replication.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = self.sync_fail
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(self.master, self.slaves),
+            (True, self.err_msg2))
+        mock_state.assert_called_with(self.slaves, "start")
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.sync_pos")
+    def test_position_sync(self, mock_sync, mock_state):
+
+        """Function:  test_position_sync
+
+        Description:  Test with syncing the slaves to the same position, the
+            slaves are stopped before the master position is read.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(self.master, self.slaves),
+            (False, None))
+        self.assertEqual(
+            [call.args for call in mock_sync.call_args_list],
+            [(slv, "mysql-bin.000010", 500) for slv in self.slaves])
+        mock_state.assert_called_once_with(self.slaves, "stop")
+
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_gtid_sync(self, mock_wait):
+
+        """Function:  test_gtid_sync
+
+        Description:  Test with syncing the slaves to the GTID set.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(
+                self.master, self.slaves, gtid=True), (False, None))
+        self.assertEqual(mock_wait.call_count, 2)
+
+    @mock.patch("mysql_rep_change.SyncProgress")
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_change.sync_pos")
+    def test_progress(self, mock_sync, mock_progress):
+
+        """Function:  test_progress
+
+        Description:  Test the progress of a position sync.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(
+                self.master, self.slaves, progress=5), (False, None))
+        mock_progress.assert_called_once_with(
+            [{"gtid": self.master.gtid, "cmd": "SHOW BINARY LOGS"}],
+            ("mysql-bin.000010", 500), 5, out=None)
+        self.assertIs(mock_sync.call_args[1]["progress"],
+                      mock_progress.return_value)
+
+    @mock.patch("mysql_rep_change.SyncProgress")
+    @mock.patch("mysql_rep_change.wait_gtid")
+    def test_gtid_progress(self, mock_wait, mock_progress):
+
+        """Function:  test_gtid_progress
+
+        Description:  Test the progress of a GTID sync is to the master's
+            position.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slaves(
+                self.master, self.slaves, gtid=True, progress=5),
+            (False, None))
+        self.assertEqual(mock_progress.call_args[0][1],
+                         ("mysql-bin.000010", 500))
+        self.assertIs(mock_wait.call_args[1]["progress"],
+                      mock_progress.return_value)
+
+    @mock.patch("mysql_rep_change.mysql_libs.chg_slv_state")
+    @mock.patch("mysql_rep_change.sync_pos")
+    def test_sync_fails_restart(self, mock_sync, mock_state):
+
+        """Function:  test_sync_fails_restart
+
+        Description:  Test the slaves are stopped before replication is
+            started again, clearing the UNTIL condition of the slaves still
+            running.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = self.sync_fail
+
+        mysql_rep_change.sync_slaves(self.master, self.slaves)
+
+        self.assertEqual(mock_state.call_args_list, [
+            mock.call(self.slaves, "stop"), mock.call(self.slaves, "stop"),
+            mock.call(self.slaves, "start")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  sync_slv.py
+
+    Description:  Unit testing of sync_slv in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/sync_slv.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_server_wait_sync
+        test_gtid_sync
+        test_position_sync
+        test_multiple_slaves
+        test_progress
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.slave = "Slave"
+        self.slaves = [self.slave]
+
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    def test_server_wait_sync(self, mock_gtid, mock_sync):
+
+        """Function:  test_server_wait_sync
+
+        Description:  Test with server side wait sync selected.
+
+        Arguments:
+
+        """
+
+        mock_gtid.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slv(
+                self.master, self.slaves, server_wait=True), (False, None))
+        mock_sync.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    def test_gtid_sync(self, mock_gtid, mock_sync):
+
+        """Function:  test_gtid_sync
+
+        Description:  Test with GTID sync selected.
+
+        Arguments:
+
+        """
+
+        mock_gtid.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slv(self.master, self.slaves, gtid=True),
+            (False, None))
+        mock_sync.assert_not_called()
+
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    def test_position_sync(self, mock_gtid, mock_sync):
+
+        """Function:  test_position_sync
+
+        Description:  Test with binary log position sync.
+
+        Arguments:
+
+        """
+
+        mock_sync.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slv(self.master, self.slaves),
+            (False, None))
+        mock_gtid.assert_not_called()
+
+
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    def test_multiple_slaves(self, mock_gtid, mock_sync):
+
+        """Function:  test_multiple_slaves
+
+        Description:  Test with more than one slave to sync.
+
+        Arguments:
+
+        """
+
+        mock_gtid.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slv(self.master, [self.slave, "Slave2"]),
+            (False, None))
+        mock_sync.assert_not_called()
+
+
+    @mock.patch("mysql_rep_change.mysql_libs.sync_rep_slv")
+    @mock.patch("mysql_rep_change.sync_slaves")
+    def test_progress(self, mock_gtid, mock_sync):
+
+        """Function:  test_progress
+
+        Description:  Test a slave with a progress interval.
+
+        Arguments:
+
+        """
+
+        mock_gtid.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.sync_slv(self.master, self.slaves, progress=5),
+            (False, None))
+        mock_sync.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  syncprogress_init.py
+
+    Description:  Unit testing of syncprogress_init in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/syncprogress_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_init
+        test_target_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logs = [
+            {"Log_name": "mysql-bin.000001", "File_size": 1000},
+            {"Log_name": "mysql-bin.000002", "File_size": "2000"},
+            {"Log_name": "mysql-bin.000003", "File_size": 500}]
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test the class initialization.
+
+        Arguments:
+
+        """
+
+        progress = mysql_rep_change.SyncProgress(
+            self.logs, ("mysql-bin.000003", 400), 5)
+
+        self.assertEqual(progress.starts, {
+            "mysql-bin.000001": 0, "mysql-bin.000002": 1000,
+            "mysql-bin.000003": 3000})
+        self.assertEqual(
+            (progress.target, progress.interval, progress.samples,
+             progress.printed), (3400, 5, {}, {}))
+
+    def test_target_not_found(self):
+
+        """Function:  test_target_not_found
+
+        Description:  Test with the target not in the binary logs.
+
+        Arguments:
+
+        """
+
+        progress = mysql_rep_change.SyncProgress(
+            self.logs, ("mysql-bin.000009", 400), 5)
+
+        self.assertIsNone(progress.target)
+
+
+if __name__ == "__main__":
+    unittest.main()
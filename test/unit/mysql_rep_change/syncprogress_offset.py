@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  syncprogress_offset.py
+
+    Description:  Unit testing of syncprogress_offset in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/syncprogress_offset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_file
+        test_later_file
+        test_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logs = [
+            {"Log_name": "mysql-bin.000001", "File_size": 1000},
+            {"Log_name": "mysql-bin.000002", "File_size": "2000"},
+            {"Log_name": "mysql-bin.000003", "File_size": 500}]
+        self.progress = mysql_rep_change.SyncProgress(
+            self.logs, ("mysql-bin.000003", 400), 5)
+
+    def test_first_file(self):
+
+        """Function:  test_first_file
+
+        Description:  Test a position in the first file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.progress.offset("mysql-bin.000001", 4), 4)
+
+    def test_later_file(self):
+
+        """Function:  test_later_file
+
+        Description:  Test a position in a later file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.progress.offset("mysql-bin.000002", "150"), 1150)
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test a file not in the binary logs.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.progress.offset("mysql-bin.000000", 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
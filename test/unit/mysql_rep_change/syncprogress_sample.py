@@ -0,0 +1,205 @@
+# Classification (U)
+
+"""Program:  syncprogress_sample.py
+
+    Description:  Unit testing of syncprogress_sample in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/syncprogress_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_found
+        test_first_sample
+        test_across_files
+        test_window
+        test_past_target
+        test_print_interval
+        test_progress_event
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logs = [
+            {"Log_name": "mysql-bin.000001", "File_size": 1000},
+            {"Log_name": "mysql-bin.000002", "File_size": "2000"},
+            {"Log_name": "mysql-bin.000003", "File_size": 500}]
+        self.progress = mysql_rep_change.SyncProgress(
+            self.logs, ("mysql-bin.000003", 400), 5)
+
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_not_found(self, mock_time):
+
+        """Function:  test_not_found
+
+        Description:  Test a position not in the binary logs.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+
+        self.assertIsNone(
+            self.progress.sample("Slave1", "mysql-bin.000000", 4))
+        self.assertEqual(self.progress.samples, {})
+
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_first_sample(self, mock_time):
+
+        """Function:  test_first_sample
+
+        Description:  Test the first sample of a slave has no rate.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                self.progress.sample("Slave1", "mysql-bin.000001", 400),
+                {"left": 3000, "rate": 0.0, "eta": None})
+
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_across_files(self, mock_time):
+
+        """Function:  test_across_files
+
+        Description:  Test the rate and ETA across binary log files.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 102.0]
+
+        with gen_libs.no_std_out():
+            self.progress.sample("Slave1", "mysql-bin.000001", 400)
+            self.assertEqual(
+                self.progress.sample("Slave1", "mysql-bin.000002", 400),
+                {"left": 2000, "rate": 500.0, "eta": 4.0})
+
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_window(self, mock_time):
+
+        """Function:  test_window
+
+        Description:  Test samples older than the window are dropped.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 120.0, 140.0, 141.0]
+
+        with gen_libs.no_std_out():
+            for pos in [0, 100, 1100, 1200]:
+                self.progress.sample("Slave1", "mysql-bin.000002", pos)
+
+        self.assertEqual(list(self.progress.samples["Slave1"]),
+                         [(120.0, 1100), (140.0, 2100), (141.0, 2200)])
+
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_past_target(self, mock_time):
+
+        """Function:  test_past_target
+
+        Description:  Test a slave past the target.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                self.progress.sample("Slave1", "mysql-bin.000003", 450)[
+                    "left"], 0)
+
+    @mock.patch("builtins.print")
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_print_interval(self, mock_time, mock_print):
+
+        """Function:  test_print_interval
+
+        Description:  Test the progress is printed at the interval.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 102.0, 106.0]
+
+        for pos in [400, 1400, 2400]:
+            self.progress.sample("Slave1", "mysql-bin.000001", pos)
+
+        self.assertEqual(
+            [call[0][0] for call in mock_print.call_args_list],
+            ["Slave Slave1:  3000 bytes to apply  rate 0 bytes/s  ETA"
+             " unknown",
+             "Slave Slave1:  1000 bytes to apply  rate 333 bytes/s  ETA"
+             " 3.0s"])
+
+    @mock.patch("mysql_rep_change.emit")
+    @mock.patch("mysql_rep_change.time.monotonic")
+    def test_progress_event(self, mock_time, mock_emit):
+
+        """Function:  test_progress_event
+
+        Description:  Test a sync_progress event is written with the progress.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+
+        with gen_libs.no_std_out():
+            self.progress.sample("Slave1", "mysql-bin.000001", 400)
+
+        mock_emit.assert_called_once_with(
+            "sync_progress", server="Slave1", file="mysql-bin.000001",
+            pos=400, left=3000, rate=0.0, eta=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  timed.py
+
+    Description:  Unit testing of timed in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/timed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_server_instance
+        test_server_name
+        test_no_server
+        test_exception
+        test_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        mysql_rep_change.reset_timing()
+
+    def test_server_instance(self):
+
+        """Function:  test_server_instance
+
+        Description:  Test with a server instance.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_change.timed("connect", self.server):
+            pass
+
+        entry = mysql_rep_change.TIMING["phases"][0]
+
+        self.assertEqual(
+            (entry["phase"], entry["server"]), ("connect", "Slave1"))
+        self.assertGreaterEqual(entry["seconds"], 0)
+
+    def test_server_name(self):
+
+        """Function:  test_server_name
+
+        Description:  Test with a server name.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_change.timed("sync", "Slave2"):
+            pass
+
+        self.assertEqual(
+            mysql_rep_change.TIMING["phases"][0]["server"], "Slave2")
+
+    def test_no_server(self):
+
+        """Function:  test_no_server
+
+        Description:  Test with no server.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_change.timed("load_config"):
+            pass
+
+        self.assertIsNone(mysql_rep_change.TIMING["phases"][0]["server"])
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test the phase is recorded when an exception is raised.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            with mysql_rep_change.timed("sync", self.server):
+                raise ValueError("Sync failed")
+
+        self.assertEqual(len(mysql_rep_change.TIMING["phases"]), 1)
+
+    @mock.patch("mysql_rep_change.emit")
+    def test_events(self, mock_emit):
+
+        """Function:  test_events
+
+        Description:  Test the phase start and end events.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_change.timed("connect", self.server):
+            pass
+
+        self.assertEqual(mock_emit.call_args_list[0], mock.call(
+            "phase_start", phase="connect", server="Slave1"))
+        self.assertEqual(mock_emit.call_args_list[1][0][0], "phase_end")
+        self.assertEqual(mock_emit.call_args_list[1][1]["server"], "Slave1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# Classification (U)
+
+"""Program:  timing_report.py
+
+    Description:  Unit testing of timing_report in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/timing_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_report
+        test_print_report
+        test_file_report
+        test_file_not_writable
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args3 = ArgParser()
+        self.args2.args_array = {"-p": True}
+        self.args3.args_array = {"-P": "timing.json"}
+        mysql_rep_change.reset_timing()
+        mysql_rep_change.TIMING["phases"] = [
+            {"phase": "sync", "server": "Slave1", "start": 0.1,
+             "seconds": 2.0},
+            {"phase": "sync", "server": "Slave2", "start": 0.1,
+             "seconds": 3.0},
+            {"phase": "connect", "server": "Slave1", "start": 0.0,
+             "seconds": 0.1}]
+
+    @mock.patch("builtins.print")
+    def test_no_report(self, mock_print):
+
+        """Function:  test_no_report
+
+        Description:  Test with no report options.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open") as mock_file:
+            mysql_rep_change.timing_report(self.args)
+
+        mock_print.assert_not_called()
+        mock_file.assert_not_called()
+
+    @mock.patch("builtins.print")
+    def test_print_report(self, mock_print):
+
+        """Function:  test_print_report
+
+        Description:  Test printing the report.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.timing_report(self.args2)
+
+        report = json.loads(mock_print.call_args[0][0])
+
+        self.assertEqual(
+            report["summary"],
+            {"sync": {"count": 2, "seconds": 5.0, "max": 3.0},
+             "connect": {"count": 1, "seconds": 0.1, "max": 0.1}})
+        self.assertEqual(len(report["phases"]), 3)
+
+    def test_file_report(self):
+
+        """Function:  test_file_report
+
+        Description:  Test writing the report to a file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open()) as mock_file:
+            mysql_rep_change.timing_report(self.args3)
+
+        mock_file.assert_called_once_with(
+            "timing.json", mode="w", encoding="UTF-8")
+        report = json.loads(mock_file().write.call_args[0][0])
+
+        self.assertEqual(report["summary"]["sync"]["count"], 2)
+
+    @mock.patch("builtins.print")
+    def test_file_not_writable(self, mock_print):
+
+        """Function:  test_file_not_writable
+
+        Description:  Test with a report file which can not be written.
+
+        Arguments:
+
+        """
+
+        self.args3.args_array["-p"] = True
+
+        with mock.patch("builtins.open",
+                        mock.Mock(side_effect=PermissionError(
+                            "Permission denied"))):
+            mysql_rep_change.timing_report(self.args3)
+
+        mock_print.assert_any_call(
+            "Warning:  Timing report not written.  Permission denied")
+        self.assertEqual(
+            json.loads(mock_print.call_args[0][0])["summary"]["sync"]["count"],
+            2)
+
+
+if __name__ == "__main__":
+    unittest.main()
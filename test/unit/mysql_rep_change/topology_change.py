@@ -0,0 +1,282 @@
+# Classification (U)
+
+"""Program:  topology_change.py
+
+    Description:  Unit testing of topology_change in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/topology_change.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-T": "topology.txt", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_topology_change
+        test_step_fails
+        test_open_slaves_fails
+        test_read_topology_fails
+        test_plan_fails
+        test_discovered_graph
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = Server("Master")
+        self.slaves = [Server("Slave1"), Server("Slave2"), Server("Slave3")]
+        self.step = ("move", "Slave2", "Master", "Slave1")
+        self.step2 = ("move", "Slave3", "Slave1", "Slave2")
+        self.err_msg = "Error:  Sync failed"
+
+    @mock.patch("mysql_rep_change.run_step")
+    @mock.patch("mysql_rep_change.get_topology",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.plan_topology")
+    @mock.patch("mysql_rep_change.read_topology",
+                mock.Mock(return_value=({}, False, None)))
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_topology_change(self, mock_plan, mock_run):
+
+        """Function:  test_topology_change
+
+        Description:  Test with all steps run.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = ([self.step, self.step2], False, None)
+        mock_run.return_value = (False, None)
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args), (False, None))
+        self.assertEqual(mock_run.call_count, 2)
+
+    @mock.patch("mysql_rep_change.run_step")
+    @mock.patch("mysql_rep_change.get_topology",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.plan_topology")
+    @mock.patch("mysql_rep_change.read_topology",
+                mock.Mock(return_value=({}, False, None)))
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_step_fails(self, mock_plan, mock_run):
+
+        """Function:  test_step_fails
+
+        Description:  Test with a step failing stops the later waves.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = ([self.step, self.step2], False, None)
+        mock_run.return_value = (True, self.err_msg)
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args),
+            (True, self.err_msg))
+        mock_run.assert_called_once_with(
+            self.master, self.slaves, self.step, args=self.args)
+
+    @mock.patch("mysql_rep_change.read_topology")
+    @mock.patch("mysql_rep_change.open_slaves")
+    def test_open_slaves_fails(self, mock_open, mock_read):
+
+        """Function:  test_open_slaves_fails
+
+        Description:  Test with a slave connection failing.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (True, "Detected problem in slave connection")
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args),
+            (True, "Detected problem in slave connection"))
+        mock_read.assert_not_called()
+
+    @mock.patch("mysql_rep_change.plan_topology")
+    @mock.patch("mysql_rep_change.read_topology")
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_read_topology_fails(self, mock_read, mock_plan):
+
+        """Function:  test_read_topology_fails
+
+        Description:  Test with an invalid topology file.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = ({}, True, "Error:  Invalid topology line")
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  Invalid topology line"))
+        mock_plan.assert_not_called()
+
+    @mock.patch("mysql_rep_change.run_step")
+    @mock.patch("mysql_rep_change.get_topology",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_change.plan_topology")
+    @mock.patch("mysql_rep_change.read_topology",
+                mock.Mock(return_value=({}, False, None)))
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_plan_fails(self, mock_plan, mock_run):
+
+        """Function:  test_plan_fails
+
+        Description:  Test with no plan for the target topology.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = ([], True, "Error:  Replication loop")
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args),
+            (True, "Error:  Replication loop"))
+        mock_run.assert_not_called()
+
+
+    @mock.patch("mysql_rep_change.run_step",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("mysql_rep_change.get_topology")
+    @mock.patch("mysql_rep_change.plan_topology")
+    @mock.patch("mysql_rep_change.read_topology",
+                mock.Mock(return_value=({}, False, None)))
+    @mock.patch("mysql_rep_change.open_slaves",
+                mock.Mock(return_value=(False, None)))
+    def test_discovered_graph(self, mock_plan, mock_topo):
+
+        """Function:  test_discovered_graph
+
+        Description:  Test with the current tree from the discovered graph.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = ([], False, None)
+        graph = {"nodes": {}, "edges": [
+            ["Master", "Slave1"], ["Slave1", "Slave2"]]}
+
+        self.assertEqual(
+            mysql_rep_change.topology_change(
+                self.master, self.slaves, args=self.args, graph=graph),
+            (False, None))
+        mock_topo.assert_not_called()
+        self.assertEqual(
+            mock_plan.call_args[0][0],
+            {"Master": None, "Slave1": "Master", "Slave2": "Slave1",
+             "Slave3": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
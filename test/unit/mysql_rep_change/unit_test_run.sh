@@ -6,12 +6,113 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python test/unit/mysql_rep_change/auto_rollback.py
+/usr/bin/python test/unit/mysql_rep_change/cache_dir_error.py
+/usr/bin/python test/unit/mysql_rep_change/cached_load.py
+/usr/bin/python test/unit/mysql_rep_change/catch_up.py
+/usr/bin/python test/unit/mysql_rep_change/cfg_mst_inst.py
+/usr/bin/python test/unit/mysql_rep_change/change_source_gtid.py
+/usr/bin/python test/unit/mysql_rep_change/chk_cache_dir.py
+/usr/bin/python test/unit/mysql_rep_change/chk_num_args.py
+/usr/bin/python test/unit/mysql_rep_change/chk_replica.py
+/usr/bin/python test/unit/mysql_rep_change/chk_slv_file.py
+/usr/bin/python test/unit/mysql_rep_change/close_events.py
+/usr/bin/python test/unit/mysql_rep_change/close_inst.py
+/usr/bin/python test/unit/mysql_rep_change/connect_servers.py
 /usr/bin/python test/unit/mysql_rep_change/create_instances.py
+/usr/bin/python test/unit/mysql_rep_change/create_slv_inst.py
+/usr/bin/python test/unit/mysql_rep_change/crt_mst_inst.py
+/usr/bin/python test/unit/mysql_rep_change/crt_slv_inst.py
 /usr/bin/python test/unit/mysql_rep_change/crt_slv_mst.py
+/usr/bin/python test/unit/mysql_rep_change/daemonhandler_handle.py
+/usr/bin/python test/unit/mysql_rep_change/daemonhandler_reply.py
+/usr/bin/python test/unit/mysql_rep_change/discover_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/emit.py
+/usr/bin/python test/unit/mysql_rep_change/failover.py
+/usr/bin/python test/unit/mysql_rep_change/fetch_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/fill_mst_secrets.py
+/usr/bin/python test/unit/mysql_rep_change/fill_slv_secrets.py
+/usr/bin/python test/unit/mysql_rep_change/find_slv.py
+/usr/bin/python test/unit/mysql_rep_change/get_conn_opts.py
+/usr/bin/python test/unit/mysql_rep_change/get_slv_names.py
+/usr/bin/python test/unit/mysql_rep_change/get_sync_opts.py
+/usr/bin/python test/unit/mysql_rep_change/get_topology.py
+/usr/bin/python test/unit/mysql_rep_change/gtid_count.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_beat.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_detach.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_init.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_lag.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_source.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_start.py
+/usr/bin/python test/unit/mysql_rep_change/heartbeat_stop.py
 /usr/bin/python test/unit/mysql_rep_change/help_message.py
-/usr/bin/python test/unit/mysql_rep_change/is_slv_up.py
+/usr/bin/python test/unit/mysql_rep_change/import_time.py
+/usr/bin/python test/unit/mysql_rep_change/lazymodule_getattr.py
+/usr/bin/python test/unit/mysql_rep_change/lazymodule_init.py
+/usr/bin/python test/unit/mysql_rep_change/leaselock_acquire.py
+/usr/bin/python test/unit/mysql_rep_change/leaselock_init.py
+/usr/bin/python test/unit/mysql_rep_change/leaselock_release.py
+/usr/bin/python test/unit/mysql_rep_change/leaselock_renew.py
+/usr/bin/python test/unit/mysql_rep_change/load_mst_cfg.py
+/usr/bin/python test/unit/mysql_rep_change/load_slv_cfg.py
+/usr/bin/python test/unit/mysql_rep_change/lock_servers.py
+/usr/bin/python test/unit/mysql_rep_change/lock_targets.py
 /usr/bin/python test/unit/mysql_rep_change/main.py
 /usr/bin/python test/unit/mysql_rep_change/move_slave.py
 /usr/bin/python test/unit/mysql_rep_change/move_slave_up.py
+/usr/bin/python test/unit/mysql_rep_change/movejournal_init.py
+/usr/bin/python test/unit/mysql_rep_change/movejournal_load.py
+/usr/bin/python test/unit/mysql_rep_change/movejournal_record.py
+/usr/bin/python test/unit/mysql_rep_change/movejournal_resumed.py
 /usr/bin/python test/unit/mysql_rep_change/mv_slv_to_new_mst.py
+/usr/bin/python test/unit/mysql_rep_change/mv_slv_up.py
+/usr/bin/python test/unit/mysql_rep_change/open_events.py
+/usr/bin/python test/unit/mysql_rep_change/open_journal.py
+/usr/bin/python test/unit/mysql_rep_change/open_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/open_socket.py
+/usr/bin/python test/unit/mysql_rep_change/parse_request.py
+/usr/bin/python test/unit/mysql_rep_change/plan_topology.py
+/usr/bin/python test/unit/mysql_rep_change/probe_candidate.py
+/usr/bin/python test/unit/mysql_rep_change/probe_server.py
+/usr/bin/python test/unit/mysql_rep_change/rank_candidates.py
+/usr/bin/python test/unit/mysql_rep_change/rank_failover.py
+/usr/bin/python test/unit/mysql_rep_change/read_topology.py
+/usr/bin/python test/unit/mysql_rep_change/refresh_conns.py
+/usr/bin/python test/unit/mysql_rep_change/repoint_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/reset_timing.py
+/usr/bin/python test/unit/mysql_rep_change/rollback_move.py
+/usr/bin/python test/unit/mysql_rep_change/rollback_slave.py
+/usr/bin/python test/unit/mysql_rep_change/rollback_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/run_daemon.py
 /usr/bin/python test/unit/mysql_rep_change/run_program.py
+/usr/bin/python test/unit/mysql_rep_change/run_request.py
+/usr/bin/python test/unit/mysql_rep_change/run_step.py
+/usr/bin/python test/unit/mysql_rep_change/sample_progress.py
+/usr/bin/python test/unit/mysql_rep_change/schedule_plan.py
+/usr/bin/python test/unit/mysql_rep_change/select_new_master.py
+/usr/bin/python test/unit/mysql_rep_change/serverlocks_acquire.py
+/usr/bin/python test/unit/mysql_rep_change/serverlocks_init.py
+/usr/bin/python test/unit/mysql_rep_change/serverlocks_lease.py
+/usr/bin/python test/unit/mysql_rep_change/serverlocks_release.py
+/usr/bin/python test/unit/mysql_rep_change/slave_state.py
+/usr/bin/python test/unit/mysql_rep_change/slavearray_find_host.py
+/usr/bin/python test/unit/mysql_rep_change/slavearray_find_id.py
+/usr/bin/python test/unit/mysql_rep_change/slavearray_find_name.py
+/usr/bin/python test/unit/mysql_rep_change/slavearray_init.py
+/usr/bin/python test/unit/mysql_rep_change/snapshot_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/start_heartbeat.py
+/usr/bin/python test/unit/mysql_rep_change/stopped_at.py
+/usr/bin/python test/unit/mysql_rep_change/strip_secrets.py
+/usr/bin/python test/unit/mysql_rep_change/sync_pos.py
+/usr/bin/python test/unit/mysql_rep_change/sync_slaves.py
+/usr/bin/python test/unit/mysql_rep_change/sync_slv.py
+/usr/bin/python test/unit/mysql_rep_change/syncprogress_init.py
+/usr/bin/python test/unit/mysql_rep_change/syncprogress_offset.py
+/usr/bin/python test/unit/mysql_rep_change/syncprogress_sample.py
+/usr/bin/python test/unit/mysql_rep_change/timed.py
+/usr/bin/python test/unit/mysql_rep_change/timing_report.py
+/usr/bin/python test/unit/mysql_rep_change/topology_change.py
+/usr/bin/python test/unit/mysql_rep_change/wait_converged.py
+/usr/bin/python test/unit/mysql_rep_change/wait_gtid.py
+/usr/bin/python test/unit/mysql_rep_change/wait_pos.py
+/usr/bin/python test/unit/mysql_rep_change/write_cache.py
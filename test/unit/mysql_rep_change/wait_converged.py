@@ -0,0 +1,284 @@
+# Classification (U)
+
+"""Program:  wait_converged.py
+
+    Description:  Unit testing of wait_converged in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/wait_converged.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name="Slave1"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_slaves
+        test_converged
+        test_catching_up
+        test_stopped
+        test_lag_over
+        test_heartbeat
+        test_progress
+        state
+        test_state_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slaves = [SlaveRep("Slave1"), SlaveRep("Slave2")]
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_no_slaves(self, mock_state):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves to check.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_change.wait_converged([]), (False, None))
+        mock_state.assert_not_called()
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_converged(self, mock_state):
+
+        """Function:  test_converged
+
+        Description:  Test with the slaves converged on the first check.
+
+        Arguments:
+
+        """
+
+        mock_state.side_effect = lambda slv, heartbeat: self.state(slv.name)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(mysql_rep_change.wait_converged(self.slaves),
+                             (False, None))
+
+        self.assertEqual(mock_state.call_count, 2)
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_catching_up(self, mock_state):
+
+        """Function:  test_catching_up
+
+        Description:  Test with a slave catching up.
+
+        Arguments:
+
+        """
+
+        states = {"Slave1": [self.state("Slave1", lag=30.0),
+                             self.state("Slave1", running=False, lag=None),
+                             self.state("Slave1", lag=2.0),
+                             self.state("Slave1", lag=0.5)],
+                  "Slave2": [self.state("Slave2")]}
+        mock_state.side_effect = lambda slv, heartbeat: states[
+            slv.name].pop(0)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.wait_converged(self.slaves, lag_max=1.0),
+                (False, None))
+
+        self.assertEqual(states["Slave1"], [])
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_stopped(self, mock_state):
+
+        """Function:  test_stopped
+
+        Description:  Test with a slave stopped by an error.
+
+        Arguments:
+
+        """
+
+        mock_state.side_effect = lambda slv, heartbeat: self.state(
+            slv.name, running=False, error="SQL Error:  1062:  Duplicate"
+            if slv.name == "Slave2" else None)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.wait_converged(
+                    self.slaves, converge_timeout=0.01),
+                (True, "Error:  Slave Slave1 did not converge within 0.01"
+                       " seconds.\nError:  Slave Slave2 has stopped:  SQL"
+                       " Error:  1062:  Duplicate"))
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_lag_over(self, mock_state):
+
+        """Function:  test_lag_over
+
+        Description:  Test with a slave staying over the lag threshold.
+
+        Arguments:
+
+        """
+
+        mock_state.side_effect = lambda slv, heartbeat: self.state(
+            slv.name, lag=5.0)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_change.wait_converged(
+                    self.slaves[:1], lag_max=1.0, converge_timeout=0.01),
+                (True, "Error:  Slave Slave1 did not converge within 0.01"
+                       " seconds."))
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_heartbeat(self, mock_state):
+
+        """Function:  test_heartbeat
+
+        Description:  Test the heartbeat is passed to the check.
+
+        Arguments:
+
+        """
+
+        heartbeat = mock.Mock()
+        mock_state.side_effect = lambda slv, heartbeat: self.state(slv.name)
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.wait_converged(self.slaves, heartbeat=heartbeat)
+
+        self.assertIs(mock_state.call_args[0][1], heartbeat)
+
+    @mock.patch("builtins.print")
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_progress(self, mock_state, mock_print):
+
+        """Function:  test_progress
+
+        Description:  Test the state is printed when it changes.
+
+        Arguments:
+
+        """
+
+        states = [self.state("Slave1", lag=3.0), self.state("Slave1", lag=3.0),
+                  self.state("Slave1", lag=None), self.state("Slave1")]
+        mock_state.side_effect = lambda slv, heartbeat: states.pop(0)
+
+        mysql_rep_change.wait_converged(self.slaves[:1])
+
+        self.assertEqual(
+            [call[0][0] for call in mock_print.call_args_list],
+            ["Slave Slave1:  running Yes  lag 3.000s",
+             "Slave Slave1:  running Yes  lag unknown",
+             "Slave Slave1:  running Yes  lag 0.000s"])
+
+    def state(self, name, running=True, lag=0.0, error=None):
+
+        """Function:  state
+
+        Description:  Returns the replication state of a slave.
+
+        Arguments:
+            (input) name -> Name of the slave
+            (input) running -> True|False - if the slave is running
+            (input) lag -> Lag of the slave in seconds
+            (input) error -> Error which stopped the slave
+            (output) Dictionary of the slave state
+
+        """
+
+        return {"name": name, "running": running, "lag": lag, "error": error}
+
+    @mock.patch("mysql_rep_change.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_change.emit")
+    @mock.patch("mysql_rep_change.slave_state")
+    def test_state_events(self, mock_state, mock_emit):
+
+        """Function:  test_state_events
+
+        Description:  Test a slave_state event is written when a state changes.
+
+        Arguments:
+
+        """
+
+        mock_state.side_effect = lambda slv, heartbeat: self.state(slv.name)
+
+        with gen_libs.no_std_out():
+            mysql_rep_change.wait_converged(self.slaves[:1])
+
+        mock_emit.assert_any_call(
+            "slave_state", server="Slave1", running=True, lag=0.0,
+            error=None)
+        self.assertEqual(
+            [item[0][0] for item in mock_emit.call_args_list].count(
+                "slave_state"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+# Classification (U)
+
+"""Program:  wait_gtid.py
+
+    Description:  Unit testing of wait_gtid in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/wait_gtid.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.status = 0
+        self.statuses = []
+        self.cmd = None
+        self.params = None
+        self.replica = [
+            {"Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes",
+             "Last_IO_Errno": 0, "Last_IO_Error": "", "Last_SQL_Errno": 0,
+             "Last_SQL_Error": ""}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  col_sql method.
+
+        Arguments:
+
+        """
+
+        if cmd == "SHOW REPLICA STATUS":
+            return self.replica
+
+        self.cmd = cmd
+        self.params = params
+
+        if self.statuses:
+            return [{"status": self.statuses.pop(0)}]
+
+        return [{"status": self.status}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cancel_set
+        test_cancel_slices
+        test_wait_timed_out
+        test_wait_with_timeout
+        test_wait_no_timeout
+        test_progress
+        test_replica_stopped
+        test_replica_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.gtid_set = "3E11FA47-71CA-11E1-9E33-C80AA9429562:1-5"
+        self.cancel = threading.Event()
+        self.err_msg = \
+            "Error:  Slave Slave_Name did not reach the GTID set within 10" \
+            " seconds."
+        self.err_msg2 = "Error:  Sync of slave Slave_Name was cancelled."
+
+    def test_cancel_set(self):
+
+        """Function:  test_cancel_set
+
+        Description:  Test with the wait cancelled by another thread.
+
+        Arguments:
+
+        """
+
+        self.cancel.set()
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(
+                self.slave, self.gtid_set, cancel=self.cancel),
+            (True, self.err_msg2))
+
+    def test_cancel_slices(self):
+
+        """Function:  test_cancel_slices
+
+        Description:  Test with the wait done in slices.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [1, 1, 0]
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(
+                self.slave, self.gtid_set, cancel=self.cancel),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.gtid_set, 1))
+
+    @mock.patch("mysql_rep_change.time.monotonic",
+                mock.Mock(side_effect=[0, 5, 11]))
+    def test_wait_timed_out(self):
+
+        """Function:  test_wait_timed_out
+
+        Description:  Test with the wait timing out.
+
+        Arguments:
+
+        """
+
+        self.slave.status = 1
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(self.slave, self.gtid_set, timeout=10),
+            (True, self.err_msg))
+
+    def test_wait_with_timeout(self):
+
+        """Function:  test_wait_with_timeout
+
+        Description:  Test with a timeout waited in one second slices.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(self.slave, self.gtid_set, timeout=10),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.gtid_set, 1))
+
+    def test_wait_no_timeout(self):
+
+        """Function:  test_wait_no_timeout
+
+        Description:  Test with an indefinite wait.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [1, 1, 0]
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(self.slave, self.gtid_set),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.gtid_set, 1))
+
+    @mock.patch("mysql_rep_change.sample_progress")
+    def test_progress(self, mock_sample):
+
+        """Function:  test_progress
+
+        Description:  Test the progress is sampled between the slices.
+
+        Arguments:
+
+        """
+
+        progress = mock.Mock()
+        self.slave.statuses = [1, 1, 0]
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(
+                self.slave, self.gtid_set, cancel=self.cancel,
+                progress=progress), (False, None))
+        self.assertEqual(mock_sample.call_args_list,
+                         [mock.call(self.slave, progress)] * 2)
+
+    def test_replica_stopped(self):
+
+        """Function:  test_replica_stopped
+
+        Description:  Test with replication stopped on the slave during an
+            indefinite wait.
+
+        Arguments:
+
+        """
+
+        self.slave.status = 1
+        self.slave.replica[0]["Replica_SQL_Running"] = "No"
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(self.slave, self.gtid_set),
+            (True, "Error:  Slave Slave_Name replication stopped during"
+             " sync."))
+
+    def test_replica_error(self):
+
+        """Function:  test_replica_error
+
+        Description:  Test with an I/O error on the slave during a wait.
+
+        Arguments:
+
+        """
+
+        self.slave.status = 1
+        self.slave.replica[0].update(
+            {"Replica_IO_Running": "Connecting", "Last_IO_Errno": 2003,
+             "Last_IO_Error": "Can't connect"})
+
+        self.assertEqual(
+            mysql_rep_change.wait_gtid(
+                self.slave, self.gtid_set, cancel=self.cancel),
+            (True, "Error:  Slave Slave_Name IO error during sync:  2003:"
+             "  Can't connect"))
+
+
+if __name__ == "__main__":
+    unittest.main()
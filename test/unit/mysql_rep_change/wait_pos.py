@@ -0,0 +1,266 @@
+# Classification (U)
+
+"""Program:  wait_pos.py
+
+    Description:  Unit testing of wait_pos in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/wait_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.statuses = []
+        self.params = None
+        self.replica = [
+            {"Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes",
+             "Last_IO_Errno": 0, "Last_IO_Error": "", "Last_SQL_Errno": 0,
+             "Last_SQL_Error": ""}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  col_sql method.
+
+        Arguments:
+
+        """
+
+        if cmd == "SHOW REPLICA STATUS":
+            return self.replica
+
+        self.params = params
+
+        return [{"status": self.statuses.pop(0), "cmd": cmd}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cancel_set
+        test_cancel_slices
+        test_sql_thread_stopped
+        test_wait_timed_out
+        test_wait_no_timeout
+        test_wait_reached
+        test_progress
+        test_io_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.log_file = "mysql-bin.000010"
+        self.cancel = threading.Event()
+        self.err_msg = \
+            "Error:  Slave Slave_Name did not reach mysql-bin.000010:500" \
+            " within 10 seconds."
+        self.err_msg2 = "Error:  Sync of slave Slave_Name was cancelled."
+
+    def test_cancel_set(self):
+
+        """Function:  test_cancel_set
+
+        Description:  Test with the wait cancelled by another thread.
+
+        Arguments:
+
+        """
+
+        self.cancel.set()
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(
+                self.slave, self.log_file, 500, cancel=self.cancel),
+            (True, self.err_msg2))
+
+    def test_cancel_slices(self):
+
+        """Function:  test_cancel_slices
+
+        Description:  Test with the wait done in slices.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [-1, -1, 4]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(
+                self.slave, self.log_file, 500, cancel=self.cancel),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.log_file, 500, 1))
+
+    def test_sql_thread_stopped(self):
+
+        """Function:  test_sql_thread_stopped
+
+        Description:  Test with a NULL return from the server.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [None]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(self.slave, self.log_file, 500),
+            (False, None))
+
+    @mock.patch("mysql_rep_change.time.monotonic",
+                mock.Mock(side_effect=[0, 5, 11]))
+    def test_wait_timed_out(self):
+
+        """Function:  test_wait_timed_out
+
+        Description:  Test with the wait timing out.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [-1, -1]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(
+                self.slave, self.log_file, 500, timeout=10),
+            (True, self.err_msg))
+
+    def test_wait_no_timeout(self):
+
+        """Function:  test_wait_no_timeout
+
+        Description:  Test with an indefinite wait.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [-1, -1, 0]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(self.slave, self.log_file, "500"),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.log_file, 500, 1))
+
+    def test_wait_reached(self):
+
+        """Function:  test_wait_reached
+
+        Description:  Test with the slave reaching the position.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [12]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(
+                self.slave, self.log_file, 500, timeout=10),
+            (False, None))
+        self.assertEqual(self.slave.params, (self.log_file, 500, 1))
+
+
+    @mock.patch("mysql_rep_change.sample_progress")
+    def test_progress(self, mock_sample):
+
+        """Function:  test_progress
+
+        Description:  Test the progress is sampled between the slices.
+
+        Arguments:
+
+        """
+
+        progress = mock.Mock()
+        self.slave.statuses = [-1, -1, 0]
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(
+                self.slave, "mysql-bin.000010", 500, cancel=self.cancel,
+                progress=progress), (False, None))
+        self.assertEqual(mock_sample.call_args_list,
+                         [mock.call(self.slave, progress)] * 2)
+
+    def test_io_error(self):
+
+        """Function:  test_io_error
+
+        Description:  Test with an I/O error on the slave during an
+            indefinite wait.
+
+        Arguments:
+
+        """
+
+        self.slave.statuses = [-1]
+        self.slave.replica[0].update(
+            {"Replica_IO_Running": "No", "Last_IO_Errno": 13114,
+             "Last_IO_Error": "Got fatal error"})
+
+        self.assertEqual(
+            mysql_rep_change.wait_pos(self.slave, self.log_file, 500),
+            (True, "Error:  Slave Slave_Name IO error during sync:  13114:"
+             "  Got fatal error"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  write_cache.py
+
+    Description:  Unit testing of write_cache in mysql_rep_change.py.
+
+    Usage:
+        test/unit/mysql_rep_change/write_cache.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_change                         # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write_fails
+        test_unserializable
+        test_permissions
+        test_write_cache
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmp_dir, "cache.json")
+        self.cache = {"ident": ["1.0.0", None], "data": [{"port": 3306}]}
+
+    def test_write_fails(self):
+
+        """Function:  test_write_fails
+
+        Description:  Test with a cache directory which does not exist.
+
+        Arguments:
+
+        """
+
+        cache_file = os.path.join(self.tmp_dir, "no_dir", "cache.json")
+
+        self.assertFalse(mysql_rep_change.write_cache(cache_file, self.cache))
+
+    def test_unserializable(self):
+
+        """Function:  test_unserializable
+
+        Description:  Test with data which cannot be written as JSON.
+
+        Arguments:
+
+        """
+
+        self.cache["data"] = {"loader": len}
+
+        self.assertFalse(
+            mysql_rep_change.write_cache(self.cache_file, self.cache))
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_permissions(self):
+
+        """Function:  test_permissions
+
+        Description:  Test the cache file is only readable by the user.
+
+        Arguments:
+
+        """
+
+        mysql_rep_change.write_cache(self.cache_file, self.cache)
+
+        self.assertEqual(os.stat(self.cache_file).st_mode & 0o777, 0o600)
+
+    def test_write_cache(self):
+
+        """Function:  test_write_cache
+
+        Description:  Test writing the cache file.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_change.write_cache(self.cache_file, self.cache))
+
+        with open(self.cache_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.cache)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
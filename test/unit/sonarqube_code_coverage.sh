@@ -8,15 +8,116 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/auto_rollback.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/cache_dir_error.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/cached_load.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/catch_up.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/cfg_mst_inst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/change_source_gtid.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/chk_cache_dir.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/chk_num_args.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/chk_replica.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/chk_slv_file.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/close_events.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/close_inst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/connect_servers.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/create_instances.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/create_slv_inst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/crt_mst_inst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/crt_slv_inst.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/crt_slv_mst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/daemonhandler_handle.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/daemonhandler_reply.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/discover_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/emit.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/failover.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/fetch_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/fill_mst_secrets.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/fill_slv_secrets.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/find_slv.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/get_conn_opts.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/get_slv_names.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/get_sync_opts.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/get_topology.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/gtid_count.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_beat.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_detach.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_lag.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_source.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_start.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/heartbeat_stop.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/help_message.py
-coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/is_slv_up.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/import_time.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/lazymodule_getattr.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/lazymodule_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/leaselock_acquire.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/leaselock_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/leaselock_release.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/leaselock_renew.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/load_mst_cfg.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/load_slv_cfg.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/lock_servers.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/lock_targets.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/main.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/move_slave.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/move_slave_up.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/movejournal_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/movejournal_load.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/movejournal_record.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/movejournal_resumed.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/mv_slv_to_new_mst.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/mv_slv_up.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/open_events.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/open_journal.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/open_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/open_socket.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/parse_request.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/plan_topology.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/probe_candidate.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/probe_server.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/rank_candidates.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/rank_failover.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/read_topology.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/refresh_conns.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/repoint_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/reset_timing.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/rollback_move.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/rollback_slave.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/rollback_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/run_daemon.py
 coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/run_program.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/run_request.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/run_step.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/sample_progress.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/schedule_plan.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/select_new_master.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/serverlocks_acquire.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/serverlocks_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/serverlocks_lease.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/serverlocks_release.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/slave_state.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/slavearray_find_host.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/slavearray_find_id.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/slavearray_find_name.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/slavearray_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/snapshot_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/start_heartbeat.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/stopped_at.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/strip_secrets.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/sync_pos.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/sync_slaves.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/sync_slv.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/syncprogress_init.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/syncprogress_offset.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/syncprogress_sample.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/timed.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/timing_report.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/topology_change.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/wait_converged.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/wait_gtid.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/wait_pos.py
+coverage run -a --source=mysql_rep_change test/unit/mysql_rep_change/write_cache.py
 
 echo ""
 echo "Producing code coverage report"